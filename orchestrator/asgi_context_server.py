@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""
+ASGI Context Server for Framework0 - Multi-Core Deployment Mode
+
+This module provides an asyncio implementation of the Enhanced Context
+Server REST and Socket.IO API for ASGI servers such as uvicorn. Request
+handlers are coroutines, and context state lives in a shard backend instead
+of in the worker process, so several workers can serve one context:
+
+- A single worker uses an in-process LocalShardBackend
+- Multiple workers share shard processes through SocketShardBackend
+
+The REST endpoints and WebSocket events match EnhancedContextServer, so
+ContextClient and AsyncContextClient work against either server. The
+interactive HTML dashboard is only served by the Flask server.
+"""
+
+import asyncio  # For background broadcast flushing and task management
+import json  # For request and response bodies
+import logging  # For server logging and debugging output
+import os  # For environment variable access
+from datetime import datetime  # For timestamping events and responses
+from pathlib import Path  # For cross-platform file path handling
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple  # For complete type safety
+from urllib.parse import parse_qs  # For query string parsing
+
+import socketio  # For Socket.IO protocol support over ASGI
+
+from orchestrator.context_broadcast import BroadcastAggregator  # Coalesced update fan-out
+from orchestrator.context_dump import DUMP_FORMATS, write_dump  # Shared dump file writers
+from orchestrator.context_shards import LocalShardBackend, SocketShardBackend, ShardCluster
+
+logger = logging.getLogger(__name__)
+
+# Environment variable carrying shard socket paths to ASGI worker processes
+SHARD_SOCKETS_ENV = "CONTEXT_SHARD_SOCKETS"
+
+
+class HTTPError(Exception):
+    """Raised by request handlers to return an error response."""
+
+    def __init__(self, status: int, message: str):
+        """
+        Initialize HTTP error.
+
+        Args:
+            status: HTTP status code
+            message: Error message returned to the client
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class AsyncContextServer:
+    """
+    Asyncio context server exposing the EnhancedContextServer API over ASGI.
+
+    The ASGI application is available as ``self.app``. State is read and
+    written through the backend, and changes reported by the backend are
+    broadcast to this worker's WebSocket clients, so updates made through
+    any worker reach every client.
+    """
+
+    def __init__(self,
+                 backend: Any = None,
+                 broadcast_window: float = 0.05,
+                 max_pending_updates: int = 1000,
+                 slow_client_policy: str = "resync",
+                 dump_directory: str = "context_dumps",
+                 max_batch_size: int = 1000):
+        """
+        Initialize the ASGI context server.
+
+        Args:
+            backend: LocalShardBackend or SocketShardBackend; in-process if omitted
+            broadcast_window: Seconds over which updates are coalesced before broadcast (0 = immediate)
+            max_pending_updates: Pending keys per client before the slow client policy applies
+            slow_client_policy: 'resync' or 'drop_oldest' for clients that fall behind
+            dump_directory: Directory for context dump files
+            max_batch_size: Maximum combined get and set keys per /ctx/batch request
+        """
+        self.backend = backend or LocalShardBackend()  # Shared or in-process context state
+        self.max_batch_size = max_batch_size  # Limit on keys per batch request
+
+        # Socket.IO server for real-time WebSocket communication
+        self.sio = socketio.AsyncServer(async_mode="asgi", cors_allowed_origins="*")
+        self.broadcaster = BroadcastAggregator(
+            self._emit,
+            window=broadcast_window,
+            max_pending=max_pending_updates,
+            slow_client_policy=slow_client_policy
+        )
+        self.backend.add_watcher(self._on_change)  # Broadcast changes from every worker
+
+        # Track connected clients for monitoring
+        self.connected_clients: Set[str] = set()  # Active WebSocket client IDs
+        self.client_types: Dict[str, Dict[str, Any]] = {}  # Client registration details
+
+        # File dumping configuration
+        self.dump_directory = Path(dump_directory)  # Directory for context dumps
+        self.dump_directory.mkdir(exist_ok=True)  # Create dump directory if it doesn't exist
+        self.dump_history: List[Dict[str, Any]] = []  # History of dump operations
+        self.max_dump_history = 100  # Maximum number of dump records to keep
+
+        # Lifecycle state
+        self._started = False  # Backend connected and broadcast loop running
+        self._start_lock: Optional[asyncio.Lock] = None  # Created inside the event loop
+        self._tasks: Set[asyncio.Task] = set()  # Background tasks kept alive until done
+
+        # Route table: (method, path) -> handler(query, body)
+        self._routes: Dict[Tuple[str, str], Callable] = {
+            ("GET", "/ctx"): self._get_context,
+            ("POST", "/ctx"): self._set_context,
+            ("POST", "/ctx/batch"): self._batch_context,
+            ("GET", "/ctx/all"): self._get_all_context,
+            ("GET", "/ctx/history"): self._get_history,
+            ("POST", "/ctx/dump"): self._dump_context,
+            ("GET", "/ctx/dump/list"): self._list_dumps,
+        }
+
+        self._setup_socketio_handlers()  # Configure WebSocket event handlers
+
+        # Socket.IO handles /socket.io; everything else goes to the REST app
+        self.app = socketio.ASGIApp(
+            self.sio,
+            other_asgi_app=self._http_app,
+            on_startup=self.start,
+            on_shutdown=self.close
+        )
+
+    async def start(self) -> None:
+        """Connect the backend and start flushing broadcasts, once."""
+        if self._started:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._started:
+                return
+            await self.backend.start()  # Connect to shards
+            if self.broadcaster.window > 0:
+                self._spawn(self._broadcast_loop())
+            self._started = True
+            logger.info("ASGI context server started")
+
+    async def close(self) -> None:
+        """Stop background work and disconnect the backend."""
+        for task in list(self._tasks):
+            task.cancel()
+        await self.backend.close()
+        self._started = False
+
+    def _spawn(self, coroutine) -> asyncio.Task:
+        """Run a coroutine as a background task and keep a reference to it."""
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _emit(self, event: str, payload: Dict[str, Any], to: Optional[str] = None,
+              callback: Optional[Callable] = None) -> None:
+        """Deliver a broadcaster event without blocking the flush."""
+        self._spawn(self.sio.emit(event, payload, to=to, callback=callback))
+
+    def _on_change(self, updates: Dict[str, Any], who: str, origin: Optional[str]) -> None:
+        """Queue changes reported by the backend for broadcast."""
+        self.broadcaster.publish(updates, who=who, skip_sid=origin)
+
+    async def _broadcast_loop(self) -> None:
+        """Flush coalesced updates to clients every broadcast window."""
+        while True:
+            await asyncio.sleep(self.broadcaster.window)  # Wait one coalescing window
+            try:
+                self.broadcaster.flush()  # Deliver pending updates
+            except Exception as e:  # Keep flushing after delivery errors
+                logger.error(f"Broadcast flush error: {e}")
+
+    # ------------------------------------------------------------------
+    # HTTP handling
+    # ------------------------------------------------------------------
+
+    async def _http_app(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        """Minimal ASGI application routing REST requests to handlers."""
+        if scope["type"] != "http":
+            return  # Lifespan is handled by the Socket.IO wrapper
+
+        await self.start()  # Servers without lifespan support start lazily
+
+        method = scope["method"]
+        path = scope["path"].rstrip("/") or "/"
+        query = {k: v[-1] for k, v in parse_qs(scope.get("query_string", b"").decode()).items()}
+        body = await self._read_body(receive)
+
+        try:
+            handler = self._routes.get((method, path))
+            if handler is not None:
+                status, payload = await handler(query, body)
+            elif method == "GET" and path.startswith("/ctx/dump/"):
+                await self._download_dump(path[len("/ctx/dump/"):], send)
+                return
+            else:
+                raise HTTPError(404, f"Not found: {method} {path}")
+        except HTTPError as e:
+            status, payload = e.status, {"error": str(e), "status": "error"}
+        except Exception as e:  # Handle any errors inside handlers
+            logger.error(f"Error handling {method} {path}: {e}")
+            status, payload = 500, {"error": str(e), "status": "error"}
+
+        await self._send_json(send, status, payload)
+
+    @staticmethod
+    async def _read_body(receive: Callable) -> bytes:
+        """Read the complete request body."""
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def _send_json(send: Callable, status: int, payload: Dict[str, Any]) -> None:
+        """Send a JSON response."""
+        body = json.dumps(payload, default=str).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode())]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    def _parse_json(body: bytes) -> Dict[str, Any]:
+        """Parse a JSON object request body."""
+        try:
+            data = json.loads(body or b"null")
+        except ValueError:
+            raise HTTPError(400, "Request must be JSON")
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Request must be a JSON object")
+        return data
+
+    async def _get_context(self, query: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Retrieve context value by key."""
+        key = query.get("key")
+        if not key:
+            raise HTTPError(400, "Missing 'key' parameter")
+
+        values = await self.backend.get_many([key])
+        return 200, {
+            "key": key,
+            "value": values.get(key),
+            "timestamp": datetime.now().isoformat(),
+            "status": "success"
+        }
+
+    async def _set_context(self, query: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Set context value and queue change notification."""
+        data = self._parse_json(body)
+        key = data.get("key")
+        value = data.get("value")
+        who = data.get("who", "api_client")
+        if not key or value is None:
+            raise HTTPError(400, "Missing 'key' or 'value' in JSON")
+
+        await self.backend.set_many({key: value}, who=who)  # Backend reports change for broadcast
+        logger.info(f"SET /ctx: key={key}, who={who}")
+        return 200, {
+            "status": "success",
+            "key": key,
+            "value": value,
+            "who": who,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    async def _batch_context(self, query: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Apply several sets and then gets in one request."""
+        data = self._parse_json(body)
+        values = data.get("set") or {}
+        keys = data.get("get") or []
+        who = data.get("who", "api_client")
+
+        if not isinstance(values, dict) or not isinstance(keys, list):
+            raise HTTPError(400, "'set' must be an object and 'get' a list of keys")
+        if any(not key for key in keys) or any(not key or value is None for key, value in values.items()):
+            raise HTTPError(400, "Missing 'key' or 'value' in batch")
+        if len(values) + len(keys) > self.max_batch_size:
+            raise HTTPError(400, f"Batch exceeds {self.max_batch_size} keys")
+
+        updated = await self.backend.set_many(values, who=who) if values else []
+        results = await self.backend.get_many(keys) if keys else {}
+
+        logger.info(f"POST /ctx/batch: set={len(values)}, get={len(keys)}, updated={len(updated)}, who={who}")
+        return 200, {
+            "status": "success",
+            "values": results,
+            "updated": updated,
+            "set_count": len(values),
+            "who": who,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    async def _get_all_context(self, query: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Retrieve entire context state."""
+        context_dict, history_count = await asyncio.gather(self.backend.to_dict(),
+                                                           self.backend.history_count())
+        return 200, {
+            "context": context_dict,
+            "history_count": history_count,
+            "connected_clients": len(self.connected_clients),
+            "timestamp": datetime.now().isoformat(),
+            "status": "success"
+        }
+
+    async def _get_history(self, query: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Retrieve change history with optional key and who filters."""
+        key_filter = query.get("key")
+        who_filter = query.get("who")
+        if key_filter or who_filter:
+            filtered, total = await asyncio.gather(
+                self.backend.get_history(key=key_filter, who=who_filter),
+                self.backend.history_count())
+        else:
+            filtered = await self.backend.get_history()
+            total = len(filtered)
+        return 200, {
+            "history": filtered,
+            "total_entries": total,
+            "filtered_entries": len(filtered),
+            "timestamp": datetime.now().isoformat(),
+            "status": "success"
+        }
+
+    async def _dump_context(self, query: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Dump complete context state to a file."""
+        if body:
+            data = self._parse_json(body)
+            include_history = data.get("include_history", False)
+        else:
+            data = query  # Allow query parameters as fallback for simple clients
+            include_history = query.get("include_history", "false").lower() == "true"
+        format_type = data.get("format", "json")
+        filename = data.get("filename")
+        who = data.get("who", "api_client")
+
+        if format_type.lower() not in DUMP_FORMATS:
+            raise HTTPError(400, f"Unsupported format: {format_type}")
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if not filename:
+            filename = f"context_dump_{timestamp}.{format_type}"
+        elif not filename.endswith(f'.{format_type}'):
+            filename = f"{filename}.{format_type}"
+        dump_path = self.dump_directory / Path(filename).name  # Never write outside the dump directory
+
+        context_data = await self.backend.to_dict()
+        dump_info = {
+            "timestamp": datetime.now().isoformat(),
+            "format": format_type,
+            "filename": dump_path.name,
+            "who": who,
+            "key_count": len(context_data),
+            "include_history": include_history,
+            "context": context_data
+        }
+        if include_history:
+            dump_info["history"] = await self.backend.get_history()
+
+        # Write in a thread so large dumps do not stall the event loop
+        await asyncio.get_running_loop().run_in_executor(None, write_dump, dump_path, dump_info, format_type)
+        file_size = dump_path.stat().st_size
+
+        self.dump_history.append({
+            "timestamp": dump_info["timestamp"],
+            "filename": dump_path.name,
+            "format": format_type,
+            "who": who,
+            "key_count": len(context_data),
+            "file_size": file_size,
+            "include_history": include_history
+        })
+        self.dump_history = self.dump_history[-self.max_dump_history:]
+
+        await self.sio.emit('context_dumped', {
+            'filename': dump_path.name,
+            'format': format_type,
+            'who': who,
+            'key_count': len(context_data),
+            'timestamp': dump_info["timestamp"]
+        })
+
+        logger.info(f"Context dumped to {dump_path} by {who} ({len(context_data)} keys)")
+        return 200, {
+            "status": "success",
+            "filename": dump_path.name,
+            "format": format_type,
+            "path": str(dump_path.absolute()),
+            "key_count": len(context_data),
+            "file_size": file_size,
+            "timestamp": dump_info["timestamp"],
+            "who": who
+        }
+
+    async def _list_dumps(self, query: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """List available context dump files."""
+        dump_files = []
+        for dump_file in self.dump_directory.iterdir():
+            if dump_file.is_file():
+                file_stat = dump_file.stat()
+                dump_files.append({
+                    "filename": dump_file.name,
+                    "path": str(dump_file.absolute()),
+                    "size": file_stat.st_size,
+                    "created": datetime.fromtimestamp(file_stat.st_ctime).isoformat(),
+                    "modified": datetime.fromtimestamp(file_stat.st_mtime).isoformat()
+                })
+        dump_files.sort(key=lambda x: x['created'], reverse=True)
+
+        return 200, {
+            "status": "success",
+            "dump_directory": str(self.dump_directory.absolute()),
+            "dump_count": len(dump_files),
+            "dump_files": dump_files,
+            "dump_history": self.dump_history[-10:],
+            "timestamp": datetime.now().isoformat()
+        }
+
+    async def _download_dump(self, filename: str, send: Callable) -> None:
+        """Send a dump file as an attachment."""
+        dump_path = self.dump_directory / Path(filename).name
+        if not dump_path.is_file():
+            await self._send_json(send, 404, {"error": "Dump file not found", "status": "error"})
+            return
+
+        content_type = {".csv": b"text/csv", ".txt": b"text/plain", ".pretty": b"text/plain"}.get(
+            dump_path.suffix, b"application/json"
+        )
+        body = dump_path.read_bytes()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", content_type),
+                        (b"content-length", str(len(body)).encode()),
+                        (b"content-disposition", f"attachment; filename={dump_path.name}".encode())]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    # ------------------------------------------------------------------
+    # WebSocket handling
+    # ------------------------------------------------------------------
+
+    def _setup_socketio_handlers(self) -> None:
+        """Configure Socket.IO event handlers matching EnhancedContextServer."""
+
+        @self.sio.event
+        async def connect(sid, environ, auth=None):
+            """Track new client and send it the current context."""
+            await self.start()
+            self.connected_clients.add(sid)
+            self.broadcaster.add_client(sid)  # Subscribe client to all keys by default
+            await self.sio.emit('context_snapshot', {
+                'context': await self.backend.to_dict(),
+                'timestamp': datetime.now().isoformat(),
+                'client_id': sid
+            }, to=sid)
+            await self.sio.emit('client_stats', {'count': len(self.connected_clients)})
+
+        @self.sio.event
+        async def disconnect(sid, *args):
+            """Forget disconnected client."""
+            self.connected_clients.discard(sid)
+            self.client_types.pop(sid, None)
+            self.broadcaster.remove_client(sid)
+            await self.sio.emit('client_stats', {'count': len(self.connected_clients)})
+
+        @self.sio.event
+        async def client_register(sid, data):
+            """Register client type and name for monitoring."""
+            client_type = data.get('type', 'unknown')
+            client_name = data.get('name', 'unnamed')
+            self.client_types[sid] = {
+                'type': client_type,
+                'name': client_name,
+                'connected_at': datetime.now().isoformat()
+            }
+            await self.sio.emit('registration_confirmed', {
+                'client_id': sid,
+                'type': client_type,
+                'name': client_name,
+                'status': 'registered'
+            }, to=sid)
+
+        @self.sio.event
+        async def subscribe(sid, data):
+            """Restrict a client's updates to key prefixes and set delivery options."""
+            prefixes = data.get('prefixes') or []
+            if isinstance(prefixes, str):
+                prefixes = [prefixes]
+            keys_only = bool(data.get('keys_only', False))
+            ack = bool(data.get('ack', False))
+            self.broadcaster.subscribe(sid, prefixes, keys_only=keys_only, ack=ack)
+            await self.sio.emit('subscription_confirmed', {
+                'prefixes': prefixes,
+                'keys_only': keys_only,
+                'ack': ack
+            }, to=sid)
+
+        @self.sio.event
+        async def context_set(sid, data):
+            """Set context value from a WebSocket client."""
+            key = data.get('key')
+            value = data.get('value')
+            who = data.get('who', f'websocket_client_{sid}')
+            if not key or value is None:
+                await self.sio.emit('error', {'message': 'Missing key or value'}, to=sid)
+                return
+            try:
+                await self.backend.set_many({key: value}, who=who, origin=sid)  # Sender is skipped
+                await self.sio.emit('context_set_confirmed', {
+                    'key': key,
+                    'value': value,
+                    'status': 'success'
+                }, to=sid)
+            except Exception as e:  # Handle any errors during WebSocket update
+                logger.error(f"WebSocket context set error: {e}")
+                await self.sio.emit('error', {'message': str(e)}, to=sid)
+
+
+def create_app() -> Any:
+    """
+    ASGI application factory for worker processes.
+
+    Workers connect to the shards listed in the CONTEXT_SHARD_SOCKETS
+    environment variable (os.pathsep separated), or keep state in-process
+    when it is unset.
+
+    Returns:
+        ASGI application
+    """
+    sockets = os.getenv(SHARD_SOCKETS_ENV)
+    backend = SocketShardBackend(sockets.split(os.pathsep)) if sockets else LocalShardBackend()
+    return AsyncContextServer(backend=backend).app
+
+
+def run_asgi_server(host: str = "0.0.0.0", port: int = 8080, workers: int = 1,
+                    shards: Optional[int] = None, log_level: str = "info") -> None:
+    """
+    Run the ASGI context server with uvicorn.
+
+    With more than one worker, shard processes are started first and every
+    worker connects to them, so all workers share one context.
+
+    Args:
+        host: Server bind address
+        port: Server port
+        workers: Number of ASGI worker processes
+        shards: Number of shard processes; defaults to workers when workers > 1
+        log_level: uvicorn log level
+    """
+    try:
+        import uvicorn  # ASGI server used for multi-worker deployment
+    except ImportError:
+        raise ImportError("ASGI mode requires uvicorn. Install with: pip install uvicorn")
+
+    shard_count = shards if shards is not None else (workers if workers > 1 else 0)
+    if workers > 1 and shard_count < 1:
+        raise ValueError("Multiple workers need at least one shard to share state")
+
+    cluster = ShardCluster(shard_count=shard_count) if shard_count else None
+    try:
+        if cluster is not None:
+            os.environ[SHARD_SOCKETS_ENV] = os.pathsep.join(cluster.start())  # Inherited by workers
+        logger.info(f"Starting ASGI Context Server on {host}:{port} "
+                    f"({workers} workers, {shard_count} shards)")
+        uvicorn.run(
+            "orchestrator.asgi_context_server:create_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            log_level=log_level
+        )
+    finally:
+        if cluster is not None:
+            cluster.stop()
+            os.environ.pop(SHARD_SOCKETS_ENV, None)
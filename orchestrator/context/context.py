@@ -12,6 +12,10 @@ import copy  # Imported for deep copying values to prevent mutable reference iss
 import time  # Imported for timestamp generation in history tracking
 import threading  # Imported for thread-safe operation support
 import weakref  # Imported for weak reference management in callbacks
+import itertools  # Imported for lazy paging through history entries
+import random  # Imported for sampling in accurate memory estimation
+import sys  # Imported for object size measurement in accurate memory estimation
+from collections import deque  # Imported for per-key history retention tracking
 from typing import (
     Any,
     Dict,
@@ -19,6 +23,7 @@ from typing import (
     Optional,
     Tuple,
     Callable,
+    Iterator,
     Union,
 )  # Imported for comprehensive type hints
 from pathlib import Path  # Imported for cross-platform file path operations
@@ -32,8 +37,195 @@ from src.core.logger import (
 # Initialize module logger with debug support from environment
 logger = get_logger(__name__, debug=os.getenv("DEBUG") == "1")
 
+# Immutable JSON scalar types that never need validation or copying
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
 
-@dataclass
+# Types accepted as JSON object keys by json.dumps
+_JSON_KEY_TYPES = (str, int, float, bool, type(None))
+
+# Number of items measured per container by the accurate memory estimate
+_MEMORY_SAMPLE_SIZE = 64
+
+
+class FrozenDict(dict):
+    """
+    Immutable dictionary used for copy-on-write context values.
+
+    Behaves like a regular dict for reads, comparisons and JSON
+    serialization, but rejects mutation so a single instance can be
+    shared between the data store, history entries and callers.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        """Reject mutation of a frozen context value."""
+        raise TypeError(
+            "Context values are immutable in copy-on-write mode; "
+            "use thaw_value() for a mutable copy"
+        )
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __copy__(self) -> "FrozenDict":
+        """Frozen values are shared instead of copied."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        """Frozen values are shared instead of copied."""
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Support pickling without going through the blocked mutators."""
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """
+    Immutable list used for copy-on-write context values.
+
+    Behaves like a regular list for reads, comparisons and JSON
+    serialization, but rejects mutation so a single instance can be
+    shared between the data store, history entries and callers.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        """Reject mutation of a frozen context value."""
+        raise TypeError(
+            "Context values are immutable in copy-on-write mode; "
+            "use thaw_value() for a mutable copy"
+        )
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    clear = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    reverse = _readonly
+    sort = _readonly
+
+    def __copy__(self) -> "FrozenList":
+        """Frozen values are shared instead of copied."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenList":
+        """Frozen values are shared instead of copied."""
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Support pickling without going through the blocked mutators."""
+        return (FrozenList, (list(self),))
+
+
+def freeze_value(value: Any) -> Any:
+    """
+    Convert a JSON-compatible value into its immutable form.
+
+    Already frozen sub-values are reused as-is, so rebuilding a container
+    around existing context values only costs the changed levels. The walk
+    doubles as JSON validation.
+
+    Args:
+        value: JSON-compatible value to freeze
+
+    Returns:
+        Immutable equivalent of the value
+
+    Raises:
+        TypeError: If the value contains non-JSON-serializable data
+        ValueError: If the value contains a circular reference
+    """
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES or value_type is FrozenDict or value_type is FrozenList:
+        return value  # Already immutable
+
+    try:
+        if isinstance(value, dict):
+            for item_key in value:
+                if not isinstance(item_key, _JSON_KEY_TYPES):
+                    raise TypeError(
+                        f"keys must be str, int, float, bool or None, not {type(item_key).__name__}"
+                    )
+            return FrozenDict(
+                {item_key: freeze_value(item) for item_key, item in value.items()}
+            )
+        if isinstance(value, list):
+            return FrozenList([freeze_value(item) for item in value])
+        if isinstance(value, tuple):
+            return tuple(freeze_value(item) for item in value)
+    except RecursionError:
+        raise ValueError("Circular reference detected")
+
+    if isinstance(value, (str, int, float)):
+        return value  # Scalar subclasses such as str/int enums
+
+    raise TypeError(f"Object of type {value_type.__name__} is not JSON serializable")
+
+
+def thaw_value(value: Any) -> Any:
+    """
+    Return a mutable deep copy of a (possibly frozen) context value.
+
+    Args:
+        value: Value previously returned by a copy-on-write Context
+
+    Returns:
+        Plain dict/list structure that can be modified freely
+    """
+    if isinstance(value, dict):
+        return {item_key: thaw_value(item) for item_key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw_value(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(thaw_value(item) for item in value)
+    return value  # Scalars are immutable
+
+
+def _copy_value(value: Any) -> Any:
+    """
+    Deep copy a value for a non copy-on-write context.
+
+    Frozen values (e.g. read from a copy-on-write context) come back as
+    plain mutable containers, so only copy-on-write contexts hold them.
+    Other dict and list subclasses, such as OrderedDict or defaultdict,
+    keep their type.
+    """
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return value  # Scalars cannot be mutated through shared references
+    if value_type is dict or value_type is FrozenDict:
+        return {item_key: _copy_value(item) for item_key, item in value.items()}
+    if value_type is list or value_type is FrozenList:
+        return [_copy_value(item) for item in value]
+    if value_type is tuple:
+        return tuple(_copy_value(item) for item in value)
+    if isinstance(value, dict):
+        copied = copy.copy(value)  # Same subclass and state, e.g. a defaultdict's factory
+        for item_key in list(copied):
+            copied[item_key] = _copy_value(copied[item_key])
+        return copied
+    if isinstance(value, list):
+        copied = copy.copy(value)
+        copied[:] = [_copy_value(item) for item in value]
+        return copied
+    return copy.deepcopy(value)
+
+
+@dataclass(slots=True)
 class ContextHistoryEntry:
     """
     Structured representation of a Context history entry.
@@ -59,6 +251,208 @@ class ContextHistoryEntry:
         }
 
 
+class ContextHistoryBuffer:
+    """
+    Bounded ring buffer for Context history with optional spill-to-disk.
+
+    Entries live in a fixed-size slot array indexed by sequence number, or
+    in an insertion-ordered mapping keyed by sequence number when no
+    capacity is set, so discarded entries never leave holes behind.
+    When the buffer is full the oldest entry is appended to an append-only
+    JSON-lines log (if configured) before its slot is reused, so memory stays
+    flat while the full audit trail remains readable through iteration.
+    Per-key retention rules discard all but the newest N entries for keys
+    matching a prefix, keeping noisy keys from flushing useful history.
+
+    The buffer supports the list operations Context uses on its history:
+    append, len, iteration and clear. Call close() to release the spill
+    log handle.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_slots",
+        "_next_seq",
+        "_live_count",
+        "_spill_path",
+        "_spill_file",
+        "_spilled_count",
+        "_retention",
+        "_retained_seqs",
+    )
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        spill_path: Optional[Union[str, Path]] = None,
+        retention: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Initialize the history buffer.
+
+        Args:
+            capacity: Maximum in-memory entries (unbounded if None)
+            spill_path: Append-only JSON-lines file receiving evicted entries
+            retention: Maximum entries kept per key, by key prefix
+
+        Raises:
+            ValueError: If capacity or retention limits are not positive
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("History capacity must be at least 1")
+        for prefix, limit in (retention or {}).items():
+            if limit < 1:
+                raise ValueError(f"History retention for '{prefix}' must be at least 1")
+
+        self._capacity = capacity  # Slot count (None for a growing buffer)
+        self._slots: Union[List[Optional[ContextHistoryEntry]], Dict[int, ContextHistoryEntry]] = (
+            [None] * capacity if capacity else {}
+        )  # Entry slots indexed by sequence number
+        self._next_seq = 0  # Sequence number of the next appended entry
+        self._live_count = 0  # Entries currently held in memory
+        self._spill_path = Path(spill_path) if spill_path else None  # Spill log location
+        self._spill_file = None  # Lazily opened spill log handle
+        self._spilled_count = 0  # Entries written to the spill log
+        self._retention = dict(retention or {})  # Per-prefix retention limits
+        self._retained_seqs: Dict[str, deque] = {}  # Live sequence numbers per retained key
+
+        if self._spill_path and self._spill_path.exists():
+            with open(self._spill_path, "rb") as spill_file:
+                self._spilled_count = sum(1 for _ in spill_file)  # Resume existing log
+
+    @property
+    def spilled_count(self) -> int:
+        """Number of entries held in the spill log."""
+        return self._spilled_count
+
+    def append(self, entry: ContextHistoryEntry) -> None:
+        """
+        Append an entry, evicting or discarding older entries as needed.
+
+        Args:
+            entry: History entry to record
+        """
+        seq = self._next_seq
+        self._next_seq += 1
+
+        if self._capacity:
+            slot_index = seq % self._capacity
+            evicted = self._slots[slot_index]
+            if evicted is not None:
+                self._live_count -= 1
+                self._spill(evicted)  # Keep the audit trail of evicted entries
+            self._slots[slot_index] = entry
+        else:
+            self._slots[seq] = entry
+        self._live_count += 1
+
+        limit = self._retention_limit(entry.key)
+        if limit is not None:
+            retained = self._retained_seqs.setdefault(entry.key, deque())
+            retained.append(seq)
+            while len(retained) > limit:
+                self._discard(retained.popleft())
+
+    def __len__(self) -> int:
+        """Return the number of entries held in memory."""
+        return self._live_count
+
+    def __iter__(self) -> Iterator[ContextHistoryEntry]:
+        """Iterate in-memory entries from oldest to newest."""
+        if not self._capacity:
+            yield from list(self._slots.values())
+            return
+        first_seq = self._first_seq()
+        for seq in range(first_seq, self._next_seq):
+            entry = self._slots[self._slot_index(seq)]
+            if entry is not None:
+                yield entry
+
+    def clear(self) -> int:
+        """
+        Remove all in-memory entries and truncate the spill log.
+
+        Returns:
+            Number of entries removed (in memory plus spilled)
+        """
+        cleared_count = self._live_count + self._spilled_count
+        self._slots = [None] * self._capacity if self._capacity else {}
+        self._next_seq = 0
+        self._live_count = 0
+        self._retained_seqs.clear()
+
+        self.close()
+        if self._spill_path and self._spill_path.exists():
+            self._spill_path.unlink()
+        self._spilled_count = 0
+        return cleared_count
+
+    def close(self) -> None:
+        """Close the spill log handle; it is reopened on the next eviction."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def __del__(self) -> None:
+        """Release the spill log handle when the buffer is garbage collected."""
+        spill_file = getattr(self, "_spill_file", None)
+        if spill_file is not None:
+            spill_file.close()
+
+    def spill_snapshot(self) -> Tuple[Optional[Path], int]:
+        """
+        Flush the spill log and return its path and current byte size.
+
+        Returns:
+            Tuple of spill path (None if not configured) and readable byte count
+        """
+        if self._spill_file is not None:
+            self._spill_file.flush()
+        if self._spill_path and self._spill_path.exists():
+            return self._spill_path, self._spill_path.stat().st_size
+        return self._spill_path, 0
+
+    def _first_seq(self) -> int:
+        """Sequence number of the oldest ring slot that may hold a live entry."""
+        return max(0, self._next_seq - self._capacity)
+
+    def _slot_index(self, seq: int) -> int:
+        """Ring slot position for a sequence number."""
+        return seq % self._capacity
+
+    def _retention_limit(self, key: str) -> Optional[int]:
+        """Return the retention limit of the longest prefix matching key."""
+        if not self._retention:
+            return None
+        matches = [prefix for prefix in self._retention if key.startswith(prefix)]
+        if not matches:
+            return None
+        return self._retention[max(matches, key=len)]
+
+    def _discard(self, seq: int) -> None:
+        """Drop an entry that exceeded its key's retention limit."""
+        if not self._capacity:
+            if self._slots.pop(seq, None) is not None:
+                self._live_count -= 1
+            return
+        if seq < self._first_seq():
+            return  # Already evicted by the ring
+        slot_index = self._slot_index(seq)
+        if self._slots[slot_index] is not None:
+            self._slots[slot_index] = None
+            self._live_count -= 1
+
+    def _spill(self, entry: ContextHistoryEntry) -> None:
+        """Append an evicted entry to the spill log if one is configured."""
+        if self._spill_path is None:
+            return  # Bounded mode without spill simply drops old entries
+        if self._spill_file is None:
+            self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill_file = open(self._spill_path, "ab")
+        self._spill_file.write(json.dumps(entry.to_dict()).encode("utf-8") + b"\n")
+        self._spilled_count += 1
+
+
 @dataclass
 class ContextMetrics:
     """
@@ -86,6 +480,17 @@ class ContextMetrics:
             self.set_operations += 1  # Increment set operation counter
         self.last_updated = time.time()  # Update last modified timestamp
 
+    def add_operations(self, operation_type: str, count: int) -> None:
+        """Fold a batch of operations counted outside the metrics object."""
+        if count <= 0:
+            return  # Nothing to record
+        self.total_operations += count  # Increment total operation counter
+        if operation_type == "get":
+            self.get_operations += count  # Increment get operation counter
+        elif operation_type == "set":
+            self.set_operations += count  # Increment set operation counter
+        self.last_updated = time.time()  # Update last modified timestamp
+
 
 class Context:
     """
@@ -103,10 +508,17 @@ class Context:
     - Built-in performance monitoring and metrics collection
     - Thread-safe operations with proper locking mechanisms
     - Extensible callback system for event notifications
+    - Optional copy-on-write storage of immutable, structurally shared values
     """
 
     def __init__(
-        self, enable_history: bool = True, enable_metrics: bool = True
+        self,
+        enable_history: bool = True,
+        enable_metrics: bool = True,
+        copy_on_write: bool = False,
+        history_limit: Optional[int] = None,
+        history_spill_path: Optional[Union[str, Path]] = None,
+        history_retention: Optional[Dict[str, int]] = None,
     ) -> None:
         """
         Initialize the Context with integrated components.
@@ -114,17 +526,31 @@ class Context:
         Args:
             enable_history: Whether to track change history (default: True)
             enable_metrics: Whether to collect performance metrics (default: True)
+            copy_on_write: Store values as shared immutable containers instead
+                of deep copies (default: False). Values returned by get() are
+                then read-only; use thaw_value() for a mutable copy.
+            history_limit: Maximum history entries kept in memory (unbounded if None)
+            history_spill_path: Append-only log receiving entries evicted by
+                history_limit, readable through iter_history()/get_history()
+            history_retention: Maximum history entries kept per key, by key prefix
         """
         # Core state management components
         self._data: Dict[str, Any] = {}  # Main data store for key-value pairs
-        self._history: List[ContextHistoryEntry] = (
-            []
+        self._history: Union[List[ContextHistoryEntry], ContextHistoryBuffer] = (
+            ContextHistoryBuffer(
+                capacity=history_limit,
+                spill_path=history_spill_path,
+                retention=history_retention,
+            )
+            if history_limit or history_spill_path or history_retention
+            else []
         )  # Change history with structured entries
         self._dirty_keys: set = set()  # Keys that have changed since last persistence
 
         # Configuration and feature flags
         self._enable_history: bool = enable_history  # Control history tracking
         self._enable_metrics: bool = enable_metrics  # Control metrics collection
+        self._copy_on_write: bool = copy_on_write  # Share frozen values instead of copying
 
         # Metrics and monitoring
         self._metrics = (
@@ -134,6 +560,16 @@ class Context:
         # Thread safety and synchronization
         self._lock = threading.RLock()  # Reentrant lock for thread-safe operations
 
+        # Lazily folded read counters for the lock-free get path
+        self._get_count: int = 0  # Reads performed (approximate under contention)
+        self._folded_get_count: int = 0  # Reads already folded into metrics
+        self._has_get_callbacks: bool = False  # Whether get needs callback dispatch
+
+        # Incremental memory accounting for get_metrics()
+        self._key_sizes: Dict[str, int] = {}  # Serialized size per measured key
+        self._unsized_keys: set = set()  # Keys changed since last measurement
+        self._data_size_bytes: int = 0  # Sum of measured key sizes
+
         # Event system for extensibility
         self._callbacks: Dict[str, List[Callable]] = {  # Event callback registry
             "before_set": [],  # Callbacks before set operations
@@ -150,7 +586,8 @@ class Context:
 
         logger.debug("Context initialized with integrated components")
         logger.debug(
-            f"Features enabled - History: {enable_history}, Metrics: {enable_metrics}"
+            f"Features enabled - History: {enable_history}, Metrics: {enable_metrics}, "
+            f"Copy-on-write: {copy_on_write}"
         )
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -158,7 +595,9 @@ class Context:
         Retrieve value for a given dotted key with optional default.
 
         This method provides thread-safe access to stored values with
-        comprehensive logging and metrics collection.
+        comprehensive logging and metrics collection. When no get callbacks
+        are registered, reads skip the lock and callback dispatch entirely
+        and are counted lazily for metrics.
 
         Args:
             key: Dotted string key for hierarchical access
@@ -167,6 +606,14 @@ class Context:
         Returns:
             Stored value or default if key doesn't exist
         """
+        if not self._has_get_callbacks:
+            # Fast path: single dict reads are atomic, so no lock or dispatch is needed
+            value = self._data.get(key, default)  # Get value or return default
+            self._get_count += 1  # Folded into metrics lazily by get_metrics()
+            if logger.config.debug_enabled:
+                logger.debug(f"Retrieved key '{key}': {type(value).__name__}")
+            return value  # Return retrieved value or default
+
         with self._lock:  # Ensure thread-safe access to internal state
             # Execute before_get callbacks for extensibility
             self._execute_callbacks("before_get", key=key, default=default)
@@ -174,15 +621,15 @@ class Context:
             # Retrieve value using safe dictionary access
             value = self._data.get(key, default)  # Get value or return default
 
-            # Update metrics if enabled
-            if self._metrics:
-                self._metrics.update_operation_count("get")  # Track get operation
+            # Count the read for lazily folded metrics
+            self._get_count += 1
 
             # Execute after_get callbacks with result
             self._execute_callbacks("after_get", key=key, value=value, default=default)
 
             # Log access for debugging and audit purposes
-            logger.debug(f"Retrieved key '{key}': {type(value).__name__}")
+            if logger.config.debug_enabled:
+                logger.debug(f"Retrieved key '{key}': {type(value).__name__}")
 
             return value  # Return retrieved value or default
 
@@ -207,11 +654,8 @@ class Context:
             if not isinstance(key, str):
                 raise TypeError(f"Key must be string, got {type(key).__name__}")
 
-            # Validate JSON serializability
-            try:
-                json.dumps(value)  # Test JSON serialization capability
-            except (TypeError, ValueError) as e:
-                raise ValueError(f"Value for key '{key}' is not JSON-serializable: {e}")
+            # Validate JSON serializability and prepare the stored form
+            stored_value = self._prepare_value(key, value)
 
             # Execute before_set callbacks for validation and preprocessing
             self._execute_callbacks("before_set", key=key, value=value, who=who)
@@ -220,22 +664,34 @@ class Context:
             previous_value = self._data.get(key)  # Get current value or None
 
             # Check if this is actually a change
-            if previous_value != value:  # Only proceed if value actually changed
+            if (
+                previous_value is not stored_value and previous_value != value
+            ):  # Only proceed if value actually changed
                 # Update the data store
-                self._data[key] = copy.deepcopy(
-                    value
-                )  # Store deep copy to prevent mutations
+                if not self._copy_on_write:
+                    stored_value = _copy_value(
+                        value
+                    )  # Store deep copy to prevent mutations
+                self._data[key] = stored_value
+                self._unsized_keys.add(key)  # Re-measure lazily in get_metrics()
 
                 # Mark key as dirty for persistence
                 self._dirty_keys.add(key)  # Add to dirty keys set
 
                 # Record history entry if enabled
                 if self._enable_history:
+                    if self._copy_on_write:
+                        before, after = (
+                            previous_value,
+                            stored_value,
+                        )  # Frozen values are shared, not copied
+                    else:
+                        before, after = _copy_value(previous_value), _copy_value(value)
                     history_entry = ContextHistoryEntry(
                         timestamp=time.time(),  # Current timestamp
                         key=key,  # Modified key
-                        before=copy.deepcopy(previous_value),  # Previous value copy
-                        after=copy.deepcopy(value),  # New value copy
+                        before=before,  # Previous value copy
+                        after=after,  # New value copy
                         who=who,  # Change attribution
                         operation="set",  # Operation type
                     )
@@ -261,10 +717,11 @@ class Context:
                 self._execute_callbacks("on_dirty", key=key)
 
                 # Log the change for debugging and audit
-                logger.debug(
-                    f"Set key '{key}' by '{who or 'unknown'}': {type(value).__name__}"
-                )
-            else:
+                if logger.config.debug_enabled:
+                    logger.debug(
+                        f"Set key '{key}' by '{who or 'unknown'}': {type(value).__name__}"
+                    )
+            elif logger.config.debug_enabled:
                 # Log no-op for debugging
                 logger.debug(f"No-op set for key '{key}': value unchanged")
 
@@ -279,6 +736,8 @@ class Context:
             Deep copy of all context data as dictionary
         """
         with self._lock:  # Ensure thread-safe access during copy operation
+            if self._copy_on_write:
+                return thaw_value(self._data)  # Mutable copy of frozen values
             return copy.deepcopy(
                 self._data
             )  # Return deep copy to prevent external mutations
@@ -334,27 +793,67 @@ class Context:
 
         # Populate data without triggering history/callbacks
         with context._lock:  # Ensure thread-safe initialization
-            context._data = copy.deepcopy(data)  # Store deep copy of data
+            if context._copy_on_write:
+                data = {key: freeze_value(value) for key, value in data.items()}
+            context._data = data  # Freshly parsed data is not shared with anyone
+            context._unsized_keys = set(data)  # Measure lazily on first poll
             if context._metrics:
                 context._metrics.total_keys = len(data)  # Update metrics
 
         logger.debug(f"Created Context from JSON with {len(data)} keys")
         return context  # Return initialized instance
 
-    def get_history(self) -> List[Dict[str, Any]]:
+    def get_history(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Retrieve complete change history as list of dictionaries.
+        Retrieve change history as list of dictionaries.
 
         Provides access to all tracked changes for debugging,
-        auditing, and rollback operations.
+        auditing, and rollback operations. Entries spilled to disk by a
+        bounded history are included, oldest first; use offset and limit
+        to page through long histories without loading them entirely.
+
+        Args:
+            offset: Number of oldest entries to skip
+            limit: Maximum number of entries to return (all if None)
 
         Returns:
             List of history entries as dictionaries
         """
-        with self._lock:  # Ensure thread-safe access to history
-            return [
-                entry.to_dict() for entry in self._history
-            ]  # Convert entries to dictionaries
+        stop = None if limit is None else offset + limit  # Page end position
+        return list(itertools.islice(self.iter_history(), offset, stop))
+
+    def iter_history(self) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate change history, including spilled entries, oldest first.
+
+        Spilled entries are streamed from the on-disk log, so memory use is
+        independent of the length of the audit trail. The iteration reflects
+        the history at the time it was started.
+
+        Yields:
+            History entries as dictionaries
+        """
+        with self._lock:  # Capture a consistent view of memory and spill log
+            entries = list(self._history)  # In-memory entries (bounded)
+            spill_path, spill_size = (
+                self._history.spill_snapshot()
+                if isinstance(self._history, ContextHistoryBuffer)
+                else (None, 0)
+            )
+
+        if spill_path is not None and spill_size:
+            with open(spill_path, "rb") as spill_file:
+                bytes_read = 0  # Only read what existed when iteration started
+                for line in spill_file:
+                    bytes_read += len(line)
+                    if bytes_read > spill_size:
+                        break
+                    yield json.loads(line)
+
+        for entry in entries:
+            yield entry.to_dict() if isinstance(entry, ContextHistoryEntry) else entry
 
     def pop_dirty_keys(self) -> List[str]:
         """
@@ -377,6 +876,22 @@ class Context:
             logger.debug(f"Popped {len(dirty_list)} dirty keys")
             return dirty_list  # Return list of previously dirty keys
 
+    def mark_dirty(self, keys: List[str]) -> None:
+        """
+        Mark keys as dirty again, e.g. after a failed persistence attempt.
+
+        Keys that are no longer present in the context are ignored.
+
+        Args:
+            keys: Keys previously returned by pop_dirty_keys()
+        """
+        with self._lock:  # Ensure thread-safe access to dirty keys
+            self._dirty_keys.update(key for key in keys if key in self._data)
+
+            # Update metrics if enabled
+            if self._metrics:
+                self._metrics.dirty_keys_count = len(self._dirty_keys)
+
     def keys(self) -> List[str]:
         """
         Return list of all current keys in the context.
@@ -411,15 +926,24 @@ class Context:
 
         with self._lock:  # Ensure thread-safe callback registration
             self._callbacks[event].append(callback)  # Add callback to event list
+            self._has_get_callbacks = bool(
+                self._callbacks["before_get"] or self._callbacks["after_get"]
+            )  # Route get through dispatch only when needed
 
         logger.debug(f"Registered callback for event '{event}'")
 
-    def get_metrics(self) -> Optional[Dict[str, Any]]:
+    def get_metrics(self, accurate: bool = False) -> Optional[Dict[str, Any]]:
         """
         Retrieve current performance metrics.
 
         Provides access to operational statistics for monitoring,
-        optimization, and capacity planning.
+        optimization, and capacity planning. The memory estimate is kept
+        up to date incrementally, so polling only measures keys changed
+        since the previous call.
+
+        Args:
+            accurate: Estimate in-memory size with a sampled sys.getsizeof
+                walk instead of the serialized-size estimate
 
         Returns:
             Dictionary of current metrics or None if metrics disabled
@@ -428,9 +952,14 @@ class Context:
             return None  # Return None if metrics are disabled
 
         with self._lock:  # Ensure thread-safe access to metrics
+            # Fold reads counted by the lock-free get path
+            read_count = self._get_count
+            self._metrics.add_operations("get", read_count - self._folded_get_count)
+            self._folded_get_count = read_count
+
             # Calculate estimated memory usage
             estimated_memory = (
-                self._estimate_memory_usage()
+                self._estimate_memory_usage(accurate=accurate)
             )  # Calculate current memory usage
             self._metrics.memory_usage_bytes = estimated_memory  # Update metrics
 
@@ -456,8 +985,11 @@ class Context:
             Number of history entries that were cleared
         """
         with self._lock:  # Ensure thread-safe history modification
-            cleared_count = len(self._history)  # Count entries before clearing
-            self._history.clear()  # Clear all history entries
+            if isinstance(self._history, ContextHistoryBuffer):
+                cleared_count = self._history.clear()  # Includes spilled entries
+            else:
+                cleared_count = len(self._history)  # Count entries before clearing
+                self._history.clear()  # Clear all history entries
 
             # Update metrics if enabled
             if self._metrics:
@@ -466,6 +998,25 @@ class Context:
             logger.debug(f"Cleared {cleared_count} history entries")
             return cleared_count  # Return number of cleared entries
 
+    def close(self) -> None:
+        """
+        Release resources held by the context.
+
+        Closes the history spill log handle; the context stays usable and
+        reopens the log on the next eviction.
+        """
+        with self._lock:  # Ensure no eviction writes to a closing handle
+            if isinstance(self._history, ContextHistoryBuffer):
+                self._history.close()
+
+    def __enter__(self) -> "Context":
+        """Return the context for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the context when leaving a with statement."""
+        self.close()
+
     def merge_from(
         self, other: "Context", conflict_strategy: str = "last_wins", prefix: str = ""
     ) -> None:
@@ -494,7 +1045,11 @@ class Context:
             )
 
         with self._lock:  # Ensure thread-safe merge operation
-            other_data = other.to_dict()  # Get data from other context
+            if other._copy_on_write:
+                with other._lock:
+                    other_data = dict(other._data)  # Frozen values can be shared
+            else:
+                other_data = other.to_dict()  # Get data from other context
             conflicts = []  # Track conflicts for error strategy
 
             for key, value in other_data.items():  # Iterate through other context data
@@ -530,6 +1085,35 @@ class Context:
                 f"Merged {len(other_data)} keys from other context with strategy '{conflict_strategy}'"
             )
 
+    def _prepare_value(self, key: str, value: Any) -> Any:
+        """
+        Validate a value for storage and return the form to store.
+
+        Scalars are accepted by type without serialization. In copy-on-write
+        mode containers are frozen (reusing already frozen sub-values);
+        otherwise they are validated with a JSON serialization pass.
+
+        Args:
+            key: Key the value is being stored under
+            value: Value to validate
+
+        Returns:
+            Value to store (frozen in copy-on-write mode)
+
+        Raises:
+            ValueError: If value is not JSON-serializable
+        """
+        if type(value) in _JSON_SCALAR_TYPES:
+            return value  # Scalars are always valid and immutable
+
+        try:
+            if self._copy_on_write:
+                return freeze_value(value)  # Validate while freezing
+            json.dumps(value)  # Test JSON serialization capability
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Value for key '{key}' is not JSON-serializable: {e}")
+        return value
+
     def _execute_callbacks(self, event: str, **kwargs) -> None:
         """
         Execute all registered callbacks for a specific event.
@@ -549,20 +1133,28 @@ class Context:
                 # Log callback errors but don't interrupt main operation
                 logger.error(f"Callback error for event '{event}': {e}")
 
-    def _estimate_memory_usage(self) -> int:
+    def _estimate_memory_usage(self, accurate: bool = False) -> int:
         """
         Estimate memory usage of the context data.
 
         Provides approximate memory consumption for monitoring
-        and optimization purposes.
+        and optimization purposes. The default estimate is the serialized
+        JSON size, maintained per key and refreshed only for keys changed
+        since the last call.
+
+        Args:
+            accurate: Use a sampled sys.getsizeof walk of the stored objects
 
         Returns:
             Estimated memory usage in bytes
         """
         try:
-            # Simple estimation based on JSON serialization length
-            json_data = json.dumps(self._data)  # Serialize data to JSON
-            data_size = len(json_data.encode("utf-8"))  # Calculate byte size
+            if accurate:
+                data_size = self._sampled_sizeof(self._data)  # In-memory object size
+            else:
+                self._refresh_key_sizes()  # Measure only changed keys
+                # Braces replace the separator not emitted after the last member
+                data_size = self._data_size_bytes or 2
 
             # Add overhead for history and internal structures
             history_size = (
@@ -574,6 +1166,62 @@ class Context:
         except Exception:
             return 0  # Return 0 if estimation fails
 
+    def _refresh_key_sizes(self) -> None:
+        """Update the running serialized-size total for keys changed since last call."""
+        for key in self._unsized_keys:
+            previous_size = self._key_sizes.pop(key, 0)  # Size counted so far
+            new_size = 0
+            if key in self._data:
+                # Key, value and the ': ' / ', ' separators of a JSON object member
+                new_size = len(json.dumps(key)) + len(json.dumps(self._data[key])) + 4
+                self._key_sizes[key] = new_size
+            self._data_size_bytes += new_size - previous_size
+        self._unsized_keys.clear()
+
+    def _sampled_sizeof(self, value: Any, depth: int = 0) -> int:
+        """
+        Estimate the deep in-memory size of a value with sys.getsizeof.
+
+        Containers with more than _MEMORY_SAMPLE_SIZE items are measured
+        on a random sample and extrapolated to their full length.
+
+        Args:
+            value: Object to measure
+            depth: Current recursion depth
+
+        Returns:
+            Estimated size in bytes
+        """
+        size = sys.getsizeof(value)  # Size of the object itself
+        if depth > 32:
+            return size  # Guard against pathological nesting
+
+        if isinstance(value, dict):
+            items = list(value.items())
+        elif isinstance(value, (list, tuple)):
+            items = list(value)
+        else:
+            return size  # Scalars have no children
+
+        if not items:
+            return size
+
+        sample = (
+            random.sample(items, _MEMORY_SAMPLE_SIZE)
+            if len(items) > _MEMORY_SAMPLE_SIZE
+            else items
+        )
+        if isinstance(value, dict):
+            sample_size = sum(
+                self._sampled_sizeof(item_key, depth + 1)
+                + self._sampled_sizeof(item, depth + 1)
+                for item_key, item in sample
+            )
+        else:
+            sample_size = sum(self._sampled_sizeof(item, depth + 1) for item in sample)
+
+        return size + sample_size * len(items) // len(sample)  # Extrapolate to all items
+
     def __repr__(self) -> str:
         """
         Provide detailed string representation for debugging.
@@ -596,4 +1244,13 @@ class Context:
 
 
 # Module exports for clean API
-__all__ = ["Context", "ContextHistoryEntry", "ContextMetrics"]
+__all__ = [
+    "Context",
+    "ContextHistoryEntry",
+    "ContextHistoryBuffer",
+    "ContextMetrics",
+    "FrozenDict",
+    "FrozenList",
+    "freeze_value",
+    "thaw_value",
+]
@@ -8,21 +8,46 @@ Provides basic database/file persistence functionality.
 import json
 import sqlite3
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 class DBAdapter:
-    """Simple database adapter for context persistence."""
+    """Simple database adapter for context persistence.
     
-    def __init__(self, db_path: str = "./data/iaf0.db"):
-        """Initialize database adapter with SQLite backend."""
+    Holds one long-lived SQLite connection in WAL journal mode, so readers
+    do not block the writer, and saves contexts with a single executemany()
+    upsert per call.
+    """
+    
+    def __init__(self, db_path: str = "./data/iaf0.db", synchronous: str = "NORMAL"):
+        """Initialize database adapter with SQLite backend.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            synchronous: SQLite synchronous level (OFF, NORMAL, FULL, EXTRA)
+        """
+        if synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Invalid synchronous level: {synchronous}")
         self.db_path = Path(db_path)  # Database file path
+        self.synchronous = synchronous.upper()  # Durability level for commits
+        self._conn: Optional[sqlite3.Connection] = None  # Shared connection, opened lazily
+        self._lock = threading.RLock()  # Serializes use of the shared connection
         self.db_path.parent.mkdir(parents=True, exist_ok=True)  # Create directory
         self._init_db()  # Initialize database schema
     
+    def _connection(self) -> sqlite3.Connection:
+        """Return the shared connection, opening and configuring it if needed."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")  # Concurrent readers during writes
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")  # Commit durability
+            self._conn = conn
+        return self._conn
+    
     def _init_db(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS context_data (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -32,26 +57,26 @@ class DBAdapter:
                     version_id TEXT
                 )
             """)
-            conn.commit()  # Save schema changes
     
     def save_context(self, data: Dict[str, Any], mode: str = "full") -> None:
         """Save context data to database."""
-        with sqlite3.connect(self.db_path) as conn:
-            for key, value in data.items():
-                # Serialize value to JSON string
-                value_json = json.dumps(value)
-                
-                # Insert or update data
-                conn.execute("""
-                    INSERT OR REPLACE INTO context_data (key, value, version_id)
-                    VALUES (?, ?, ?)
-                """, (key, value_json, mode))
-            
-            conn.commit()  # Save changes
+        # Serialize values before taking the lock
+        rows = [(key, json.dumps(value), mode) for key, value in data.items()]
+        with self._lock, self._connection() as conn:  # Single transaction
+            # Insert or update data
+            conn.executemany("""
+                INSERT INTO context_data (key, value, version_id)
+                VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    version_id = excluded.version_id,
+                    timestamp = CURRENT_TIMESTAMP
+            """, rows)
     
     def load_context(self, version_id: Optional[str] = None) -> Dict[str, Any]:
         """Load context data from database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._connection()
             if version_id:
                 cursor = conn.execute("""
                     SELECT key, value FROM context_data 
@@ -61,21 +86,21 @@ class DBAdapter:
                 cursor = conn.execute("""
                     SELECT key, value FROM context_data
                 """)
+            rows = cursor.fetchall()
             
-            data = {}  # Initialize result dictionary
-            for row in cursor.fetchall():
-                key, value_json = row
-                try:
-                    data[key] = json.loads(value_json)  # Deserialize JSON
-                except json.JSONDecodeError:
-                    data[key] = value_json  # Use raw value if JSON fails
-            
-            return data
+        data = {}  # Initialize result dictionary
+        for key, value_json in rows:
+            try:
+                data[key] = json.loads(value_json)  # Deserialize JSON
+            except json.JSONDecodeError:
+                data[key] = value_json  # Use raw value if JSON fails
+        
+        return data
     
     def get_versions(self) -> list:
         """Get list of available versions."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
+        with self._lock:
+            cursor = self._connection().execute("""
                 SELECT DISTINCT version_id FROM context_data 
                 WHERE version_id IS NOT NULL
                 ORDER BY timestamp DESC
@@ -84,16 +109,21 @@ class DBAdapter:
     
     def clear(self) -> None:
         """Clear all data from database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._connection() as conn:
             conn.execute("DELETE FROM context_data")
-            conn.commit()  # Save changes
+    
+    def close(self) -> None:
+        """Close the shared connection; it is reopened on next use."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
     
     def __repr__(self) -> str:
         """String representation of adapter."""
         return f"DBAdapter(db_path={self.db_path})"
 
 
-# Simple file-based storage for basic persistence
 class FileAdapter:
     """Simple file-based storage adapter."""
     
@@ -3,6 +3,8 @@
 # of context data to disk or database in the IAF0 framework.
 # It supports interval-based flushes (e.g., every 10 seconds), diff-only flushes
 # (only changed keys), and on-demand flushes.
+# Diff flushes append the Context's dirty keys to a write-ahead log, which is
+# periodically compacted into a single base snapshot.
 # Compression is applied using gzip for efficiency, especially for large contexts.
 # The class integrates with the Context class for data access, MemoryBus for in-memory state,
 # and version_control.py for versioning during persistence.
@@ -12,32 +14,32 @@
 import gzip  # Imported for compression of data during flushing to reduce storage size.
 import json  # Imported for serializing data to JSON format before flushing.
 import os  # Imported for file system operations like checking paths and writing files.
+import tempfile  # Imported for atomic replacement of the base snapshot.
 import time  # Imported for handling interval-based flushing using timestamps.
 from typing import (
     Any,
     Dict,
+    List,
     Optional,
+    Tuple,
 )  # Imported for type hints to improve code readability.
 from orchestrator.context.context import (
     Context,
 )  # Imported to access the Context class for data retrieval.
-try:
-    from .db_adapter import (
-        DatabaseAdapter,
-        DatabaseConfig,
-        QueryResult,
-        create_database_adapter,
-    )
-except ImportError:
-    from orchestrator.context.db_adapter import (
-        DatabaseAdapter,
-        DatabaseConfig,
-        QueryResult,
-        create_database_adapter,
-    )  # Imported for database interactions (MySQL/SQLite3).
+from orchestrator.context.db_adapter import (
+    DBAdapter,
+)  # Imported for database interactions (SQLite3).
 from orchestrator.context.version_control import (
     VersionControl,
 )  # Imported for versioning integration during flushes.
+from src.core.logger import get_logger  # Imported for framework logging.
+
+logger = get_logger(__name__, debug=os.getenv("DEBUG") == "1")  # Module logger.
+
+BASE_SNAPSHOT_NAME = "context_base.json"  # Base snapshot written by compaction.
+WAL_FILE_NAME = "context.wal"  # Append-only log of key changes since the base snapshot.
+WAL_FORMAT_VERSION = 1  # Bumped whenever the base or WAL record layout changes.
+_MISSING = object()  # Sentinel for dirty keys no longer present in the context.
 
 
 class Persistence:
@@ -45,6 +47,13 @@ class Persistence:
     Persistence class for flushing context data to disk or DB with compression.
     Supports interval, diff-only, and on-demand modes.
     Integrates with DBAdapter for persistent storage and VersionControl for versioning.
+
+    Disk state is a base snapshot plus an append-only write-ahead log (WAL).
+    Diff flushes append one JSON line holding only the keys marked dirty by
+    the Context since the previous flush, so their cost scales with the
+    number of changed keys. Full flushes, and diff flushes once the WAL holds
+    wal_compaction_threshold records, compact everything into the base
+    snapshot and truncate the WAL. recover() replays base plus WAL.
     """
 
     def __init__(
@@ -53,9 +62,15 @@ class Persistence:
         db_adapter: Optional[DBAdapter] = None,
         flush_interval: int = 10,
         flush_dir: str = "./persistence",
+        wal_compaction_threshold: int = 100,
+        fsync: bool = True,
     ) -> None:
         # Initializes the Persistence instance.
         # Requires a Context object; optionally takes DBAdapter, flush interval (seconds), and disk directory.
+        # wal_compaction_threshold: WAL records appended before diff flushes compact into the base snapshot.
+        # fsync: Whether WAL appends and snapshots are forced to stable storage before returning.
+        if wal_compaction_threshold < 1:  # Validates the compaction threshold.
+            raise ValueError("wal_compaction_threshold must be at least 1")
         self.context = (
             context  # Stores the reference to the Context object for data access.
         )
@@ -64,51 +79,61 @@ class Persistence:
             flush_interval  # Interval in seconds for automatic flushes.
         )
         self.flush_dir = flush_dir  # Directory path for disk-based flush files.
+        self.wal_compaction_threshold = wal_compaction_threshold  # WAL records allowed before compaction.
+        self.fsync = fsync  # Durability flag for WAL appends and snapshots.
+        self.version_control = VersionControl(db_adapter)  # Versioning for every flush.
         self.last_flush_time = (
             time.time()
         )  # Tracks the timestamp of the last flush for interval checks.
-        self.last_flushed_data: Dict[str, Any] = (
-            {}
-        )  # Stores the last flushed data for diff calculations.
         os.makedirs(
             self.flush_dir, exist_ok=True
         )  # Creates the flush directory if it doesn't exist, avoiding errors.
+        self.wal_path = os.path.join(self.flush_dir, WAL_FILE_NAME)  # Location of the WAL.
+        self._wal_sequence, self._wal_records = (
+            self._scan_existing_state()
+        )  # Continues numbering after any state left by a previous process.
 
     def flush(self, mode: str = "full", compress: bool = True) -> None:
         # Performs a flush operation based on the mode.
         # Modes: 'full' (all data), 'diff' (only changes), 'demand' (forced full).
         # Args:
         #   mode: Flush mode ('full', 'diff', 'demand').
-        #   compress: Whether to apply gzip compression.
-        current_data = (
-            self.context.to_dict()
-        )  # Retrieves the current context data as a dict.
-        data_to_flush = (
-            current_data
-            if mode in ("full", "demand")
-            else self._compute_diff(current_data)
-        )  # Determines data based on mode.
-        flushed = False  # Flag to track if flush occurred.
-
-        if self.db_adapter:  # Checks if a DBAdapter is provided.
+        #   compress: Whether to apply gzip compression to the base snapshot.
+        if mode in ("full", "demand"):  # Full flushes rewrite the base snapshot.
+            data_to_flush = self.compact(compress)  # Snapshots everything and truncates the WAL.
+        else:
+            data_to_flush = self._flush_dirty_keys()  # Appends only changed keys to the WAL.
+            if self._wal_records >= self.wal_compaction_threshold:  # WAL grew long enough to fold.
+                self.compact(compress)  # Keeps recovery time and disk use bounded.
+            else:
+                self.version_control.commit(
+                    self.context
+                )  # Every flush records a version, as compaction does.
+
+        if self.db_adapter and data_to_flush:  # Checks if a DBAdapter is provided.
             self._flush_to_db(
                 data_to_flush, mode
             )  # Calls private method to flush to database.
-            flushed = True  # Sets flag to indicate flush happened.
-
-        self._flush_to_disk(
-            data_to_flush, compress
-        )  # Calls private method to flush to disk, regardless of DB.
-        flushed = True  # Sets flag (redundant if DB flushed, but ensures).
-
-        if flushed:  # If a flush occurred:
-            self.last_flush_time = time.time()  # Updates the last flush timestamp.
-            self.last_flushed_data = (
-                current_data.copy()
-            )  # Updates the last flushed data for future diffs.
-            VersionControl(self.db_adapter).commit(
-                self.context
-            )  # Integrates with VersionControl to commit the version.
+
+        self.last_flush_time = time.time()  # Updates the last flush timestamp.
+
+    def compact(self, compress: bool = True) -> Dict[str, Any]:
+        # Folds the WAL into a fresh base snapshot of the whole context and truncates the WAL.
+        # Args:
+        #   compress: Whether to gzip the base snapshot.
+        # Returns: The snapshotted context data.
+        dirty_keys = self.context.pop_dirty_keys()  # Everything dirty so far is covered by the snapshot.
+        data = self.context.to_dict()  # Full copy taken after clearing dirty keys.
+        try:
+            self._flush_to_disk(data, compress)  # Atomically replaces the base snapshot.
+        except BaseException:
+            self.context.mark_dirty(dirty_keys)  # Not on disk; the next flush retries them.
+            raise
+        self._truncate_wal()  # Records up to the base sequence are no longer needed.
+        self.version_control.commit(
+            self.context
+        )  # Integrates with VersionControl to commit the version.
+        return data  # Returned for DB flushing by full modes.
 
     def check_and_flush(self) -> None:
         # Checks if interval has passed and performs an interval-based flush if needed.
@@ -119,6 +144,33 @@ class Persistence:
         ):  # Checks if interval has elapsed.
             self.flush(mode="diff")  # Performs a diff-based flush.
 
+    def recover(self) -> int:
+        # Restores the context from the base snapshot followed by the WAL.
+        # WAL records already folded into the base snapshot are skipped, so a
+        # crash between writing the base and truncating the WAL is harmless.
+        # Returns: Number of keys restored.
+        data: Dict[str, Any] = {}  # Reconstructed context state.
+        base_path = self._find_base_snapshot()  # Most recent base snapshot, if any.
+        base_sequence = 0  # Highest WAL sequence folded into the base snapshot.
+        if base_path:  # Loads the base snapshot first.
+            base = self._read_base_snapshot(base_path)  # Parsed snapshot envelope.
+            data.update(base["data"])  # Base key-values.
+            base_sequence = base["wal_sequence"]  # Replay starts after this record.
+
+        for record in self._read_wal():  # Replays newer changes in order.
+            if record["seq"] <= base_sequence:  # Already folded into the base snapshot.
+                continue
+            data.update(record["changes"])  # Applies set keys.
+            for key in record.get("removed", []):  # Applies removed keys.
+                data.pop(key, None)
+
+        for key, value in data.items():  # Iterates over the recovered data.
+            self.context.set(
+                key, value, who="persistence_load"
+            )  # Sets each key-value in the context with traceability.
+        self.context.pop_dirty_keys()  # Recovered keys are already on disk.
+        return len(data)  # Number of restored keys.
+
     def load_from_disk(self, file_name: str) -> None:
         # Loads persisted data from disk into the context.
         # Handles decompression if applicable.
@@ -132,11 +184,10 @@ class Persistence:
                 f"Persistence file not found: {file_path}"
             )  # Raises error if missing.
 
-        with open(file_path, "rb") as f:  # Opens the file in binary read mode.
-            content = f.read()  # Reads the entire file content.
-            if file_path.endswith(".gz"):  # Checks if the file is gzipped.
-                content = gzip.decompress(content)  # Decompresses if gzipped.
-            data = json.loads(content)  # Deserializes the JSON content to a dict.
+        if file_name.startswith(BASE_SNAPSHOT_NAME):  # Base snapshots wrap data in an envelope.
+            data = self._read_base_snapshot(file_path)["data"]
+        else:
+            data = json.loads(self._read_file(file_path))  # Plain JSON context dump.
 
         for key, value in data.items():  # Iterates over the loaded data.
             self.context.set(
@@ -161,25 +212,91 @@ class Persistence:
                 key, value, who="db_load"
             )  # Sets each key-value in the context.
 
+    def _flush_dirty_keys(self) -> Dict[str, Any]:
+        # Private method appending the keys changed since the last flush to the WAL.
+        # Returns: Dict of changed keys and their current values.
+        dirty_keys = self.context.pop_dirty_keys()  # Keys set since the last flush.
+        if not dirty_keys:  # Nothing changed; no record is written.
+            return {}
+
+        changes: Dict[str, Any] = {}  # Current values of dirty keys.
+        removed: List[str] = []  # Dirty keys that no longer exist.
+        for key in dirty_keys:  # Reads only the changed keys.
+            value = self.context.get(key, _MISSING)
+            if value is _MISSING:
+                removed.append(key)
+            else:
+                changes[key] = value
+
+        self._wal_sequence += 1  # Sequence number of the new record.
+        record = {
+            "seq": self._wal_sequence,  # Ordering and base-snapshot cut-off.
+            "timestamp": time.time(),  # Flush time for auditing.
+            "changes": changes,  # Changed key-values.
+        }
+        if removed:
+            record["removed"] = removed  # Only written when keys disappeared.
+        line = json.dumps(record, separators=(",", ":")) + "\n"  # One record per line.
+
+        try:
+            with open(self.wal_path, "a", encoding="utf-8") as wal_file:  # Appends, never rewrites.
+                wal_file.write(line)
+                if self.fsync:
+                    wal_file.flush()
+                    os.fsync(wal_file.fileno())  # Record survives a crash once flush returns.
+        except BaseException:
+            self.context.mark_dirty(dirty_keys)  # Not logged; the next flush retries them.
+            raise
+        self._wal_records += 1  # Counts towards the compaction threshold.
+        return changes  # Returned for DB flushing.
+
     def _flush_to_disk(self, data: Dict[str, Any], compress: bool) -> None:
-        # Private method to flush data to disk.
-        # Serializes to JSON and optionally compresses with gzip.
+        # Private method writing the base snapshot.
+        # Serializes to JSON, optionally compresses with gzip, and atomically
+        # replaces the previous snapshot so readers never see a partial file.
         # Args:
         #   data: Dict of data to flush.
         #   compress: Whether to gzip the file.
-        timestamp = int(time.time())  # Gets current timestamp for unique file naming.
-        file_name = f"context_{timestamp}.json"  # Base file name.
+        file_name = BASE_SNAPSHOT_NAME  # Single base file instead of one file per flush.
         if compress:  # If compression is enabled:
             file_name += ".gz"  # Appends .gz extension.
         file_path = os.path.join(self.flush_dir, file_name)  # Constructs full path.
 
-        json_data = json.dumps(data)  # Serializes the data to JSON string.
-        content = json_data.encode("utf-8")  # Encodes to bytes for writing.
+        envelope = {
+            "format_version": WAL_FORMAT_VERSION,  # Layout version.
+            "wal_sequence": self._wal_sequence,  # Last WAL record folded into this snapshot.
+            "timestamp": time.time(),  # Snapshot time.
+            "data": data,  # Complete context data.
+        }
+        content = json.dumps(envelope).encode("utf-8")  # Encodes to bytes for writing.
         if compress:  # If compression:
             content = gzip.compress(content)  # Compresses the bytes.
 
-        with open(file_path, "wb") as f:  # Opens file in binary write mode.
-            f.write(content)  # Writes the (compressed) content to file.
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=self.flush_dir, suffix=".tmp"
+        )  # Temporary file on the same filesystem for an atomic rename.
+        try:
+            with os.fdopen(file_descriptor, "wb") as f:  # Opens file in binary write mode.
+                f.write(content)  # Writes the (compressed) content to file.
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())  # Snapshot is durable before it replaces the old one.
+            os.replace(temp_path, file_path)  # Atomic swap of the base snapshot.
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)  # Leaves no partial temporary files behind.
+            raise
+
+        other_name = BASE_SNAPSHOT_NAME if compress else BASE_SNAPSHOT_NAME + ".gz"
+        other_path = os.path.join(self.flush_dir, other_name)  # Snapshot with the other encoding.
+        if os.path.exists(other_path):
+            os.remove(other_path)  # Only one base snapshot is ever current.
+
+    def _truncate_wal(self) -> None:
+        # Private method emptying the WAL after its records were folded into the base snapshot.
+        with open(self.wal_path, "w", encoding="utf-8"):  # Truncates in place.
+            pass
+        self._wal_records = 0  # Compaction threshold starts over.
 
     def _flush_to_db(self, data: Dict[str, Any], mode: str) -> None:
         # Private method to flush data to the database.
@@ -191,20 +308,82 @@ class Persistence:
             return  # Early return if no adapter.
         self.db_adapter.save_context(data, mode)  # Calls DBAdapter's save method.
 
-    def _compute_diff(self, current_data: Dict[str, Any]) -> Dict[str, Any]:
-        # Private method to compute the diff between current and last flushed data.
-        # Returns only changed or new keys.
-        # Args:
-        #   current_data: Current context dict.
-        # Returns: Dict of differences.
-        diff = {}  # Initializes empty diff dict.
-        for key, value in current_data.items():  # Iterates over current data.
-            if (
-                key not in self.last_flushed_data
-                or self.last_flushed_data[key] != value
-            ):  # Checks for new or changed.
-                diff[key] = value  # Adds to diff if different.
-        return diff  # Returns the diff dict.
+    def _find_base_snapshot(self) -> Optional[str]:
+        # Private method locating the current base snapshot.
+        # Returns: Path of the base snapshot, or None if none was written yet.
+        for file_name in (BASE_SNAPSHOT_NAME + ".gz", BASE_SNAPSHOT_NAME):
+            file_path = os.path.join(self.flush_dir, file_name)
+            if os.path.exists(file_path):
+                return file_path
+        return None
+
+    def _read_file(self, file_path: str) -> bytes:
+        # Private method reading a (possibly gzipped) file.
+        # Returns: Decompressed file content.
+        with open(file_path, "rb") as f:  # Opens the file in binary read mode.
+            content = f.read()  # Reads the entire file content.
+        if file_path.endswith(".gz"):  # Checks if the file is gzipped.
+            content = gzip.decompress(content)  # Decompresses if gzipped.
+        return content
+
+    def _read_base_snapshot(self, file_path: str) -> Dict[str, Any]:
+        # Private method parsing a base snapshot envelope.
+        # Returns: Envelope with 'wal_sequence' and 'data'.
+        base = json.loads(self._read_file(file_path))  # Deserializes the envelope.
+        if base.get("format_version") != WAL_FORMAT_VERSION:
+            raise ValueError(f"Unsupported base snapshot format in {file_path}")
+        return base
+
+    def _read_wal(self) -> List[Dict[str, Any]]:
+        # Private method reading all complete WAL records.
+        # A torn final line from a crash mid-append is skipped.
+        # Returns: WAL records in append order.
+        if not os.path.exists(self.wal_path):  # No WAL written yet.
+            return []
+        records = []  # Parsed records.
+        with open(self.wal_path, "r", encoding="utf-8") as wal_file:
+            for line_number, line in enumerate(wal_file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(
+                        f"Skipping incomplete WAL record at {self.wal_path}:{line_number}"
+                    )
+        return records
+
+    def _repair_wal_tail(self) -> None:
+        # Private method truncating a partial final WAL line left by a crash mid-append.
+        if not os.path.exists(self.wal_path):  # No WAL written yet.
+            return
+        with open(self.wal_path, "rb+") as wal_file:
+            wal_file.seek(0, os.SEEK_END)
+            size = wal_file.tell()  # Current WAL length.
+            if size == 0:
+                return
+            wal_file.seek(size - 1)
+            if wal_file.read(1) == b"\n":  # Last record is complete.
+                return
+            wal_file.seek(0)
+            keep = wal_file.read().rfind(b"\n") + 1  # End of the last complete record.
+            wal_file.truncate(keep)
+            logger.warning(f"Truncated incomplete WAL record from {self.wal_path}")
+
+    def _scan_existing_state(self) -> Tuple[int, int]:
+        # Private method reading sequence numbers left by a previous process.
+        # Returns: (last WAL sequence, WAL record count).
+        base_sequence = 0  # No base snapshot yet.
+        base_path = self._find_base_snapshot()
+        if base_path:
+            try:
+                base_sequence = self._read_base_snapshot(base_path)["wal_sequence"]
+            except (OSError, ValueError) as error:
+                logger.warning(f"Ignoring unreadable base snapshot {base_path}: {error}")
+        self._repair_wal_tail()  # New records must not be appended to a torn line.
+        records = self._read_wal()  # Existing WAL records.
+        last_sequence = max([base_sequence] + [record["seq"] for record in records])
+        return last_sequence, len(records)
 
     def __repr__(self) -> str:
         # Provides a string representation for debugging.
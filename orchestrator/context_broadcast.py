@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Coalescing broadcast aggregator for Framework0 context update notifications.
+
+This module batches context changes before they are pushed to WebSocket
+clients. Updates to the same key within a flush window are coalesced with
+last-write-wins semantics, each client receives only the keys matching its
+subscription prefixes, and clients that acknowledge deliveries get
+backpressure: while a batch is unacknowledged, newer changes keep coalescing
+for that client, and a client whose backlog overflows is told to resync.
+"""
+
+import threading  # For guarding shared pending state across request threads
+import time  # For acknowledgement timeouts
+from collections import OrderedDict  # For ordered per-client pending updates
+from datetime import datetime  # For timestamping delivered events
+from typing import Any, Callable, Dict, List, Optional  # For complete type safety
+
+# Policies applied when a client's pending backlog exceeds max_pending
+SLOW_CLIENT_POLICIES = ("resync", "drop_oldest")
+
+_MISSING = object()  # Marker for pending entries without a value (keys_only clients)
+
+
+class _ClientState:
+    """Per-client subscription and delivery state."""
+
+    __slots__ = ("prefixes", "keys_only", "ack", "pending", "in_flight_since",
+                 "needs_resync", "seq", "dropped")
+
+    def __init__(self) -> None:
+        """Initialize a client subscribed to every key without acknowledgements."""
+        self.prefixes: Optional[List[str]] = None  # None subscribes to all keys
+        self.keys_only = False  # Send key names without values
+        self.ack = False  # Client acknowledges each delivered batch
+        self.pending: "OrderedDict[str, Any]" = OrderedDict()  # Coalesced updates to deliver
+        self.in_flight_since: Optional[float] = None  # When the unacknowledged batch was sent
+        self.needs_resync = False  # Backlog overflowed and updates were discarded
+        self.seq = 0  # Sequence number of the last delivered batch
+        self.dropped = 0  # Number of updates discarded for this client
+
+    def matches(self, key: str) -> bool:
+        """
+        Check whether a key falls within the client's subscription.
+
+        Args:
+            key: Context key to check
+
+        Returns:
+            True if the client should receive updates for the key
+        """
+        if self.prefixes is None:
+            return True  # Unfiltered subscription
+        return any(key.startswith(prefix) for prefix in self.prefixes)
+
+
+class BroadcastAggregator:
+    """
+    Coalesce context updates and fan them out per client subscription.
+
+    Updates published between flushes are merged per key so each flush
+    sends every client at most one event containing the latest value of each
+    changed key it subscribes to. The aggregator does not depend on Flask:
+    delivery happens through the emit callable supplied by the server, which
+    must accept ``emit(event, payload, to=sid, callback=None)``.
+    """
+
+    def __init__(self,
+                 emit: Callable[..., Any],
+                 window: float = 0.05,
+                 max_pending: int = 1000,
+                 slow_client_policy: str = "resync",
+                 ack_timeout: float = 5.0,
+                 event: str = "context_updated"):
+        """
+        Initialize the broadcast aggregator.
+
+        Args:
+            emit: Callable used to deliver one event to one client
+            window: Seconds between flushes; 0 delivers on every publish
+            max_pending: Maximum pending keys per client before the slow client policy applies
+            slow_client_policy: 'resync' discards the backlog and asks the client to
+                reload, 'drop_oldest' discards the oldest pending keys
+            ack_timeout: Seconds after which an unacknowledged batch no longer blocks delivery
+            event: Event name used for update notifications
+        """
+        if slow_client_policy not in SLOW_CLIENT_POLICIES:
+            raise ValueError(f"Unknown slow client policy: {slow_client_policy}")
+
+        self._emit = emit  # Delivery callable supplied by the server
+        self.window = window  # Flush interval in seconds
+        self.max_pending = max_pending  # Backlog bound per client
+        self.slow_client_policy = slow_client_policy  # Overflow handling policy
+        self.ack_timeout = ack_timeout  # Limit on waiting for acknowledgements
+        self.event = event  # Event name for update notifications
+
+        self._lock = threading.RLock()  # Guards clients and pending updates
+        self._clients: Dict[str, _ClientState] = {}  # Client state by session ID
+        self._pending: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (value, who, origin sid)
+
+        # Delivery statistics for monitoring
+        self._stats = {
+            "published": 0,  # Updates handed to publish()
+            "coalesced": 0,  # Updates replaced by a later write to the same key
+            "events": 0,  # Events emitted to clients
+            "dropped": 0,  # Updates discarded for slow clients
+            "resyncs": 0  # Resync notifications sent
+        }
+
+    def add_client(self, sid: str) -> None:
+        """
+        Register a connected client with an unfiltered subscription.
+
+        Args:
+            sid: Client session ID
+        """
+        with self._lock:
+            self._clients.setdefault(sid, _ClientState())
+
+    def remove_client(self, sid: str) -> None:
+        """
+        Forget a disconnected client and its pending updates.
+
+        Args:
+            sid: Client session ID
+        """
+        with self._lock:
+            self._clients.pop(sid, None)
+
+    def subscribe(self, sid: str, prefixes: Optional[List[str]] = None,
+                  keys_only: bool = False, ack: bool = False) -> None:
+        """
+        Set a client's subscription filter and delivery options.
+
+        Args:
+            sid: Client session ID
+            prefixes: Key prefixes to receive; None or empty receives all keys
+            keys_only: Send changed key names without values
+            ack: Client acknowledges batches, enabling backpressure
+        """
+        with self._lock:
+            state = self._clients.setdefault(sid, _ClientState())
+            if state.keys_only and not keys_only and state.pending:
+                state.pending = OrderedDict()  # Backlog has no values to send
+                state.needs_resync = True
+            state.prefixes = list(prefixes) if prefixes else None
+            state.keys_only = keys_only
+            state.ack = ack
+            state.in_flight_since = None  # Do not wait on acknowledgements from before
+
+    def publish(self, updates: Dict[str, Any], who: str = "unknown",
+                skip_sid: Optional[str] = None) -> None:
+        """
+        Queue changed keys for the next flush.
+
+        Args:
+            updates: Mapping of changed keys to their new values
+            who: Attribution for the changes
+            skip_sid: Client that made the change and should not be notified
+        """
+        with self._lock:
+            for key, value in updates.items():
+                if key in self._pending:
+                    self._stats["coalesced"] += 1  # Last write wins within the window
+                    del self._pending[key]  # Move key to the end of the order
+                self._pending[key] = (value, who, skip_sid)
+            self._stats["published"] += len(updates)
+
+        if self.window <= 0:
+            self.flush()  # Immediate mode delivers without a background loop
+
+    def acknowledge(self, sid: str, seq: int) -> None:
+        """
+        Record that a client processed a delivered batch.
+
+        Args:
+            sid: Client session ID
+            seq: Sequence number of the acknowledged batch
+        """
+        with self._lock:
+            state = self._clients.get(sid)
+            if state is not None and seq >= state.seq:
+                state.in_flight_since = None  # Client is ready for the next batch
+
+    def _ack_callback(self, sid: str, seq: int) -> Callable[..., None]:
+        """
+        Build the Socket.IO acknowledgement callback for one delivered batch.
+
+        Args:
+            sid: Client session ID
+            seq: Sequence number of the delivered batch
+
+        Returns:
+            Callback ignoring whatever arguments the client acknowledges with
+        """
+        def callback(*args: Any) -> None:
+            self.acknowledge(sid, seq)
+
+        return callback
+
+    def flush(self) -> int:
+        """
+        Fan pending updates out to clients and deliver ready batches.
+
+        Returns:
+            Number of events emitted
+        """
+        deliveries = []  # (sid, event, payload, needs ack) collected under the lock
+
+        with self._lock:
+            pending, self._pending = self._pending, OrderedDict()
+            now = time.time()
+
+            for sid, state in self._clients.items():
+                # Merge this window's updates into the client's backlog
+                for key, (value, who, origin) in pending.items():
+                    if origin == sid or not state.matches(key):
+                        continue  # Sender already knows, or client is not subscribed
+                    state.pending.pop(key, None)  # Keep backlog ordered by latest write
+                    state.pending[key] = _MISSING if state.keys_only else value
+
+                self._enforce_backlog(state)
+
+                # Hold delivery while an acknowledged batch is still outstanding
+                if state.in_flight_since is not None:
+                    if now - state.in_flight_since < self.ack_timeout:
+                        continue
+                    state.in_flight_since = None  # Give up waiting on a lost acknowledgement
+
+                if state.needs_resync:
+                    state.needs_resync = False
+                    state.seq += 1
+                    deliveries.append((sid, "context_resync", {
+                        "seq": state.seq,
+                        "dropped": state.dropped,
+                        "timestamp": datetime.now().isoformat()
+                    }, state.ack))
+                    state.dropped = 0
+                    self._stats["resyncs"] += 1
+                    if state.ack:
+                        state.in_flight_since = now
+                        continue  # Deliver remaining updates after the resync is acknowledged
+
+                if not state.pending:
+                    continue
+
+                state.seq += 1
+                deliveries.append((sid, self.event,
+                                   self._build_payload(state, pending), state.ack))
+                state.pending = OrderedDict()
+                if state.ack:
+                    state.in_flight_since = now
+
+        # Emit outside the lock so slow transports do not block publishers
+        for sid, event, payload, needs_ack in deliveries:
+            callback = self._ack_callback(sid, payload["seq"]) if needs_ack else None
+            self._emit(event, payload, to=sid, callback=callback)
+
+        with self._lock:
+            self._stats["events"] += len(deliveries)
+        return len(deliveries)
+
+    def _enforce_backlog(self, state: _ClientState) -> None:
+        """
+        Apply the slow client policy when a backlog exceeds max_pending.
+
+        Args:
+            state: Client state whose backlog to bound
+        """
+        overflow = len(state.pending) - self.max_pending
+        if overflow <= 0:
+            return
+
+        if self.slow_client_policy == "resync":
+            dropped = len(state.pending)  # Client must reload the whole context
+            state.pending = OrderedDict()
+            state.needs_resync = True
+        else:
+            dropped = overflow  # Discard the oldest pending keys
+            for _ in range(overflow):
+                state.pending.popitem(last=False)
+
+        state.dropped += dropped
+        self._stats["dropped"] += dropped
+
+    def _build_payload(self, state: _ClientState,
+                       pending: "OrderedDict[str, tuple]") -> Dict[str, Any]:
+        """
+        Build the compact update event for a client's backlog.
+
+        Args:
+            state: Client state holding the backlog
+            pending: Updates from the current window, for attribution
+
+        Returns:
+            Event payload with changed keys and, unless keys_only, their values
+        """
+        payload: Dict[str, Any] = {
+            "seq": state.seq,
+            "keys": list(state.pending),
+            "timestamp": datetime.now().isoformat(),
+            "batch": True
+        }
+        if not state.keys_only:
+            payload["updates"] = dict(state.pending)
+
+        # Single-key events keep the fields used by per-key consumers
+        if len(state.pending) == 1:
+            key = payload["keys"][0]
+            payload["key"] = key
+            if not state.keys_only:
+                payload["value"] = state.pending[key]
+            if key in pending:
+                payload["who"] = pending[key][1]
+        return payload
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get delivery statistics for monitoring.
+
+        Returns:
+            Dictionary of counters and current client and backlog sizes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["clients"] = len(self._clients)
+            stats["pending_keys"] = len(self._pending)
+            stats["backlog_keys"] = sum(len(state.pending) for state in self._clients.values())
+        return stats
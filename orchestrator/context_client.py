@@ -213,7 +213,83 @@ class ContextClient:
         response = self._make_request("POST", "/ctx", request_data)  # Send update to server
         
         return response.get("status") == "success"  # Return success status
-    
+
+    def _batch(self, values: Optional[Dict[str, Any]] = None,
+               keys: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Send one /ctx/batch request with sets applied before gets.
+
+        Args:
+            values: Optional mapping of keys to new values
+            keys: Optional keys to read after the sets are applied
+
+        Returns:
+            Parsed JSON response from server
+        """
+        request_data = {
+            "set": values or {},  # Keys to update in this batch
+            "get": list(keys or []),  # Keys to read in this batch
+            "who": self.who  # Attribution for change tracking
+        }
+        return self._make_request("POST", "/ctx/batch", request_data)  # Single round-trip
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get values for several keys in one request.
+
+        Args:
+            keys: Context keys to retrieve values for
+
+        Returns:
+            Dictionary mapping each key to its value, or None if not found
+
+        Raises:
+            ConnectionError: When unable to connect to server
+            ServerError: When server returns error response
+        """
+        self.logger.debug(f"Getting {len(keys)} keys in batch")  # Log batch get operation
+
+        if not keys:
+            return {}  # Nothing to request
+
+        response = self._batch(keys=keys)  # Request all keys at once
+        values = response.get("values", {})  # Values returned by server
+        return {key: values.get(key) for key in keys}  # Preserve requested key order
+
+    def set_many(self, values: Dict[str, Any]) -> bool:
+        """
+        Set several keys in one request and one server history commit.
+
+        Args:
+            values: Mapping of context keys to new values
+
+        Returns:
+            True if operation was successful
+
+        Raises:
+            ConnectionError: When unable to connect to server
+            ServerError: When server returns error response
+        """
+        self.logger.debug(f"Setting {len(values)} keys in batch")  # Log batch set operation
+
+        if not values:
+            return True  # Nothing to send
+
+        response = self._batch(values=values)  # Send all updates at once
+        return response.get("status") == "success"  # Return success status
+
+    def pipeline(self, max_batch_size: int = 100) -> "ContextPipeline":
+        """
+        Create a pipeline that queues gets and sets and sends them in batches.
+
+        Args:
+            max_batch_size: Number of queued operations that triggers a send
+
+        Returns:
+            ContextPipeline bound to this client
+        """
+        return ContextPipeline(self, max_batch_size=max_batch_size)  # New pipeline for this client
+
     def list_all(self) -> Dict[str, Any]:
         """
         Get all context keys and values from server.
@@ -403,6 +479,110 @@ class ContextClient:
         return response.text
 
 
+class ContextPipeline:
+    """
+    Auto-batching pipeline of context operations for a ContextClient.
+
+    Operations are queued and sent as /ctx/batch requests whenever
+    max_batch_size operations are pending, and on execute(). Results are
+    returned by execute() in the order the operations were queued: the
+    value for each get and True for each set.
+    """
+
+    def __init__(self, client: ContextClient, max_batch_size: int = 100):
+        """
+        Initialize pipeline for a client.
+
+        Args:
+            client: Client used to send batch requests
+            max_batch_size: Number of queued operations that triggers a send
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")  # Empty batches never send
+
+        self.client = client  # Client used for batch requests
+        self.max_batch_size = max_batch_size  # Operations per batch request
+        self._pending: List[tuple] = []  # Queued (operation, key, value) tuples
+        self._pending_gets: set = set()  # Keys read by queued gets
+        self._results: List[Any] = []  # Results of operations already sent
+
+    def get(self, key: str) -> "ContextPipeline":
+        """
+        Queue a get operation.
+
+        Args:
+            key: Context key to retrieve value for
+
+        Returns:
+            This pipeline for chaining
+        """
+        self._pending.append(("get", key, None))  # Queue read
+        self._pending_gets.add(key)  # Remember key for ordering checks
+        self._flush_if_full()  # Send batch when enough operations are pending
+        return self
+
+    def set(self, key: str, value: Any) -> "ContextPipeline":
+        """
+        Queue a set operation.
+
+        Args:
+            key: Context key to set value for
+            value: Value to assign to the key
+
+        Returns:
+            This pipeline for chaining
+        """
+        # The server applies sets before gets, so a queued get of this key
+        # must be sent first to observe the value it was queued against
+        if key in self._pending_gets:
+            self.flush()
+
+        self._pending.append(("set", key, value))  # Queue write
+        self._flush_if_full()  # Send batch when enough operations are pending
+        return self
+
+    def _flush_if_full(self) -> None:
+        """Send pending operations once the batch size is reached."""
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send all pending operations as one batch request."""
+        if not self._pending:
+            return  # Nothing queued
+
+        pending, self._pending = self._pending, []  # Take queued operations
+        self._pending_gets = set()  # Reset ordering checks for next batch
+
+        values = {key: value for op, key, value in pending if op == "set"}  # Last write wins
+        keys = [key for op, key, _ in pending if op == "get"]  # Keys to read
+        response = self.client._batch(values=values, keys=keys)  # Single round-trip
+
+        fetched = response.get("values", {})  # Values returned by server
+        for op, key, _ in pending:
+            self._results.append(fetched.get(key) if op == "get" else True)
+
+    def execute(self) -> List[Any]:
+        """
+        Send remaining operations and return all results in queue order.
+
+        Returns:
+            List with the value of each get and True for each set
+        """
+        self.flush()  # Send whatever is still queued
+        results, self._results = self._results, []  # Hand results over and reset
+        return results
+
+    def __enter__(self) -> "ContextPipeline":
+        """Context manager entry - return pipeline for queuing."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - send remaining operations unless an error occurred."""
+        if exc_type is None:
+            self.flush()
+
+
 class AsyncContextClient:
     """
     Asynchronous context client with WebSocket support for real-time updates.
@@ -481,10 +661,20 @@ class AsyncContextClient:
         @self.sio.event  # Handle context update notifications
         async def context_updated(data):
             """Handle real-time context update notifications from server."""
-            self.logger.debug(f"Context updated: {data.get('key')} = {data.get('value')}")  # Log update
+            self.logger.debug(f"Context updated: {data.get('keys', data.get('key'))}")  # Log update
             
             # Trigger user-defined update handlers with change data
             await self._trigger_event_handlers('context_updated', data)  # Notify handlers of update
+            return True  # Acknowledge batch so the server sends the next one
+        
+        @self.sio.event  # Handle notification that coalesced updates were dropped
+        async def context_resync(data):
+            """Handle server request to reload context after dropped updates."""
+            self.logger.warning(f"Context resync requested ({data.get('dropped', 0)} updates dropped)")
+            
+            # Trigger user-defined resync handlers so they can reload state
+            await self._trigger_event_handlers('context_resync', data)  # Notify handlers of resync
+            return True  # Acknowledge resync so delivery resumes
         
         @self.sio.event  # Handle initial context snapshot
         async def context_snapshot(data):
@@ -557,6 +747,29 @@ class AsyncContextClient:
             self.logger.error(error_msg)  # Log connection failure
             raise ConnectionError(error_msg)  # Raise connection exception
     
+    async def subscribe(self, prefixes: Optional[List[str]] = None, keys_only: bool = False) -> None:
+        """
+        Restrict real-time updates to keys starting with the given prefixes.
+        
+        Updates are acknowledged once all context_updated handlers finish, so
+        the server holds further batches for this client until then.
+        
+        Args:
+            prefixes: Key prefixes to receive; None receives all keys
+            keys_only: Receive changed key names without values
+            
+        Raises:
+            ConnectionError: When not connected to WebSocket
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to WebSocket")  # Check connection state
+        
+        await self.sio.emit('subscribe', {  # Send subscription to server
+            'prefixes': prefixes or [],  # Key prefixes, empty for all keys
+            'keys_only': keys_only,  # Whether values are included
+            'ack': True  # Handlers acknowledge each batch
+        })
+    
     async def disconnect(self) -> None:
         """Disconnect from context server WebSocket."""
         if self.connected:
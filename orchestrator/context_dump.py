@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Context dump writers for Framework0 context servers.
+
+This module writes context dump files in the formats offered by the
+/ctx/dump endpoint. It has no web framework dependencies so the Flask and
+ASGI context servers share one implementation.
+"""
+
+import csv  # For CSV format dump file writing
+import json  # For JSON format dump file writing
+from pathlib import Path  # For cross-platform file path handling
+from typing import Any, Dict  # For complete type safety
+
+# Supported dump formats, mapped to writers at the end of this module
+DUMP_FORMATS = ('json', 'pretty', 'csv', 'txt')
+
+
+def write_json_dump(dump_path: Path, dump_info: Dict[str, Any]) -> None:
+    """
+    Write context dump in JSON format.
+
+    Args:
+        dump_path: Path where to write the dump file
+        dump_info: Complete dump information including context data
+    """
+    with open(dump_path, 'w', encoding='utf-8') as f:  # Open file for writing
+        json.dump(dump_info, f, indent=2, ensure_ascii=False, default=str)  # Write formatted JSON
+
+
+def write_pretty_dump(dump_path: Path, dump_info: Dict[str, Any]) -> None:
+    """
+    Write context dump in human-readable pretty format.
+
+    Args:
+        dump_path: Path where to write the dump file
+        dump_info: Complete dump information including context data
+    """
+    with open(dump_path, 'w', encoding='utf-8') as f:  # Open file for writing
+        f.write("=" * 80 + "\n")  # Header separator
+        f.write("Framework0 Context Dump - Pretty Format\n")  # Title
+        f.write("=" * 80 + "\n\n")  # Header separator
+
+        # Write dump metadata
+        f.write(f"Timestamp: {dump_info['timestamp']}\n")  # When dump was created
+        f.write(f"Requested by: {dump_info['who']}\n")  # Who requested dump
+        f.write(f"Total keys: {dump_info['key_count']}\n")  # Number of context keys
+        f.write(f"Include history: {dump_info['include_history']}\n\n")  # History inclusion flag
+
+        # Write context data in readable format
+        f.write("Context Data:\n")  # Section header
+        f.write("-" * 40 + "\n")  # Section separator
+
+        for key, value in sorted(dump_info['context'].items()):  # Iterate through context keys
+            f.write(f"{key}: {json.dumps(value, indent=2)}\n\n")  # Write key-value pair
+
+        # Write history if included
+        if dump_info.get('include_history') and 'history' in dump_info:
+            f.write("\nChange History:\n")  # History section header
+            f.write("-" * 40 + "\n")  # Section separator
+
+            for i, entry in enumerate(dump_info['history'], 1):  # Iterate through history entries
+                f.write(f"{i}. [{entry.get('timestamp', 'unknown')}] ")  # Entry number and timestamp
+                f.write(f"{entry.get('who', 'unknown')} changed {entry.get('key', 'unknown')}\n")  # Change details
+                f.write(f"   Before: {entry.get('before', 'None')}\n")  # Previous value
+                f.write(f"   After:  {entry.get('after', 'None')}\n\n")  # New value
+
+
+def write_csv_dump(dump_path: Path, dump_info: Dict[str, Any]) -> None:
+    """
+    Write context dump in CSV format.
+
+    Args:
+        dump_path: Path where to write the dump file
+        dump_info: Complete dump information including context data
+    """
+    with open(dump_path, 'w', newline='', encoding='utf-8') as f:  # Open file for CSV writing
+        writer = csv.writer(f)  # Create CSV writer
+
+        # Write CSV header
+        writer.writerow(['Key', 'Value', 'Type', 'Dump_Timestamp', 'Requested_By'])  # Column headers
+
+        # Write context data rows
+        for key, value in sorted(dump_info['context'].items()):  # Iterate through context data
+            value_str = json.dumps(value) if not isinstance(value, str) else value  # Convert value to string
+            value_type = type(value).__name__  # Get value type name
+
+            writer.writerow([  # Write data row
+                key,  # Context key
+                value_str,  # String representation of value
+                value_type,  # Python type of value
+                dump_info['timestamp'],  # When dump was created
+                dump_info['who']  # Who requested dump
+            ])
+
+
+def write_text_dump(dump_path: Path, dump_info: Dict[str, Any]) -> None:
+    """
+    Write context dump in plain text format.
+
+    Args:
+        dump_path: Path where to write the dump file
+        dump_info: Complete dump information including context data
+    """
+    with open(dump_path, 'w', encoding='utf-8') as f:  # Open file for writing
+        f.write(f"Context Dump - {dump_info['timestamp']}\n")  # Header with timestamp
+        f.write(f"Requested by: {dump_info['who']}\n")  # Attribution
+        f.write(f"Total keys: {dump_info['key_count']}\n\n")  # Key count
+
+        # Write context data in simple key=value format
+        for key, value in sorted(dump_info['context'].items()):  # Iterate through context
+            f.write(f"{key}={value}\n")  # Simple key=value format
+
+
+def write_dump(dump_path: Path, dump_info: Dict[str, Any], format_type: str) -> None:
+    """
+    Write context dump in the requested format.
+
+    Args:
+        dump_path: Path where to write the dump file
+        dump_info: Complete dump information including context data
+        format_type: One of DUMP_FORMATS (case-insensitive)
+
+    Raises:
+        ValueError: If format_type is not supported
+    """
+    writers = {
+        'json': write_json_dump,  # Machine-readable JSON
+        'pretty': write_pretty_dump,  # Human-readable report
+        'csv': write_csv_dump,  # Spreadsheet-friendly rows
+        'txt': write_text_dump  # Simple key=value lines
+    }
+    writer = writers.get(format_type.lower())  # Select writer for format
+    if writer is None:
+        raise ValueError(f"Unsupported format: {format_type}")
+    writer(dump_path, dump_info)  # Write dump file
@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+"""
+Sharded context state for multi-process Framework0 context servers.
+
+The key space is split across shard processes by a stable hash of each key.
+Every shard owns its keys and their change history and serves them over a
+local (Unix domain) socket using newline-delimited JSON messages, so any
+number of front-end worker processes can share one consistent state. Shards
+also push change notifications to watching workers, which lets each worker
+broadcast updates made through any other worker to its own WebSocket clients.
+
+Two interchangeable async backends are provided:
+- LocalShardBackend keeps state in-process for single-worker servers and tests
+- SocketShardBackend talks to shard processes started by ShardCluster
+"""
+
+import asyncio  # For shard servers and multiplexed client connections
+import itertools  # For request ID generation
+import json  # For the shard wire protocol
+import logging  # For shard diagnostics
+import multiprocessing  # For running shard processes
+import os  # For socket path handling
+import shutil  # For removing the socket directory
+import tempfile  # For creating the socket directory
+import time  # For waiting on shard startup
+import zlib  # For a hash that is stable across processes
+from collections import deque  # For bounded change history
+from datetime import datetime  # For timestamping history entries
+from typing import Any, Callable, Dict, List, Optional, Set  # For complete type safety
+
+logger = logging.getLogger(__name__)
+
+# Largest single protocol message; values travel inside one JSON line
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+# Watcher callback signature: (updates, who, origin client session ID)
+Watcher = Callable[[Dict[str, Any], str, Optional[str]], None]
+
+
+class ShardError(Exception):
+    """Raised when a shard request fails or a shard cannot be reached."""
+    pass
+
+
+def shard_for(key: str, shard_count: int) -> int:
+    """
+    Map a key to its shard.
+
+    Python's built-in hash is randomized per process, so CRC32 is used to
+    give every worker the same mapping.
+
+    Args:
+        key: Context key
+        shard_count: Number of shards
+
+    Returns:
+        Index of the shard that owns the key
+    """
+    return zlib.crc32(key.encode("utf-8")) % shard_count
+
+
+class ShardStore:
+    """
+    Key-value state and change history for one shard.
+
+    The history keeps the most recent max_history entries so long-running
+    shards do not grow without bound.
+    """
+
+    def __init__(self, max_history: int = 10000):
+        """
+        Initialize an empty shard.
+
+        Args:
+            max_history: Maximum number of history entries to keep
+        """
+        self._data: Dict[str, Any] = {}  # Current values owned by this shard
+        self._history: deque = deque(maxlen=max_history)  # Recent change records
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get values for several keys.
+
+        Args:
+            keys: Keys to read
+
+        Returns:
+            Mapping of each key to its value, or None if not found
+        """
+        return {key: self._data.get(key) for key in keys}
+
+    def set_many(self, values: Dict[str, Any], who: str = "unknown") -> List[str]:
+        """
+        Set several keys as one history commit.
+
+        Args:
+            values: Mapping of keys to new values
+            who: Attribution for the changes
+
+        Returns:
+            Keys whose values actually changed
+        """
+        timestamp = datetime.now().isoformat()  # One timestamp for the whole batch
+        changed = []
+        for key, value in values.items():
+            before = self._data.get(key)
+            if before != value:  # Only record actual changes
+                self._data[key] = value
+                self._history.append({
+                    "timestamp": timestamp,
+                    "key": key,
+                    "before": before,
+                    "after": value,
+                    "who": who
+                })
+                changed.append(key)
+        return changed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get all values owned by this shard.
+
+        Returns:
+            Copy of the shard's key-value state
+        """
+        return dict(self._data)
+
+    def get_history(self, key: Optional[str] = None, who: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get change history with optional filtering.
+
+        Args:
+            key: Only return entries for this key
+            who: Only return entries made by this attribution
+
+        Returns:
+            Matching history entries, oldest first
+        """
+        return [
+            entry for entry in self._history
+            if (key is None or entry["key"] == key) and (who is None or entry["who"] == who)
+        ]
+
+    def history_count(self) -> int:
+        """
+        Get the number of retained history entries.
+
+        Returns:
+            Entry count, without copying the history
+        """
+        return len(self._history)
+
+
+def _merge_history(histories: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Merge per-shard histories into one list ordered by timestamp."""
+    merged = [entry for history in histories for entry in history]
+    merged.sort(key=lambda entry: entry["timestamp"])  # ISO timestamps sort chronologically
+    return merged
+
+
+class LocalShardBackend:
+    """
+    In-process context backend for single-worker servers.
+
+    Implements the same async interface as SocketShardBackend around a
+    single ShardStore, so servers can switch between them unchanged.
+    """
+
+    def __init__(self, max_history: int = 10000):
+        """
+        Initialize in-process backend.
+
+        Args:
+            max_history: Maximum number of history entries to keep
+        """
+        self.store = ShardStore(max_history=max_history)  # All keys live in one store
+        self._watchers: List[Watcher] = []  # Callbacks notified of changes
+
+    def add_watcher(self, watcher: Watcher) -> None:
+        """Register a callback notified with every change."""
+        self._watchers.append(watcher)
+
+    async def start(self) -> None:
+        """Start the backend (nothing to connect in-process)."""
+
+    async def close(self) -> None:
+        """Close the backend (nothing to release in-process)."""
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get values for several keys."""
+        return self.store.get_many(keys)
+
+    async def set_many(self, values: Dict[str, Any], who: str = "unknown",
+                       origin: Optional[str] = None) -> List[str]:
+        """Set several keys and notify watchers of the keys that changed."""
+        changed = self.store.set_many(values, who=who)
+        if changed:
+            updates = {key: values[key] for key in changed}
+            for watcher in self._watchers:
+                watcher(updates, who, origin)
+        return changed
+
+    async def to_dict(self) -> Dict[str, Any]:
+        """Get the complete context state."""
+        return self.store.to_dict()
+
+    async def get_history(self, key: Optional[str] = None,
+                          who: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get change history with optional filtering."""
+        return self.store.get_history(key=key, who=who)
+
+    async def history_count(self) -> int:
+        """Get the number of retained history entries."""
+        return self.store.history_count()
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    """Encode one protocol message as a JSON line."""
+    return json.dumps(message, default=str).encode("utf-8") + b"\n"
+
+
+async def serve_shard(socket_path: str, store: Optional[ShardStore] = None) -> asyncio.AbstractServer:
+    """
+    Serve a shard store on a Unix domain socket.
+
+    Requests are JSON lines ``{"id", "op", ...}`` answered with
+    ``{"id", "ok", "result"}`` or ``{"id", "ok": false, "error"}``.
+    Connections that send the ``watch`` operation additionally receive
+    ``{"event": "changed", "updates", "who", "origin"}`` for every change.
+
+    Args:
+        socket_path: Filesystem path for the socket
+        store: Store to serve; a new one is created if omitted
+
+    Returns:
+        Started asyncio server
+    """
+    store = store or ShardStore()
+    watchers: Set[asyncio.StreamWriter] = set()  # Connections receiving change events
+
+    def apply(request: Dict[str, Any]) -> Any:
+        """Execute one request against the store."""
+        op = request.get("op")
+        if op == "get":
+            return store.get_many(request["keys"])
+        if op == "set":
+            values = request["values"]
+            who = request.get("who", "unknown")
+            changed = store.set_many(values, who=who)
+            if changed:
+                event = _encode({
+                    "event": "changed",
+                    "updates": {key: values[key] for key in changed},
+                    "who": who,
+                    "origin": request.get("origin")
+                })
+                for watcher in list(watchers):
+                    watcher.write(event)  # Buffered; watchers drain on their own
+            return changed
+        if op == "all":
+            return store.to_dict()
+        if op == "history":
+            return store.get_history(key=request.get("key"), who=request.get("who"))
+        if op == "history_count":
+            return store.history_count()
+        if op == "ping":
+            return True
+        raise ShardError(f"Unknown shard operation: {op}")
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests from one connection until it closes."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                request = json.loads(line)
+                if request.get("op") == "watch":
+                    watchers.add(writer)
+                    response = {"id": request.get("id"), "ok": True, "result": True}
+                else:
+                    try:
+                        response = {"id": request.get("id"), "ok": True, "result": apply(request)}
+                    except Exception as e:  # Report failures to the caller
+                        response = {"id": request.get("id"), "ok": False, "error": str(e)}
+                writer.write(_encode(response))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            logger.debug(f"Shard connection closed: {e}")
+        finally:
+            watchers.discard(writer)
+            writer.close()
+
+    return await asyncio.start_unix_server(handle, path=socket_path, limit=MAX_MESSAGE_BYTES)
+
+
+def run_shard_process(socket_path: str, max_history: int = 10000) -> None:
+    """
+    Entry point for a shard process; serves until terminated.
+
+    Args:
+        socket_path: Filesystem path for the socket
+        max_history: Maximum number of history entries to keep
+    """
+    async def main() -> None:
+        server = await serve_shard(socket_path, ShardStore(max_history=max_history))
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+class _ShardConnection:
+    """Multiplexed request connection to one shard."""
+
+    def __init__(self, socket_path: str):
+        """
+        Initialize an unopened connection.
+
+        Args:
+            socket_path: Shard socket path
+        """
+        self.socket_path = socket_path
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}  # Outstanding requests by ID
+        self._ids = itertools.count(1)
+
+    async def open(self) -> None:
+        """Connect to the shard and start dispatching responses."""
+        reader, self._writer = await asyncio.open_unix_connection(self.socket_path, limit=MAX_MESSAGE_BYTES)
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_responses(reader))
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        """Resolve pending requests as responses arrive."""
+        error: Exception = ShardError(f"Shard connection closed: {self.socket_path}")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._pending.pop(response.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if response.get("ok"):
+                    future.set_result(response.get("result"))
+                else:
+                    future.set_exception(ShardError(response.get("error", "Unknown shard error")))
+        except (ConnectionError, ValueError) as e:
+            error = ShardError(f"Shard connection failed: {e}")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    async def request(self, op: str, **fields: Any) -> Any:
+        """
+        Send one request and wait for its response.
+
+        Args:
+            op: Shard operation name
+            **fields: Operation arguments
+
+        Returns:
+            Operation result
+
+        Raises:
+            ShardError: If the shard reports an error or the connection fails
+        """
+        if self._writer is None or self._reader_task is None or self._reader_task.done():
+            raise ShardError(f"Shard not connected: {self.socket_path}")
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(_encode(dict(fields, id=request_id, op=op)))
+        await self._writer.drain()
+        return await future
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+
+
+class SocketShardBackend:
+    """
+    Context backend that spreads keys across shard processes.
+
+    Each worker keeps one multiplexed connection per shard for requests and
+    one watch connection per shard for change notifications. Batches that
+    span shards are committed per shard.
+    """
+
+    def __init__(self, socket_paths: List[str]):
+        """
+        Initialize backend for a set of shards.
+
+        Args:
+            socket_paths: Socket path of each shard, in shard order
+        """
+        if not socket_paths:
+            raise ValueError("At least one shard socket path is required")
+
+        self.socket_paths = list(socket_paths)  # Shard order defines key placement
+        self._connections = [_ShardConnection(path) for path in self.socket_paths]
+        self._watchers: List[Watcher] = []  # Callbacks notified of changes
+        self._watch_tasks: List[asyncio.Task] = []  # Readers of shard change events
+
+    def add_watcher(self, watcher: Watcher) -> None:
+        """Register a callback notified with every change on any shard."""
+        self._watchers.append(watcher)
+
+    async def start(self) -> None:
+        """Connect to every shard and subscribe to its changes."""
+        loop = asyncio.get_running_loop()
+        for connection in self._connections:
+            await connection.open()
+        for path in self.socket_paths:
+            reader, writer = await asyncio.open_unix_connection(path, limit=MAX_MESSAGE_BYTES)
+            writer.write(_encode({"id": 0, "op": "watch"}))
+            await writer.drain()
+            if not await reader.readline():  # Changes made after start() must not be missed
+                raise ShardError(f"Shard closed watch connection: {path}")
+            self._watch_tasks.append(loop.create_task(self._read_events(reader, writer)))
+
+    async def _read_events(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Deliver change events from one shard to watchers."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                if message.get("event") != "changed":
+                    continue  # Only change events are delivered to watchers
+                for watcher in self._watchers:
+                    try:
+                        watcher(message["updates"], message.get("who", "unknown"), message.get("origin"))
+                    except Exception as e:  # One failing watcher must not stop delivery
+                        logger.error(f"Shard watcher error: {e}")
+        except (ConnectionError, ValueError) as e:
+            logger.error(f"Shard watch connection failed: {e}")
+        finally:
+            writer.close()
+
+    async def close(self) -> None:
+        """Close all shard connections."""
+        for task in self._watch_tasks:
+            task.cancel()
+        self._watch_tasks = []
+        for connection in self._connections:
+            await connection.close()
+
+    def _group(self, keys) -> Dict[int, List[str]]:
+        """Group keys by owning shard."""
+        groups: Dict[int, List[str]] = {}
+        for key in keys:
+            groups.setdefault(shard_for(key, len(self._connections)), []).append(key)
+        return groups
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get values for several keys, querying shards concurrently."""
+        groups = self._group(keys)
+        results = await asyncio.gather(*[
+            self._connections[shard].request("get", keys=shard_keys)
+            for shard, shard_keys in groups.items()
+        ])
+        values: Dict[str, Any] = {}
+        for result in results:
+            values.update(result)
+        return {key: values.get(key) for key in keys}
+
+    async def set_many(self, values: Dict[str, Any], who: str = "unknown",
+                       origin: Optional[str] = None) -> List[str]:
+        """Set several keys, committing each shard's part concurrently."""
+        groups = self._group(values)
+        results = await asyncio.gather(*[
+            self._connections[shard].request(
+                "set", values={key: values[key] for key in shard_keys}, who=who, origin=origin
+            )
+            for shard, shard_keys in groups.items()
+        ])
+        return [key for changed in results for key in changed]
+
+    async def to_dict(self) -> Dict[str, Any]:
+        """Get the complete context state from all shards."""
+        state: Dict[str, Any] = {}
+        for result in await asyncio.gather(*[c.request("all") for c in self._connections]):
+            state.update(result)
+        return state
+
+    async def get_history(self, key: Optional[str] = None,
+                          who: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get change history from the owning shard or all shards."""
+        if key is not None:
+            connection = self._connections[shard_for(key, len(self._connections))]
+            return await connection.request("history", key=key, who=who)
+        return _merge_history(await asyncio.gather(*[
+            c.request("history", key=None, who=who) for c in self._connections
+        ]))
+
+    async def history_count(self) -> int:
+        """Get the number of retained history entries across all shards."""
+        return sum(await asyncio.gather(*[c.request("history_count") for c in self._connections]))
+
+
+class ShardCluster:
+    """
+    Start and stop shard processes on local sockets.
+
+    Use as a context manager, or call start() and stop() explicitly.
+    """
+
+    def __init__(self, shard_count: int = 2, max_history: int = 10000,
+                 socket_dir: Optional[str] = None, startup_timeout: float = 10.0):
+        """
+        Initialize cluster configuration.
+
+        Args:
+            shard_count: Number of shard processes
+            max_history: Maximum history entries kept per shard
+            socket_dir: Directory for socket files; a temporary one is created if omitted
+            startup_timeout: Seconds to wait for shards to start listening
+        """
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+
+        self.shard_count = shard_count
+        self.max_history = max_history
+        self.startup_timeout = startup_timeout
+        self._socket_dir = socket_dir
+        self._owns_dir = socket_dir is None  # Remove only directories we created
+        self._processes: List[multiprocessing.Process] = []
+        self.socket_paths: List[str] = []
+
+    def start(self) -> List[str]:
+        """
+        Start shard processes and wait until they are listening.
+
+        Returns:
+            Socket path of each shard, in shard order
+
+        Raises:
+            ShardError: If a shard does not start in time
+        """
+        if self._socket_dir is None:
+            self._socket_dir = tempfile.mkdtemp(prefix="ctxshards-")
+        self.socket_paths = [
+            os.path.join(self._socket_dir, f"shard-{index}.sock") for index in range(self.shard_count)
+        ]
+
+        context = multiprocessing.get_context("spawn")  # Fresh interpreters, no inherited loops
+        for path in self.socket_paths:
+            process = context.Process(target=run_shard_process, args=(path, self.max_history), daemon=True)
+            process.start()
+            self._processes.append(process)
+
+        deadline = time.time() + self.startup_timeout
+        while not all(os.path.exists(path) for path in self.socket_paths):
+            if time.time() > deadline or any(not process.is_alive() for process in self._processes):
+                self.stop()
+                raise ShardError("Shard processes failed to start")
+            time.sleep(0.05)
+
+        logger.info(f"Started {self.shard_count} context shards in {self._socket_dir}")
+        return list(self.socket_paths)
+
+    def stop(self) -> None:
+        """Terminate shard processes and remove their sockets."""
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join(timeout=5)
+        self._processes = []
+
+        if self._socket_dir and self._owns_dir:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+            self._socket_dir = None
+
+    def __enter__(self) -> "ShardCluster":
+        """Context manager entry - start shards."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - stop shards."""
+        self.stop()
@@ -7,8 +7,6 @@ between shell scripts, Python applications, and Dash apps through multiple proto
 Supports REST API, WebSocket connections, and interactive debugging features.
 """
 
-import csv  # For CSV format dump file writing
-import json  # For JSON serialization of dump files and API responses
 import logging  # For comprehensive server logging and debugging output
 import os  # For environment variable access and path operations
 from datetime import datetime  # For timestamping events and connection tracking
@@ -20,6 +18,11 @@ from flask import Flask, request, jsonify, abort, Response
 # SocketIO imports for real-time WebSocket communication
 from flask_socketio import SocketIO, emit
 
+from orchestrator.context_broadcast import BroadcastAggregator  # Coalesced update fan-out
+from orchestrator.context_dump import (  # Shared dump file writers
+    write_json_dump, write_pretty_dump, write_csv_dump, write_text_dump
+)
+
 # Import Framework0 components for core functionality
 try:
     from orchestrator.memory_bus import MemoryBus  # In-memory data storage backend
@@ -110,7 +113,40 @@ class Context:
                 "who": who  # Attribution for the change
             }
             self._history.append(history_entry)  # Add to change history
-    
+
+    def set_many(self, values: Dict[str, Any], who: str = "unknown") -> List[str]:
+        """
+        Set several keys in context as one history commit.
+
+        All entries recorded for the batch share one timestamp and are
+        appended to the history together, so a batch reads as a single change.
+
+        Args:
+            values: Mapping of context keys to new values
+            who: Attribution for who made the changes
+
+        Returns:
+            List of keys whose values actually changed
+        """
+        timestamp = datetime.now().isoformat()  # One timestamp for the whole batch
+        entries = []  # History entries collected for this batch
+
+        for key, value in values.items():
+            before = self._data.get(key)  # Capture previous value for history
+            if before != value:  # Only record actual changes
+                self._data[key] = value  # Update current state
+                self._dirty_keys.add(key)  # Mark key as modified
+                entries.append({
+                    "timestamp": timestamp,  # When batch was applied
+                    "key": key,  # Which key was changed
+                    "before": before,  # Previous value (None if new key)
+                    "after": value,  # New value
+                    "who": who  # Attribution for the change
+                })
+
+        self._history.extend(entries)  # Commit batch to history in one step
+        return [entry["key"] for entry in entries]  # Keys that changed
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Get current context state as dictionary.
@@ -153,7 +189,9 @@ class EnhancedContextServer:
     - Event broadcasting for state change notifications
     """
     
-    def __init__(self, host: str = "0.0.0.0", port: int = 8080, debug: bool = False):
+    def __init__(self, host: str = "0.0.0.0", port: int = 8080, debug: bool = False,
+                 broadcast_window: float = 0.05, max_pending_updates: int = 1000,
+                 slow_client_policy: str = "resync"):
         """
         Initialize the enhanced context server with multi-protocol support.
         
@@ -161,6 +199,9 @@ class EnhancedContextServer:
             host: Server bind address for network accessibility
             port: Server port for client connections
             debug: Enable debug mode for verbose logging and error details
+            broadcast_window: Seconds over which updates are coalesced before broadcast (0 = immediate)
+            max_pending_updates: Pending keys per client before the slow client policy applies
+            slow_client_policy: 'resync' or 'drop_oldest' for clients that fall behind
         """
         self.host = host  # Store host configuration for server binding
         self.port = port  # Store port configuration for client access
@@ -173,6 +214,15 @@ class EnhancedContextServer:
         # Initialize SocketIO for real-time WebSocket communication
         self.socketio = SocketIO(self.app, cors_allowed_origins="*")  # Enable CORS for cross-origin requests
         
+        # Coalesce context updates per key and fan them out per client subscription
+        self.broadcaster = BroadcastAggregator(
+            self.socketio.emit,
+            window=broadcast_window,
+            max_pending=max_pending_updates,
+            slow_client_policy=slow_client_policy
+        )
+        self._broadcast_task = None  # Background flush loop, started with the first client
+        
         # Initialize core Framework0 components for data management
         self.memory_bus = MemoryBus()  # In-memory storage backend for fast access
         self.context = Context()  # Context instance for state management and history
@@ -188,7 +238,10 @@ class EnhancedContextServer:
         # Track dump operations for monitoring and cleanup
         self.dump_history: List[Dict[str, Any]] = []  # History of dump operations
         self.max_dump_history = 100  # Maximum number of dump records to keep
-        
+
+        # Limit on keys per /ctx/batch request to bound request processing time
+        self.max_batch_size = 1000  # Maximum combined get and set keys per batch
+
         # Setup all server routes and handlers
         self._setup_routes()  # Configure REST API endpoints for HTTP access
         self._setup_websocket_handlers()  # Configure WebSocket event handlers for real-time updates
@@ -356,6 +409,7 @@ class EnhancedContextServer:
                             <h3>REST API Endpoints:</h3>
                             <p><code>GET /ctx?key=your.key</code> - Get context value</p>
                             <p><code>POST /ctx</code> - Set context value (JSON: {"key": "your.key", "value": "your.value"})</p>
+                            <p><code>POST /ctx/batch</code> - Set and get many keys (JSON: {"set": {"a": 1}, "get": ["b"]})</p>
                             <p><code>GET /ctx/all</code> - Get entire context state</p>
                             <p><code>GET /ctx/history</code> - Get change history</p>
                             
@@ -375,6 +429,7 @@ class EnhancedContextServer:
                     socket.on('connect', function() {
                         logEvent('✅ Connected to Context Server');
                         socket.emit('client_register', {type: 'dashboard', name: 'Web Dashboard'});
+                        socket.emit('subscribe', {keys_only: true});  // Dashboard reloads values itself
                     });
                     
                     socket.on('disconnect', function() {
@@ -382,7 +437,16 @@ class EnhancedContextServer:
                     });
                     
                     socket.on('context_updated', function(data) {
-                        logEvent('🔄 Context Updated: ' + data.key + ' = ' + JSON.stringify(data.value));
+                        if (data.keys) {
+                            logEvent('🔄 Context Updated: ' + data.keys.join(', '));
+                        } else {
+                            logEvent('🔄 Context Updated: ' + data.key + ' = ' + JSON.stringify(data.value));
+                        }
+                        refreshContext();
+                    });
+                    
+                    socket.on('context_resync', function(data) {
+                        logEvent('⚠️ Updates dropped (' + data.dropped + '), reloading context');
                         refreshContext();
                     });
                     
@@ -531,13 +595,8 @@ class EnhancedContextServer:
                 self.memory_bus.set(key, value)  # Update memory bus for fast access
                 self.context.set(key, value, who=who)  # Update context for history tracking
                 
-                # Broadcast change to all connected WebSocket clients
-                self.socketio.emit('context_updated', {  # Send real-time update notification
-                    'key': key,
-                    'value': value, 
-                    'who': who,
-                    'timestamp': datetime.now().isoformat()
-                })
+                # Queue change for coalesced broadcast to connected WebSocket clients
+                self.broadcaster.publish({key: value}, who=who)
                 
                 logger.info(f"SET /ctx: key={key}, value={value}, who={who}")  # Log successful set operation
                 
@@ -552,7 +611,55 @@ class EnhancedContextServer:
             except Exception as e:  # Handle any errors during value setting
                 logger.error(f"Error setting key {key}: {e}")  # Log error for debugging
                 return jsonify({"error": str(e), "status": "error"}), 500  # Return error response
-        
+
+        @self.app.route('/ctx/batch', methods=['POST'])  # POST endpoint for multi-key get and set
+        def batch_context() -> Dict[str, Any]:
+            """Apply several sets and gets in one request with a single broadcast."""
+            if not request.is_json:  # Validate that request contains JSON data
+                abort(400, description="Request must be JSON")  # Return error for non-JSON requests
+
+            data = request.get_json()  # Parse JSON data from request body
+            values = data.get('set') or {}  # Mapping of keys to new values
+            keys = data.get('get') or []  # Keys to read after sets are applied
+            who = data.get('who', 'api_client')  # Extract attribution, default to api_client
+
+            if not isinstance(values, dict) or not isinstance(keys, list):  # Validate batch shape
+                abort(400, description="'set' must be an object and 'get' a list of keys")
+            if any(not key for key in keys) or any(not key or value is None for key, value in values.items()):
+                abort(400, description="Missing 'key' or 'value' in batch")  # Same rule as POST /ctx
+            if len(values) + len(keys) > self.max_batch_size:  # Bound work done per request
+                abort(400, description=f"Batch exceeds {self.max_batch_size} keys")
+
+            try:
+                # Apply all sets before any gets so reads see this batch's writes
+                for key, value in values.items():
+                    self.memory_bus.set(key, value)  # Update memory bus for fast access
+                updated = self.context.set_many(values, who=who)  # One history commit for the batch
+
+                timestamp = datetime.now().isoformat()  # Shared timestamp for response and event
+
+                # Queue all keys that changed for one coalesced broadcast
+                if updated:
+                    self.broadcaster.publish({key: values[key] for key in updated}, who=who)
+
+                results = {key: self.memory_bus.get(key) for key in keys}  # Read requested keys
+
+                logger.info(f"POST /ctx/batch: set={len(values)}, get={len(keys)}, "
+                            f"updated={len(updated)}, who={who}")  # Log batch summary
+
+                return jsonify({  # Return success response with batch results
+                    "status": "success",
+                    "values": results,
+                    "updated": updated,
+                    "set_count": len(values),
+                    "who": who,
+                    "timestamp": timestamp
+                })
+
+            except Exception as e:  # Handle any errors during batch processing
+                logger.error(f"Error processing batch: {e}")  # Log error for debugging
+                return jsonify({"error": str(e), "status": "error"}), 500  # Return error response
+
         @self.app.route('/ctx/all', methods=['GET'])  # GET endpoint for retrieving entire context
         def get_all_context() -> Dict[str, Any]:
             """Retrieve entire context state for dashboard and debugging purposes."""
@@ -785,6 +892,8 @@ class EnhancedContextServer:
             """Handle new client connection and initialize tracking."""
             client_id = request.sid  # Get unique client session ID
             self.connected_clients.add(client_id)  # Add client to tracking set
+            self.broadcaster.add_client(client_id)  # Subscribe client to all keys by default
+            self._start_broadcast_loop()  # Ensure coalesced updates are flushed
             
             logger.info(f"WebSocket client connected: {client_id}")  # Log new connection
             
@@ -804,6 +913,7 @@ class EnhancedContextServer:
             client_id = request.sid  # Get disconnecting client session ID
             self.connected_clients.discard(client_id)  # Remove client from tracking set
             self.client_types.pop(client_id, None)  # Remove client type mapping
+            self.broadcaster.remove_client(client_id)  # Drop pending updates for client
             
             logger.info(f"WebSocket client disconnected: {client_id}")  # Log disconnection
             
@@ -833,6 +943,28 @@ class EnhancedContextServer:
                 'status': 'registered'
             })
         
+        @self.socketio.on('subscribe')  # Handle update subscription filters
+        def handle_subscribe(data):
+            """Restrict a client's updates to key prefixes and set delivery options."""
+            client_id = request.sid  # Get client session ID
+            prefixes = data.get('prefixes') or []  # Key prefixes to receive, empty for all
+            keys_only = bool(data.get('keys_only', False))  # Send key names without values
+            ack = bool(data.get('ack', False))  # Client acknowledges batches for backpressure
+            
+            if isinstance(prefixes, str):
+                prefixes = [prefixes]  # Accept a single prefix
+            
+            self.broadcaster.subscribe(client_id, prefixes, keys_only=keys_only, ack=ack)
+            
+            logger.info(f"Client {client_id} subscribed to {prefixes or 'all keys'}")  # Log subscription
+            
+            # Confirm subscription to client
+            emit('subscription_confirmed', {
+                'prefixes': prefixes,
+                'keys_only': keys_only,
+                'ack': ack
+            })
+        
         @self.socketio.on('context_set')  # Handle context updates via WebSocket
         def handle_context_set(data):
             """Handle context value updates from WebSocket clients."""
@@ -850,13 +982,8 @@ class EnhancedContextServer:
                 self.memory_bus.set(key, value)  # Update memory bus storage
                 self.context.set(key, value, who=who)  # Update context with history tracking
                 
-                # Broadcast change to all connected clients except sender
-                self.socketio.emit('context_updated', {  # Send update notification
-                    'key': key,
-                    'value': value,
-                    'who': who,
-                    'timestamp': datetime.now().isoformat()
-                }, room=None, skip_sid=client_id)  # Broadcast to all except sender
+                # Queue change for all subscribed clients except sender
+                self.broadcaster.publish({key: value}, who=who, skip_sid=client_id)
                 
                 # Send confirmation to sender
                 emit('context_set_confirmed', {  # Confirm successful update to sender
@@ -871,97 +998,35 @@ class EnhancedContextServer:
                 logger.error(f"WebSocket context set error: {e}")  # Log error for debugging
                 emit('error', {'message': str(e)})  # Send error message to client
 
+    def _start_broadcast_loop(self) -> None:
+        """Start the background task that flushes coalesced updates, once."""
+        if self._broadcast_task is None and self.broadcaster.window > 0:
+            self._broadcast_task = self.socketio.start_background_task(self._broadcast_loop)
+    
+    def _broadcast_loop(self) -> None:
+        """Flush coalesced updates to clients every broadcast window."""
+        while True:
+            self.socketio.sleep(self.broadcaster.window)  # Wait one coalescing window
+            try:
+                self.broadcaster.flush()  # Deliver pending updates
+            except Exception as e:  # Keep flushing after delivery errors
+                logger.error(f"Broadcast flush error: {e}")  # Log error for debugging
+    
     def _write_json_dump(self, dump_path: Path, dump_info: Dict[str, Any]) -> None:
-        """
-        Write context dump in JSON format.
-        
-        Args:
-            dump_path: Path where to write the dump file
-            dump_info: Complete dump information including context data
-        """
-        with open(dump_path, 'w', encoding='utf-8') as f:  # Open file for writing
-            json.dump(dump_info, f, indent=2, ensure_ascii=False, default=str)  # Write formatted JSON
+        """Write context dump in JSON format."""
+        write_json_dump(dump_path, dump_info)  # Shared writer in context_dump
     
     def _write_pretty_dump(self, dump_path: Path, dump_info: Dict[str, Any]) -> None:
-        """
-        Write context dump in human-readable pretty format.
-        
-        Args:
-            dump_path: Path where to write the dump file
-            dump_info: Complete dump information including context data
-        """
-        with open(dump_path, 'w', encoding='utf-8') as f:  # Open file for writing
-            f.write("=" * 80 + "\n")  # Header separator
-            f.write("Framework0 Context Dump - Pretty Format\n")  # Title
-            f.write("=" * 80 + "\n\n")  # Header separator
-            
-            # Write dump metadata
-            f.write(f"Timestamp: {dump_info['timestamp']}\n")  # When dump was created
-            f.write(f"Requested by: {dump_info['who']}\n")  # Who requested dump
-            f.write(f"Total keys: {dump_info['key_count']}\n")  # Number of context keys
-            f.write(f"Include history: {dump_info['include_history']}\n\n")  # History inclusion flag
-            
-            # Write context data in readable format
-            f.write("Context Data:\n")  # Section header
-            f.write("-" * 40 + "\n")  # Section separator
-            
-            for key, value in sorted(dump_info['context'].items()):  # Iterate through context keys
-                f.write(f"{key}: {json.dumps(value, indent=2)}\n\n")  # Write key-value pair
-            
-            # Write history if included
-            if dump_info.get('include_history') and 'history' in dump_info:
-                f.write("\nChange History:\n")  # History section header
-                f.write("-" * 40 + "\n")  # Section separator
-                
-                for i, entry in enumerate(dump_info['history'], 1):  # Iterate through history entries
-                    f.write(f"{i}. [{entry.get('timestamp', 'unknown')}] ")  # Entry number and timestamp
-                    f.write(f"{entry.get('who', 'unknown')} changed {entry.get('key', 'unknown')}\n")  # Change details
-                    f.write(f"   Before: {entry.get('before', 'None')}\n")  # Previous value
-                    f.write(f"   After:  {entry.get('after', 'None')}\n\n")  # New value
+        """Write context dump in human-readable pretty format."""
+        write_pretty_dump(dump_path, dump_info)  # Shared writer in context_dump
     
     def _write_csv_dump(self, dump_path: Path, dump_info: Dict[str, Any]) -> None:
-        """
-        Write context dump in CSV format.
-        
-        Args:
-            dump_path: Path where to write the dump file
-            dump_info: Complete dump information including context data
-        """
-        with open(dump_path, 'w', newline='', encoding='utf-8') as f:  # Open file for CSV writing
-            writer = csv.writer(f)  # Create CSV writer
-            
-            # Write CSV header
-            writer.writerow(['Key', 'Value', 'Type', 'Dump_Timestamp', 'Requested_By'])  # Column headers
-            
-            # Write context data rows
-            for key, value in sorted(dump_info['context'].items()):  # Iterate through context data
-                value_str = json.dumps(value) if not isinstance(value, str) else value  # Convert value to string
-                value_type = type(value).__name__  # Get value type name
-                
-                writer.writerow([  # Write data row
-                    key,  # Context key
-                    value_str,  # String representation of value
-                    value_type,  # Python type of value
-                    dump_info['timestamp'],  # When dump was created
-                    dump_info['who']  # Who requested dump
-                ])
+        """Write context dump in CSV format."""
+        write_csv_dump(dump_path, dump_info)  # Shared writer in context_dump
     
     def _write_text_dump(self, dump_path: Path, dump_info: Dict[str, Any]) -> None:
-        """
-        Write context dump in plain text format.
-        
-        Args:
-            dump_path: Path where to write the dump file
-            dump_info: Complete dump information including context data
-        """
-        with open(dump_path, 'w', encoding='utf-8') as f:  # Open file for writing
-            f.write(f"Context Dump - {dump_info['timestamp']}\n")  # Header with timestamp
-            f.write(f"Requested by: {dump_info['who']}\n")  # Attribution
-            f.write(f"Total keys: {dump_info['key_count']}\n\n")  # Key count
-            
-            # Write context data in simple key=value format
-            for key, value in sorted(dump_info['context'].items()):  # Iterate through context
-                f.write(f"{key}={value}\n")  # Simple key=value format
+        """Write context dump in plain text format."""
+        write_text_dump(dump_path, dump_info)  # Shared writer in context_dump
 
     def run(self) -> None:
         """Start the enhanced context server with full logging and error handling."""
@@ -994,6 +1059,10 @@ def main():
     parser.add_argument('--host', default='0.0.0.0', help='Server host address (default: 0.0.0.0)')  # Host configuration
     parser.add_argument('--port', type=int, default=8080, help='Server port (default: 8080)')  # Port configuration
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')  # Debug flag
+    parser.add_argument('--asgi', action='store_true', help='Serve with the multi-process ASGI server')  # ASGI mode
+    parser.add_argument('--workers', type=int, default=1, help='ASGI worker processes (default: 1)')  # Worker count
+    parser.add_argument('--shards', type=int, default=None,
+                        help='ASGI shard processes (default: one per worker when workers > 1)')  # Shard count
     
     args = parser.parse_args()  # Parse command-line arguments
     
@@ -1002,6 +1071,13 @@ def main():
     port = int(os.getenv('CONTEXT_SERVER_PORT', args.port))  # Allow environment override for port
     debug = os.getenv('DEBUG') == '1' or args.debug  # Enable debug from environment or args
     
+    # ASGI mode spreads requests over worker processes sharing sharded state
+    if args.asgi:
+        from orchestrator.asgi_context_server import run_asgi_server  # Import only when requested
+        run_asgi_server(host=host, port=port, workers=args.workers, shards=args.shards,
+                        log_level='debug' if debug else 'info')
+        return
+    
     # Create and start the enhanced context server
     server = EnhancedContextServer(host=host, port=port, debug=debug)  # Initialize server with configuration
     server.run()  # Start the server and begin accepting connections
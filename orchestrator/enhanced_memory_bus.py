@@ -17,24 +17,44 @@ Features:
 """
 
 import os
+import io
 import json
+import gzip
+import mmap
+import shutil
 import sqlite3
 import pickle
+import tempfile
 import asyncio
 import threading
 import time
 import weakref
 import hashlib
-from typing import Dict, Any, List, Optional, Union, Callable, Set, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Union, Callable, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from collections import defaultdict
+from collections.abc import MutableMapping
 import uuid
 
+# Optional encoders for JSONPersistenceBackend
+try:
+    import zstandard  # For zstd-compressed persistence files
+    ZSTD_AVAILABLE = True  # Flag for zstd compression availability
+except ImportError:
+    ZSTD_AVAILABLE = False  # zstd compression will be disabled
+
+try:
+    import msgpack  # For compact binary persistence files
+    MSGPACK_AVAILABLE = True  # Flag for msgpack serialization availability
+except ImportError:
+    MSGPACK_AVAILABLE = False  # msgpack serialization will be disabled
+
 # Import core systems
+from src.core.file_modes import match_file_mode
 from src.core.logger import get_logger
 from orchestrator.context.context import Context
 
@@ -128,13 +148,45 @@ class PersistenceBackend(ABC):
     
     Defines the interface that all persistence backends must implement
     for storing and retrieving memory bus data.
+    
+    Backends that can write individual keys set supports_incremental_save
+    and override save_changes(); the memory bus then persists only the keys
+    changed or deleted since the previous persist instead of calling save()
+    with the whole cache.
     """
     
+    # Whether save_changes() writes only the given keys
+    supports_incremental_save: bool = False
+    
     @abstractmethod
     def save(self, data: Dict[str, Any]) -> bool:
         """Save data to persistent storage."""
         pass
     
+    def save_changes(self, changes: Dict[str, Any], deleted: Iterable[str]) -> bool:
+        """
+        Apply changed and deleted keys to persistent storage.
+        
+        The default implementation rewrites the whole store through load()
+        and save(); incremental backends override it.
+        
+        Args:
+            changes: Keys to insert or update with their new values
+            deleted: Keys to remove
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        data = self.load()
+        for key in deleted:
+            data.pop(key, None)
+        data.update(changes)
+        return self.save(data)
+    
+    def close(self) -> None:
+        """Release resources held by the backend."""
+        pass
+    
     @abstractmethod
     def load(self) -> Dict[str, Any]:
         """Load data from persistent storage."""
@@ -161,18 +213,135 @@ class PersistenceBackend(ABC):
         pass
 
 
+class LazyJSONMapping(MutableMapping):
+    """
+    Mapping over a memory-mapped JSON object that decodes values on access.
+    
+    Built by JSONPersistenceBackend from a byte-offset index, so loading a
+    large file only parses the index. Values are decoded the first time they
+    are read; assigned values shadow the file. Untouched values are written
+    back as their original bytes on the next save.
+    """
+    
+    def __init__(self, buffer: mmap.mmap, offsets: Dict[str, List[int]]) -> None:
+        """
+        Initialize the mapping.
+        
+        Args:
+            buffer: Read-only memory map of the JSON file
+            offsets: Start and end byte offset of each key's encoded value
+        """
+        self._buffer = buffer  # Shared between copies; kept alive by references
+        self._offsets = offsets  # Keys whose value is still undecoded
+        self._values: Dict[str, Any] = {}  # Decoded or assigned values
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        start, end = self._offsets.pop(key)  # KeyError for missing keys
+        value = self._values[key] = json.loads(self._buffer[start:end])
+        return value
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._offsets.pop(key, None)
+        self._values[key] = value
+    
+    def __delitem__(self, key: str) -> None:
+        if self._offsets.pop(key, None) is None:
+            del self._values[key]
+        else:
+            self._values.pop(key, None)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._offsets
+    
+    def __iter__(self):
+        yield from list(self._values)
+        yield from list(self._offsets)
+    
+    def __len__(self) -> int:
+        return len(self._values) + len(self._offsets)
+    
+    def clear(self) -> None:
+        self._values.clear()
+        self._offsets.clear()
+    
+    def copy(self) -> "LazyJSONMapping":
+        """Return a shallow copy sharing the memory map and decoded values."""
+        duplicate = LazyJSONMapping(self._buffer, dict(self._offsets))
+        duplicate._values = dict(self._values)
+        return duplicate
+    
+    def raw_value(self, key: str) -> Optional[bytes]:
+        """Return the encoded bytes of an undecoded value, or None."""
+        offsets = self._offsets.get(key)
+        return None if offsets is None else self._buffer[offsets[0]:offsets[1]]
+    
+    @property
+    def decoded_count(self) -> int:
+        """Number of values decoded or assigned so far."""
+        return len(self._values)
+
+
 class JSONPersistenceBackend(PersistenceBackend):
     """
     JSON file-based persistence backend.
     
     Provides simple file-based persistence using JSON format
     for easy debugging and cross-platform compatibility.
+    
+    Saves are crash-safe: data is streamed to a temporary file in the same
+    directory, optionally fsynced, and moved over the live file with
+    os.replace(), so a crash leaves either the old or the new file intact.
+    The previous version is kept as a .bak hard link. Files can be gzip or
+    zstd compressed and encoded as JSON or msgpack; load() detects the
+    format from the file content.
+    
+    With lazy_load, saves also write a byte-offset index next to the file,
+    and load() memory-maps the file and returns a LazyJSONMapping that
+    decodes each value on first access.
     """
     
-    def __init__(self, file_path: Union[str, Path], enable_compression: bool = False) -> None:
-        """Initialize JSON persistence backend."""
+    COMPRESSIONS = (None, "gzip", "zstd")  # Supported compression codecs
+    SERIALIZERS = ("json", "msgpack")  # Supported encodings
+    INDEX_VERSION = 1  # Bumped whenever the offset index layout changes
+    
+    def __init__(self, file_path: Union[str, Path], enable_compression: bool = False,
+                 compression: Optional[str] = None, serializer: str = "json",
+                 durable: bool = True, lazy_load: bool = False) -> None:
+        """
+        Initialize JSON persistence backend.
+        
+        Args:
+            file_path: Path to the persistence file
+            enable_compression: Write compact JSON without indentation
+            compression: Compression codec (None, 'gzip' or 'zstd')
+            serializer: Encoding ('json' or 'msgpack')
+            durable: fsync the file and directory before save() returns
+            lazy_load: Write an offset index and load values lazily through
+                a memory map (JSON without compression only)
+            
+        Raises:
+            ValueError: If an option is unsupported or its package is missing
+        """
+        if compression not in self.COMPRESSIONS:
+            raise ValueError(f"Unsupported compression '{compression}'. Supported: {self.COMPRESSIONS}")
+        if serializer not in self.SERIALIZERS:
+            raise ValueError(f"Unsupported serializer '{serializer}'. Supported: {self.SERIALIZERS}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        if serializer == "msgpack" and not MSGPACK_AVAILABLE:
+            raise ValueError("msgpack serialization requires the 'msgpack' package")
+        if lazy_load and (compression or serializer != "json"):
+            raise ValueError("lazy_load requires uncompressed JSON")
+        
         self.file_path = Path(file_path)  # Convert to Path object
-        self.enable_compression = enable_compression  # Whether to compress data
+        self.enable_compression = enable_compression  # Whether to write compact JSON
+        self.compression = compression  # Compression codec
+        self.serializer = serializer  # File encoding
+        self.durable = durable  # Whether saves are fsynced
+        self.lazy_load = lazy_load  # Whether loads are lazy
+        self.index_path = self.file_path.with_name(self.file_path.name + ".idx")  # Offset index
         self.logger = get_logger(__name__, debug=os.getenv("DEBUG") == "1")
         
         # Ensure directory exists
@@ -181,20 +350,32 @@ class JSONPersistenceBackend(PersistenceBackend):
         self.logger.debug(f"JSON persistence backend initialized: {self.file_path}")
     
     def save(self, data: Dict[str, Any]) -> bool:
-        """Save data to JSON file."""
+        """Atomically save data to the file."""
+        temp_path = None
         try:
-            # Create backup of existing file
-            if self.file_path.exists():
-                backup_path = self.file_path.with_suffix('.bak')
-                self.file_path.rename(backup_path)
+            file_descriptor, temp_path = tempfile.mkstemp(
+                dir=self.file_path.parent, prefix=f".{self.file_path.name}.", suffix=".tmp"
+            )
+            with os.fdopen(file_descriptor, "wb") as raw_file:
+                match_file_mode(temp_path, self.file_path)
+                stream = self._open_compressor(raw_file)
+                offsets = self._encode(data, stream)
+                if stream is not raw_file:
+                    stream.close()  # Writes the compression trailer
+                raw_file.flush()
+                if self.durable:
+                    os.fsync(raw_file.fileno())
+                temp_stat = os.fstat(raw_file.fileno())  # Rename keeps inode, size and mtime
             
-            # Save new data
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                if self.enable_compression:
-                    # Simple compression by removing whitespace
-                    json.dump(data, f, separators=(',', ':'))
-                else:
-                    json.dump(data, f, indent=2)
+            # Keep the previous version without ever removing the live file
+            if self.file_path.exists():
+                self._link_backup()
+            if offsets is not None:
+                self._write_index(offsets, temp_stat)
+            os.replace(temp_path, self.file_path)
+            temp_path = None
+            if self.durable:
+                self._fsync_directory()
             
             self.logger.debug(f"Data saved to JSON file: {len(data)} keys")
             return True
@@ -202,15 +383,125 @@ class JSONPersistenceBackend(PersistenceBackend):
         except Exception as e:
             self.logger.error(f"Failed to save data to JSON file: {str(e)}")
             return False
+        finally:
+            if temp_path is not None:
+                Path(temp_path).unlink(missing_ok=True)
+    
+    def _open_compressor(self, raw_file: io.BufferedWriter) -> Any:
+        """Wrap the output file in the configured compressor."""
+        if self.compression == "gzip":
+            return gzip.GzipFile(fileobj=raw_file, mode="wb", compresslevel=6)
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor().stream_writer(raw_file, closefd=False)
+        return raw_file
+    
+    def _encode(self, data: Dict[str, Any], stream: Any) -> Optional[Dict[str, List[int]]]:
+        """
+        Stream-encode data without building the whole document in memory.
+        
+        Returns:
+            Byte offsets of each value when writing a lazy-load index, else None
+        """
+        if self.serializer == "msgpack":
+            packer = msgpack.Packer()
+            stream.write(packer.pack_map_header(len(data)))
+            for key, value in data.items():
+                stream.write(packer.pack(key))
+                stream.write(packer.pack(value))
+            return None
+        
+        if self.lazy_load or self.enable_compression or self.compression:
+            # Compact JSON written one value at a time; offsets feed the lazy-load index
+            # and undecoded values of a LazyJSONMapping are copied verbatim
+            raw_value = data.raw_value if isinstance(data, LazyJSONMapping) else (lambda key: None)
+            encode = json.JSONEncoder(separators=(",", ":")).encode  # Reused for every value
+            offsets: Dict[str, List[int]] = {}
+            position = 1
+            stream.write(b"{")
+            for key in data:
+                encoded = raw_value(key)
+                if encoded is None:
+                    encoded = encode(data[key]).encode("utf-8")
+                prefix = (b"," if offsets else b"") + encode(key).encode("utf-8") + b":"
+                stream.write(prefix)
+                position += len(prefix)
+                stream.write(encoded)
+                offsets[key] = [position, position + len(encoded)]
+                position += len(encoded)
+            stream.write(b"}")
+            return offsets if self.lazy_load else None
+        
+        text_stream = io.TextIOWrapper(stream, encoding="utf-8")
+        json.dump(dict(data), text_stream, indent=2)  # Human-readable format
+        text_stream.flush()
+        text_stream.detach()  # Leave the underlying stream open
+        return None
+    
+    def _link_backup(self) -> None:
+        """Point the .bak file at the current version before it is replaced."""
+        backup_path = self.file_path.with_suffix(".bak")
+        backup_path.unlink(missing_ok=True)
+        try:
+            os.link(self.file_path, backup_path)  # Cheap; the live file stays in place
+        except OSError:
+            shutil.copy2(self.file_path, backup_path)  # Filesystems without hard links
+    
+    def _write_index(self, offsets: Dict[str, List[int]], file_stat: os.stat_result) -> None:
+        """Atomically write the lazy-load offset index for a data file."""
+        index = {
+            "version": self.INDEX_VERSION,
+            "stamp": [file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns],
+            "offsets": offsets
+        }
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=self.file_path.parent, prefix=f".{self.index_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as index_file:
+                match_file_mode(temp_path, self.index_path)
+                index_file.write(json.dumps(index, separators=(",", ":")))  # C encoder; json.dump is pure Python
+                index_file.flush()
+                if self.durable:
+                    os.fsync(index_file.fileno())
+            os.replace(temp_path, self.index_path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+    
+    def _fsync_directory(self) -> None:
+        """Persist the rename by syncing the containing directory (POSIX only)."""
+        try:
+            directory_descriptor = os.open(self.file_path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(directory_descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(directory_descriptor)
     
     def load(self) -> Dict[str, Any]:
-        """Load data from JSON file."""
+        """Load data from the file, lazily if an up-to-date index exists."""
         try:
             if not self.file_path.exists():
                 return {}
             
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if self.lazy_load:
+                lazy_data = self._load_lazy()
+                if lazy_data is not None:
+                    self.logger.debug(f"Data mapped from JSON file: {len(lazy_data)} keys")
+                    return lazy_data
+            
+            with open(self.file_path, 'rb') as f:
+                content = self._decompress(f.read())
+            
+            if content.lstrip()[:1] in (b"{", b""):
+                data = json.loads(content) if content.strip() else {}
+            elif MSGPACK_AVAILABLE:
+                data = msgpack.unpackb(content, raw=False, strict_map_key=False)
+            else:
+                raise ValueError("File is msgpack-encoded but the 'msgpack' package is not installed")
             
             self.logger.debug(f"Data loaded from JSON file: {len(data)} keys")
             return data
@@ -219,6 +510,33 @@ class JSONPersistenceBackend(PersistenceBackend):
             self.logger.error(f"Failed to load data from JSON file: {str(e)}")
             return {}
     
+    @staticmethod
+    def _decompress(content: bytes) -> bytes:
+        """Decompress file content based on its magic number."""
+        if content[:2] == b"\x1f\x8b":
+            return gzip.decompress(content)
+        if content[:4] == b"\x28\xb5\x2f\xfd":
+            if not ZSTD_AVAILABLE:
+                raise ValueError("File is zstd-compressed but the 'zstandard' package is not installed")
+            return zstandard.ZstdDecompressor().decompressobj().decompress(content)
+        return content
+    
+    def _load_lazy(self) -> Optional[LazyJSONMapping]:
+        """Map the file through its offset index, or return None if the index is stale."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as index_file:
+                index = json.load(index_file)
+            file_stat = os.stat(self.file_path)
+        except (OSError, ValueError):
+            return None
+        stamp = [file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns]
+        if index.get("version") != self.INDEX_VERSION or index.get("stamp") != stamp:
+            return None  # File was replaced without this backend
+        
+        with open(self.file_path, 'rb') as data_file:
+            buffer = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return LazyJSONMapping(buffer, index["offsets"])
+    
     def delete(self, key: str) -> bool:
         """Delete specific key from JSON storage."""
         try:
@@ -243,7 +561,6 @@ class JSONPersistenceBackend(PersistenceBackend):
                 backup_file = Path(backup_path)
                 backup_file.parent.mkdir(parents=True, exist_ok=True)
                 
-                import shutil
                 shutil.copy2(self.file_path, backup_file)
                 self.logger.debug(f"JSON backup created: {backup_file}")
                 return True
@@ -254,12 +571,21 @@ class JSONPersistenceBackend(PersistenceBackend):
             return False
     
     def restore(self, backup_path: str) -> bool:
-        """Restore from JSON backup."""
+        """Atomically restore from JSON backup."""
         try:
             backup_file = Path(backup_path)
             if backup_file.exists():
-                import shutil
-                shutil.copy2(backup_file, self.file_path)
+                file_descriptor, temp_path = tempfile.mkstemp(
+                    dir=self.file_path.parent, prefix=f".{self.file_path.name}.", suffix=".tmp"
+                )
+                os.close(file_descriptor)
+                try:
+                    shutil.copy2(backup_file, temp_path)
+                    match_file_mode(temp_path, self.file_path)  # copy2 took the backup's mode
+                    os.replace(temp_path, self.file_path)  # Invalidates any offset index
+                except BaseException:
+                    Path(temp_path).unlink(missing_ok=True)
+                    raise
                 self.logger.info(f"JSON restored from backup: {backup_file}")
                 return True
             return False
@@ -275,14 +601,44 @@ class SQLitePersistenceBackend(PersistenceBackend):
     
     Provides robust database-based persistence with transaction support
     and better performance for large datasets.
+    
+    A single long-lived connection in WAL journal mode is shared by all
+    operations. Incremental saves upsert changed keys and delete removed
+    keys with executemany() in one transaction, so persisting a large bus
+    costs time proportional to the number of changed keys.
     """
     
-    def __init__(self, db_path: Union[str, Path], table_name: str = "memory_bus") -> None:
-        """Initialize SQLite persistence backend."""
+    # Accepted values for the synchronous pragma
+    SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+    
+    supports_incremental_save = True
+    
+    def __init__(self, db_path: Union[str, Path], table_name: str = "memory_bus",
+                 synchronous: str = "NORMAL") -> None:
+        """
+        Initialize SQLite persistence backend.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            table_name: Table holding memory bus keys
+            synchronous: SQLite synchronous level (OFF, NORMAL, FULL, EXTRA);
+                NORMAL is durable against application crashes in WAL mode,
+                FULL also against power loss
+        """
+        synchronous = synchronous.upper()
+        if synchronous not in self.SYNCHRONOUS_LEVELS:
+            raise ValueError(
+                f"Invalid synchronous level '{synchronous}'. Supported: {self.SYNCHRONOUS_LEVELS}"
+            )
         self.db_path = Path(db_path)
         self.table_name = table_name
+        self.synchronous = synchronous
         self.logger = get_logger(__name__, debug=os.getenv("DEBUG") == "1")
         
+        # Shared connection, opened lazily and guarded by a lock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.RLock()
+        
         # Ensure directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -291,46 +647,57 @@ class SQLitePersistenceBackend(PersistenceBackend):
         
         self.logger.debug(f"SQLite persistence backend initialized: {self.db_path}")
     
+    def _connection(self) -> sqlite3.Connection:
+        """Return the shared connection, opening and configuring it if needed."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(f'PRAGMA synchronous={self.synchronous}')
+            self._conn = conn
+        return self._conn
+    
     def _init_database(self) -> None:
         """Initialize SQLite database and create table."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f'''
-                    CREATE TABLE IF NOT EXISTS {self.table_name} (
-                        key TEXT PRIMARY KEY,
-                        value TEXT NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                # Create index for better performance
-                cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{self.table_name}_updated ON {self.table_name}(updated_at)')
-                
-                conn.commit()
+            with self._conn_lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(f'''
+                        CREATE TABLE IF NOT EXISTS {self.table_name} (
+                            key TEXT PRIMARY KEY,
+                            value TEXT NOT NULL,
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        )
+                    ''')
+                    
+                    # Create index for better performance
+                    conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{self.table_name}_updated ON {self.table_name}(updated_at)')
                 
         except Exception as e:
             self.logger.error(f"Failed to initialize SQLite database: {str(e)}")
             raise
     
+    def _write(self, conn: sqlite3.Connection, changes: Dict[str, Any], deleted: Iterable[str]) -> None:
+        """Upsert changed keys and delete removed keys on a connection."""
+        conn.executemany(
+            f'DELETE FROM {self.table_name} WHERE key = ?',
+            [(key,) for key in deleted]
+        )
+        conn.executemany(f'''
+            INSERT INTO {self.table_name} (key, value, updated_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+        ''', [(key, json.dumps(value)) for key, value in changes.items()])
+    
     def save(self, data: Dict[str, Any]) -> bool:
-        """Save data to SQLite database."""
+        """Replace the stored data with the given data."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Clear existing data and insert new data
-                cursor.execute(f'DELETE FROM {self.table_name}')
-                
-                for key, value in data.items():
-                    json_value = json.dumps(value)
-                    cursor.execute(f'''
-                        INSERT OR REPLACE INTO {self.table_name} (key, value, updated_at)
-                        VALUES (?, ?, CURRENT_TIMESTAMP)
-                    ''', (key, json_value))
-                
-                conn.commit()
+            with self._conn_lock:
+                conn = self._connection()
+                with conn:  # Single transaction
+                    stored_keys = [row[0] for row in conn.execute(f'SELECT key FROM {self.table_name}')]
+                    self._write(conn, data, [key for key in stored_keys if key not in data])
                 
             self.logger.debug(f"Data saved to SQLite: {len(data)} keys")
             return True
@@ -339,19 +706,34 @@ class SQLitePersistenceBackend(PersistenceBackend):
             self.logger.error(f"Failed to save data to SQLite: {str(e)}")
             return False
     
+    def save_changes(self, changes: Dict[str, Any], deleted: Iterable[str]) -> bool:
+        """Upsert changed keys and delete removed keys in one transaction."""
+        try:
+            deleted = list(deleted)
+            with self._conn_lock:
+                conn = self._connection()
+                with conn:  # Single transaction
+                    self._write(conn, changes, deleted)
+            
+            self.logger.debug(f"Changes saved to SQLite: {len(changes)} upserted, {len(deleted)} deleted")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to save changes to SQLite: {str(e)}")
+            return False
+    
     def load(self) -> Dict[str, Any]:
         """Load data from SQLite database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f'SELECT key, value FROM {self.table_name}')
-                
-                data = {}
-                for key, json_value in cursor.fetchall():
-                    try:
-                        data[key] = json.loads(json_value)
-                    except json.JSONDecodeError:
-                        self.logger.warning(f"Failed to decode JSON for key: {key}")
+            with self._conn_lock:
+                rows = self._connection().execute(f'SELECT key, value FROM {self.table_name}').fetchall()
+            
+            data = {}
+            for key, json_value in rows:
+                try:
+                    data[key] = json.loads(json_value)
+                except json.JSONDecodeError:
+                    self.logger.warning(f"Failed to decode JSON for key: {key}")
                 
             self.logger.debug(f"Data loaded from SQLite: {len(data)} keys")
             return data
@@ -362,30 +744,24 @@ class SQLitePersistenceBackend(PersistenceBackend):
     
     def delete(self, key: str) -> bool:
         """Delete specific key from SQLite storage."""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f'DELETE FROM {self.table_name} WHERE key = ?', (key,))
-                conn.commit()
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to delete key from SQLite: {str(e)}")
-            return False
+        return self.save_changes({}, [key])
     
     def exists(self) -> bool:
         """Check if SQLite database exists."""
         return self.db_path.exists()
     
     def backup(self, backup_path: str) -> bool:
-        """Create backup of SQLite database."""
+        """Create a consistent online backup of the SQLite database."""
         try:
             backup_file = Path(backup_path)
             backup_file.parent.mkdir(parents=True, exist_ok=True)
             
-            import shutil
-            shutil.copy2(self.db_path, backup_file)
+            with self._conn_lock:
+                target = sqlite3.connect(backup_file)
+                try:
+                    self._connection().backup(target)  # Includes pages still in the WAL
+                finally:
+                    target.close()
             self.logger.debug(f"SQLite backup created: {backup_file}")
             return True
             
@@ -398,8 +774,12 @@ class SQLitePersistenceBackend(PersistenceBackend):
         try:
             backup_file = Path(backup_path)
             if backup_file.exists():
-                import shutil
-                shutil.copy2(backup_file, self.db_path)
+                with self._conn_lock:
+                    self.close()  # Checkpoint and release the WAL before replacing the file
+                    for suffix in ("-wal", "-shm"):
+                        Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+                    shutil.copy2(backup_file, self.db_path)
+                    self._connection()  # Reopen with the configured pragmas
                 self.logger.info(f"SQLite restored from backup: {backup_file}")
                 return True
             return False
@@ -407,6 +787,13 @@ class SQLitePersistenceBackend(PersistenceBackend):
         except Exception as e:
             self.logger.error(f"Failed to restore from SQLite backup: {str(e)}")
             return False
+    
+    def close(self) -> None:
+        """Close the shared connection; it is reopened on next use."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
 
 @dataclass
@@ -506,7 +893,7 @@ class EnhancedMemoryBus:
         self.logger = get_logger(__name__, debug=os.getenv("DEBUG") == "1")
         
         # Memory storage
-        self._memory_cache: Dict[str, Any] = {}  # In-memory cache
+        self._memory_cache: MutableMapping = {}  # In-memory cache (LazyJSONMapping after a lazy load)
         self._memory_lock = threading.RLock()  # Thread safety lock
         
         # Persistence
@@ -516,6 +903,8 @@ class EnhancedMemoryBus:
         )
         self.auto_persist_interval = auto_persist_interval
         self._last_persist_time = time.time()
+        self._dirty_keys: Set[str] = set()  # Keys set since the last persist
+        self._deleted_keys: Set[str] = set()  # Keys deleted since the last persist
         
         # Messaging
         self.enable_messaging = enable_messaging
@@ -549,7 +938,10 @@ class EnhancedMemoryBus:
             if self.persistence_backend.exists():
                 data = self.persistence_backend.load()
                 with self._memory_lock:
-                    self._memory_cache.update(data)
+                    if isinstance(data, LazyJSONMapping) and not self._memory_cache:
+                        self._memory_cache = data  # Values are decoded on first access
+                    else:
+                        self._memory_cache.update(data)
                 
                 self.logger.info(f"Loaded {len(data)} items from persistence")
             else:
@@ -679,6 +1071,8 @@ class EnhancedMemoryBus:
             
             with self._memory_lock:
                 self._memory_cache[key] = value
+                self._dirty_keys.add(key)
+                self._deleted_keys.discard(key)
             
             # Update Context if available
             if self.context:
@@ -724,9 +1118,13 @@ class EnhancedMemoryBus:
         start_time = time.time()
         
         try:
+            incremental = self.persistence_backend.supports_incremental_save
             with self._memory_lock:
                 if key in self._memory_cache:
                     del self._memory_cache[key]
+                self._dirty_keys.discard(key)
+                if incremental:
+                    self._deleted_keys.add(key)  # Removed in a batch on the next persist
             
             # Delete from Context if available
             if self.context:
@@ -741,7 +1139,7 @@ class EnhancedMemoryBus:
                     self.logger.warning(f"Failed to delete from context for key '{key}': {str(e)}")
             
             # Delete from persistence
-            if self.enable_persistence:
+            if self.enable_persistence and not incremental:
                 self.persistence_backend.delete(key)
             
             # Update metrics
@@ -772,6 +1170,8 @@ class EnhancedMemoryBus:
     def clear(self) -> None:
         """Clear all data from memory bus."""
         with self._memory_lock:
+            self._deleted_keys.update(self._memory_cache)
+            self._dirty_keys.clear()
             self._memory_cache.clear()
         
         # Trigger event
@@ -787,28 +1187,62 @@ class EnhancedMemoryBus:
         """
         Manually trigger persistence of current data.
         
+        Backends supporting incremental saves receive only the keys set or
+        deleted since the previous persist; other backends receive the whole
+        cache.
+        
         Returns:
             True if successful, False otherwise
         """
         if not self.enable_persistence:
             return True
         
+        changes: Dict[str, Any] = {}
+        deleted: List[str] = []
         try:
+            incremental = self.persistence_backend.supports_incremental_save
             with self._memory_lock:
-                data = self._memory_cache.copy()
+                if incremental:
+                    changes = {key: self._memory_cache[key] for key in self._dirty_keys}
+                    deleted = list(self._deleted_keys)
+                else:
+                    data = self._memory_cache.copy()
+                self._dirty_keys.clear()
+                self._deleted_keys.clear()
+            
+            if not incremental:
+                success = self.persistence_backend.save(data)
+                item_count = len(data)
+            elif changes or deleted:
+                success = self.persistence_backend.save_changes(changes, deleted)
+                item_count = len(changes) + len(deleted)
+            else:
+                return True  # Nothing changed since the last persist
             
-            success = self.persistence_backend.save(data)
             if success:
                 self.metrics.persistence_operations += 1
-                self.logger.debug(f"Persisted {len(data)} items to storage")
+                self.logger.debug(f"Persisted {item_count} items to storage")
+            elif incremental:
+                self._requeue_changes(changes, deleted)
             
             return success
             
         except Exception as e:
             self.metrics.error_count += 1
+            self._requeue_changes(changes, deleted)
             self.logger.error(f"Failed to persist data: {str(e)}")
             return False
     
+    def _requeue_changes(self, changes: Dict[str, Any], deleted: List[str]) -> None:
+        """Mark changes from a failed persist as pending again unless superseded."""
+        with self._memory_lock:
+            for key in changes:
+                if key in self._memory_cache and key not in self._deleted_keys:
+                    self._dirty_keys.add(key)
+            for key in deleted:
+                if key not in self._memory_cache:
+                    self._deleted_keys.add(key)
+    
     def backup(self, backup_name: Optional[str] = None) -> bool:
         """
         Create backup of current data.
@@ -863,6 +1297,10 @@ class EnhancedMemoryBus:
             if success:
                 # Reload data from persistence
                 self._load_from_persistence()
+                with self._memory_lock:
+                    # Keys kept in memory but absent from the backup are written back on persist
+                    self._dirty_keys.update(self._memory_cache)
+                    self._deleted_keys.difference_update(self._memory_cache)
                 self._recovery_count += 1
                 self.metrics.recovery_operations += 1
                 self.logger.info(f"Restored from backup: {backup_path}")
@@ -997,7 +1435,8 @@ class EnhancedMemoryBus:
             'persistence': {
                 'enabled': self.enable_persistence,  # Persistence enabled
                 'backend_type': type(self.persistence_backend).__name__,  # Backend type
-                'last_persist': self._last_persist_time  # Last persistence time
+                'last_persist': self._last_persist_time,  # Last persistence time
+                'pending_changes': len(self._dirty_keys) + len(self._deleted_keys)  # Unpersisted keys
             },
             'messaging': {
                 'enabled': self.enable_messaging,  # Messaging enabled
@@ -1044,6 +1483,7 @@ class EnhancedMemoryBus:
         # Final persistence
         if self.enable_persistence:
             self.persist()
+            self.persistence_backend.close()
         
         # Clear subscribers
         if self.enable_messaging:
@@ -1093,6 +1533,7 @@ __all__ = [
     'MessageEvent',
     'PersistenceBackend',
     'JSONPersistenceBackend',
+    'LazyJSONMapping',
     'SQLitePersistenceBackend',
     'create_json_memory_bus',
     'create_sqlite_memory_bus',
@@ -28,6 +28,7 @@ from enum import Enum
 import yaml
 
 from orchestrator.context.context import Context
+from orchestrator.recipe_cache import RecipePlanCache, hash_recipe_content
 from src.core.logger import get_logger
 
 # Initialize logger with debug support
@@ -484,15 +485,17 @@ class EnhancedRecipeParser:
     - Extensible validation and parsing pipeline
     """
     
-    def __init__(self, context: Optional[Context] = None) -> None:
+    def __init__(self, context: Optional[Context] = None, plan_cache: Optional[RecipePlanCache] = None) -> None:
         """
         Initialize enhanced recipe parser with Context integration.
         
         :param context: Optional Context instance for logging and data sharing
+        :param plan_cache: Optional on-disk cache persisting parsed recipes across processes
         """
         self.context = context or Context()  # Use provided Context or create new one
         self.validator = RecipeValidator(self.context)  # Initialize validator with Context
         self._cache: Dict[str, Tuple[str, ParsedRecipe]] = {}  # Recipe cache (hash -> recipe)
+        self.plan_cache = plan_cache  # Persistent parsed recipe cache
         
         logger.info("Enhanced Recipe Parser initialized with Context integration")
         
@@ -703,7 +706,17 @@ class EnhancedRecipeParser:
         """
         logger.info(f"Parsing recipe file: {file_path}")
         
+        # Check persistent cache, which is validated by file stamp without parsing
+        if use_cache and self.plan_cache is not None:
+            cached = self.plan_cache.load("parser", file_path)
+            if cached is not None:
+                _, cached_recipe = cached
+                self._cache[file_path] = (cached_recipe.file_hash, cached_recipe)
+                logger.debug(f"Using persisted recipe for: {file_path}")
+                return cached_recipe
+        
         # Load raw recipe data
+        recipe_stat = os.stat(file_path) if os.path.exists(file_path) else None  # Stamp before reading
         recipe_data = self.load_file(file_path)
         content_hash = self._compute_content_hash(recipe_data)
         
@@ -734,6 +747,10 @@ class EnhancedRecipeParser:
         # Cache result
         if use_cache:
             self._cache[file_path] = (content_hash, parsed_recipe)
+            if self.plan_cache is not None:
+                with open(file_path, 'rb') as recipe_file:
+                    file_content_hash = hash_recipe_content(recipe_file.read())  # Raw bytes hash
+                self.plan_cache.store("parser", file_path, file_content_hash, parsed_recipe, recipe_stat)
         
         # Record parsing results in Context
         if self.context:
@@ -782,7 +799,7 @@ class EnhancedRecipeParser:
     
     def clear_cache(self) -> None:
         """Clear internal recipe cache."""
-        self._cache.clear()
+        self._cache.clear()  # Persistent entries are invalidated by file changes
         logger.debug("Recipe parser cache cleared")
     
     def add_validator(self, name: str, validator: Callable[[Dict[str, Any]], List[ValidationMessage]]) -> None:
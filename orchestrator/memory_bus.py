@@ -3,12 +3,16 @@
 import json
 import threading
 import time
-from typing import Any, Dict, Optional
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
 
 import requests  # using HTTP client as an example — you could choose sockets, gRPC, etc.
 
 from orchestrator.context import Context
 
+_MISSING = object()  # Distinguishes absent keys from keys holding None
+
 
 class MemoryBusClient:
     """
@@ -29,6 +33,17 @@ class MemoryBusClient:
         self.timeout = timeout
         # Internal lock to guard multi-threaded calls
         self._lock = threading.Lock()
+        # Last server revision merged into the local context (None = never synced)
+        self._revision: Optional[int] = None
+        # Identifies our own patches so the server does not echo them back
+        self.client_id = uuid.uuid4().hex
+
+    @property
+    def revision(self) -> Optional[int]:
+        """
+        The last server revision this client has merged, or None before the first sync.
+        """
+        return self._revision
 
     def fetch_snapshot(self) -> Optional[Context]:
         """
@@ -46,6 +61,20 @@ class MemoryBusClient:
             ctx.set(k, v, who="memory_bus_fetch")
         return ctx
 
+    def fetch_changes(self, since: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the changes committed on the server after revision `since`.
+        Returns the server response (see MemoryBusServer.get_changes_since)
+        or None on error. A response with "full": True carries a complete
+        snapshot instead of changes.
+        """
+        url = f"{self.server_url}/changes"
+        params = {"since": -1 if since is None else since, "origin": self.client_id}
+        resp = requests.get(url, params=params, timeout=self.timeout)
+        if resp.status_code != 200:
+            return None
+        return resp.json()
+
     def push_patch(self, patch: Dict[str, Any]) -> bool:
         """
         Send a JSON patch (key→value mapping) to the server.
@@ -53,27 +82,44 @@ class MemoryBusClient:
         """
         url = f"{self.server_url}/patch"
         headers = {"Content-Type": "application/json"}
-        resp = requests.post(url, json=patch, headers=headers, timeout=self.timeout)
+        resp = requests.post(url, json=patch, headers=headers, params={"origin": self.client_id},
+                             timeout=self.timeout)
         return resp.status_code == 200
 
     def sync(self, local_ctx: Context) -> Context:
         """
-        Two‑way sync: fetch latest from server, merge into local context,
-        then push only local dirty keys as patch.
+        Two‑way sync: fetch what changed on the server since our last sync,
+        merge it into the local context, then push only local dirty keys as
+        patch. The first sync, or one after the server's change log has been
+        truncated past our revision, receives a full snapshot instead.
+
+        Local edits that could not be pushed (request error or rejected
+        patch) stay dirty and are retried by the next sync.
 
         Returns the merged Context (i.e. updated local context).
         """
         with self._lock:
-            remote_ctx = self.fetch_snapshot() or Context()
-            # Merge remote into local (remote may overwrite local where newer)
-            local_ctx.merge_from(remote_ctx, prefix=None)
-            # Get local dirty keys and build patch
+            # Capture local edits before remote values mark keys dirty too
             dirty = local_ctx.pop_dirty_keys()
-            if dirty:
-                patch = {}
-                for k in dirty:
-                    patch[k] = local_ctx.get(k)
-                self.push_patch(patch)
+            remote: Dict[str, Any] = {}
+            try:
+                response = self.fetch_changes(self._revision)
+                if response is not None:
+                    remote = response["snapshot"] if response.get("full") else response["changes"]
+                    # Merge remote into local (remote overwrites local, last-write-wins)
+                    for k, v in remote.items():
+                        local_ctx.set(k, v, who="memory_bus_sync")
+                    # Remote values are not local edits; keys set meanwhile by
+                    # other threads stay dirty for the next sync and persistence
+                    concurrent = set(local_ctx.pop_dirty_keys()) - set(remote)
+                    local_ctx.mark_dirty(list(concurrent))
+                    self._revision = response["revision"]
+                patch = {k: local_ctx.get(k) for k in dirty if k not in remote}
+                if patch and not self.push_patch(patch):
+                    local_ctx.mark_dirty(list(patch))  # Retry on the next sync
+            except Exception:
+                local_ctx.mark_dirty([k for k in dirty if k not in remote])
+                raise
             return local_ctx
 
 
@@ -81,11 +127,32 @@ class MemoryBusServer:
     """
     A simple in-memory context server. Exposes HTTP endpoints for clients
     to get snapshot, push patches, etc. Maintains an internal master Context.
+
+    Every applied patch that changes something advances a monotonically
+    increasing revision. The last `max_changes` key changes are kept in a
+    change log so clients can ask for "changes since revision N"; older
+    revisions are answered with a full snapshot.
     """
 
-    def __init__(self):
+    def __init__(self, max_changes: int = 10000):
+        """
+        :param max_changes: Number of key changes kept in the change log
+        """
         self._ctx = Context()
         self._lock = threading.Lock()
+        self._revision = 0
+        # (revision, key, value, origin) for recent key changes, oldest first
+        self._changes: Deque[Tuple[int, str, Any, Optional[str]]] = deque()
+        self._max_changes = max_changes
+        # Changes after this revision are complete in the log
+        self._log_floor = 0
+
+    @property
+    def revision(self) -> int:
+        """
+        The current revision of the master context.
+        """
+        return self._revision
 
     def get_snapshot(self) -> Dict[str, Any]:
         """
@@ -94,14 +161,51 @@ class MemoryBusServer:
         with self._lock:
             return self._ctx.to_dict()
 
-    def apply_patch(self, patch: Dict[str, Any]) -> None:
+    def apply_patch(self, patch: Dict[str, Any], origin: Optional[str] = None) -> int:
         """
         Apply a patch (key → value) to the master context.
         Overwrites existing keys (last-write-wins by default).
+        `origin` identifies the sending client so its own changes are not
+        sent back to it. Returns the revision after the patch.
         """
         with self._lock:
-            for k, v in patch.items():
-                self._ctx.set(k, v, who="memory_bus_server")
+            changed = [k for k, v in patch.items() if self._ctx.get(k, _MISSING) != v]
+            if not changed:
+                return self._revision
+            self._revision += 1
+            for k in changed:
+                self._ctx.set(k, patch[k], who="memory_bus_server")
+                if len(self._changes) >= self._max_changes:
+                    # Revisions up to the dropped entry can no longer be served as changes
+                    self._log_floor = self._changes.popleft()[0]
+                self._changes.append((self._revision, k, self._ctx.get(k), origin))
+            return self._revision
+
+    def get_changes_since(self, since: int, origin: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return the key changes committed after revision `since`, collapsed
+        to the latest value per key, as {"revision": ..., "changes": {...}}.
+        Keys whose latest change came from `origin` are left out.
+
+        If `since` is older than the change log (or newer than the server,
+        e.g. after a restart) returns {"revision": ..., "full": True,
+        "snapshot": {...}} instead.
+        """
+        with self._lock:
+            if since < self._log_floor or since > self._revision:
+                return {"revision": self._revision, "full": True, "snapshot": self._ctx.to_dict()}
+            changes: Dict[str, Any] = {}
+            seen = set()
+            # Walk newest first so only the latest change per key is kept
+            for revision, k, v, source in reversed(self._changes):
+                if revision <= since:
+                    break
+                if k in seen:
+                    continue
+                seen.add(k)
+                if origin is None or source != origin:
+                    changes[k] = v
+            return {"revision": self._revision, "changes": changes}
 
     # Example HTTP handler stubs (to be wired into a web framework)
 
@@ -113,13 +217,25 @@ class MemoryBusServer:
         data = self.get_snapshot()
         return json.dumps(data), 200
 
+    def handle_changes_request(self, request) -> Any:
+        """
+        HTTP endpoint handler for GET /changes?since=N&origin=ID
+        Returns JSON changes since revision N, or a full snapshot.
+        """
+        try:
+            since = int(request.args.get("since", -1))
+        except (TypeError, ValueError):
+            return json.dumps({"error": "since must be an integer revision"}), 400
+        data = self.get_changes_since(since, origin=request.args.get("origin"))
+        return json.dumps(data), 200
+
     def handle_patch_request(self, request) -> Any:
         """
-        HTTP endpoint handler for POST /patch
+        HTTP endpoint handler for POST /patch?origin=ID
         Expects JSON body of key→value mapping.
         """
         patch = request.get_json()  # or similar based on framework
         if not isinstance(patch, dict):
             return json.dumps({"error": "patch must be JSON object"}), 400
-        self.apply_patch(patch)
-        return json.dumps({"status": "ok"}), 200
+        revision = self.apply_patch(patch, origin=request.args.get("origin"))
+        return json.dumps({"status": "ok", "revision": revision}), 200
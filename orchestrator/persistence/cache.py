@@ -11,12 +11,15 @@ import os
 import time
 import json
 import uuid
+import heapq
 import shutil
 import hashlib
 import logging
+import itertools
 import tempfile
 import threading
 import functools
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Union, Tuple, Optional, Callable, TypeVar, Generic, Set, cast
@@ -40,6 +43,9 @@ V = TypeVar('V')  # Generic type for values
 # Get module logger with debug support
 logger = get_logger(__name__, debug=os.getenv("DEBUG") == "1")
 
+# Minimum number of stale expiry heap items before the heap is compacted
+EXPIRY_HEAP_COMPACT_THRESHOLD = 1024
+
 
 class CacheError(PersistenceError):
     """Exception raised when cache operations fail."""
@@ -234,6 +240,16 @@ class Cache(Generic[K, V]):
     
     This class provides a generic in-memory cache with support for different
     eviction policies, TTL-based expiration, and size limits.
+    
+    Each policy is backed by an index kept up to date on every set, get and
+    delete, so selecting an eviction victim never scans the cache:
+    
+    - LRU and FIFO: an OrderedDict in recency or insertion order, O(1)
+    - LFU: access-count buckets of insertion-ordered keys, O(1)
+    - TTL: a heap of expiration times, O(log n), falling back to LRU
+    
+    The expiration heap also lets expired entries be purged without a scan.
+    The eviction policy is fixed when the cache is created.
     """
     
     def __init__(self, 
@@ -260,6 +276,16 @@ class Cache(Generic[K, V]):
         # Initialize storage
         self._entries: Dict[K, CacheEntry[K, V]] = {}
         
+        # Eviction indexes (only those needed by the policy are maintained)
+        self._policy = eviction_policy if eviction_policy in EvictionPolicy.all_policies() else EvictionPolicy.LRU
+        self._order: "OrderedDict[K, None]" = OrderedDict()  # Recency (LRU/TTL) or insertion (FIFO) order
+        self._order_tracks_access = self._policy != EvictionPolicy.FIFO  # Move keys to the end on access
+        self._frequency_buckets: Dict[int, "OrderedDict[K, None]"] = {}  # LFU keys by access count
+        self._min_frequency: Optional[int] = None  # Lowest populated bucket (None when unknown)
+        self._expiry_heap: List[Tuple[float, int, CacheEntry[K, V]]] = []  # (expires_at, seq, entry)
+        self._expiry_sequence = itertools.count()  # Tie breaker so entries are never compared
+        self._stale_expiry_items = 0  # Heap items whose entry is no longer cached
+        
         # Track current memory usage
         self._current_memory_bytes = 0
         
@@ -277,6 +303,9 @@ class Cache(Generic[K, V]):
         # Logger
         self.logger = get_logger(f"{__name__}.Cache", debug=os.getenv("DEBUG") == "1")
         
+        if self._policy != eviction_policy:
+            self.logger.warning(f"Unknown eviction policy: {eviction_policy}, falling back to LRU")
+        
     def _with_lock(self, func: Callable) -> Callable:
         """Decorator to execute a function with the cache lock if thread safety is enabled.
         
@@ -326,11 +355,8 @@ class Cache(Generic[K, V]):
         new_entry = CacheEntry(key, value, ttl)
         
         # If key exists, remove old entry first
-        old_size = 0
         if key in self._entries:
-            old_size = self._entries[key].size_bytes
-            del self._entries[key]
-            self._current_memory_bytes -= old_size
+            self._remove_entry(key)
             
         # Check if we need to make space
         new_size = new_entry.size_bytes
@@ -352,13 +378,13 @@ class Cache(Generic[K, V]):
             raise CacheFullError("Cache is full (memory limit reached)")
             
         # Add the new entry
-        self._entries[key] = new_entry
-        self._current_memory_bytes += new_size
+        self._insert_entry(new_entry)
         
-        self.logger.debug(
-            f"Cache set: {key}, size={new_size} bytes, "
-            f"total={len(self._entries)} entries, {self._current_memory_bytes} bytes"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Cache set: {key}, size={new_size} bytes, "
+                f"total={len(self._entries)} entries, {self._current_memory_bytes} bytes"
+            )
         
     def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
         """Get a value from the cache.
@@ -388,13 +414,12 @@ class Cache(Generic[K, V]):
             # Check if the entry is expired
             if entry.is_expired():
                 self._stats["expirations"] += 1
-                del self._entries[key]
-                self._current_memory_bytes -= entry.size_bytes
+                self._remove_entry(key)
                 self._stats["misses"] += 1
                 return default
                 
             # Update access metadata
-            entry.access()
+            self._record_access(entry)
             self._stats["hits"] += 1
             
             return entry.value
@@ -429,8 +454,7 @@ class Cache(Generic[K, V]):
             # Check if the entry is expired
             if entry.is_expired():
                 self._stats["expirations"] += 1
-                del self._entries[key]
-                self._current_memory_bytes -= entry.size_bytes
+                self._remove_entry(key)
                 return False
                 
             return True
@@ -456,9 +480,7 @@ class Cache(Generic[K, V]):
     def __delete(self, key: K) -> bool:
         """Internal implementation of delete (without locking)."""
         if key in self._entries:
-            entry = self._entries[key]
-            del self._entries[key]
-            self._current_memory_bytes -= entry.size_bytes
+            self._remove_entry(key)
             return True
         return False
         
@@ -475,6 +497,11 @@ class Cache(Generic[K, V]):
         """Internal implementation of clear (without locking)."""
         self._entries.clear()
         self._current_memory_bytes = 0
+        self._order.clear()
+        self._frequency_buckets.clear()
+        self._min_frequency = None
+        self._expiry_heap.clear()
+        self._stale_expiry_items = 0
         self.logger.debug("Cache cleared")
         
     def get_stats(self) -> Dict[str, Any]:
@@ -560,8 +587,7 @@ class Cache(Generic[K, V]):
             # Check if the entry is expired
             if entry.is_expired():
                 self._stats["expirations"] += 1
-                del self._entries[key]
-                self._current_memory_bytes -= entry.size_bytes
+                self._remove_entry(key)
                 raise CacheEntryNotFoundError(f"Cache entry '{key}' not found (expired)")
                 
             # Extract metadata (without the actual value)
@@ -576,29 +602,134 @@ class Cache(Generic[K, V]):
         else:
             raise CacheEntryNotFoundError(f"Cache entry '{key}' not found")
             
+    def _insert_entry(self, entry: CacheEntry[K, V]) -> None:
+        """Add an entry to storage and to the eviction indexes.
+        
+        Args:
+            entry: Entry whose key is not currently cached
+        """
+        key = entry.key
+        self._entries[key] = entry
+        self._current_memory_bytes += entry.size_bytes
+        
+        if self._policy == EvictionPolicy.LFU:
+            self._add_to_frequency_bucket(key, entry.access_count)
+        else:
+            self._order[key] = None  # Newest position
+            
+        if entry.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (entry.expires_at, next(self._expiry_sequence), entry))
+            
+    def _remove_entry(self, key: K) -> CacheEntry[K, V]:
+        """Remove an entry from storage and from the eviction indexes.
+        
+        Args:
+            key: Key of a cached entry
+            
+        Returns:
+            CacheEntry[K, V]: The removed entry
+        """
+        entry = self._entries.pop(key)
+        self._current_memory_bytes -= entry.size_bytes
+        
+        if self._policy == EvictionPolicy.LFU:
+            self._remove_from_frequency_bucket(key, entry.access_count)
+        else:
+            del self._order[key]
+            
+        if entry.expires_at is not None:
+            self._stale_expiry_items += 1  # Heap item is discarded lazily
+            if (self._stale_expiry_items > EXPIRY_HEAP_COMPACT_THRESHOLD and
+                    self._stale_expiry_items > len(self._expiry_heap) // 2):
+                self._compact_expiry_heap()
+                
+        return entry
+        
+    def _record_access(self, entry: CacheEntry[K, V]) -> None:
+        """Record an access to a cached entry and update the eviction indexes.
+        
+        Args:
+            entry: Entry that was read
+        """
+        if self._policy == EvictionPolicy.LFU:
+            previous_count = entry.access_count
+            was_minimum = self._min_frequency == previous_count
+            entry.access()
+            self._remove_from_frequency_bucket(entry.key, previous_count)
+            self._add_to_frequency_bucket(entry.key, entry.access_count)
+            if was_minimum and previous_count not in self._frequency_buckets:
+                self._min_frequency = entry.access_count  # Promoted key is the new minimum
+        else:
+            entry.access()
+            if self._order_tracks_access:
+                self._order.move_to_end(entry.key)  # Most recently used position
+                
+    def _add_to_frequency_bucket(self, key: K, count: int) -> None:
+        """Add a key to the LFU bucket for its access count."""
+        bucket = self._frequency_buckets.get(count)
+        if bucket is None:
+            bucket = self._frequency_buckets[count] = OrderedDict()
+        bucket[key] = None
+        if self._min_frequency is not None and count < self._min_frequency:
+            self._min_frequency = count
+        elif self._min_frequency is None and len(self._frequency_buckets) == 1:
+            self._min_frequency = count  # Only populated bucket
+            
+    def _remove_from_frequency_bucket(self, key: K, count: int) -> None:
+        """Remove a key from the LFU bucket for its access count."""
+        bucket = self._frequency_buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._frequency_buckets[count]
+            if self._min_frequency == count:
+                self._min_frequency = None  # Recomputed lazily from the buckets
+                
+    def _peek_expiry_heap(self) -> Optional[CacheEntry[K, V]]:
+        """Return the cached entry expiring soonest, discarding stale heap items.
+        
+        Returns:
+            Optional[CacheEntry[K, V]]: Entry with the earliest expiration, if any
+        """
+        heap = self._expiry_heap
+        while heap:
+            entry = heap[0][2]
+            if self._entries.get(entry.key) is entry:
+                return entry
+            heapq.heappop(heap)  # Entry was replaced, deleted or evicted
+            self._stale_expiry_items -= 1
+        return None
+        
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the expiration heap without stale items."""
+        self._expiry_heap = [
+            item for item in self._expiry_heap
+            if self._entries.get(item[2].key) is item[2]
+        ]
+        heapq.heapify(self._expiry_heap)
+        self._stale_expiry_items = 0
+        
     def _clean_expired_entries(self) -> int:
         """Remove all expired entries from the cache.
         
+        Expired entries are popped from the front of the expiration heap, so
+        the cost is proportional to the number of expired entries.
+        
         Returns:
             int: Number of entries removed
         """
-        if self.default_ttl is None:
-            return 0  # No expiration configured
+        if not self._expiry_heap:
+            return 0  # No entry has an expiration time
             
         removed_count = 0
-        expired_keys = []
+        now = time.time()
         
-        # Find all expired keys
-        for key, entry in self._entries.items():
-            if entry.is_expired():
-                expired_keys.append(key)
-                removed_count += 1
-                self._stats["expirations"] += 1
-                self._current_memory_bytes -= entry.size_bytes
-                
-        # Remove expired entries
-        for key in expired_keys:
-            del self._entries[key]
+        # Remove entries from the front of the heap until one is still valid
+        entry = self._peek_expiry_heap()
+        while entry is not None and now >= entry.expires_at:
+            self._remove_entry(entry.key)
+            removed_count += 1
+            self._stats["expirations"] += 1
+            entry = self._peek_expiry_heap()
             
         if removed_count > 0:
             self.logger.debug(f"Removed {removed_count} expired cache entries")
@@ -622,14 +753,13 @@ class Cache(Generic[K, V]):
         while evicted < count and self._entries:
             # Select an entry to evict based on the policy
             key_to_evict = self._select_eviction_candidate()
-            
-            if key_to_evict is not None:
-                # Remove the selected entry
-                entry = self._entries[key_to_evict]
-                del self._entries[key_to_evict]
-                self._current_memory_bytes -= entry.size_bytes
-                evicted += 1
-                self._stats["evictions"] += 1
+            if key_to_evict is None:
+                break
+                
+            # Remove the selected entry
+            self._remove_entry(key_to_evict)
+            evicted += 1
+            self._stats["evictions"] += 1
                 
         if evicted > 0:
             self.logger.debug(
@@ -656,15 +786,14 @@ class Cache(Generic[K, V]):
         while freed_bytes < bytes_needed and self._entries:
             # Select an entry to evict based on the policy
             key_to_evict = self._select_eviction_candidate()
-            
-            if key_to_evict is not None:
-                # Remove the selected entry
-                entry = self._entries[key_to_evict]
-                freed_bytes += entry.size_bytes
-                del self._entries[key_to_evict]
-                self._current_memory_bytes -= entry.size_bytes
-                evicted_count += 1
-                self._stats["evictions"] += 1
+            if key_to_evict is None:
+                break
+                
+            # Remove the selected entry
+            entry = self._remove_entry(key_to_evict)
+            freed_bytes += entry.size_bytes
+            evicted_count += 1
+            self._stats["evictions"] += 1
                 
         if evicted_count > 0:
             self.logger.debug(
@@ -683,53 +812,20 @@ class Cache(Generic[K, V]):
         if not self._entries:
             return None
             
-        if self.eviction_policy == EvictionPolicy.LRU:
-            # Find the least recently used entry
-            return min(
-                self._entries.items(),
-                key=lambda item: item[1].last_accessed
-            )[0]
-            
-        elif self.eviction_policy == EvictionPolicy.LFU:
-            # Find the least frequently used entry
-            return min(
-                self._entries.items(),
-                key=lambda item: item[1].access_count
-            )[0]
-            
-        elif self.eviction_policy == EvictionPolicy.FIFO:
-            # Find the oldest entry
-            return min(
-                self._entries.items(),
-                key=lambda item: item[1].created_at
-            )[0]
-            
-        elif self.eviction_policy == EvictionPolicy.TTL:
-            # Find the entry closest to expiration
-            # If no TTL is set, fall back to LRU
-            entries_with_ttl = {
-                k: v for k, v in self._entries.items() if v.expires_at is not None
-            }
-            
-            if entries_with_ttl:
-                return min(
-                    entries_with_ttl.items(),
-                    key=lambda item: item[1].expires_at or float('inf')
-                )[0]
-            else:
-                # Fall back to LRU if no entries have TTL
-                return min(
-                    self._entries.items(),
-                    key=lambda item: item[1].last_accessed
-                )[0]
+        if self._policy == EvictionPolicy.LFU:
+            # Oldest key in the lowest access-count bucket
+            if self._min_frequency is None:
+                self._min_frequency = min(self._frequency_buckets)
+            return next(iter(self._frequency_buckets[self._min_frequency]))
+            
+        if self._policy == EvictionPolicy.TTL:
+            # Entry closest to expiration; fall back to LRU if no entry has a TTL
+            entry = self._peek_expiry_heap()
+            if entry is not None:
+                return entry.key
                 
-        else:
-            # Unknown policy, fall back to LRU
-            self.logger.warning(f"Unknown eviction policy: {self.eviction_policy}, falling back to LRU")
-            return min(
-                self._entries.items(),
-                key=lambda item: item[1].last_accessed
-            )[0]
+        # LRU, FIFO and TTL fallback: front of the order index
+        return next(iter(self._order))
 
 
 class PersistentCache(Cache[K, V]):
@@ -915,8 +1011,9 @@ class PersistentCache(Cache[K, V]):
                     entry = CacheEntry.from_dict(entry_data)
                     
                     # Add to cache (bypassing regular set to avoid eviction)
-                    self._entries[entry.key] = entry
-                    self._current_memory_bytes += entry.size_bytes
+                    if entry.key in self._entries:
+                        self._remove_entry(entry.key)
+                    self._insert_entry(entry)
                     loaded_count += 1
                     
                 except Exception as e:
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-Addressed Chunk Store for Enhanced Persistence Framework.
+
+This module stores snapshot data as immutable chunks addressed by the
+SHA-256 of their content, so identical values shared between snapshots are
+written once. Data is split structurally rather than byte-wise:
+
+- Dictionaries with string keys are split per key
+- Lists are split per element
+- Other values are stored as one blob, split into fixed-size chunks
+
+Small JSON values are inlined into manifest pages instead of getting their
+own chunk. Manifest pages are themselves chunks; page boundaries are chosen
+from a hash of each key (or element digest), so inserting or removing an
+entry only changes the pages around it and unchanged pages are shared.
+
+Reference counts live in a SQLite table supplied by the caller, which lets
+snapshot registration and reference updates commit in one transaction.
+"""
+import io
+import os
+import json
+import zlib
+import pickle
+import hashlib
+import sqlite3
+import tempfile
+from typing import Dict, List, Any, Iterable, Iterator, Set, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from orchestrator.persistence.core import PersistenceError, get_logger
+
+# Get module logger with debug support
+logger = get_logger(__name__, debug=os.getenv("DEBUG") == "1")
+
+# Manifest layout version stored in every root manifest
+MANIFEST_FORMAT_VERSION = 1
+
+# JSON values up to this many bytes are stored inside manifest pages
+INLINE_VALUE_LIMIT = 256
+
+# A page ends after an entry whose boundary hash has these bits clear (~256 entries)
+PAGE_BOUNDARY_MASK = 0xFF
+
+# Upper bound on entries per manifest page
+MAX_PAGE_ENTRIES = 4096
+
+# Size of the pieces a non-splittable blob is cut into
+BLOB_CHUNK_SIZE = 1024 * 1024
+
+# Payloads at least this large are zlib-compressed on disk
+COMPRESSION_THRESHOLD = 128
+
+# Value encoding tags (first byte of a value payload)
+_TAG_JSON = b"J"
+_TAG_PICKLE = b"P"
+_TAG_BYTES = b"B"
+_TAG_STR = b"S"
+_TAG_NUMPY = b"N"
+
+# On-disk chunk file tags
+_FILE_RAW = b"R"
+_FILE_ZLIB = b"Z"
+
+# Shared compact encoder; json.dumps with keyword arguments builds a new one per call
+_encode_json = json.JSONEncoder(separators=(",", ":"), allow_nan=True).encode
+
+
+class ChunkStoreError(PersistenceError):
+    """Exception raised when chunk store operations fail."""
+    pass
+
+
+class ChunkStore:
+    """Content-addressed store of immutable, reference-counted chunks.
+
+    Chunk files live under ``<base_path>/<first two hex digits>/<digest>``.
+    Writing a chunk that already exists is a no-op, which is what makes
+    repeated snapshots of mostly unchanged data cheap.
+    """
+
+    def __init__(self, base_path: str, compress: bool = True, durable: bool = False):
+        """Initialize the chunk store.
+
+        Args:
+            base_path: Directory holding chunk files
+            compress: Whether to zlib-compress larger chunks
+            durable: Whether to fsync chunk files before they become visible
+        """
+        self.base_path = base_path
+        self.compress = compress
+        self.durable = durable
+        self._created_dirs: Set[str] = set()  # Fan-out directories known to exist
+        os.makedirs(self.base_path, exist_ok=True)
+
+        # Logger for debug and informational messages
+        self.logger = get_logger(f"{__name__}.ChunkStore", debug=os.getenv("DEBUG") == "1")
+
+    @staticmethod
+    def create_tables(conn: sqlite3.Connection) -> None:
+        """Create the reference count table on a registry connection.
+
+        Args:
+            conn: SQLite connection holding the registry
+        """
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS chunk_refs ("
+            "digest TEXT PRIMARY KEY, refcount INTEGER NOT NULL)"
+        )
+
+    def _chunk_path(self, digest: str) -> str:
+        """Return the file path for a chunk digest."""
+        return os.path.join(self.base_path, digest[:2], digest)
+
+    def put(self, payload: bytes) -> str:
+        """Store a chunk if it is not already present.
+
+        Args:
+            payload: Chunk content
+
+        Returns:
+            str: SHA-256 hex digest addressing the chunk
+        """
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self._chunk_path(digest)
+        if os.path.exists(path):
+            return digest  # Deduplicated
+
+        directory = os.path.dirname(path)
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
+        content = _FILE_RAW + payload
+        if self.compress and len(payload) >= COMPRESSION_THRESHOLD:
+            compressed = zlib.compress(payload, 1)
+            if len(compressed) < len(payload):
+                content = _FILE_ZLIB + compressed
+
+        # Write to a temporary file first so readers never see partial chunks
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as f:
+                f.write(content)
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Read a chunk.
+
+        Args:
+            digest: Chunk digest
+
+        Returns:
+            bytes: Chunk content
+
+        Raises:
+            ChunkStoreError: If the chunk is missing or unreadable
+        """
+        try:
+            with open(self._chunk_path(digest), "rb") as f:
+                content = f.read()
+        except OSError as e:
+            raise ChunkStoreError(f"Chunk {digest} not found: {str(e)}") from e
+
+        if content[:1] == _FILE_ZLIB:
+            return zlib.decompress(content[1:])
+        return content[1:]
+
+    def add_refs(self, conn: sqlite3.Connection, digests: Iterable[str]) -> None:
+        """Increment reference counts inside the caller's transaction.
+
+        Args:
+            conn: Registry connection with an open transaction
+            digests: Distinct digests referenced by one new snapshot
+        """
+        conn.executemany(
+            "INSERT INTO chunk_refs (digest, refcount) VALUES (?, 1) "
+            "ON CONFLICT(digest) DO UPDATE SET refcount = refcount + 1",
+            [(digest,) for digest in digests]
+        )
+
+    def release_refs(self, conn: sqlite3.Connection, digests: Iterable[str]) -> List[str]:
+        """Decrement reference counts inside the caller's transaction.
+
+        Args:
+            conn: Registry connection with an open transaction
+            digests: Distinct digests referenced by one removed snapshot
+
+        Returns:
+            List[str]: Digests no longer referenced, to pass to remove()
+        """
+        rows = [(digest,) for digest in digests]
+        conn.executemany("UPDATE chunk_refs SET refcount = refcount - 1 WHERE digest = ?", rows)
+        unreferenced = [row[0] for row in conn.execute("SELECT digest FROM chunk_refs WHERE refcount <= 0")]
+        conn.execute("DELETE FROM chunk_refs WHERE refcount <= 0")
+        return unreferenced
+
+    def remove(self, digests: Iterable[str]) -> int:
+        """Delete chunk files.
+
+        Args:
+            digests: Digests of unreferenced chunks
+
+        Returns:
+            int: Number of files removed
+        """
+        removed = 0
+        for digest in digests:
+            try:
+                os.unlink(self._chunk_path(digest))
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def iter_digests(self) -> Iterator[str]:
+        """Yield the digest of every chunk file on disk."""
+        for entry in os.scandir(self.base_path):
+            if entry.is_dir():
+                for chunk in os.scandir(entry.path):
+                    if not chunk.name.endswith(".tmp"):
+                        yield chunk.name
+
+    def collect_garbage(self, conn: sqlite3.Connection) -> int:
+        """Remove chunk files without references, such as those left by a crash.
+
+        Args:
+            conn: Registry connection
+
+        Returns:
+            int: Number of files removed
+        """
+        referenced = {row[0] for row in conn.execute("SELECT digest FROM chunk_refs")}
+        return self.remove([digest for digest in self.iter_digests() if digest not in referenced])
+
+    def store(self, data: Any) -> Tuple[str, Set[str]]:
+        """Split data into chunks and store them.
+
+        Args:
+            data: Data to store
+
+        Returns:
+            Tuple[str, Set[str]]: Root manifest digest and every digest it references
+        """
+        digests: Set[str] = set()
+
+        if isinstance(data, dict) and all(isinstance(key, str) for key in data):
+            # Page boundaries follow keys, so value edits never move them
+            entries = [
+                (key, f"[{_encode_json(key)},{self._store_value(value, digests)}]")
+                for key, value in data.items()
+            ]
+            manifest = {"kind": "dict", "pages": self._store_pages(entries, digests)}
+        elif isinstance(data, list):
+            entries = [(reference, reference) for reference in
+                       (self._store_value(item, digests) for item in data)]
+            manifest = {"kind": "list", "pages": self._store_pages(entries, digests)}
+        else:
+            payload = self._encode_blob(data)
+            chunks = []
+            for offset in range(0, max(len(payload), 1), BLOB_CHUNK_SIZE):
+                digest = self.put(payload[offset:offset + BLOB_CHUNK_SIZE])
+                digests.add(digest)
+                chunks.append(digest)
+            manifest = {"kind": "blob", "chunks": chunks}
+
+        manifest["format"] = MANIFEST_FORMAT_VERSION
+        root = self.put(_encode_json(manifest).encode("utf-8"))
+        digests.add(root)
+        return root, digests
+
+    def load(self, root: str) -> Any:
+        """Reassemble data from its root manifest.
+
+        Args:
+            root: Root manifest digest
+
+        Returns:
+            Any: Reconstructed data
+        """
+        manifest = self._load_manifest(root)
+        kind = manifest["kind"]
+        if kind == "dict":
+            return {key: self._load_ref(ref) for page in manifest["pages"] for key, ref in self._load_page(page)}
+        if kind == "list":
+            return [self._load_ref(ref) for page in manifest["pages"] for ref in self._load_page(page)]
+        return self._decode_value(b"".join(self.get(digest) for digest in manifest["chunks"]))
+
+    def referenced_digests(self, root: str) -> Set[str]:
+        """Collect every digest reachable from a root manifest.
+
+        Args:
+            root: Root manifest digest
+
+        Returns:
+            Set[str]: Root, page and value digests
+        """
+        manifest = self._load_manifest(root)
+        digests = {root}
+        if manifest["kind"] == "blob":
+            digests.update(manifest["chunks"])
+            return digests
+
+        keyed = manifest["kind"] == "dict"
+        for page in manifest["pages"]:
+            digests.add(page)
+            for entry in self._load_page(page):
+                ref = entry[1] if keyed else entry
+                if isinstance(ref, str):
+                    digests.add(ref)
+        return digests
+
+    def _load_manifest(self, root: str) -> Dict[str, Any]:
+        """Read and validate a root manifest."""
+        manifest = json.loads(self.get(root))
+        if manifest.get("format") != MANIFEST_FORMAT_VERSION:
+            raise ChunkStoreError(f"Unsupported manifest format in chunk {root}")
+        return manifest
+
+    def _load_page(self, digest: str) -> List[Any]:
+        """Read a manifest page."""
+        return json.loads(self.get(digest))
+
+    def _store_value(self, value: Any, digests: Set[str]) -> str:
+        """Store one value and return its page reference as JSON text.
+
+        Returns:
+            str: A quoted digest, or ``{"i":<value>}`` for small inline JSON values
+        """
+        payload = self._encode_value(value)
+        if payload[:1] == _TAG_JSON and len(payload) <= INLINE_VALUE_LIMIT:
+            # Reuse the encoded text rather than encoding the value again
+            return '{"i":' + payload[1:].decode("utf-8") + "}"
+        digest = self.put(payload)
+        digests.add(digest)
+        return f'"{digest}"'
+
+    def _load_ref(self, ref: Any) -> Any:
+        """Resolve a page reference to its value."""
+        if isinstance(ref, str):
+            return self._decode_value(self.get(ref))
+        return ref["i"]
+
+    def _store_pages(self, entries: List[Tuple[str, str]], digests: Set[str]) -> List[str]:
+        """Group entries into content-defined pages and store each page.
+
+        Args:
+            entries: ``(boundary text, JSON fragment)`` pairs in order
+            digests: Set collecting the page digests
+
+        Returns:
+            List[str]: Page digests in order
+        """
+        pages = []
+        page: List[str] = []
+        for boundary, fragment in entries:
+            page.append(fragment)
+            # Boundaries depend only on the entry itself, so edits do not shift later pages
+            if ((zlib.crc32(boundary.encode("utf-8")) & PAGE_BOUNDARY_MASK) == 0
+                    or len(page) >= MAX_PAGE_ENTRIES):
+                pages.append(self._put_page(page, digests))
+                page = []
+        if page:
+            pages.append(self._put_page(page, digests))
+        return pages
+
+    def _put_page(self, page: List[str], digests: Set[str]) -> str:
+        """Store a manifest page built from encoded entries."""
+        digest = self.put(("[" + ",".join(page) + "]").encode("utf-8"))
+        digests.add(digest)
+        return digest
+
+    @staticmethod
+    def _encode_value(value: Any) -> bytes:
+        """Serialize a value into a tagged payload."""
+        if isinstance(value, bytes):
+            return _TAG_BYTES + value
+        if HAS_NUMPY and isinstance(value, np.ndarray):
+            buffer = io.BytesIO()
+            np.save(buffer, value, allow_pickle=False)
+            return _TAG_NUMPY + buffer.getvalue()
+        try:
+            return _TAG_JSON + _encode_json(value).encode("utf-8")
+        except (TypeError, ValueError):
+            return _TAG_PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _encode_blob(data: Any) -> bytes:
+        """Serialize top-level data that is not split, preserving its exact type."""
+        if isinstance(data, str):
+            return _TAG_STR + data.encode("utf-8")
+        if isinstance(data, bytes) or (HAS_NUMPY and isinstance(data, np.ndarray)):
+            return ChunkStore._encode_value(data)
+        return _TAG_PICKLE + pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _decode_value(payload: bytes) -> Any:
+        """Deserialize a tagged payload."""
+        tag, body = payload[:1], payload[1:]
+        if tag == _TAG_JSON:
+            return json.loads(body)
+        if tag == _TAG_BYTES:
+            return body
+        if tag == _TAG_STR:
+            return body.decode("utf-8")
+        if tag == _TAG_NUMPY:
+            if not HAS_NUMPY:
+                raise ChunkStoreError("Chunk holds a numpy array but numpy is not installed")
+            return np.load(io.BytesIO(body), allow_pickle=False)
+        if tag == _TAG_PICKLE:
+            return pickle.loads(body)
+        raise ChunkStoreError(f"Unknown value encoding tag: {tag!r}")
@@ -99,7 +99,10 @@ class DeltaStrategy(str, Enum):
     
     # Dictionary diffing
     DICT = "dict"
-    
+
+    # Recursive diffing with JSON-Pointer paths
+    STRUCTURAL = "structural"
+
     # Compression without diffing
     COMPRESS = "compress"
     
@@ -11,6 +11,7 @@ tracking only changes between successive states.
 
 Features:
 - Multiple delta compression strategies
+- Structural deltas with JSON-Pointer paths, proportional to the change
 - Delta chain management with automatic optimization
 - Integrity verification and statistics
 """
@@ -18,10 +19,13 @@ import os
 import time
 import json
 import gzip
+import bisect
+import pickle
 import difflib
 import hashlib
 import logging
 import functools
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum, auto
 from typing import Dict, List, Any, Tuple, Optional, Set, Union, Callable, TypeVar, cast
@@ -50,6 +54,88 @@ K = TypeVar('K')  # Generic type for keys
 # Get module logger with debug support
 logger = get_logger(__name__, debug=os.getenv("DEBUG") == "1")
 
+# Size statistics that DeltaInfo measures on first lookup
+DELTA_SIZE_KEYS = ("original_size", "compressed_size", "compression_ratio")
+
+# Changed list regions with more elements than this are diffed positionally
+# or replaced with one splice instead of being sequence matched
+LIST_MATCH_LIMIT = 100_000
+
+# Shared compact encoder for list element fingerprints
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def escape_pointer_token(token: str) -> str:
+    """Escape a key for use as a JSON Pointer reference token.
+    
+    Args:
+        token: Dictionary key
+        
+    Returns:
+        str: Token with ``~`` and ``/`` escaped as ``~0`` and ``~1``
+    """
+    if "~" in token or "/" in token:
+        return token.replace("~", "~0").replace("/", "~1")
+    return token
+
+
+def parse_json_pointer(path: str) -> List[str]:
+    """Split a JSON Pointer into unescaped reference tokens.
+    
+    Args:
+        path: JSON Pointer such as ``/users/0/name`` (empty for the root)
+        
+    Returns:
+        List[str]: Reference tokens
+        
+    Raises:
+        DeltaCompressionError: If the pointer is malformed
+    """
+    if not path:
+        return []
+    if path[0] != "/":
+        raise DeltaCompressionError(f"Invalid JSON Pointer: {path!r}")
+    return [
+        token.replace("~1", "/").replace("~0", "~") if "~" in token else token
+        for token in path[1:].split("/")
+    ]
+
+
+# Marker for keys absent from the previous state
+_MISSING = object()
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """Return whether two values need no patch operation."""
+    return old is new or (type(old) is type(new) and old == new)
+
+
+def _top_level_operations(changes: Dict[str, Any], removed_keys: List[str]) -> List[Dict[str, Any]]:
+    """Express top-level changes and removals as structural operations."""
+    operations = [
+        {"op": "add", "path": f"/{escape_pointer_token(key)}", "value": value}
+        for key, value in changes.items()
+    ]
+    operations.extend({"op": "remove", "path": f"/{escape_pointer_token(key)}"} for key in removed_keys)
+    return operations
+
+
+def _fingerprint(value: Any) -> Any:
+    """Return a hashable stand-in for a list element used in sequence matching.
+    
+    Equal fingerprints only suggest equality; matches are re-checked before
+    being treated as unchanged.
+    """
+    try:
+        hash(value)
+        return (0, type(value), value)
+    except TypeError:
+        pass
+    try:
+        return (1, type(value), _encode_json(value))
+    except (TypeError, ValueError):
+        return (2, id(value))  # Never matches anything else
+
 
 class DeltaCompressionError(PersistenceError):
     """Exception raised when delta compression operations fail."""
@@ -70,7 +156,8 @@ class DeltaRecord:
                  metadata: Dict[str, Any] = None,
                  compression_ratio: float = 1.0,
                  size_bytes: int = 0,
-                 checksum: str = ""):
+                 checksum: str = "",
+                 operations: List[Dict[str, Any]] = None):
         """Initialize a delta record.
         
         Args:
@@ -81,11 +168,13 @@ class DeltaRecord:
             compression_ratio: Compression ratio achieved
             size_bytes: Size in bytes after compression
             checksum: Integrity checksum
+            operations: Structural patch operations, applied after changes
         """
         # Core delta data
         self.timestamp = timestamp
         self.changes = changes
         self.removed_keys = removed_keys or []
+        self.operations = operations or []
         
         # Metadata and statistics
         self.metadata = metadata or {}
@@ -95,7 +184,7 @@ class DeltaRecord:
         
     def __repr__(self) -> str:
         """String representation of delta record."""
-        change_count = len(self.changes)
+        change_count = len(self.changes) + len(self.operations)
         remove_count = len(self.removed_keys)
         return f"DeltaRecord({change_count} changes, {remove_count} removals, {self.size_bytes} bytes)"
         
@@ -109,6 +198,7 @@ class DeltaRecord:
             "timestamp": self.timestamp,
             "changes": self.changes,
             "removed_keys": self.removed_keys,
+            "operations": self.operations,
             "metadata": self.metadata,
             "compression_ratio": self.compression_ratio,
             "size_bytes": self.size_bytes,
@@ -132,8 +222,104 @@ class DeltaRecord:
             metadata=data.get("metadata", {}),
             compression_ratio=data.get("compression_ratio", 1.0),
             size_bytes=data.get("size_bytes", 0),
-            checksum=data.get("checksum", "")
+            checksum=data.get("checksum", ""),
+            operations=data.get("operations", [])
         )
+    
+    def to_patch(self) -> Dict[str, Any]:
+        """Return delta information that apply_delta accepts.
+        
+        Returns:
+            Dict[str, Any]: Changes, removals and any structural operations
+        """
+        patch = {"changes": self.changes, "removed_keys": self.removed_keys}
+        if self.operations:
+            patch["operations"] = self.operations
+        return patch
+
+
+class DeltaInfo(dict):
+    """Delta information whose size statistics are measured on first lookup.
+    
+    Serializing and compressing a delta just to report its size costs more
+    than computing a small delta, so ``original_size``, ``compressed_size``
+    and ``compression_ratio`` are only calculated when one of them is read.
+    Iterating or serializing the mapping does not trigger the measurement.
+    """
+    
+    def __init__(self,
+                 *args: Any,
+                 enable_compression: bool = True,
+                 compression_level: int = 6,
+                 on_measure: Optional[Callable[[int, int], None]] = None,
+                 **kwargs: Any):
+        """Initialize delta information.
+        
+        Args:
+            enable_compression: Whether the measured size is gzip-compressed
+            compression_level: Compression level used for measurement
+            on_measure: Callback receiving (original_size, compressed_size)
+        """
+        super().__init__(*args, **kwargs)
+        self._enable_compression = enable_compression
+        self._compression_level = compression_level
+        self._on_measure = on_measure
+        
+    def _measure(self) -> None:
+        """Calculate size statistics if they are not present yet."""
+        if dict.__contains__(self, "compression_ratio"):
+            return
+            
+        # Measure the same payload that earlier versions always serialized
+        if dict.__contains__(self, "operations"):
+            payload = {"operations": dict.__getitem__(self, "operations")}
+        else:
+            payload = {
+                "changes": dict.get(self, "changes", {}),
+                "removed_keys": dict.get(self, "removed_keys", [])
+            }
+        try:
+            data = json.dumps(payload, sort_keys=True).encode('utf-8')
+        except (TypeError, ValueError):
+            data = pickle.dumps(payload)
+        original_size = len(data)
+        
+        # Apply compression if enabled
+        if self._enable_compression:
+            compressed_size = len(gzip.compress(data, compresslevel=self._compression_level))
+            compression_ratio = original_size / max(1, compressed_size)
+        else:
+            compressed_size = original_size
+            compression_ratio = 1.0
+            
+        dict.update(self, {
+            "original_size": original_size,
+            "compressed_size": compressed_size,
+            "compression_ratio": compression_ratio
+        })
+        if self._on_measure is not None:
+            self._on_measure(original_size, compressed_size)
+            
+    def __getitem__(self, key: Any) -> Any:
+        if key in DELTA_SIZE_KEYS:
+            self._measure()
+        return dict.__getitem__(self, key)
+        
+    def __contains__(self, key: Any) -> bool:
+        if key in DELTA_SIZE_KEYS:
+            self._measure()
+        return dict.__contains__(self, key)
+        
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in DELTA_SIZE_KEYS:
+            self._measure()
+        return dict.get(self, key, default)
+        
+    def __getstate__(self) -> Dict[str, Any]:
+        # The callback refers to a live compressor and is not persisted
+        state = self.__dict__.copy()
+        state["_on_measure"] = None
+        return state
 
 
 class DeltaCompressor:
@@ -194,34 +380,19 @@ class DeltaCompressor:
                 delta_info = self._dict_delta(old_state, new_state, include_unchanged)
             elif self.strategy == DeltaStrategy.BINARY and HAS_BSDIFF:
                 delta_info = self._binary_delta(old_state, new_state)
-            elif self.strategy == DeltaStrategy.AUTO:
-                # Auto-select based on data characteristics
-                if len(old_state) > 1000 or len(new_state) > 1000:
-                    # For large states, binary delta may be more efficient
-                    if HAS_BSDIFF:
-                        delta_info = self._binary_delta(old_state, new_state)
-                    else:
-                        delta_info = self._dict_delta(old_state, new_state, include_unchanged)
-                else:
-                    # For smaller states, dict delta is usually better
-                    delta_info = self._dict_delta(old_state, new_state, include_unchanged)
+            elif self.strategy in (DeltaStrategy.AUTO, DeltaStrategy.STRUCTURAL):
+                # Structural deltas grow with the change, not with the state,
+                # and handle nested data that top-level diffing re-stores whole
+                delta_info = self._structural_delta(old_state, new_state)
             else:
                 # Default to dict delta
                 delta_info = self._dict_delta(old_state, new_state, include_unchanged)
-                
-            # Update statistics
+            
+            # Update statistics; lazily measured deltas report on first use
             self._compression_stats["total_operations"] += 1
-            if "original_size" in delta_info and "compressed_size" in delta_info:
-                self._compression_stats["total_original_size"] += delta_info["original_size"]
-                self._compression_stats["total_compressed_size"] += delta_info["compressed_size"]
-                
-                # Update average compression ratio
-                if self._compression_stats["total_original_size"] > 0:
-                    self._compression_stats["avg_compression_ratio"] = (
-                        self._compression_stats["total_original_size"] / 
-                        max(1, self._compression_stats["total_compressed_size"])
-                    )
-                    
+            if not isinstance(delta_info, DeltaInfo) and "original_size" in delta_info:
+                self._record_sizes(delta_info["original_size"], delta_info["compressed_size"])
+            
             # Add timing information
             delta_info["computation_time"] = time.time() - start_time
             
@@ -266,36 +437,223 @@ class DeltaCompressor:
             if key not in new_state:
                 removed_keys.append(key)
                 
-        # Calculate sizes for statistics
-        json_data = json.dumps({
-            "changes": changes,
-            "removed_keys": removed_keys
-        }, sort_keys=True)
-        original_size = len(json_data.encode('utf-8'))
-        
-        # Apply compression if enabled
-        if self.enable_compression:
-            compressed_data = gzip.compress(
-                json_data.encode('utf-8'), 
-                compresslevel=self.compression_level
-            )
-            compressed_size = len(compressed_data)
-            compression_ratio = original_size / max(1, compressed_size)
-        else:
-            compressed_size = original_size
-            compression_ratio = 1.0
-            
-        return {
+        # Sizes are measured only when requested
+        return self._make_delta_info({
             "changes": changes,
             "removed_keys": removed_keys,
             "unchanged_keys": list(unchanged.keys()) if include_unchanged else [],
             "unchanged": unchanged if include_unchanged else {},
             "is_full_snapshot": False,
-            "strategy": DeltaStrategy.DICT,
-            "original_size": original_size,
-            "compressed_size": compressed_size,
-            "compression_ratio": compression_ratio
-        }
+            "strategy": DeltaStrategy.DICT
+        })
+    
+    def _make_delta_info(self, data: Dict[str, Any]) -> DeltaInfo:
+        """Wrap delta data so its sizes are measured on first lookup.
+        
+        Args:
+            data: Delta information without size statistics
+            
+        Returns:
+            DeltaInfo: Lazily measured delta information
+        """
+        return DeltaInfo(
+            data,
+            enable_compression=self.enable_compression,
+            compression_level=self.compression_level,
+            on_measure=self._record_sizes
+        )
+    
+    def _record_sizes(self, original_size: int, compressed_size: int) -> None:
+        """Add one measured delta to the compression statistics.
+        
+        Args:
+            original_size: Serialized delta size
+            compressed_size: Compressed delta size
+        """
+        self._compression_stats["total_original_size"] += original_size
+        self._compression_stats["total_compressed_size"] += compressed_size
+        
+        # Update average compression ratio
+        if self._compression_stats["total_original_size"] > 0:
+            self._compression_stats["avg_compression_ratio"] = (
+                self._compression_stats["total_original_size"] / 
+                max(1, self._compression_stats["total_compressed_size"])
+            )
+    
+    def _structural_delta(self, old_state: Any, new_state: Any) -> DeltaInfo:
+        """Calculate a recursive delta as JSON-Pointer patch operations.
+        
+        Operations are applied in order and are one of:
+        
+        - ``{"op": "add", "path": p, "value": v}``: set a dict key or insert into a list
+        - ``{"op": "remove", "path": p}``: delete a dict key or list element
+        - ``{"op": "replace", "path": p, "value": v}``: overwrite a value
+        - ``{"op": "splice", "path": p, "index": i, "delete": n, "values": [...]}``:
+          replace ``n`` list elements at ``i`` with ``values``
+        
+        Args:
+            old_state: Previous state
+            new_state: Current state
+            
+        Returns:
+            DeltaInfo: Delta information with an ``operations`` list
+        """
+        operations: List[Dict[str, Any]] = []
+        self._diff_value(old_state, new_state, "", operations)
+        
+        return self._make_delta_info({
+            "operations": operations,
+            "is_full_snapshot": False,
+            "strategy": DeltaStrategy.STRUCTURAL
+        })
+    
+    def _diff_value(self, old: Any, new: Any, path: str, operations: List[Dict[str, Any]]) -> None:
+        """Append the operations turning one value into another.
+        
+        Args:
+            old: Previous value
+            new: Current value
+            path: JSON Pointer of the value
+            operations: List collecting operations
+        """
+        if old is new:
+            return
+        value_type = type(old)
+        if value_type is not type(new):
+            operations.append({"op": "replace", "path": path, "value": new})
+        elif value_type is dict:
+            self._diff_dict(old, new, path, operations)
+        elif value_type is list:
+            self._diff_list(old, new, path, operations)
+        elif old != new:
+            operations.append({"op": "replace", "path": path, "value": new})
+    
+    def _diff_dict(self,
+                   old: Dict[Any, Any],
+                   new: Dict[Any, Any],
+                   path: str,
+                   operations: List[Dict[str, Any]]) -> None:
+        """Append the operations turning one dictionary into another.
+        
+        Unchanged values are skipped with a C-level equality check, so only
+        branches that differ are descended into.
+        """
+        start = len(operations)
+        added = 0
+        
+        for key, value in new.items():
+            if key in old:
+                old_value = old[key]
+                if _same_value(old_value, value):
+                    continue
+            else:
+                old_value = _MISSING
+                added += 1
+                
+            # JSON Pointer tokens are strings; replace dicts with other keys whole
+            if type(key) is not str:
+                del operations[start:]
+                operations.append({"op": "replace", "path": path, "value": new})
+                return
+                
+            child_path = f"{path}/{escape_pointer_token(key)}"
+            if old_value is _MISSING:
+                operations.append({"op": "add", "path": child_path, "value": value})
+            else:
+                self._diff_value(old_value, value, child_path, operations)
+                
+        # Only scan for removals when the key counts say some exist
+        if len(old) + added != len(new):
+            for key in old:
+                if key not in new:
+                    if type(key) is not str:
+                        del operations[start:]
+                        operations.append({"op": "replace", "path": path, "value": new})
+                        return
+                    operations.append({"op": "remove", "path": f"{path}/{escape_pointer_token(key)}"})
+    
+    def _diff_list(self,
+                   old: List[Any],
+                   new: List[Any],
+                   path: str,
+                   operations: List[Dict[str, Any]]) -> None:
+        """Append the operations turning one list into another.
+        
+        The common prefix and suffix are trimmed, and the remaining region is
+        aligned with sequence matching so insertions and deletions become
+        splices rather than a rewrite of every following element.
+        """
+        old_length, new_length = len(old), len(new)
+        limit = min(old_length, new_length)
+        
+        # Trim the common prefix and suffix
+        prefix = 0
+        while prefix < limit and _same_value(old[prefix], new[prefix]):
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix
+               and _same_value(old[old_length - 1 - suffix], new[new_length - 1 - suffix])):
+            suffix += 1
+            
+        old_middle = old[prefix:old_length - suffix]
+        new_middle = new[prefix:new_length - suffix]
+        if not old_middle and not new_middle:
+            return
+            
+        if max(len(old_middle), len(new_middle)) > LIST_MATCH_LIMIT:
+            # Too large to align; diff positionally or splice the region
+            if len(old_middle) == len(new_middle):
+                self._diff_positions(old_middle, new_middle, path, prefix, operations)
+            else:
+                operations.append({
+                    "op": "splice", "path": path, "index": prefix,
+                    "delete": len(old_middle), "values": new_middle
+                })
+            return
+            
+        # Autojunk ignores very frequent elements as anchors on long lists,
+        # which keeps matching near linear when values repeat
+        matcher = difflib.SequenceMatcher(
+            None,
+            [_fingerprint(item) for item in old_middle],
+            [_fingerprint(item) for item in new_middle]
+        )
+        
+        # Walk backwards so earlier indices stay valid while operations apply
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == "equal" or (tag == "replace" and i2 - i1 == j2 - j1):
+                # Equal fingerprints are verified by the positional diff
+                self._diff_positions(old_middle[i1:i2], new_middle[j1:j2], path, prefix + i1, operations)
+            else:
+                operations.append({
+                    "op": "splice", "path": path, "index": prefix + i1,
+                    "delete": i2 - i1, "values": new_middle[j1:j2]
+                })
+    
+    def _diff_positions(self,
+                        old: List[Any],
+                        new: List[Any],
+                        path: str,
+                        offset: int,
+                        operations: List[Dict[str, Any]]) -> None:
+        """Diff equally long list regions element by element.
+        
+        Regions where most positions differ, such as shifted repetitive
+        data, are replaced with one splice instead.
+        """
+        changed = [
+            index for index, (old_item, new_item) in enumerate(zip(old, new))
+            if not _same_value(old_item, new_item)
+        ]
+        if len(changed) > 16 and len(changed) * 2 > len(new):
+            operations.append({
+                "op": "splice", "path": path, "index": offset,
+                "delete": len(old), "values": list(new)
+            })
+            return
+            
+        for index in changed:
+            self._diff_value(old[index], new[index], f"{path}/{offset + index}", operations)
     
     def _binary_delta(self, old_state: Dict[str, Any], new_state: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate binary delta using bsdiff if available.
@@ -337,16 +695,24 @@ class DeltaCompressor:
             logger.warning(f"Binary diff failed: {str(e)}, falling back to dict delta")
             return self._dict_delta(old_state, new_state)
     
-    def apply_delta(self, base_state: Dict[str, Any], delta_info: Dict[str, Any]) -> Dict[str, Any]:
+    def apply_delta(self,
+                    base_state: Dict[str, Any],
+                    delta_info: Dict[str, Any],
+                    in_place: bool = False) -> Dict[str, Any]:
         """Apply delta to a base state to produce new state.
         
+        Structural deltas touch only the containers on changed paths. With
+        ``in_place`` they are patched directly; otherwise just those
+        containers are copied, so the base state is left unchanged.
+        
         Args:
             base_state: Base state to apply delta to
             delta_info: Delta information from calculate_delta
-            
+            in_place: Whether base_state may be modified
+        
         Returns:
             Dict[str, Any]: Updated state
-            
+        
         Raises:
             DeltaCompressionError: If delta application fails
         """
@@ -364,8 +730,16 @@ class DeltaCompressor:
                 # Deserialize
                 return json.loads(new_data.decode('utf-8'))
                 
+            # Handle structural delta
+            operations = delta_info.get("operations")
+            if operations is not None:
+                prefix = _top_level_operations(
+                    delta_info.get("changes") or {}, delta_info.get("removed_keys") or []
+                )
+                return self._apply_operations(base_state, prefix + list(operations), in_place)
+            
             # Handle dictionary delta
-            new_state = base_state.copy()
+            new_state = base_state if in_place else base_state.copy()
             
             # Apply changes
             changes = delta_info.get("changes", {})
@@ -376,23 +750,90 @@ class DeltaCompressor:
             for key in removed_keys:
                 if key in new_state:
                     del new_state[key]
-                    
-            return new_state
             
+            return new_state
+        
         except Exception as e:
             logger.error(f"Failed to apply delta: {str(e)}")
             raise DeltaCompressionError(f"Failed to apply delta: {str(e)}") from e
     
+    def _apply_operations(self, state: Any, operations: List[Dict[str, Any]], in_place: bool) -> Any:
+        """Apply structural patch operations.
+        
+        Args:
+            state: State to patch
+            operations: Operations from a structural delta
+            in_place: Whether state may be modified
+        
+        Returns:
+            Any: Patched state
+        """
+        # Containers already copied in this call, by id; holding them keeps ids unique
+        copies: Dict[int, Any] = {}
+    
+        def writable(container: Any) -> Any:
+            if in_place or id(container) in copies:
+                return container
+            container = container.copy() if type(container) is dict else list(container)
+            copies[id(container)] = container
+            return container
+        
+        root = state
+        for operation in operations:
+            op = operation["op"]
+            tokens = parse_json_pointer(operation["path"])
+            
+            # Replacing the root swaps the whole state
+            if not tokens and op != "splice":
+                root = operation.get("value")
+                continue
+            
+            # Walk to the target's container, copying containers on the way
+            root = writable(root)
+            container = root
+            parent_tokens = tokens if op == "splice" else tokens[:-1]
+            for token in parent_tokens:
+                key = int(token) if type(container) is list else token
+                child = writable(container[key])
+                container[key] = child
+                container = child
+            
+            if op == "splice":
+                index = operation["index"]
+                container[index:index + operation["delete"]] = operation["values"]
+                continue
+            
+            token = tokens[-1]
+            is_list = type(container) is list
+            if op == "add":
+                if is_list:
+                    container.insert(int(token), operation["value"])
+                else:
+                    container[token] = operation["value"]
+            elif op == "replace":
+                container[int(token) if is_list else token] = operation["value"]
+            elif op == "remove":
+                if is_list:
+                    del container[int(token)]
+                else:
+                    container.pop(token, None)
+            else:
+                raise DeltaCompressionError(f"Unknown patch operation: {op!r}")
+        
+        return root
+    
     def create_delta_record(self,
-                          changes: Dict[str, Any],
-                          removed_keys: List[str],
-                          timestamp: Optional[float] = None) -> DeltaRecord:
+                            changes: Dict[str, Any],
+                            removed_keys: List[str],
+                            timestamp: Optional[float] = None,
+                            operations: Optional[List[Dict[str, Any]]] = None) -> DeltaRecord:
         """Create compressed delta record from changes.
         
         Args:
             changes: Dictionary of changes
             removed_keys: List of removed keys
             timestamp: Delta creation timestamp (default: current time)
+            operations: Structural patch operations
             
         Returns:
             DeltaRecord: Compressed delta record
@@ -402,7 +843,7 @@ class DeltaCompressor:
             timestamp = time.time()
             
         # Skip compression if no changes
-        if not changes and not removed_keys:
+        if not changes and not removed_keys and not operations:
             return DeltaRecord(
                 timestamp=timestamp,
                 changes={},
@@ -415,6 +856,8 @@ class DeltaCompressor:
             "changes": changes,
             "removed": removed_keys
         }
+        if operations:
+            delta_payload["operations"] = operations
         
         # Serialize to JSON
         json_data = json.dumps(delta_payload, sort_keys=True)
@@ -446,6 +889,7 @@ class DeltaCompressor:
             compression_ratio=compression_ratio,
             size_bytes=compressed_size,
             checksum=checksum,
+            operations=operations,
             metadata={
                 "original_size": original_size,
                 "compressed_size": compressed_size,
@@ -468,6 +912,14 @@ class DeltaCompressor:
         # Use the latest timestamp
         timestamp = max(delta.timestamp for delta in deltas)
         
+        # Structural operations are order dependent, so concatenate everything
+        if any(delta.operations for delta in deltas):
+            merged_operations: List[Dict[str, Any]] = []
+            for delta in sorted(deltas, key=lambda d: d.timestamp):
+                merged_operations.extend(_top_level_operations(delta.changes, delta.removed_keys))
+                merged_operations.extend(delta.operations)
+            return self.create_delta_record({}, [], timestamp, merged_operations)
+            
         # Start with empty changes and removals
         merged_changes: Dict[str, Any] = {}
         all_removed_keys: List[str] = []
@@ -552,56 +1004,134 @@ class DeltaChain:
     
     This class handles sequences of delta records, including optimization,
     rebaseline, and state reconstruction operations.
+    
+    Full states are kept as keyframes at intervals bounded by delta count
+    and cumulative delta size, and recently reconstructed states are kept in
+    an LRU cache. Reconstructing any index therefore starts from the nearest
+    keyframe or cached state and replays at most ``checkpoint_interval``
+    deltas. States share unchanged branches with each other, so keyframes
+    cost little more than the containers that differ.
+    
+    With ``enable_rebase``, a chain that grows past ``max_chain_length`` is
+    rebased onto the oldest keyframe that brings it back within the limit,
+    keeping the history after that keyframe. Only when no such keyframe
+    exists, i.e. ``checkpoint_interval`` is not below ``max_chain_length``
+    and no byte-triggered keyframe was inserted, does the whole history
+    collapse into a new base state. The defaults (20 deltas, a keyframe
+    every 8) therefore retain between 13 and 20 deltas of history.
     """
     
     def __init__(self,
-                delta_strategy: str = DeltaStrategy.AUTO,
-                max_chain_length: int = 20,
-                enable_rebase: bool = True):
+                 delta_strategy: str = DeltaStrategy.AUTO,
+                 max_chain_length: int = 20,
+                 enable_rebase: bool = True,
+                 checkpoint_interval: int = 8,
+                 checkpoint_bytes: int = 1024 * 1024,
+                 state_cache_size: int = 32):
         """Initialize the delta chain manager.
         
         Args:
             delta_strategy: Delta compression strategy
-            max_chain_length: Maximum chain length before optimization
-            enable_rebase: Whether to enable automatic rebaseline
+            max_chain_length: Maximum chain length before optimization (0 = unlimited)
+            enable_rebase: Whether optimization rebases the chain instead of
+                merging its oldest deltas
+            checkpoint_interval: Maximum deltas between keyframes; keep it below
+                max_chain_length so rebasing can keep recent history
+            checkpoint_bytes: Cumulative delta size that triggers a keyframe
+            state_cache_size: Number of reconstructed states to keep
         """
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1")
+            
         self.delta_compressor = DeltaCompressor(strategy=delta_strategy)
         self.max_chain_length = max_chain_length
         self.enable_rebase = enable_rebase
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_bytes = checkpoint_bytes
+        self.state_cache_size = state_cache_size
         
         # Chain data
         self._deltas: List[DeltaRecord] = []
         self._base_state: Dict[str, Any] = {}
+        self._current_state: Dict[str, Any] = self._base_state  # State after the last delta
+        
+        # Keyframes: chain index -> full state, with indices kept sorted
+        self._keyframes: Dict[int, Dict[str, Any]] = {}
+        self._keyframe_indices: List[int] = []
+        self._bytes_since_checkpoint = 0
+        
+        # Recently reconstructed states, least recently used first
+        self._state_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
         
         # Metrics
-        self._chain_metrics = {
+        self._chain_metrics = self._initial_metrics()
+        
+        self._reset_keyframes()
+        
+        logger.debug(f"DeltaChain initialized with max_length={max_chain_length}")
+    
+    @staticmethod
+    def _initial_metrics() -> Dict[str, Any]:
+        """Return zeroed chain metrics."""
+        return {
             "chain_length": 0,
             "rebaseline_count": 0,
             "optimization_count": 0,
             "total_changes": 0,
-            "total_removals": 0
+            "total_removals": 0,
+            "checkpoint_count": 0,
+            "cache_hits": 0,
+            "cache_misses": 0
         }
-        
-        logger.debug(f"DeltaChain initialized with max_length={max_chain_length}")
     
-    def add_delta(self, delta: DeltaRecord) -> None:
-        """Add a delta to the chain.
+    def _reset_keyframes(self) -> None:
+        """Drop all keyframes and cached states, keeping the base as index 0."""
+        self._keyframes = {0: self._base_state}
+        self._keyframe_indices = [0]
+        self._bytes_since_checkpoint = 0
+        self._state_cache.clear()
+    
+    def _add_keyframe(self, index: int, state: Dict[str, Any]) -> None:
+        """Record a full state at a chain index."""
+        self._keyframes[index] = state
+        self._keyframe_indices.append(index)
+        self._bytes_since_checkpoint = 0
+        self._chain_metrics["checkpoint_count"] += 1
+    
+    def _append_delta(self, delta: DeltaRecord) -> None:
+        """Append a delta, advance the current state and checkpoint if due.
         
         Args:
             delta: Delta record to add
         """
-        # Add to chain
+        # Apply to the current state; only changed paths are copied
+        self._current_state = self.delta_compressor.apply_delta(self._current_state, delta.to_patch())
         self._deltas.append(delta)
+        index = len(self._deltas)
         
         # Update metrics
-        self._chain_metrics["chain_length"] = len(self._deltas)
-        self._chain_metrics["total_changes"] += len(delta.changes)
+        self._chain_metrics["chain_length"] = index
+        self._chain_metrics["total_changes"] += len(delta.changes) + len(delta.operations)
         self._chain_metrics["total_removals"] += len(delta.removed_keys)
         
+        # Insert a keyframe once enough deltas or delta bytes have accumulated
+        self._bytes_since_checkpoint += delta.size_bytes
+        if (index - self._keyframe_indices[-1] >= self.checkpoint_interval
+                or self._bytes_since_checkpoint >= self.checkpoint_bytes):
+            self._add_keyframe(index, self._current_state)
+            
         # Check if optimization needed
-        if len(self._deltas) > self.max_chain_length:
+        if 0 < self.max_chain_length < len(self._deltas):
             self._optimize_chain()
     
+    def add_delta(self, delta: DeltaRecord) -> None:
+        """Add a delta to the chain.
+        
+        Args:
+            delta: Delta record to add
+        """
+        self._append_delta(delta)
+    
     def add_state(self, state: Dict[str, Any], timestamp: Optional[float] = None) -> DeltaRecord:
         """Add a new state to the chain by calculating delta from previous state.
         
@@ -615,6 +1145,8 @@ class DeltaChain:
         # If chain is empty, set as base state
         if not self._deltas:
             self._base_state = state.copy()
+            self._current_state = self._base_state
+            self._reset_keyframes()
             
             # Create an empty delta for the base state
             delta = self.delta_compressor.create_delta_record({}, [], timestamp)
@@ -625,30 +1157,19 @@ class DeltaChain:
             
             return delta
             
-        # Calculate current state
-        current_state = self.get_current_state()
-        
         # Calculate delta from current state
-        delta_info = self.delta_compressor.calculate_delta(current_state, state)
+        delta_info = self.delta_compressor.calculate_delta(self._current_state, state)
         
         # Create delta record
         delta = self.delta_compressor.create_delta_record(
             changes=delta_info.get("changes", {}),
             removed_keys=delta_info.get("removed_keys", []),
-            timestamp=timestamp
+            timestamp=timestamp,
+            operations=delta_info.get("operations")
         )
         
         # Add to chain
-        self._deltas.append(delta)
-        
-        # Update metrics
-        self._chain_metrics["chain_length"] = len(self._deltas)
-        self._chain_metrics["total_changes"] += len(delta.changes)
-        self._chain_metrics["total_removals"] += len(delta.removed_keys)
-        
-        # Check if optimization needed
-        if len(self._deltas) > self.max_chain_length:
-            self._optimize_chain()
+        self._append_delta(delta)
             
         return delta
     
@@ -667,18 +1188,37 @@ class DeltaChain:
         if index < 0 or index > len(self._deltas):
             raise IndexError(f"Delta chain index {index} out of range")
             
-        # Start with base state
-        state = self._base_state.copy()
+        if index == len(self._deltas):
+            return self._current_state.copy()
+            
+        # Serve recently reconstructed states from the cache
+        cached = self._state_cache.get(index)
+        if cached is not None:
+            self._state_cache.move_to_end(index)
+            self._chain_metrics["cache_hits"] += 1
+            return cached.copy()
+        self._chain_metrics["cache_misses"] += 1
         
-        # Apply deltas up to the requested index
-        for i in range(min(index, len(self._deltas))):
-            delta = self._deltas[i]
-            state = self.delta_compressor.apply_delta(state, {
-                "changes": delta.changes,
-                "removed_keys": delta.removed_keys
-            })
+        # Start from the nearest keyframe at or before the index
+        start = self._keyframe_indices[bisect.bisect_right(self._keyframe_indices, index) - 1]
+        state = self._keyframes[start]
+        
+        # A cached state between the keyframe and the index is a closer start
+        for cached_index, cached_state in self._state_cache.items():
+            if start < cached_index < index:
+                start, state = cached_index, cached_state
+                
+        # Apply the remaining deltas; shared containers are copied, not modified
+        for i in range(start, index):
+            state = self.delta_compressor.apply_delta(state, self._deltas[i].to_patch())
             
-        return state
+        # Remember the result, evicting the least recently used state
+        if self.state_cache_size > 0:
+            self._state_cache[index] = state
+            if len(self._state_cache) > self.state_cache_size:
+                self._state_cache.popitem(last=False)
+                
+        return state.copy()
     
     def get_current_state(self) -> Dict[str, Any]:
         """Get the current (latest) state in the chain.
@@ -706,29 +1246,23 @@ class DeltaChain:
         """Clear the delta chain."""
         self._deltas = []
         self._base_state = {}
+        self._current_state = self._base_state
+        self._reset_keyframes()
         
         # Reset metrics
-        self._chain_metrics = {
-            "chain_length": 0,
-            "rebaseline_count": 0,
-            "optimization_count": 0,
-            "total_changes": 0,
-            "total_removals": 0
-        }
+        self._chain_metrics = self._initial_metrics()
     
     def rebaseline(self) -> None:
         """Rebaseline the chain by setting current state as new base state."""
         if not self._deltas:
             return
             
-        # Get current state
-        current_state = self.get_current_state()
-        
-        # Reset chain with new base state
-        self._base_state = current_state
+        # Reset chain with the current state as new base state
+        self._base_state = self._current_state
         self._deltas = [
             self.delta_compressor.create_delta_record({}, [], time.time())
         ]
+        self._reset_keyframes()
         
         # Update metrics
         self._chain_metrics["chain_length"] = 1
@@ -736,14 +1270,52 @@ class DeltaChain:
         self._chain_metrics["total_changes"] = 0
         self._chain_metrics["total_removals"] = 0
     
+    def _rebase_onto_keyframe(self, index: int) -> None:
+        """Drop the deltas before a keyframe, making it the new base state.
+        
+        Args:
+            index: Chain index of the keyframe (greater than 0)
+        """
+        dropped = self._deltas[:index]
+        self._base_state = self._keyframes[index]
+        self._deltas = self._deltas[index:]
+        
+        # Later keyframes move down with their indices
+        keyframes = {
+            keyframe_index - index: state for keyframe_index, state in self._keyframes.items()
+            if keyframe_index > index
+        }
+        self._reset_keyframes()
+        self._keyframes.update(keyframes)
+        self._keyframe_indices = sorted(self._keyframes)
+        self._bytes_since_checkpoint = sum(
+            delta.size_bytes for delta in self._deltas[self._keyframe_indices[-1]:]
+        )
+        
+        # Update metrics
+        self._chain_metrics["rebaseline_count"] += 1
+        self._chain_metrics["total_changes"] -= sum(
+            len(delta.changes) + len(delta.operations) for delta in dropped
+        )
+        self._chain_metrics["total_removals"] -= sum(len(delta.removed_keys) for delta in dropped)
+    
     def _optimize_chain(self) -> None:
         """Optimize the delta chain by merging deltas."""
         if len(self._deltas) <= self.max_chain_length // 2:
             return
             
         if self.enable_rebase:
-            # For simplicity, just rebaseline
-            self.rebaseline()
+            # Rebase onto the oldest keyframe that brings the chain back within
+            # bounds; without one the whole history collapses into the base
+            keyframe_index = next(
+                (index for index in self._keyframe_indices
+                 if index > 0 and len(self._deltas) - index <= self.max_chain_length),
+                None
+            )
+            if keyframe_index is None:
+                self.rebaseline()
+            else:
+                self._rebase_onto_keyframe(keyframe_index)
         else:
             # Merge oldest deltas
             merge_count = len(self._deltas) - self.max_chain_length // 2
@@ -757,6 +1329,16 @@ class DeltaChain:
                 # Replace merged deltas with single merged delta
                 self._deltas = [merged] + self._deltas[merge_count:]
                 
+                # Indices after the merged range move down; earlier keyframes go
+                shift = merge_count - 1
+                keyframes = {
+                    index - shift: state for index, state in self._keyframes.items()
+                    if index >= merge_count
+                }
+                self._reset_keyframes()
+                self._keyframes.update(keyframes)
+                self._keyframe_indices = sorted(self._keyframes)
+                
         # Update metrics
         self._chain_metrics["chain_length"] = len(self._deltas)
         self._chain_metrics["optimization_count"] += 1
@@ -783,4 +1365,10 @@ def extract_keys_from_delta(delta: DeltaRecord) -> Set[str]:
     """
     keys = set(delta.changes.keys())
     keys.update(delta.removed_keys)
+    
+    # Structural operations affect the top-level key their path starts with
+    for operation in delta.operations:
+        tokens = parse_json_pointer(operation["path"])
+        if tokens:
+            keys.add(tokens[0])
     return keys
\ No newline at end of file
@@ -5,6 +5,10 @@ Snapshot Management Module for Enhanced Persistence Framework.
 
 This module provides functionality for managing snapshots of data over time,
 including versioning, tagging, and lifecycle management of persistence data.
+
+Full snapshots are stored as manifests in a content-addressed chunk store, so
+values that did not change between snapshots are kept once. Snapshot metadata
+lives in a SQLite registry that is updated row by row.
 """
 import os
 import time
@@ -13,7 +17,9 @@ import uuid
 import shutil
 import hashlib
 import logging
+import sqlite3
 import tempfile
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Union, Tuple, Optional, Callable, TypeVar, Generic, Set
@@ -31,6 +37,7 @@ from orchestrator.persistence.core import (
 from orchestrator.persistence.delta import (
     DeltaCompressor, DeltaChain, DeltaStrategy, DeltaCompressionError
 )
+from orchestrator.persistence.chunk_store import ChunkStore
 
 # Type variables for generics
 T = TypeVar('T')  # Generic type for data
@@ -39,6 +46,17 @@ K = TypeVar('K')  # Generic type for keys
 # Get module logger with debug support
 logger = get_logger(__name__, debug=os.getenv("DEBUG") == "1")
 
+# Registry database file inside the snapshot directory
+REGISTRY_DB_NAME = "registry.db"
+
+# Legacy JSON registry, migrated into the database on first open
+LEGACY_REGISTRY_NAME = "registry.json"
+
+# How a snapshot's data is stored
+SNAPSHOT_STORAGE_CHUNKED = "chunked"  # Manifest in the chunk store
+SNAPSHOT_STORAGE_FILE = "file"  # Legacy data/<version>.data file
+SNAPSHOT_STORAGE_DELTA = "delta"  # data/<version>.delta relative to a base snapshot
+
 
 class SnapshotError(PersistenceError):
     """Exception raised when snapshot operations fail."""
@@ -205,7 +223,11 @@ class SnapshotManager:
         
         # Internal state
         self._snapshot_registry = {}  # Maps version IDs to metadata
+        self._snapshot_storage = {}  # Maps version IDs to (storage kind, root digest)
         self._tag_index = {}  # Maps tags to version IDs
+        self._registry_conn = None  # Lazily opened SQLite registry connection
+        self._registry_lock = threading.RLock()  # Serializes registry and chunk reference updates
+        self.chunk_store = None  # Content-addressed store for full snapshots
         
         # Logger for debug and informational messages
         self.logger = get_logger(f"{__name__}.SnapshotManager", debug=os.getenv("DEBUG") == "1")
@@ -216,29 +238,30 @@ class SnapshotManager:
     def _initialize_storage(self) -> None:
         """Initialize the storage backend.
         
-        Creates necessary directories and loads existing snapshot registry.
+        Creates necessary directories, opens the registry database and loads
+        the snapshot registry, migrating a legacy JSON registry if present.
         """
         try:
             # Create base directory if it doesn't exist
             if self.storage_backend == StorageBackend.FILE_SYSTEM:
                 os.makedirs(self.base_path, exist_ok=True)
                 
-                # Create subdirectories for data and metadata
+                # Create subdirectories for delta and legacy data files
                 os.makedirs(os.path.join(self.base_path, "data"), exist_ok=True)
                 os.makedirs(os.path.join(self.base_path, "metadata"), exist_ok=True)
                 
-                # Load existing registry if available
-                registry_path = os.path.join(self.base_path, "registry.json")
+                # Chunk store for full snapshots
+                self.chunk_store = ChunkStore(os.path.join(self.base_path, "chunks"))
+                
+                # Migrate a registry written by earlier versions
+                registry_path = os.path.join(self.base_path, LEGACY_REGISTRY_NAME)
                 if os.path.exists(registry_path):
                     try:
-                        with open(registry_path, 'r') as f:
-                            registry_data = json.load(f)
-                            self._load_registry(registry_data)
+                        self._migrate_legacy_registry(registry_path)
                     except Exception as e:
-                        self.logger.warning(f"Failed to load existing registry: {str(e)}")
-                        # Create a new registry
-                        self._snapshot_registry = {}
-                        self._tag_index = {}
+                        self.logger.warning(f"Failed to migrate existing registry: {str(e)}")
+                        
+                self._load_registry()
             else:
                 raise SnapshotError(f"Unsupported storage backend: {self.storage_backend}")
                 
@@ -247,19 +270,45 @@ class SnapshotManager:
         except Exception as e:
             raise SnapshotError(f"Failed to initialize snapshot storage: {str(e)}") from e
             
-    def _load_registry(self, registry_data: Dict[str, Any]) -> None:
-        """Load snapshot registry from parsed data.
+    def _get_registry_connection(self) -> sqlite3.Connection:
+        """Return the registry connection, opening it on first use.
         
-        Args:
-            registry_data: Parsed registry data
+        Returns:
+            sqlite3.Connection: Connection to the registry database
         """
+        with self._registry_lock:
+            if self._registry_conn is None:
+                conn = sqlite3.connect(
+                    os.path.join(self.base_path, REGISTRY_DB_NAME), check_same_thread=False
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS snapshots ("
+                    "version TEXT PRIMARY KEY, created_at TEXT NOT NULL, "
+                    "storage TEXT NOT NULL, root TEXT, metadata TEXT NOT NULL)"
+                )
+                ChunkStore.create_tables(conn)
+                conn.commit()
+                self._registry_conn = conn
+            return self._registry_conn
+            
+    def _load_registry(self) -> None:
+        """Load the snapshot registry from the registry database."""
         # Clear existing registry
         self._snapshot_registry = {}
+        self._snapshot_storage = {}
         self._tag_index = {}
         
+        with self._registry_lock:
+            rows = self._get_registry_connection().execute(
+                "SELECT version, storage, root, metadata FROM snapshots ORDER BY rowid"
+            ).fetchall()
+            
         # Load snapshot metadata
-        for version_id, metadata_dict in registry_data.get("snapshots", {}).items():
-            self._snapshot_registry[version_id] = SnapshotMetadata.from_dict(metadata_dict)
+        for version_id, storage, root, metadata_json in rows:
+            self._snapshot_registry[version_id] = SnapshotMetadata.from_dict(json.loads(metadata_json))
+            self._snapshot_storage[version_id] = (storage, root)
             
         # Rebuild tag index
         for version_id, metadata in self._snapshot_registry.items():
@@ -272,36 +321,85 @@ class SnapshotManager:
             f"Loaded registry with {len(self._snapshot_registry)} snapshots "
             f"and {len(self._tag_index)} tags"
         )
-    
-    def _save_registry(self) -> None:
-        """Save the snapshot registry to storage."""
-        if self.storage_backend == StorageBackend.FILE_SYSTEM:
-            try:
-                # Convert registry to serializable format
-                registry_data = {
-                    "snapshots": {
-                        version_id: metadata.to_dict() 
-                        for version_id, metadata in self._snapshot_registry.items()
-                    }
-                }
-                
-                # Write to file atomically
-                registry_path = os.path.join(self.base_path, "registry.json")
-                temp_path = f"{registry_path}.tmp"
+        
+    def _migrate_legacy_registry(self, registry_path: str) -> None:
+        """Import a JSON registry into the registry database.
+        
+        Snapshots listed there keep their existing data files. The JSON file
+        is renamed afterwards so the migration runs once.
+        
+        Args:
+            registry_path: Path to the legacy registry.json
+        """
+        with open(registry_path, 'r') as f:
+            registry_data = json.load(f)
+            
+        rows = []
+        for version_id, metadata_dict in registry_data.get("snapshots", {}).items():
+            metadata = SnapshotMetadata.from_dict(metadata_dict)
+            delta_path = os.path.join(self.base_path, "data", f"{version_id}.delta")
+            storage = SNAPSHOT_STORAGE_DELTA if os.path.exists(delta_path) else SNAPSHOT_STORAGE_FILE
+            rows.append((version_id, metadata.created_at, storage, None, json.dumps(metadata.to_dict())))
+            
+        with self._registry_lock:
+            conn = self._get_registry_connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO snapshots (version, created_at, storage, root, metadata) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
                 
-                with open(temp_path, 'w') as f:
-                    json.dump(registry_data, f, indent=2)
+        os.replace(registry_path, f"{registry_path}.migrated")
+        self.logger.info(f"Migrated {len(rows)} snapshots from {registry_path}")
+        
+    def _register_snapshot(self,
+                           metadata: 'SnapshotMetadata',
+                           storage: str,
+                           root: Optional[str] = None,
+                           digests: Optional[Set[str]] = None) -> None:
+        """Record a new snapshot and its chunk references in one transaction.
+        
+        Args:
+            metadata: Snapshot metadata
+            storage: Storage kind of the snapshot data
+            root: Root manifest digest for chunked snapshots
+            digests: Chunk digests referenced by the snapshot
+        """
+        with self._registry_lock:
+            conn = self._get_registry_connection()
+            with conn:
+                conn.execute(
+                    "INSERT INTO snapshots (version, created_at, storage, root, metadata) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (metadata.version, metadata.created_at, storage, root, json.dumps(metadata.to_dict()))
+                )
+                if digests:
+                    self.chunk_store.add_refs(conn, digests)
                     
-                # Atomically replace the registry file
-                os.replace(temp_path, registry_path)
-                
-                self.logger.debug(f"Registry saved with {len(self._snapshot_registry)} snapshots")
+            # Update registry
+            self._snapshot_registry[metadata.version] = metadata
+            self._snapshot_storage[metadata.version] = (storage, root)
+            
+            # Update tag index
+            for tag in metadata.tags:
+                if tag not in self._tag_index:
+                    self._tag_index[tag] = []
+                self._tag_index[tag].append(metadata.version)
                 
-            except Exception as e:
-                self.logger.error(f"Failed to save registry: {str(e)}")
-                raise SnapshotError(f"Failed to save snapshot registry: {str(e)}") from e
-        else:
-            raise SnapshotError(f"Unsupported storage backend: {self.storage_backend}")
+    def _update_snapshot_metadata(self, metadata: 'SnapshotMetadata') -> None:
+        """Rewrite the stored metadata of one snapshot.
+        
+        Args:
+            metadata: Updated snapshot metadata
+        """
+        with self._registry_lock:
+            conn = self._get_registry_connection()
+            with conn:
+                conn.execute(
+                    "UPDATE snapshots SET metadata = ? WHERE version = ?",
+                    (json.dumps(metadata.to_dict()), metadata.version)
+                )
     
     def create_snapshot(self, 
                        data: Any,
@@ -336,30 +434,21 @@ class SnapshotManager:
             # Update integrity information
             metadata.update_integrity_info(data)
             
-            # Store the snapshot
-            if self.storage_backend == StorageBackend.FILE_SYSTEM:
-                # Save data file
-                data_path = os.path.join(self.base_path, "data", f"{metadata.version}.data")
-                self._save_data_to_file(data, data_path)
-                
-                # Save metadata file
-                metadata_path = os.path.join(self.base_path, "metadata", f"{metadata.version}.json")
-                with open(metadata_path, 'w') as f:
-                    json.dump(metadata.to_dict(), f, indent=2)
-            else:
+            if self.storage_backend != StorageBackend.FILE_SYSTEM:
                 raise SnapshotError(f"Unsupported storage backend: {self.storage_backend}")
                 
-            # Update registry
-            self._snapshot_registry[metadata.version] = metadata
-            
-            # Update tag index
-            for tag in metadata.tags:
-                if tag not in self._tag_index:
-                    self._tag_index[tag] = []
-                self._tag_index[tag].append(metadata.version)
+            # Hold the lock from chunk writes to reference updates so a
+            # concurrent delete cannot remove a chunk this snapshot reuses
+            with self._registry_lock:
+                # Recreating an existing version replaces it
+                if metadata.version in self._snapshot_registry:
+                    self.delete_snapshot(metadata.version)
+                    
+                # Store chunks; only content not already present is written
+                root, digests = self.chunk_store.store(data)
                 
-            # Save updated registry
-            self._save_registry()
+                # Register the manifest and its chunk references
+                self._register_snapshot(metadata, SNAPSHOT_STORAGE_CHUNKED, root, digests)
             
             # Enforce snapshot limit if configured
             self._enforce_snapshot_limit()
@@ -375,49 +464,6 @@ class SnapshotManager:
             self.logger.error(f"Failed to create snapshot: {str(e)}")
             raise SnapshotError(f"Failed to create snapshot: {str(e)}") from e
     
-    def _save_data_to_file(self, data: Any, file_path: str) -> None:
-        """Save data to a file with appropriate serialization.
-        
-        Args:
-            data: Data to save
-            file_path: Path to save data to
-            
-        Raises:
-            SnapshotError: If data cannot be saved
-        """
-        try:
-            # Create parent directory if it doesn't exist
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            
-            # Save to temporary file first for atomic operation
-            temp_file = f"{file_path}.tmp"
-            
-            # Use appropriate serialization based on data type
-            if isinstance(data, (dict, list)):
-                with open(temp_file, 'w') as f:
-                    json.dump(data, f)
-            elif isinstance(data, str):
-                with open(temp_file, 'w') as f:
-                    f.write(data)
-            elif isinstance(data, bytes):
-                with open(temp_file, 'wb') as f:
-                    f.write(data)
-            elif HAS_NUMPY and isinstance(data, np.ndarray):
-                np.save(temp_file, data)
-            else:
-                # Fall back to pickle for other types
-                import pickle
-                with open(temp_file, 'wb') as f:
-                    pickle.dump(data, f)
-                    
-            # Atomically replace the target file
-            os.replace(temp_file, file_path)
-            
-        except Exception as e:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
-            raise SnapshotError(f"Failed to save data: {str(e)}") from e
-    
     def _load_data_from_file(self, file_path: str) -> Any:
         """Load data from a file with appropriate deserialization.
         
@@ -478,10 +524,19 @@ class SnapshotManager:
             
         metadata = self._snapshot_registry[version_id]
         
+        storage, root = self._snapshot_storage.get(version_id, (SNAPSHOT_STORAGE_FILE, None))
+        
+        # Delta snapshots are reconstructed from their base
+        if storage == SNAPSHOT_STORAGE_DELTA:
+            return self.get_delta_snapshot(version_id)
+            
         try:
             if self.storage_backend == StorageBackend.FILE_SYSTEM:
-                data_path = os.path.join(self.base_path, "data", f"{version_id}.data")
-                data = self._load_data_from_file(data_path)
+                if storage == SNAPSHOT_STORAGE_CHUNKED:
+                    data = self.chunk_store.load(root)
+                else:
+                    data_path = os.path.join(self.base_path, "data", f"{version_id}.data")
+                    data = self._load_data_from_file(data_path)
                 return data, metadata
             else:
                 raise SnapshotError(f"Unsupported storage backend: {self.storage_backend}")
@@ -594,14 +649,8 @@ class SnapshotManager:
             if version_id not in self._tag_index[tag]:
                 self._tag_index[tag].append(version_id)
                 
-        # Update metadata file
-        if self.storage_backend == StorageBackend.FILE_SYSTEM:
-            metadata_path = os.path.join(self.base_path, "metadata", f"{version_id}.json")
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata.to_dict(), f, indent=2)
-                
-        # Save registry
-        self._save_registry()
+        # Update the registry row
+        self._update_snapshot_metadata(metadata)
         
         self.logger.debug(f"Tagged snapshot {version_id} with tags: {tags}")
     
@@ -633,14 +682,8 @@ class SnapshotManager:
                 if not self._tag_index[tag]:
                     del self._tag_index[tag]
                     
-        # Update metadata file
-        if self.storage_backend == StorageBackend.FILE_SYSTEM:
-            metadata_path = os.path.join(self.base_path, "metadata", f"{version_id}.json")
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata.to_dict(), f, indent=2)
-                
-        # Save registry
-        self._save_registry()
+        # Update the registry row
+        self._update_snapshot_metadata(metadata)
         
         self.logger.debug(f"Removed tags {tags} from snapshot {version_id}")
     
@@ -657,41 +700,69 @@ class SnapshotManager:
             raise SnapshotNotFoundError(f"Snapshot with version {version_id} not found")
             
         metadata = self._snapshot_registry[version_id]
+        storage, root = self._snapshot_storage.get(version_id, (SNAPSHOT_STORAGE_FILE, None))
         
         try:
-            # Remove from tag index
-            for tag in metadata.tags:
-                if tag in self._tag_index and version_id in self._tag_index[tag]:
-                    self._tag_index[tag].remove(version_id)
+            with self._registry_lock:
+                # Collect the chunks this snapshot references
+                digests = set()
+                if storage == SNAPSHOT_STORAGE_CHUNKED:
+                    digests = self.chunk_store.referenced_digests(root)
                     
-                    # Remove tag from index if no more snapshots have it
-                    if not self._tag_index[tag]:
-                        del self._tag_index[tag]
-                        
-            # Delete files
-            if self.storage_backend == StorageBackend.FILE_SYSTEM:
-                # Delete data file
-                data_path = os.path.join(self.base_path, "data", f"{version_id}.data")
-                if os.path.exists(data_path):
-                    os.unlink(data_path)
-                    
-                # Delete metadata file
-                metadata_path = os.path.join(self.base_path, "metadata", f"{version_id}.json")
-                if os.path.exists(metadata_path):
-                    os.unlink(metadata_path)
+                # Drop the registry row and release references together
+                conn = self._get_registry_connection()
+                with conn:
+                    conn.execute("DELETE FROM snapshots WHERE version = ?", (version_id,))
+                    unreferenced = self.chunk_store.release_refs(conn, digests) if digests else []
                     
-            # Remove from registry
-            del self._snapshot_registry[version_id]
-            
-            # Save registry
-            self._save_registry()
-            
-            self.logger.debug(f"Deleted snapshot {version_id}")
+                # Chunks shared with other snapshots stay; the rest are removed
+                self.chunk_store.remove(unreferenced)
+                
+                # Remove from tag index
+                for tag in metadata.tags:
+                    if tag in self._tag_index and version_id in self._tag_index[tag]:
+                        self._tag_index[tag].remove(version_id)
+                        
+                        # Remove tag from index if no more snapshots have it
+                        if not self._tag_index[tag]:
+                            del self._tag_index[tag]
+                            
+                # Delete delta and legacy files
+                if self.storage_backend == StorageBackend.FILE_SYSTEM:
+                    for file_path in (
+                        os.path.join(self.base_path, "data", f"{version_id}.data"),
+                        os.path.join(self.base_path, "data", f"{version_id}.delta"),
+                        os.path.join(self.base_path, "metadata", f"{version_id}.json"),
+                    ):
+                        if os.path.exists(file_path):
+                            os.unlink(file_path)
+                            
+                # Remove from registry
+                del self._snapshot_registry[version_id]
+                self._snapshot_storage.pop(version_id, None)
+                
+            self.logger.debug(
+                f"Deleted snapshot {version_id}, released {len(unreferenced)} unreferenced chunks"
+            )
             
         except Exception as e:
             self.logger.error(f"Failed to delete snapshot {version_id}: {str(e)}")
             raise SnapshotError(f"Failed to delete snapshot {version_id}: {str(e)}") from e
     
+    def collect_garbage(self) -> int:
+        """Remove chunk files that no snapshot references.
+        
+        Such files are only left behind when a process stops between writing
+        chunks and registering the snapshot that uses them.
+        
+        Returns:
+            int: Number of chunk files removed
+        """
+        with self._registry_lock:
+            removed = self.chunk_store.collect_garbage(self._get_registry_connection())
+        self.logger.debug(f"Garbage collection removed {removed} chunks")
+        return removed
+    
     def _enforce_snapshot_limit(self) -> None:
         """Enforce the maximum number of snapshots if configured."""
         if self.max_snapshots <= 0:
@@ -775,7 +846,11 @@ class SnapshotManager:
             
             # Calculate delta
             delta_info = self.delta_compressor.calculate_delta(base_data, data)
-            
+
+            # Recreating an existing version replaces it
+            if metadata.version in self._snapshot_registry:
+                self.delete_snapshot(metadata.version)
+
             # Store the snapshot
             if self.storage_backend == StorageBackend.FILE_SYSTEM:
                 # Save delta file
@@ -787,33 +862,21 @@ class SnapshotManager:
                     pickle.dump(delta_info, f)
                     
                 os.replace(temp_path, delta_path)
-                
-                # Save metadata file
-                metadata_path = os.path.join(self.base_path, "metadata", f"{metadata.version}.json")
-                with open(metadata_path, 'w') as f:
-                    json.dump(metadata.to_dict(), f, indent=2)
             else:
                 raise SnapshotError(f"Unsupported storage backend: {self.storage_backend}")
                 
-            # Update registry
-            self._snapshot_registry[metadata.version] = metadata
-            
-            # Update tag index
-            for tag in metadata.tags:
-                if tag not in self._tag_index:
-                    self._tag_index[tag] = []
-                self._tag_index[tag].append(metadata.version)
-                
-            # Save updated registry
-            self._save_registry()
+            # Register the delta snapshot
+            self._register_snapshot(metadata, SNAPSHOT_STORAGE_DELTA)
             
             # Enforce snapshot limit if configured
             self._enforce_snapshot_limit()
             
-            self.logger.debug(
-                f"Created delta snapshot {metadata.version} with base {base_version}, "
-                f"compression ratio: {delta_info.get('compression_ratio', 1.0):.2f}"
-            )
+            # Reading the ratio measures the delta, so only do it when logging it
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Created delta snapshot {metadata.version} with base {base_version}, "
+                    f"compression ratio: {delta_info.get('compression_ratio', 1.0):.2f}"
+                )
             
             return metadata.version
             
@@ -838,6 +901,11 @@ class SnapshotManager:
             
         metadata = self._snapshot_registry[version_id]
         
+        # Full snapshots need no reconstruction
+        storage, _ = self._snapshot_storage.get(version_id, (SNAPSHOT_STORAGE_FILE, None))
+        if storage == SNAPSHOT_STORAGE_CHUNKED:
+            return self.get_snapshot(version_id)
+            
         try:
             if self.storage_backend == StorageBackend.FILE_SYSTEM:
                 # Check if this is a delta or regular snapshot
@@ -859,8 +927,8 @@ class SnapshotManager:
                     with open(delta_path, 'rb') as f:
                         delta_info = pickle.load(f)
                         
-                    # Apply delta to reconstruct data
-                    data = self.delta_compressor.apply_delta(base_data, delta_info)
+                    # Apply delta to reconstruct data; the base was just loaded
+                    data = self.delta_compressor.apply_delta(base_data, delta_info, in_place=True)
                     return data, metadata
                 elif os.path.exists(data_path):
                     # Regular snapshot
@@ -1025,7 +1093,11 @@ class SnapshotManager:
         """Clean up resources used by the snapshot manager."""
         self.logger.debug("Cleaning up snapshot manager resources")
         
-        # Nothing specific to clean up for now
+        # Close the registry connection; it is reopened on next use
+        with self._registry_lock:
+            if self._registry_conn is not None:
+                self._registry_conn.close()
+                self._registry_conn = None
     
     def clear_all(self) -> None:
         """Delete all snapshots and reset the registry.
@@ -1045,15 +1117,22 @@ class SnapshotManager:
                             if os.path.isfile(file_path):
                                 os.unlink(file_path)
                                 
-                # Remove registry file
-                registry_path = os.path.join(self.base_path, "registry.json")
-                if os.path.exists(registry_path):
-                    os.unlink(registry_path)
+                # Remove all chunks
+                with self._registry_lock:
+                    shutil.rmtree(self.chunk_store.base_path, ignore_errors=True)
+                    self.chunk_store = ChunkStore(self.chunk_store.base_path)
+                    
+                    # Empty the registry tables
+                    conn = self._get_registry_connection()
+                    with conn:
+                        conn.execute("DELETE FROM snapshots")
+                        conn.execute("DELETE FROM chunk_refs")
             else:
                 raise SnapshotError(f"Unsupported storage backend: {self.storage_backend}")
                 
             # Reset in-memory state
             self._snapshot_registry = {}
+            self._snapshot_storage = {}
             self._tag_index = {}
             
         except Exception as e:
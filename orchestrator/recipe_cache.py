@@ -0,0 +1,253 @@
+# orchestrator/recipe_cache.py
+"""
+Persistent on-disk cache for compiled recipe plans.
+
+Parsing and validating a recipe (YAML loading, structure checks, dependency
+graph validation and module import checks) is repeated by every CLI
+invocation of the runner. This module stores the result of that work as a
+pickled entry under a cache directory so warm starts can skip it entirely.
+
+Entries are keyed by namespace and recipe path, and are valid while the
+recipe file keeps the same modification time and size. When either differs
+the file content is hashed, and an entry whose content hash still matches
+is reused and re-stamped, so touching a recipe does not force a rebuild.
+
+The same cache is shared by EnhancedRecipeParser and EnhancedRecipeRunner,
+each storing its own representation under a separate namespace.
+"""
+
+import hashlib  # Imported for recipe content and cache key hashing
+import os  # Imported for environment configuration and atomic replacement
+import pickle  # Imported for plan serialization
+import tempfile  # Imported for atomic cache entry writes
+import threading  # Imported for thread-safe statistics
+from pathlib import Path  # Imported for cross-platform path handling
+from typing import Any, Dict, Optional, Tuple, Union  # Imported for type hints
+
+from src.core.logger import get_logger  # Imported for framework logging
+
+# Initialize logger with debug support
+logger = get_logger(__name__, debug=os.getenv("DEBUG") == "1")
+
+# Bumped whenever the stored entry layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Environment variable overriding the default cache directory
+CACHE_DIR_ENV_VAR = "FRAMEWORK0_RECIPE_CACHE_DIR"
+
+# Cache directory used when neither an explicit path nor the variable is set
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "framework0" / "recipes"
+
+
+def hash_recipe_content(content: bytes) -> str:
+    """
+    Compute the content hash used to validate cached plans.
+
+    Args:
+        content: Raw recipe file bytes
+
+    Returns:
+        str: SHA-256 hex digest of the content
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the configured recipe cache directory.
+
+    Returns:
+        Path: Directory from FRAMEWORK0_RECIPE_CACHE_DIR or the default location
+    """
+    configured = os.getenv(CACHE_DIR_ENV_VAR)
+    return Path(configured) if configured else DEFAULT_CACHE_DIR
+
+
+class RecipePlanCache:
+    """
+    Pickle-backed cache of compiled recipe plans validated by file stamp.
+
+    Cache entries are written atomically, so concurrent runner processes can
+    share a directory. Corrupt, outdated or unreadable entries are treated as
+    misses and rebuilt by the caller.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None) -> None:
+        """
+        Initialize the recipe plan cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (default_cache_dir() if None)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self._stats_lock = threading.Lock()  # Protects hit and miss counters
+        self._hits = 0  # Entries served from disk
+        self._misses = 0  # Lookups that required a rebuild
+
+    def _entry_path(self, namespace: str, recipe_path: Union[str, Path]) -> Path:
+        """
+        Return the cache entry file for a recipe.
+
+        Args:
+            namespace: Consumer namespace such as 'runner' or 'parser'
+            recipe_path: Path to the recipe file
+
+        Returns:
+            Path: Location of the cache entry
+        """
+        resolved_path = str(Path(recipe_path).resolve())  # Same recipe, same entry
+        entry_key = hashlib.sha256(f"{namespace}\0{resolved_path}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{namespace}-{entry_key[:32]}.pkl"
+
+    def _count(self, hit: bool) -> None:
+        """Record a cache lookup outcome."""
+        with self._stats_lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def load(self, namespace: str, recipe_path: Union[str, Path]) -> Optional[Tuple[str, Any]]:
+        """
+        Load the cached payload for a recipe if it is still current.
+
+        Args:
+            namespace: Consumer namespace such as 'runner' or 'parser'
+            recipe_path: Path to the recipe file
+
+        Returns:
+            Optional[Tuple[str, Any]]: Content hash and payload, or None on a miss
+        """
+        entry_path = self._entry_path(namespace, recipe_path)
+        try:
+            recipe_stat = os.stat(recipe_path)  # Current recipe stamp
+            with open(entry_path, "rb") as entry_file:
+                entry = pickle.load(entry_file)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None  # No entry yet, or recipe missing
+        except Exception as load_error:
+            logger.warning(f"Discarding unreadable recipe cache entry {entry_path}: {load_error}")
+            self._count(hit=False)
+            return None
+
+        if not isinstance(entry, dict) or entry.get("version") != CACHE_FORMAT_VERSION:
+            self._count(hit=False)
+            return None  # Written by an incompatible version
+
+        stamp = (recipe_stat.st_mtime_ns, recipe_stat.st_size)
+        if tuple(entry["stamp"]) != stamp:
+            # Stamp changed; reuse the entry only if the content is identical
+            with open(recipe_path, "rb") as recipe_file:
+                content_hash = hash_recipe_content(recipe_file.read())
+            if content_hash != entry["content_hash"]:
+                self._count(hit=False)
+                return None  # Recipe content changed
+            entry["stamp"] = stamp
+            self._write_entry(entry_path, entry)  # Re-stamp so next lookup is stat-only
+
+        self._count(hit=True)
+        logger.debug(f"Recipe cache hit ({namespace}): {recipe_path}")
+        return entry["content_hash"], entry["payload"]
+
+    def store(
+        self,
+        namespace: str,
+        recipe_path: Union[str, Path],
+        content_hash: str,
+        payload: Any,
+        recipe_stat: Optional[os.stat_result] = None
+    ) -> bool:
+        """
+        Store a compiled payload for a recipe.
+
+        Args:
+            namespace: Consumer namespace such as 'runner' or 'parser'
+            recipe_path: Path to the recipe file
+            content_hash: Hash of the content the payload was built from
+            payload: Picklable compiled representation
+            recipe_stat: Stat taken before the recipe was read (taken now if None)
+
+        Returns:
+            bool: True if the entry was written
+        """
+        try:
+            recipe_stat = recipe_stat or os.stat(recipe_path)
+            entry = {
+                "version": CACHE_FORMAT_VERSION,                          # Entry layout version
+                "recipe_path": str(recipe_path),                          # Source recipe
+                "stamp": (recipe_stat.st_mtime_ns, recipe_stat.st_size),  # Fast validity check
+                "content_hash": content_hash,                             # Slow validity check
+                "payload": payload                                        # Compiled plan
+            }
+            self._write_entry(self._entry_path(namespace, recipe_path), entry)
+            return True
+        except Exception as store_error:
+            logger.warning(f"Could not write recipe cache entry for {recipe_path}: {store_error}")
+            return False
+
+    def _write_entry(self, entry_path: Path, entry: Dict[str, Any]) -> None:
+        """
+        Atomically write a cache entry.
+
+        Args:
+            entry_path: Destination entry file
+            entry: Entry dictionary to pickle
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                pickle.dump(entry, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, entry_path)  # Readers never see partial entries
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def invalidate(self, namespace: str, recipe_path: Union[str, Path]) -> None:
+        """
+        Remove the cache entry for a recipe.
+
+        Args:
+            namespace: Consumer namespace such as 'runner' or 'parser'
+            recipe_path: Path to the recipe file
+        """
+        self._entry_path(namespace, recipe_path).unlink(missing_ok=True)
+
+    def clear(self) -> int:
+        """
+        Remove every cache entry in the cache directory.
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        if self.cache_dir.is_dir():
+            for entry_path in self.cache_dir.glob("*.pkl"):
+                entry_path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache lookup statistics for this instance.
+
+        Returns:
+            Dict[str, Any]: Hit and miss counts and the cache directory
+        """
+        with self._stats_lock:
+            return {
+                "cache_dir": str(self.cache_dir),
+                "hits": self._hits,
+                "misses": self._misses
+            }
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "CACHE_DIR_ENV_VAR",
+    "DEFAULT_CACHE_DIR",
+    "RecipePlanCache",
+    "default_cache_dir",
+    "hash_recipe_content",
+]
@@ -11,32 +11,154 @@ Features:
 - Advanced error handling and recovery patterns
 - Flexible filtering and execution control
 - Thread-safe operations with cancellation support
+- Dependency-aware parallel step scheduling on thread or process pools
 - Detailed logging and debug tracing capabilities
 - JSON-based result reporting and status tracking
 - Backward compatibility with legacy scriptlets
 """
 
 import os  # Imported for environment variable access and file operations
+import asyncio  # Imported for the asyncio step execution mode
 import sys  # Imported for system-specific parameters and functions
 import json  # Imported for JSON serialization and result reporting
+import copy  # Imported for isolating cached step arguments between executions
 import yaml  # Imported for YAML recipe file parsing and processing
 import time  # Imported for timing operations and performance measurement
 import importlib  # Imported for dynamic module loading and scriptlet discovery
+import importlib.util  # Imported for locating scriptlet module sources without importing them
 import traceback  # Imported for detailed error reporting and debugging
 import threading  # Imported for thread-safe operations and cancellation
-from typing import Optional, List, Dict, Any, Set, Union  # Imported for comprehensive type hints
+import multiprocessing  # Imported for killable subprocess step isolation
+from collections import OrderedDict, deque  # Imported for the plan cache and the parallel ready queue
+from concurrent.futures import (  # Imported for parallel step execution pools
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Optional, List, Dict, Any, Set, Tuple, Union  # Imported for comprehensive type hints
 from pathlib import Path  # Imported for cross-platform path operations
-from dataclasses import dataclass, field  # Imported for structured data definitions
+from dataclasses import asdict, dataclass, field  # Imported for structured data definitions
 from datetime import datetime  # Imported for timestamp handling and formatting
 from enum import Enum  # Imported for enumerated execution states
 
 from orchestrator.context.context import Context  # Imported for context state management  
-from scriptlets.framework import BaseScriptlet, ScriptletResult, ScriptletState  # Imported for unified scriptlet framework
+from scriptlets.framework import (  # Imported for unified scriptlet framework
+    AsyncBaseScriptlet,
+    CancellationToken,
+    ScriptletResult,
+    ScriptletState,
+    StepCancelledError,
+)
+from orchestrator.recipe_cache import RecipePlanCache, hash_recipe_content  # Imported for on-disk plans
 from src.core.logger import get_logger  # Imported for consistent logging across runner
 
 # Initialize module logger with debug support from environment
 logger = get_logger(__name__, debug=os.getenv("DEBUG") == "1")
 
+# Pool types supported by the parallel step scheduler
+PARALLEL_EXECUTOR_TYPES = ("thread", "process", "asyncio")
+
+# Default in-flight step limit for the asyncio executor, whose steps mostly wait on I/O
+DEFAULT_ASYNC_MAX_PARALLEL_STEPS = 256
+
+# Where a step with a timeout runs: an abandonable thread or a killable subprocess
+TIMEOUT_ISOLATION_TYPES = ("thread", "process")
+
+# Seconds between checks of a supervised step for completion or cancellation
+SUPERVISOR_POLL_INTERVAL = 0.05
+
+# Resource class assigned to steps that do not declare one
+DEFAULT_RESOURCE_CLASS = "default"
+
+# Maximum number of recipe plans kept in the in-process plan cache
+RECIPE_PLAN_CACHE_SIZE = 64
+
+# In-process caches shared by all runner instances
+_recipe_plan_cache: "OrderedDict[tuple, RecipePlan]" = OrderedDict()  # Plans by (content hash, path)
+_scriptlet_class_cache: Dict[tuple, tuple] = {}  # (class, is_framework) by (module, class name)
+_cache_lock = threading.Lock()  # Protects both caches
+
+
+def _resolve_scriptlet_class(module_name: str, class_name: str) -> tuple:
+    """
+    Resolve a scriptlet class and whether it uses the unified framework.
+    
+    Successful resolutions are cached for the lifetime of the process, so
+    repeated steps, retries and recipe runs skip the import machinery and
+    MRO inspection. Failures are not cached.
+    
+    Args:
+        module_name: Module path of the scriptlet
+        class_name: Class name of the scriptlet
+        
+    Returns:
+        tuple: Scriptlet class and framework scriptlet flag
+        
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the class does not exist in the module
+    """
+    cache_key = (module_name, class_name)
+    cached = _scriptlet_class_cache.get(cache_key)
+    if cached is not None:
+        return cached  # Resolved previously
+    
+    module = importlib.import_module(module_name)  # Dynamic module import
+    scriptlet_class = getattr(module, class_name)  # Get class reference
+    
+    # Framework scriptlets have a BaseScriptlet class somewhere in their MRO
+    is_framework_scriptlet = hasattr(scriptlet_class, '__bases__') and any(
+        hasattr(base, '__name__') and 'BaseScriptlet' in base.__name__
+        for base in scriptlet_class.__mro__
+    )
+    
+    resolved = (scriptlet_class, is_framework_scriptlet)
+    with _cache_lock:
+        _scriptlet_class_cache[cache_key] = resolved
+    return resolved
+
+
+def _module_stamp(module_name: str) -> Optional[Tuple[int, int]]:
+    """
+    Stamp a module's source file so persisted import results notice edits.
+    
+    Args:
+        module_name: Module path of the scriptlet
+        
+    Returns:
+        Optional[Tuple[int, int]]: Modification time (ns) and size of the
+        module file, or None if the module has no locatable source file
+    """
+    module_file = getattr(sys.modules.get(module_name), "__file__", None)
+    if module_file is None:
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            return None  # Module or one of its parent packages is missing
+        module_file = spec.origin if spec is not None else None
+    try:
+        module_stat = os.stat(module_file)
+    except (OSError, TypeError):
+        return None  # Built-in, namespace or vanished module
+    return (module_stat.st_mtime_ns, module_stat.st_size)
+
+
+def _is_step_selected(step_name: str, only: Optional[List[str]], skip: Optional[List[str]]) -> bool:
+    """
+    Check a step name against a run's only and skip filters.
+    
+    Args:
+        step_name: Name of the step
+        only: Steps to include (None includes every step)
+        skip: Steps to skip
+        
+    Returns:
+        bool: True if the step runs
+    """
+    return (only is None or step_name in only) and (skip is None or step_name not in skip)
+
 
 class RecipeExecutionStatus(Enum):
     """
@@ -184,6 +306,87 @@ class RecipeExecutionResult:
         }
 
 
+class StepTimeoutError(TimeoutError):
+    """Exception raised when a supervised step exceeds its timeout."""
+    pass
+
+
+class _AsyncStepExecutor:
+    """
+    Step pool running coroutines on one event loop in a background thread.
+    
+    Submitted coroutines return concurrent.futures.Future objects, so the
+    parallel scheduler treats this like any other pool. Blocking work, such
+    as synchronous scriptlets, is bridged onto a bounded thread pool set as
+    the loop's default executor.
+    """
+    
+    def __init__(self, bridge_workers: Optional[int] = None) -> None:
+        """
+        Start the event loop thread.
+        
+        Args:
+            bridge_workers: Thread count for synchronous work (executor default if None)
+        """
+        self._bridge = ThreadPoolExecutor(max_workers=bridge_workers, thread_name_prefix="recipe-sync-bridge")
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._bridge)
+        self._thread = threading.Thread(target=self._loop.run_forever, name="recipe-event-loop", daemon=True)
+        self._thread.start()
+    
+    def submit(self, coroutine_function: Any, *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedule a coroutine function on the event loop.
+        
+        Returns:
+            Future: Thread-safe future for the coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine_function(*args, **kwargs), self._loop)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the event loop and the bridge pool.
+        
+        Args:
+            wait: Wait for running synchronous work to finish
+        """
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._bridge.shutdown(wait=wait)
+    
+    def __enter__(self) -> "_AsyncStepExecutor":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+
+@dataclass
+class RecipePlan:
+    """
+    Validated recipe ready for execution.
+    
+    Plans are cached by recipe content hash so repeated runs of an unchanged
+    recipe skip YAML parsing, validation and scriptlet class resolution. When
+    the runner has a RecipePlanCache, plans also persist across processes.
+    """
+    recipe_path: str                                    # Path the plan was built from
+    content_hash: str                                   # SHA-256 of the recipe file content
+    recipe_data: Dict[str, Any]                         # Parsed recipe document
+    steps: List[Dict[str, Any]]                         # Validated and sorted steps
+    unresolved_steps: List[str] = field(default_factory=list)  # Steps whose class failed to resolve
+    import_results: Dict[str, bool] = field(default_factory=dict)  # Resolution outcome by 'module.Class'
+    module_stamps: Dict[str, Optional[Tuple[int, int]]] = field(default_factory=dict)  # Module file stamp per result
+    dependencies: Optional[Dict[str, List[str]]] = None  # Dependency map in topological order
+    dependency_error: Optional[str] = None              # Why the dependency graph is invalid
+    
+    @property
+    def execution_order(self) -> Optional[List[str]]:
+        """Step names in dependency order, or None if the graph is invalid."""
+        return list(self.dependencies) if self.dependencies is not None else None
+
+
 class EnhancedRecipeRunner:
     """
     Enhanced recipe execution engine with comprehensive IAF0 compliance.
@@ -197,15 +400,72 @@ class EnhancedRecipeRunner:
     - Detailed logging and result reporting
     """
     
-    def __init__(self, default_timeout: Optional[float] = None) -> None:
+    def __init__(
+        self,
+        default_timeout: Optional[float] = None,
+        max_parallel_steps: Optional[int] = None,
+        executor_type: str = "thread",
+        resource_limits: Optional[Dict[str, int]] = None,
+        pool_scriptlet_instances: bool = False,
+        plan_cache: Optional[RecipePlanCache] = None,
+        async_bridge_workers: Optional[int] = None,
+        timeout_isolation: str = "thread",
+        cancel_grace_period: float = 1.0
+    ) -> None:
         """
         Initialize the enhanced recipe runner with configuration.
         
         Args:
             default_timeout: Default timeout for step execution (no timeout if None)
+            max_parallel_steps: Default worker count for parallel execution (CPU count if None,
+                or DEFAULT_ASYNC_MAX_PARALLEL_STEPS for the asyncio executor)
+            executor_type: Pool used for parallel execution ('thread', 'process' or 'asyncio')
+            resource_limits: Maximum concurrent steps per step 'resource_class'
+            pool_scriptlet_instances: Reuse idle scriptlet instances instead of
+                constructing one per step attempt
+            plan_cache: On-disk cache persisting recipe plans across processes
+            async_bridge_workers: Threads running synchronous scriptlets in asyncio mode
+            timeout_isolation: How steps with a timeout are supervised: 'thread'
+                (abandoned on expiry) or 'process' (terminated on expiry)
+            cancel_grace_period: Seconds a timed-out or cancelled step gets to
+                stop cooperatively before it is abandoned or killed
+            
+        Raises:
+            ValueError: If executor type, isolation or parallelism limits are invalid
         """
+        if executor_type not in PARALLEL_EXECUTOR_TYPES:
+            raise ValueError(f"Unsupported executor type '{executor_type}'. Supported: {list(PARALLEL_EXECUTOR_TYPES)}")
+        
+        if max_parallel_steps is not None and max_parallel_steps < 1:
+            raise ValueError("max_parallel_steps must be at least 1")
+        
+        if async_bridge_workers is not None and async_bridge_workers < 1:
+            raise ValueError("async_bridge_workers must be at least 1")
+        
+        if timeout_isolation not in TIMEOUT_ISOLATION_TYPES:
+            raise ValueError(f"Unsupported timeout isolation '{timeout_isolation}'. Supported: {list(TIMEOUT_ISOLATION_TYPES)}")
+        
+        if cancel_grace_period < 0:
+            raise ValueError("cancel_grace_period must not be negative")
+        
+        for resource_class, limit in (resource_limits or {}).items():
+            if limit < 1:
+                raise ValueError(f"Resource limit for class '{resource_class}' must be at least 1")
+        
         # Core configuration and state
         self.default_timeout = default_timeout  # Default step timeout setting
+        self.max_parallel_steps = max_parallel_steps  # Default parallel worker count
+        self.executor_type = executor_type  # Pool type for parallel execution
+        self.resource_limits: Dict[str, int] = dict(resource_limits or {})  # Per-class concurrency limits
+        self.pool_scriptlet_instances = pool_scriptlet_instances  # Reuse scriptlet instances
+        self.plan_cache = plan_cache  # Persistent recipe plan cache
+        self.async_bridge_workers = async_bridge_workers  # Sync scriptlet threads in asyncio mode
+        self.timeout_isolation = timeout_isolation  # Supervision for steps with a timeout
+        self.cancel_grace_period = cancel_grace_period  # Cooperative stop window
+        
+        # Idle scriptlet instances by class when pooling is enabled
+        self._scriptlet_pool: Dict[type, List[Any]] = {}
+        self._pool_lock = threading.Lock()  # Protects the scriptlet pool
         
         # Logging and monitoring setup
         self.logger = get_logger(f"runner.{id(self)}", debug=os.getenv("DEBUG") == "1")
@@ -214,6 +474,9 @@ class EnhancedRecipeRunner:
         self._execution_lock = threading.RLock()    # Thread-safe execution protection
         self._is_cancelled = threading.Event()      # Cancellation signal mechanism
         self._current_execution: Optional[RecipeExecutionResult] = None  # Active execution tracking
+        self._active_tokens: Set[CancellationToken] = set()  # Tokens of running step attempts
+        self._tokens_lock = threading.Lock()  # Protects active tokens and abandoned count
+        self._abandoned_steps = 0  # Timed-out step threads left running
         
         # Statistics and monitoring
         self._execution_history: List[RecipeExecutionResult] = []  # Historical execution results
@@ -232,7 +495,9 @@ class EnhancedRecipeRunner:
         continue_on_error: bool = False,
         step_timeout: Optional[float] = None,
         max_retries: int = 0,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        parallel: bool = False,
+        max_parallel_steps: Optional[int] = None
     ) -> Context:
         """
         Execute a complete recipe with enhanced capabilities and comprehensive monitoring.
@@ -249,6 +514,8 @@ class EnhancedRecipeRunner:
             step_timeout: Timeout for individual steps (overrides default)
             max_retries: Maximum number of retry attempts for failed steps
             retry_delay: Delay between retry attempts in seconds
+            parallel: Schedule steps by their 'depends_on' graph instead of list order
+            max_parallel_steps: Worker count for parallel mode (overrides runner default)
             
         Returns:
             Context: Final context state with execution results and metadata
@@ -271,9 +538,17 @@ class EnhancedRecipeRunner:
                 
                 self.logger.info(f"Starting enhanced recipe execution: {recipe_path}")
                 
-                # Load and validate recipe content
-                recipe_data = self._load_recipe(recipe_path)  # Load recipe with validation
-                steps = self._validate_recipe_structure(recipe_data, recipe_path)  # Validate structure
+                # Load and validate recipe content (cached by content hash)
+                plan = self._get_recipe_plan(recipe_path, only=only, skip=skip)
+                recipe_data = plan.recipe_data  # Parsed recipe data
+                steps = plan.steps  # Validated and sorted steps
+                unresolved_steps = [
+                    step_name for step_name in plan.unresolved_steps if _is_step_selected(step_name, only, skip)
+                ]
+                if unresolved_steps:
+                    self.logger.warning(
+                        f"Scriptlet classes could not be resolved for steps: {', '.join(unresolved_steps)}"
+                    )  # These steps fail when dispatched
                 
                 # Initialize execution result tracking
                 execution_result = RecipeExecutionResult(
@@ -296,18 +571,34 @@ class EnhancedRecipeRunner:
                 # Execute recipe steps with comprehensive monitoring
                 execution_result.status = RecipeExecutionStatus.RUNNING  # Mark as running
                 
-                successful_steps = self._execute_recipe_steps(
-                    ctx=ctx,
-                    steps=steps,
-                    execution_result=execution_result,
-                    debug=debug,
-                    only=only,
-                    skip=skip,
-                    continue_on_error=continue_on_error,
-                    step_timeout=step_timeout or self.default_timeout,
-                    max_retries=max_retries,
-                    retry_delay=retry_delay
-                )
+                if parallel:
+                    successful_steps = self._execute_recipe_steps_parallel(
+                        ctx=ctx,
+                        steps=steps,
+                        execution_result=execution_result,
+                        debug=debug,
+                        only=only,
+                        skip=skip,
+                        continue_on_error=continue_on_error,
+                        step_timeout=step_timeout or self.default_timeout,
+                        max_retries=max_retries,
+                        retry_delay=retry_delay,
+                        max_parallel_steps=max_parallel_steps,
+                        plan=plan
+                    )
+                else:
+                    successful_steps = self._execute_recipe_steps(
+                        ctx=ctx,
+                        steps=steps,
+                        execution_result=execution_result,
+                        debug=debug,
+                        only=only,
+                        skip=skip,
+                        continue_on_error=continue_on_error,
+                        step_timeout=step_timeout or self.default_timeout,
+                        max_retries=max_retries,
+                        retry_delay=retry_delay
+                    )
                 
                 # Finalize execution result
                 execution_result.end_time = time.time()  # Record completion time
@@ -368,6 +659,12 @@ class EnhancedRecipeRunner:
         self._is_cancelled.set()  # Signal cancellation request
         self.logger.info("Recipe execution cancellation requested")
         
+        # Ask running steps to stop cooperatively
+        with self._tokens_lock:
+            active_tokens = list(self._active_tokens)
+        for token in active_tokens:
+            token.cancel("recipe execution cancelled")
+        
         # Update current execution status if available
         if self._current_execution:
             self._current_execution.status = RecipeExecutionStatus.CANCELLED  # Mark as cancelled
@@ -396,6 +693,10 @@ class EnhancedRecipeRunner:
             "current_execution_active": self._current_execution is not None,  # Active status
             "cancellation_requested": self.is_execution_cancelled(), # Cancellation status
             "default_timeout": self.default_timeout,                 # Configuration
+            "max_parallel_steps": self.max_parallel_steps,           # Parallel worker default
+            "executor_type": self.executor_type,                     # Parallel pool type
+            "timeout_isolation": self.timeout_isolation,             # Timeout supervision
+            "abandoned_steps": self._abandoned_steps,                # Timed-out threads left running
             "runner_instance_id": id(self)                          # Instance identification
         }
     
@@ -416,12 +717,184 @@ class EnhancedRecipeRunner:
         
         return [result.to_dict() for result in history]  # Convert to dictionaries
     
-    def _load_recipe(self, recipe_path: str) -> Dict[str, Any]:
+    @staticmethod
+    def clear_plan_cache() -> None:
+        """Discard all in-process recipe plans and resolved scriptlet classes."""
+        with _cache_lock:
+            _recipe_plan_cache.clear()
+            _scriptlet_class_cache.clear()
+    
+    def _get_recipe_plan(
+        self,
+        recipe_path: str,
+        only: Optional[List[str]] = None,
+        skip: Optional[List[str]] = None
+    ) -> RecipePlan:
+        """
+        Return the execution plan for a recipe, building it on a cache miss.
+        
+        Scriptlet classes are resolved for the steps selected by only and
+        skip that earlier runs of the plan have not resolved yet.
+        
+        With a plan_cache configured, a plan stored by an earlier process is
+        used as long as the recipe's modification time and size (or, failing
+        that, its content hash) are unchanged. Otherwise the recipe file is
+        read so edits are picked up, but parsing, validation and scriptlet
+        class resolution only happen when its content hash has not been seen
+        before in this process.
+        
+        Args:
+            recipe_path: Path to recipe file
+            only: Steps to include (None includes every step)
+            skip: Steps to skip
+            
+        Returns:
+            RecipePlan: Validated plan for the recipe
+        """
+        recipe_stat = os.stat(recipe_path)  # Stamp taken before reading for the plan cache
+        if self.plan_cache is not None:
+            cached = self.plan_cache.load("runner", recipe_path)
+            if cached is not None:
+                _, payload = cached
+                payload["recipe_path"] = str(recipe_path)
+                plan = RecipePlan(**payload)
+                self.logger.debug(f"Using persisted plan for recipe: {recipe_path}")
+                stale_imports = self._drop_stale_imports(plan)  # Scriptlet modules edited since stored
+                if self._resolve_plan_imports(plan, only, skip) or stale_imports:
+                    self.plan_cache.store("runner", recipe_path, plan.content_hash, asdict(plan), recipe_stat)
+                return plan
+        
+        with open(recipe_path, 'rb') as recipe_file:
+            content = recipe_file.read()  # Raw bytes for hashing and parsing
+        content_hash = hash_recipe_content(content)
+        cache_key = (content_hash, str(recipe_path))
+        
+        with _cache_lock:
+            plan = _recipe_plan_cache.get(cache_key)
+            if plan is not None:
+                _recipe_plan_cache.move_to_end(cache_key)  # Mark as recently used
+        
+        if plan is not None:
+            self.logger.debug(f"Using cached plan for recipe: {recipe_path}")
+        else:
+            plan = self._build_recipe_plan(recipe_path, content, content_hash)
+            with _cache_lock:
+                _recipe_plan_cache[cache_key] = plan
+                while len(_recipe_plan_cache) > RECIPE_PLAN_CACHE_SIZE:
+                    _recipe_plan_cache.popitem(last=False)  # Evict least recently used plan
+        
+        self._resolve_plan_imports(plan, only, skip)
+        if self.plan_cache is not None:
+            self.plan_cache.store("runner", recipe_path, content_hash, asdict(plan), recipe_stat)
+        
+        return plan
+    
+    def _build_recipe_plan(self, recipe_path: str, content: bytes, content_hash: str) -> RecipePlan:
+        """
+        Parse and validate a recipe into an execution plan.
+        
+        Args:
+            recipe_path: Path to recipe file
+            content: Raw recipe file content
+            content_hash: Hash of the content
+            
+        Returns:
+            RecipePlan: Validated plan for the recipe
+        """
+        recipe_data = self._load_recipe(recipe_path, content=content)  # Load recipe with validation
+        steps = self._validate_recipe_structure(recipe_data, recipe_path)  # Validate structure
+        plan = RecipePlan(
+            recipe_path=str(recipe_path),
+            content_hash=content_hash,
+            recipe_data=recipe_data,
+            steps=steps
+        )
+        
+        # Validate the dependency graph once for parallel execution
+        step_names = [step.get("name", f"step_{step_index}") for step_index, step in enumerate(steps)]
+        try:
+            plan.dependencies = self._build_step_dependencies(steps, step_names)
+        except ValueError as dependency_error:
+            plan.dependency_error = str(dependency_error)  # Raised if run in parallel mode
+        
+        return plan
+    
+    def _resolve_plan_imports(
+        self,
+        plan: RecipePlan,
+        only: Optional[List[str]],
+        skip: Optional[List[str]]
+    ) -> bool:
+        """
+        Pre-resolve scriptlet classes so step dispatch is a dictionary lookup.
+        
+        Only steps selected by only and skip are resolved, so filtered runs
+        never import the modules of steps they do not execute.
+        
+        Args:
+            plan: Plan whose import results are updated
+            only: Steps to include (None includes every step)
+            skip: Steps to skip
+            
+        Returns:
+            bool: True if new import results were recorded
+        """
+        changed = False
+        for step_index, step in enumerate(plan.steps):
+            step_name = step.get("name", f"step_{step_index}")
+            if not _is_step_selected(step_name, only, skip):
+                continue  # Filtered out of this run
+            import_key = f"{step['module']}.{step['function']}"
+            if import_key not in plan.import_results:
+                try:
+                    _resolve_scriptlet_class(step["module"], step["function"])
+                    plan.import_results[import_key] = True
+                except Exception:
+                    plan.import_results[import_key] = False
+                plan.module_stamps[import_key] = _module_stamp(step["module"])
+                changed = True
+            if not plan.import_results[import_key] and step_name not in plan.unresolved_steps:
+                plan.unresolved_steps.append(step_name)  # Warned about when execution starts
+                changed = True
+        return changed
+    
+    def _drop_stale_imports(self, plan: RecipePlan) -> bool:
+        """
+        Forget import results whose scriptlet module changed since they were recorded.
+        
+        Args:
+            plan: Persisted plan whose import results are checked
+            
+        Returns:
+            bool: True if any import result was dropped
+        """
+        stale_keys = {
+            import_key for import_key in plan.import_results
+            if import_key not in plan.module_stamps
+            or plan.module_stamps[import_key] != _module_stamp(import_key.rpartition(".")[0])
+        }
+        if not stale_keys:
+            return False
+        
+        for import_key in stale_keys:
+            del plan.import_results[import_key]
+            plan.module_stamps.pop(import_key, None)
+        stale_steps = {
+            step.get("name", f"step_{step_index}") for step_index, step in enumerate(plan.steps)
+            if f"{step['module']}.{step['function']}" in stale_keys
+        }
+        plan.unresolved_steps = [
+            step_name for step_name in plan.unresolved_steps if step_name not in stale_steps
+        ]  # Re-resolved for the steps the run selects
+        return True
+    
+    def _load_recipe(self, recipe_path: str, content: Optional[bytes] = None) -> Dict[str, Any]:
         """
         Load and parse recipe YAML file with comprehensive error handling.
         
         Args:
             recipe_path: Path to recipe file to load
+            content: Already read file content (read from recipe_path if None)
             
         Returns:
             Dict[str, Any]: Parsed recipe data
@@ -431,8 +904,11 @@ class EnhancedRecipeRunner:
             ValueError: If recipe content is invalid
         """
         try:
-            with open(recipe_path, 'r', encoding='utf-8') as recipe_file:  # Open with explicit encoding
-                recipe_data = yaml.safe_load(recipe_file)  # Parse YAML content
+            if content is not None:
+                recipe_data = yaml.safe_load(content)  # Parse YAML content
+            else:
+                with open(recipe_path, 'r', encoding='utf-8') as recipe_file:  # Open with explicit encoding
+                    recipe_data = yaml.safe_load(recipe_file)  # Parse YAML content
                 
             if not isinstance(recipe_data, dict):
                 raise ValueError(f"Recipe file must contain a YAML dictionary, got {type(recipe_data).__name__}")
@@ -608,194 +1084,522 @@ class EnhancedRecipeRunner:
         
         return successful_steps  # Return count of successful steps
     
-    def _execute_single_step(
+    def _execute_recipe_steps_parallel(
         self,
         ctx: Context,
-        step: Dict[str, Any],
-        step_index: int,
+        steps: List[Dict[str, Any]],
+        execution_result: RecipeExecutionResult,
         debug: bool,
+        only: Optional[List[str]],
+        skip: Optional[List[str]],
+        continue_on_error: bool,
         step_timeout: Optional[float],
         max_retries: int,
-        retry_delay: float
-    ) -> StepExecutionResult:
+        retry_delay: float,
+        max_parallel_steps: Optional[int] = None,
+        plan: Optional[RecipePlan] = None
+    ) -> int:
         """
-        Execute a single recipe step with comprehensive error handling and retry logic.
+        Execute recipe steps concurrently following their dependency graph.
+        
+        Steps are submitted to a thread or process pool as soon as every step
+        listed in their 'depends_on' has completed, so total wall time follows
+        the critical path of the recipe rather than the sum of step durations.
+        Steps may declare a 'resource_class' whose concurrency is bounded by
+        the runner's resource_limits. With the asyncio executor, steps are
+        coroutines awaited concurrently on a single event loop.
         
         Args:
             ctx: Context for step execution
-            step: Step configuration dictionary
-            step_index: Index of step in recipe
+            steps: List of validated steps to execute
+            execution_result: Result tracking for recipe execution
             debug: Enable debug logging
-            step_timeout: Timeout for step execution
+            only: Steps to include (others skipped)
+            skip: Steps to skip
+            continue_on_error: Continue after failures
+            step_timeout: Timeout for individual steps
             max_retries: Maximum retry attempts
             retry_delay: Delay between retries
+            max_parallel_steps: Worker count (runner default or CPU count if None)
+            plan: Recipe plan whose precomputed dependency map is reused if given
             
         Returns:
-            StepExecutionResult: Comprehensive result of step execution
+            int: Number of successfully executed steps
+            
+        Raises:
+            ValueError: If the dependency graph is invalid
         """
-        step_name = step.get("name", f"step_{step_index}")  # Get step name
-        module_name = step.get("module", "")  # Get module name
-        class_name = step.get("function", "")  # Get class name
+        step_names = [step.get("name", f"step_{step_index}") for step_index, step in enumerate(steps)]
+        if plan is not None and plan.dependency_error is not None:
+            raise ValueError(plan.dependency_error)  # Graph was rejected when the plan was built
+        if plan is not None and plan.dependencies is not None:
+            dependencies = plan.dependencies  # Validated when the plan was built
+        else:
+            dependencies = self._build_step_dependencies(steps, step_names)  # Validated dependency map
         
-        # Initialize step result tracking
-        step_result = StepExecutionResult(
-            step_name=step_name,               # Step identification
-            step_index=step_index,             # Step order
-            module_name=module_name,           # Module path
-            class_name=class_name,             # Class name
-            status=ScriptletState.INITIALIZED,    # Initial status
-            exit_code=1,                       # Default to error
-            execution_time_seconds=0.0,        # Will be calculated
-            start_time=time.time(),            # Record start time
-            end_time=0.0                       # Will be set on completion
-        )
+        worker_count = max_parallel_steps if max_parallel_steps is not None else self.max_parallel_steps
+        if worker_count is None:
+            worker_count = DEFAULT_ASYNC_MAX_PARALLEL_STEPS if self.executor_type == "asyncio" else (os.cpu_count() or 4)
+        if worker_count < 1:
+            raise ValueError("max_parallel_steps must be at least 1")
         
-        try:
-            # Validate step configuration
-            if not module_name or not class_name:
-                error_msg = f"Step '{step_name}' missing required 'module' or 'function' field"
-                step_result.errors.append(error_msg)  # Record configuration error
-                step_result.status = ScriptletState.FAILED  # Mark as failed
-                return step_result  # Return early with failure
-            
-            # Attempt step execution with retry logic
-            for attempt in range(max_retries + 1):  # Include initial attempt plus retries
-                if attempt > 0:  # This is a retry attempt
-                    self.logger.info(f"Retrying step '{step_name}' (attempt {attempt + 1}/{max_retries + 1})")
-                    time.sleep(retry_delay)  # Wait before retry
+        # Reverse edges and outstanding dependency counts for ready detection
+        dependents: Dict[str, List[str]] = {name: [] for name in step_names}
+        for step_name, step_deps in dependencies.items():
+            for dep in step_deps:
+                dependents[dep].append(step_name)
+        pending_dependencies = {name: len(step_deps) for name, step_deps in dependencies.items()}
+        step_positions = {name: step_index for step_index, name in enumerate(step_names)}
+        
+        ready = deque(name for name in step_names if pending_dependencies[name] == 0)  # Steps free to run
+        in_flight: Dict[Future, str] = {}  # Running step futures by step name
+        class_in_flight: Dict[str, int] = {}  # Running step counts per resource class
+        handled: Set[str] = set()  # Steps that were run or skipped
+        successful_steps = 0  # Counter for successful step executions
+        stop_scheduling = False  # Set on cancellation or unrecoverable failure
+        
+        def release_dependents(step_name: str) -> None:
+            """Mark a step as satisfied and queue dependents that became ready."""
+            for dependent in dependents[step_name]:
+                pending_dependencies[dependent] -= 1
+                if pending_dependencies[dependent] == 0:
+                    ready.append(dependent)  # All dependencies satisfied
+        
+        execution_result.execution_metadata.update({
+            "execution_mode": "parallel",         # Scheduling mode
+            "executor_type": self.executor_type,  # Pool type
+            "max_parallel_steps": worker_count    # Effective worker count
+        })
+        
+        self.logger.info(f"Executing {len(steps)} steps in parallel with {worker_count} {self.executor_type} workers")
+        
+        with self._create_step_executor(worker_count) as executor:
+            while ready or in_flight:
+                # Check for cancellation before scheduling more work
+                if not stop_scheduling and self.is_execution_cancelled():
+                    self.logger.info("Execution cancelled, no further steps will be scheduled")
+                    stop_scheduling = True
                 
-                # Execute step attempt
-                attempt_successful = self._attempt_step_execution(
-                    ctx=ctx,
-                    step=step,
-                    step_result=step_result,
-                    debug=debug,
-                    step_timeout=step_timeout
-                )
+                # Launch every ready step that fits within its resource class limit
+                deferred: List[str] = []
+                while ready and not stop_scheduling and len(in_flight) < worker_count:
+                    step_name = ready.popleft()
+                    step = steps[step_positions[step_name]]
+                    
+                    # Apply runtime filters; filtered steps still satisfy their dependents
+                    if (only is not None and step_name not in only) or (skip is not None and step_name in skip):
+                        self.logger.debug(f"Skipping step '{step_name}' (filtered)")
+                        execution_result.skipped_steps += 1  # Increment skipped counter
+                        handled.add(step_name)
+                        release_dependents(step_name)
+                        continue
+                    
+                    resource_class = step.get("resource_class", DEFAULT_RESOURCE_CLASS)
+                    class_limit = self.resource_limits.get(resource_class)
+                    if class_limit is not None and class_in_flight.get(resource_class, 0) >= class_limit:
+                        deferred.append(step_name)  # Wait for a slot in this resource class
+                        continue
+                    
+                    future = self._submit_step(
+                        executor=executor,
+                        ctx=ctx,
+                        step=step,
+                        step_index=step_positions[step_name],
+                        debug=debug,
+                        step_timeout=step_timeout,
+                        max_retries=max_retries,
+                        retry_delay=retry_delay
+                    )
+                    in_flight[future] = step_name
+                    class_in_flight[resource_class] = class_in_flight.get(resource_class, 0) + 1
+                    handled.add(step_name)
+                    self.logger.debug(f"Scheduled step '{step_name}' (resource class: {resource_class})")
                 
-                if attempt_successful:
-                    break  # Exit retry loop on success
+                ready.extendleft(reversed(deferred))  # Keep deferred steps at the front
                 
-                # Log retry information if more attempts available
-                if attempt < max_retries:
-                    self.logger.warning(f"Step '{step_name}' failed, will retry in {retry_delay}s")
-            
-        except Exception as unexpected_error:
-            # Handle unexpected errors during step execution
-            error_message = f"Unexpected error in step '{step_name}': {unexpected_error}"
-            step_result.errors.append(error_message)  # Record unexpected error
-            step_result.status = ScriptletState.FAILED  # Mark as failed
-            self.logger.error(error_message)
-            
-            # Log full traceback for debugging
-            if debug or os.getenv("DEBUG") == "1":
-                traceback_info = traceback.format_exc()  # Get full traceback
-                self.logger.debug(f"Step execution traceback: {traceback_info}")
+                if not in_flight:
+                    break  # Nothing running and nothing schedulable
+                
+                # Wait for at least one running step to finish
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    step_name = in_flight.pop(future)
+                    step = steps[step_positions[step_name]]
+                    resource_class = step.get("resource_class", DEFAULT_RESOURCE_CLASS)
+                    class_in_flight[resource_class] -= 1
+                    
+                    step_result = self._collect_step_result(future, ctx, step, step_positions[step_name])
+                    execution_result.add_step_result(step_result)  # Track step result
+                    
+                    if step_result.success:
+                        successful_steps += 1  # Increment success counter
+                        self.logger.info(f"Step '{step_name}' completed successfully ({step_result.execution_time_seconds:.3f}s)")
+                        release_dependents(step_name)
+                    else:
+                        self.logger.error(f"Step '{step_name}' failed: {step_result.errors}")
+                        
+                        if not continue_on_error:
+                            self.logger.error(f"Stopping scheduling due to step failure: {step_name}")
+                            stop_scheduling = True  # Let in-flight steps drain
         
-        finally:
-            # Finalize step result timing and status
-            step_result.end_time = time.time()  # Record completion time
-            step_result.execution_time_seconds = step_result.end_time - step_result.start_time  # Calculate duration
-            
-            # Ensure status is set appropriately
-            if step_result.status == ScriptletState.INITIALIZED:
-                step_result.status = ScriptletState.FAILED  # Default to failed if still pending
+        # Steps downstream of a failed step can never run when continuing on error
+        if continue_on_error and not self.is_execution_cancelled():
+            blocked_steps = [name for name in step_names if name not in handled]
+            if blocked_steps:
+                execution_result.skipped_steps += len(blocked_steps)  # Count as skipped
+                execution_result.add_global_warning(
+                    f"Skipped steps with failed dependencies: {', '.join(blocked_steps)}"
+                )
         
-        return step_result  # Return comprehensive step result
+        return successful_steps  # Return count of successful steps
     
-    def _attempt_step_execution(
+    def _build_step_dependencies(
         self,
-        ctx: Context,
-        step: Dict[str, Any],
-        step_result: StepExecutionResult,
-        debug: bool,
-        step_timeout: Optional[float]
-    ) -> bool:
+        steps: List[Dict[str, Any]],
+        step_names: List[str]
+    ) -> Dict[str, List[str]]:
         """
-        Attempt execution of a single step with framework integration.
+        Build and validate the step dependency map from 'depends_on' fields.
         
         Args:
-            ctx: Context for step execution
-            step: Step configuration
-            step_result: Result tracking object
-            debug: Enable debug logging
-            step_timeout: Timeout for execution
+            steps: List of validated steps
+            step_names: Resolved name for each step
+            
+        Returns:
+            Dict[str, List[str]]: Dependencies by step name, in topological order
+            
+        Raises:
+            ValueError: If names are duplicated, dependencies are missing or cyclic
+        """
+        if len(set(step_names)) != len(step_names):
+            duplicates = sorted({name for name in step_names if step_names.count(name) > 1})
+            raise ValueError(f"Parallel execution requires unique step names, duplicates: {duplicates}")
+        
+        known_steps = set(step_names)  # Fast membership checks
+        dependencies: Dict[str, List[str]] = {}
+        for step_name, step in zip(step_names, steps):
+            step_deps = step.get("depends_on", []) or []
+            if isinstance(step_deps, str):
+                step_deps = [step_deps]  # Allow single dependency shorthand
+            if not isinstance(step_deps, list):
+                raise ValueError(f"Step '{step_name}' 'depends_on' must be a list")
+            
+            for dep in step_deps:
+                if dep not in known_steps:
+                    raise ValueError(f"Step '{step_name}' depends on non-existent step '{dep}'")
+            dependencies[step_name] = list(dict.fromkeys(step_deps))  # Drop duplicate entries
+        
+        # Detect cycles with Kahn's algorithm
+        pending = {name: len(step_deps) for name, step_deps in dependencies.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in step_names}
+        for step_name, step_deps in dependencies.items():
+            for dep in step_deps:
+                dependents[dep].append(step_name)
+        
+        queue = deque(name for name, count in pending.items() if count == 0)
+        topological_order: List[str] = []  # Steps in an order satisfying all dependencies
+        while queue:
+            step_name = queue.popleft()
+            topological_order.append(step_name)
+            for dependent in dependents[step_name]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    queue.append(dependent)
+        
+        if len(topological_order) != len(step_names):
+            cyclic_steps = sorted(name for name, count in pending.items() if count > 0)
+            raise ValueError(f"Circular step dependencies detected involving: {cyclic_steps}")
+        
+        return {name: dependencies[name] for name in topological_order}  # Validated dependency map
+    
+    def _create_step_executor(self, worker_count: int) -> Union[ThreadPoolExecutor, ProcessPoolExecutor, _AsyncStepExecutor]:
+        """
+        Create the step pool for the configured executor type.
+        
+        Args:
+            worker_count: Maximum number of steps executing at once
+            
+        Returns:
+            Union[ThreadPoolExecutor, ProcessPoolExecutor, _AsyncStepExecutor]: Step pool
+        """
+        if self.executor_type == "asyncio":
+            return _AsyncStepExecutor(bridge_workers=self.async_bridge_workers)
+        if self.executor_type == "process":
+            return ProcessPoolExecutor(max_workers=worker_count)
+        return ThreadPoolExecutor(max_workers=worker_count)
+    
+    def _submit_step(
+        self,
+        executor: Union[ThreadPoolExecutor, ProcessPoolExecutor, _AsyncStepExecutor],
+        ctx: Context,
+        step: Dict[str, Any],
+        step_index: int,
+        debug: bool,
+        step_timeout: Optional[float],
+        max_retries: int,
+        retry_delay: float
+    ) -> Future:
+        """
+        Submit a single step to the parallel execution pool.
+        
+        Thread workers and asyncio steps share the live context. Process
+        workers receive a snapshot of the context and return the keys they
+        changed, which are merged back when the step result is collected.
+        
+        Returns:
+            Future: Pending step execution
+        """
+        if self.executor_type == "asyncio":
+            return executor.submit(
+                self._execute_single_step_async,
+                ctx=ctx,
+                step=step,
+                step_index=step_index,
+                debug=debug,
+                step_timeout=step_timeout,
+                max_retries=max_retries,
+                retry_delay=retry_delay
+            )
+        
+        if self.executor_type == "process":
+            return executor.submit(
+                _execute_step_in_worker_process,
+                step,
+                step_index,
+                ctx.to_dict(),  # Snapshot including outputs of completed dependencies
+                debug,
+                step_timeout,
+                max_retries,
+                retry_delay
+            )
+        
+        return executor.submit(
+            self._execute_single_step,
+            ctx=ctx,
+            step=step,
+            step_index=step_index,
+            debug=debug,
+            step_timeout=step_timeout,
+            max_retries=max_retries,
+            retry_delay=retry_delay
+        )
+    
+    def _collect_step_result(
+        self,
+        future: Future,
+        ctx: Context,
+        step: Dict[str, Any],
+        step_index: int
+    ) -> StepExecutionResult:
+        """
+        Collect a finished step future into a step result.
+        
+        Args:
+            future: Completed step future
+            ctx: Context receiving process worker changes
+            step: Step configuration
+            step_index: Index of step in recipe
+            
+        Returns:
+            StepExecutionResult: Result of the step execution
+        """
+        step_name = step.get("name", f"step_{step_index}")
+        
+        try:
+            outcome = future.result()
+        except Exception as worker_error:
+            # Worker crashed or the step could not be transferred to it
+            now = time.time()
+            step_result = StepExecutionResult(
+                step_name=step_name,
+                step_index=step_index,
+                module_name=step.get("module", ""),
+                class_name=step.get("function", ""),
+                status=ScriptletState.FAILED,
+                exit_code=1,
+                execution_time_seconds=0.0,
+                start_time=now,
+                end_time=now
+            )
+            step_result.errors.append(f"Step worker failed: {worker_error}")
+            return step_result
+        
+        if self.executor_type != "process":
+            return outcome  # Thread workers already wrote to the shared context
+        
+        step_result, context_changes = outcome
+        for key, value in context_changes.items():
+            ctx.set(key, value, who=step_name)  # Merge process worker changes
+        return step_result
+    
+    def _execute_single_step(
+        self,
+        ctx: Context,
+        step: Dict[str, Any],
+        step_index: int,
+        debug: bool,
+        step_timeout: Optional[float],
+        max_retries: int,
+        retry_delay: float
+    ) -> StepExecutionResult:
+        """
+        Execute a single recipe step with comprehensive error handling and retry logic.
+        
+        Args:
+            ctx: Context for step execution
+            step: Step configuration dictionary
+            step_index: Index of step in recipe
+            debug: Enable debug logging
+            step_timeout: Timeout for step execution
+            max_retries: Maximum retry attempts
+            retry_delay: Delay between retries
+            
+        Returns:
+            StepExecutionResult: Comprehensive result of step execution
+        """
+        step_name = step.get("name", f"step_{step_index}")  # Get step name
+        module_name = step.get("module", "")  # Get module name
+        class_name = step.get("function", "")  # Get class name
+        
+        # Initialize step result tracking
+        step_result = StepExecutionResult(
+            step_name=step_name,               # Step identification
+            step_index=step_index,             # Step order
+            module_name=module_name,           # Module path
+            class_name=class_name,             # Class name
+            status=ScriptletState.INITIALIZED,    # Initial status
+            exit_code=1,                       # Default to error
+            execution_time_seconds=0.0,        # Will be calculated
+            start_time=time.time(),            # Record start time
+            end_time=0.0                       # Will be set on completion
+        )
+        
+        try:
+            # Validate step configuration
+            if not module_name or not class_name:
+                error_msg = f"Step '{step_name}' missing required 'module' or 'function' field"
+                step_result.errors.append(error_msg)  # Record configuration error
+                step_result.status = ScriptletState.FAILED  # Mark as failed
+                return step_result  # Return early with failure
+            
+            # Attempt step execution with retry logic
+            for attempt in range(max_retries + 1):  # Include initial attempt plus retries
+                if attempt > 0:  # This is a retry attempt
+                    self.logger.info(f"Retrying step '{step_name}' (attempt {attempt + 1}/{max_retries + 1})")
+                    time.sleep(retry_delay)  # Wait before retry
+                
+                # Execute step attempt
+                attempt_successful = self._attempt_step_execution(
+                    ctx=ctx,
+                    step=step,
+                    step_result=step_result,
+                    debug=debug,
+                    step_timeout=step_timeout
+                )
+                
+                if attempt_successful:
+                    break  # Exit retry loop on success
+                
+                # Log retry information if more attempts available
+                if attempt < max_retries:
+                    self.logger.warning(f"Step '{step_name}' failed, will retry in {retry_delay}s")
+            
+        except Exception as unexpected_error:
+            # Handle unexpected errors during step execution
+            error_message = f"Unexpected error in step '{step_name}': {unexpected_error}"
+            step_result.errors.append(error_message)  # Record unexpected error
+            step_result.status = ScriptletState.FAILED  # Mark as failed
+            self.logger.error(error_message)
+            
+            # Log full traceback for debugging
+            if debug or os.getenv("DEBUG") == "1":
+                traceback_info = traceback.format_exc()  # Get full traceback
+                self.logger.debug(f"Step execution traceback: {traceback_info}")
+        
+        finally:
+            # Finalize step result timing and status
+            step_result.end_time = time.time()  # Record completion time
+            step_result.execution_time_seconds = step_result.end_time - step_result.start_time  # Calculate duration
+            
+            # Ensure status is set appropriately
+            if step_result.status == ScriptletState.INITIALIZED:
+                step_result.status = ScriptletState.FAILED  # Default to failed if still pending
+        
+        return step_result  # Return comprehensive step result
+    
+    def _attempt_step_execution(
+        self,
+        ctx: Context,
+        step: Dict[str, Any],
+        step_result: StepExecutionResult,
+        debug: bool,
+        step_timeout: Optional[float]
+    ) -> bool:
+        """
+        Attempt execution of a single step with framework integration.
+        
+        Without a timeout the scriptlet runs inline. With a timeout it runs on
+        a supervised worker thread, or in a subprocess when timeout_isolation
+        is 'process', so a hung step cannot block the runner. Either way the
+        scriptlet receives a cancellation token that is cancelled on timeout
+        or when the recipe is cancelled.
+        
+        Args:
+            ctx: Context for step execution
+            step: Step configuration
+            step_result: Result tracking object
+            debug: Enable debug logging
+            step_timeout: Timeout for execution (no timeout if None)
             
         Returns:
             bool: True if execution was successful, False otherwise
         """
+        if step_timeout is not None and self.timeout_isolation == "process":
+            return self._attempt_step_in_subprocess(ctx, step, step_result, debug, step_timeout)
+        
+        scriptlet = None  # Scriptlet instance for this attempt
+        token = self._register_token()  # Cancellation signal for this attempt
+        
         try:
             # Load scriptlet module and class
             if debug:
                 self.logger.debug(f"Loading {step_result.module_name}.{step_result.class_name}")
             
-            module = importlib.import_module(step_result.module_name)  # Dynamic module import
-            scriptlet_class = getattr(module, step_result.class_name)  # Get class reference
+            scriptlet_class, is_framework_scriptlet = _resolve_scriptlet_class(
+                step_result.module_name, step_result.class_name
+            )  # Cached after first resolution
             
-            # Create scriptlet instance
-            scriptlet = scriptlet_class()  # Instantiate scriptlet
+            # Create or reuse scriptlet instance
+            scriptlet = self._acquire_scriptlet(scriptlet_class)
             
-            # Prepare execution parameters
+            # Prepare execution parameters; copied so cached plans stay pristine
             params = step.get("args", {})  # Extract step arguments
+            if params:
+                params = copy.deepcopy(params)
             
             if debug:
                 self.logger.debug(f"Executing step '{step_result.step_name}' with params: {json.dumps(params, default=str)}")
             
+            _attach_cancellation_token(scriptlet, token)
+            
             # Execute using unified framework or legacy interface
-            if hasattr(scriptlet_class, '__bases__') and any(
-                hasattr(base, '__name__') and 'BaseScriptlet' in base.__name__ 
-                for base in scriptlet_class.__mro__
-            ):
+            if is_framework_scriptlet:
                 # Use new unified framework execution
-                scriptlet_result = scriptlet.execute(ctx, params)  # Framework execution
-                
-                # Process framework result
-                step_result.exit_code = scriptlet_result.exit_code  # Set exit code
-                # Map success to status
-                if scriptlet_result.success:
-                    step_result.status = ScriptletState.COMPLETED  # Mark as successful
-                else:
-                    step_result.status = ScriptletState.FAILED     # Mark as failed
-                
-                # Track created outputs from context changes
-                if hasattr(scriptlet_result, 'context_changes'):
-                    step_result.outputs_created.extend(scriptlet_result.context_changes)
-                
-                # Handle errors if any
-                if scriptlet_result.error_details:
-                    step_result.errors.append(scriptlet_result.error_details)
-                
-                # Handle validation errors
-                if hasattr(scriptlet_result, 'validation_errors'):
-                    step_result.errors.extend(scriptlet_result.validation_errors)
-                
-                # Add framework metrics to metadata
-                if hasattr(scriptlet_result, 'metrics') and scriptlet_result.metrics:
-                    step_result.metadata.update({
-                        "framework_metrics": scriptlet_result.metrics.to_dict(),  # Framework metrics
-                        "framework_version": "2.0"  # Framework version
-                    })
+                scriptlet_result = self._call_with_timeout(
+                    scriptlet.execute, ctx, params, token, step_timeout, step_result.step_name
+                )  # Framework execution
+                self._record_framework_result(step_result, scriptlet_result)
                 
             else:
                 # Use legacy scriptlet interface for backward compatibility
                 self.logger.debug(f"Using legacy interface for step '{step_result.step_name}'")
                 
                 # Execute legacy run method
-                exit_code = scriptlet.run(ctx, params)  # Legacy execution
-                
-                # Process legacy result
-                step_result.exit_code = exit_code  # Set exit code
-                if exit_code == 0:
-                    step_result.status = ScriptletState.COMPLETED  # Mark as successful
-                else:
-                    step_result.status = ScriptletState.FAILED   # Mark as failed
-                    step_result.errors.append(f"Legacy scriptlet returned exit code: {exit_code}")
-                
-                # Add legacy execution metadata
-                step_result.metadata.update({
-                    "execution_method": "legacy",  # Execution method
-                    "legacy_exit_code": exit_code  # Legacy exit code
-                })
+                exit_code = self._call_with_timeout(
+                    scriptlet.run, ctx, params, token, step_timeout, step_result.step_name
+                )  # Legacy execution
+                self._record_legacy_result(step_result, exit_code)
             
             # Check execution success
             if step_result.exit_code == 0 and step_result.status == ScriptletState.COMPLETED:
@@ -803,6 +1607,19 @@ class EnhancedRecipeRunner:
             else:
                 return False  # Failed execution
             
+        except (StepTimeoutError, StepCancelledError) as interruption:
+            # Step overran its timeout or the recipe was cancelled
+            if getattr(interruption, "abandoned", False):
+                scriptlet = None  # Still in use by the abandoned thread
+            error_message = (
+                str(interruption) if isinstance(interruption, StepTimeoutError)
+                else f"Step cancelled: {interruption}"
+            )
+            step_result.errors.append(error_message)  # Record interruption
+            step_result.status = ScriptletState.FAILED  # Mark as failed
+            self.logger.error(f"Step '{step_result.step_name}': {error_message}")
+            return False  # Failed execution
+        
         except ImportError as import_error:
             # Handle module/class import failures
             error_message = f"Failed to import scriptlet: {import_error}"
@@ -826,6 +1643,465 @@ class EnhancedRecipeRunner:
             step_result.status = ScriptletState.FAILED  # Mark as failed
             self.logger.error(error_message)
             return False  # Failed execution
+        
+        finally:
+            self._unregister_token(token)
+            if scriptlet is not None:
+                self._release_scriptlet(scriptlet)  # Return instance to the pool
+    
+    def _register_token(self) -> CancellationToken:
+        """
+        Create and track a cancellation token for a step attempt.
+        
+        Returns:
+            CancellationToken: Token, already cancelled if the recipe is
+        """
+        token = CancellationToken()
+        with self._tokens_lock:
+            self._active_tokens.add(token)
+        if self.is_execution_cancelled():
+            token.cancel("recipe execution cancelled")
+        return token
+    
+    def _unregister_token(self, token: CancellationToken) -> None:
+        """
+        Stop tracking a finished step attempt's cancellation token.
+        
+        Args:
+            token: Token registered for the attempt
+        """
+        with self._tokens_lock:
+            self._active_tokens.discard(token)
+    
+    def _call_with_timeout(
+        self,
+        function: Any,
+        ctx: Context,
+        params: Dict[str, Any],
+        token: CancellationToken,
+        step_timeout: Optional[float],
+        step_name: str
+    ) -> Any:
+        """
+        Call a scriptlet entry point, supervising it when a timeout applies.
+        
+        The call runs on a daemon worker thread while this thread waits for
+        completion, the timeout or cancellation. On expiry or cancellation
+        the token is cancelled and the step gets cancel_grace_period seconds
+        to stop; after that the worker is abandoned so the runner slot is
+        freed. Abandoned threads cannot be killed and may keep running.
+        
+        Args:
+            function: Scriptlet execute or run method
+            ctx: Context for step execution
+            params: Step parameters
+            token: Cancellation token of the attempt
+            step_timeout: Timeout in seconds (called inline if None)
+            step_name: Step name for thread naming and messages
+            
+        Returns:
+            Any: Value returned by the function
+            
+        Raises:
+            StepTimeoutError: If the step did not finish within the timeout
+            StepCancelledError: If the recipe was cancelled while the step ran
+        """
+        if step_timeout is None:
+            return function(ctx, params)  # Inline call; cancellation is cooperative
+        
+        outcome: Dict[str, Any] = {}  # Return value or exception from the worker
+        finished = threading.Event()
+        
+        def supervised_call() -> None:
+            try:
+                outcome["value"] = function(ctx, params)
+            except BaseException as call_error:
+                outcome["error"] = call_error
+            finally:
+                finished.set()
+        
+        worker = threading.Thread(target=supervised_call, name=f"step-{step_name}", daemon=True)
+        worker.start()
+        
+        deadline = time.monotonic() + step_timeout
+        while not finished.wait(min(SUPERVISOR_POLL_INTERVAL, max(deadline - time.monotonic(), 0.0))):
+            if token.is_cancelled or time.monotonic() >= deadline:
+                break  # Stop waiting for normal completion
+        
+        if not finished.is_set():
+            timed_out = not token.is_cancelled
+            if timed_out:
+                token.cancel(f"timed out after {step_timeout}s")
+            
+            interruption: Exception = (
+                StepTimeoutError(f"Step timed out after {step_timeout}s") if timed_out
+                else StepCancelledError(token.reason)
+            )
+            if not finished.wait(self.cancel_grace_period):
+                interruption.abandoned = True  # Worker ignored the token
+                with self._tokens_lock:
+                    self._abandoned_steps += 1
+                self.logger.warning(f"Abandoning unresponsive worker thread for step '{step_name}'")
+            raise interruption
+        
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["value"]
+    
+    def _attempt_step_in_subprocess(
+        self,
+        ctx: Context,
+        step: Dict[str, Any],
+        step_result: StepExecutionResult,
+        debug: bool,
+        step_timeout: float
+    ) -> bool:
+        """
+        Attempt a step in a dedicated subprocess that is killed on expiry.
+        
+        The subprocess receives a context snapshot and returns its step result
+        and changed keys, which are merged into the live context. On timeout
+        or cancellation it is terminated after cancel_grace_period seconds,
+        and killed if it still does not exit.
+        
+        Args:
+            ctx: Context for step execution
+            step: Step configuration
+            step_result: Result tracking object
+            step_timeout: Timeout in seconds
+            debug: Enable debug logging
+            
+        Returns:
+            bool: True if execution was successful, False otherwise
+        """
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_attempt_step_in_child_process,
+            args=(sender, step, step_result.step_index, ctx.to_dict(), debug),
+            name=f"step-{step_result.step_name}",
+            daemon=True
+        )
+        process.start()
+        sender.close()  # Child holds the only write end
+        
+        token = self._register_token()  # Cancellation signal for this attempt
+        deadline = time.monotonic() + step_timeout
+        try:
+            while not receiver.poll(SUPERVISOR_POLL_INTERVAL):
+                if token.is_cancelled or time.monotonic() >= deadline or not process.is_alive():
+                    break  # Stop waiting for a result
+            
+            outcome = None
+            if receiver.poll(0):
+                try:
+                    outcome = receiver.recv()  # (child step result, context changes)
+                except EOFError:
+                    outcome = None  # Child exited without reporting
+            
+            if outcome is None:
+                if process.is_alive():
+                    process.terminate()  # Ask the child to exit
+                    process.join(self.cancel_grace_period)
+                    if process.is_alive():
+                        process.kill()  # Force exit
+                process.join()
+                
+                if token.is_cancelled:
+                    error_message = f"Step cancelled: {token.reason}"
+                elif time.monotonic() >= deadline:
+                    error_message = f"Step timed out after {step_timeout}s"
+                else:
+                    error_message = f"Step subprocess exited with code {process.exitcode}"
+                step_result.errors.append(error_message)  # Record interruption
+                step_result.status = ScriptletState.FAILED  # Mark as failed
+                self.logger.error(f"Step '{step_result.step_name}': {error_message}")
+                return False  # Failed execution
+            
+            process.join()
+            child_result, context_changes = outcome
+            for key, value in context_changes.items():
+                ctx.set(key, value, who=step_result.step_name)  # Merge subprocess changes
+            
+            step_result.exit_code = child_result.exit_code
+            step_result.status = child_result.status
+            step_result.outputs_created.extend(child_result.outputs_created)
+            step_result.errors.extend(child_result.errors)
+            step_result.metadata.update(child_result.metadata)
+            return step_result.exit_code == 0 and step_result.status == ScriptletState.COMPLETED
+        
+        finally:
+            self._unregister_token(token)
+            receiver.close()
+    
+    async def _execute_single_step_async(
+        self,
+        ctx: Context,
+        step: Dict[str, Any],
+        step_index: int,
+        debug: bool,
+        step_timeout: Optional[float],
+        max_retries: int,
+        retry_delay: float
+    ) -> StepExecutionResult:
+        """
+        Execute a single recipe step on the event loop with retry logic.
+        
+        Args:
+            ctx: Context for step execution
+            step: Step configuration dictionary
+            step_index: Index of step in recipe
+            debug: Enable debug logging
+            step_timeout: Timeout for each attempt, enforced with asyncio.wait_for
+            max_retries: Maximum retry attempts
+            retry_delay: Delay between retries
+            
+        Returns:
+            StepExecutionResult: Comprehensive result of step execution
+        """
+        step_name = step.get("name", f"step_{step_index}")  # Get step name
+        module_name = step.get("module", "")  # Get module name
+        class_name = step.get("function", "")  # Get class name
+        
+        # Initialize step result tracking
+        step_result = StepExecutionResult(
+            step_name=step_name,               # Step identification
+            step_index=step_index,             # Step order
+            module_name=module_name,           # Module path
+            class_name=class_name,             # Class name
+            status=ScriptletState.INITIALIZED,    # Initial status
+            exit_code=1,                       # Default to error
+            execution_time_seconds=0.0,        # Will be calculated
+            start_time=time.time(),            # Record start time
+            end_time=0.0                       # Will be set on completion
+        )
+        
+        try:
+            # Validate step configuration
+            if not module_name or not class_name:
+                error_msg = f"Step '{step_name}' missing required 'module' or 'function' field"
+                step_result.errors.append(error_msg)  # Record configuration error
+                step_result.status = ScriptletState.FAILED  # Mark as failed
+                return step_result  # Return early with failure
+            
+            # Attempt step execution with retry logic
+            for attempt in range(max_retries + 1):  # Include initial attempt plus retries
+                if attempt > 0:  # This is a retry attempt
+                    self.logger.info(f"Retrying step '{step_name}' (attempt {attempt + 1}/{max_retries + 1})")
+                    await asyncio.sleep(retry_delay)  # Wait without blocking the loop
+                
+                attempt_successful = await self._attempt_step_execution_async(
+                    ctx=ctx,
+                    step=step,
+                    step_result=step_result,
+                    debug=debug,
+                    step_timeout=step_timeout
+                )
+                
+                if attempt_successful:
+                    break  # Exit retry loop on success
+                
+                # Log retry information if more attempts available
+                if attempt < max_retries:
+                    self.logger.warning(f"Step '{step_name}' failed, will retry in {retry_delay}s")
+            
+        except Exception as unexpected_error:
+            # Handle unexpected errors during step execution
+            error_message = f"Unexpected error in step '{step_name}': {unexpected_error}"
+            step_result.errors.append(error_message)  # Record unexpected error
+            step_result.status = ScriptletState.FAILED  # Mark as failed
+            self.logger.error(error_message)
+        
+        finally:
+            # Finalize step result timing and status
+            step_result.end_time = time.time()  # Record completion time
+            step_result.execution_time_seconds = step_result.end_time - step_result.start_time  # Calculate duration
+            
+            if step_result.status == ScriptletState.INITIALIZED:
+                step_result.status = ScriptletState.FAILED  # Default to failed if still pending
+        
+        return step_result  # Return comprehensive step result
+    
+    async def _attempt_step_execution_async(
+        self,
+        ctx: Context,
+        step: Dict[str, Any],
+        step_result: StepExecutionResult,
+        debug: bool,
+        step_timeout: Optional[float]
+    ) -> bool:
+        """
+        Attempt execution of a single step on the event loop.
+        
+        AsyncBaseScriptlet steps are awaited directly. Synchronous scriptlets
+        run on the loop's bounded bridge pool so they do not block other steps.
+        
+        Args:
+            ctx: Context for step execution
+            step: Step configuration
+            step_result: Result tracking object
+            debug: Enable debug logging
+            step_timeout: Timeout for execution
+            
+        Returns:
+            bool: True if execution was successful, False otherwise
+        """
+        scriptlet = None  # Scriptlet instance for this attempt
+        bridged_done = None  # Set once bridged synchronous work has returned
+        token = self._register_token()  # Cancellation signal for this attempt
+        
+        try:
+            scriptlet_class, is_framework_scriptlet = _resolve_scriptlet_class(
+                step_result.module_name, step_result.class_name
+            )  # Cached after first resolution
+            scriptlet = self._acquire_scriptlet(scriptlet_class)
+            
+            # Prepare execution parameters; copied so cached plans stay pristine
+            params = step.get("args", {})  # Extract step arguments
+            if params:
+                params = copy.deepcopy(params)
+            
+            if debug:
+                self.logger.debug(f"Executing step '{step_result.step_name}' with params: {json.dumps(params, default=str)}")
+            
+            _attach_cancellation_token(scriptlet, token)
+            
+            loop = asyncio.get_running_loop()
+            if isinstance(scriptlet, AsyncBaseScriptlet):
+                pending = scriptlet.execute_async(ctx, params)  # Awaited on this loop
+            else:
+                bridged_done = threading.Event()
+                method = scriptlet.execute if is_framework_scriptlet else scriptlet.run  # Framework or legacy
+                pending = loop.run_in_executor(
+                    None, _run_bridged, method, ctx, params, bridged_done
+                )  # Bridged sync execution
+            
+            outcome = await asyncio.wait_for(pending, timeout=step_timeout)
+            
+            if is_framework_scriptlet:
+                self._record_framework_result(step_result, outcome)
+            else:
+                self._record_legacy_result(step_result, outcome)
+            
+            return step_result.exit_code == 0 and step_result.status == ScriptletState.COMPLETED
+        
+        except asyncio.TimeoutError:
+            token.cancel(f"timed out after {step_timeout}s")  # Stops bridged synchronous work cooperatively
+            error_message = f"Step timed out after {step_timeout}s"
+            step_result.errors.append(error_message)  # Record timeout
+            step_result.status = ScriptletState.FAILED  # Mark as failed
+            self.logger.error(f"Step '{step_result.step_name}': {error_message}")
+            return False  # Failed execution
+        
+        except ImportError as import_error:
+            error_message = f"Failed to import scriptlet: {import_error}"
+            step_result.errors.append(error_message)  # Record import error
+            step_result.status = ScriptletState.FAILED  # Mark as failed
+            self.logger.error(error_message)
+            return False  # Failed execution
+        
+        except AttributeError as attr_error:
+            error_message = f"Scriptlet class/method not found: {attr_error}"
+            step_result.errors.append(error_message)  # Record attribute error
+            step_result.status = ScriptletState.FAILED  # Mark as failed
+            self.logger.error(error_message)
+            return False  # Failed execution
+        
+        except Exception as execution_error:
+            error_message = f"Step execution failed: {execution_error}"
+            step_result.errors.append(error_message)  # Record execution error
+            step_result.status = ScriptletState.FAILED  # Mark as failed
+            self.logger.error(error_message)
+            return False  # Failed execution
+        
+        finally:
+            # Runs on cancellation too; an instance still busy on an abandoned
+            # bridge thread is dropped instead of being handed out again
+            self._unregister_token(token)
+            if scriptlet is not None and (bridged_done is None or bridged_done.is_set()):
+                self._release_scriptlet(scriptlet)  # Return instance to the pool
+    
+    def _record_framework_result(self, step_result: StepExecutionResult, scriptlet_result: ScriptletResult) -> None:
+        """
+        Copy a unified framework ScriptletResult into the step result.
+        
+        Args:
+            step_result: Result tracking object
+            scriptlet_result: Result returned by the scriptlet
+        """
+        step_result.exit_code = scriptlet_result.exit_code  # Set exit code
+        # Map success to status
+        if scriptlet_result.success:
+            step_result.status = ScriptletState.COMPLETED  # Mark as successful
+        else:
+            step_result.status = ScriptletState.FAILED     # Mark as failed
+        
+        # Track created outputs from context changes
+        if hasattr(scriptlet_result, 'context_changes'):
+            step_result.outputs_created.extend(scriptlet_result.context_changes)
+        
+        # Handle errors if any
+        if scriptlet_result.error_details:
+            step_result.errors.append(scriptlet_result.error_details)
+        
+        # Handle validation errors
+        if hasattr(scriptlet_result, 'validation_errors'):
+            step_result.errors.extend(scriptlet_result.validation_errors)
+        
+        # Add framework metrics to metadata
+        if hasattr(scriptlet_result, 'metrics') and scriptlet_result.metrics:
+            step_result.metadata.update({
+                "framework_metrics": scriptlet_result.metrics.to_dict(),  # Framework metrics
+                "framework_version": "2.0"  # Framework version
+            })
+    
+    def _record_legacy_result(self, step_result: StepExecutionResult, exit_code: int) -> None:
+        """
+        Record the exit code of a legacy scriptlet in the step result.
+        
+        Args:
+            step_result: Result tracking object
+            exit_code: Exit code returned by the legacy run method
+        """
+        step_result.exit_code = exit_code  # Set exit code
+        if exit_code == 0:
+            step_result.status = ScriptletState.COMPLETED  # Mark as successful
+        else:
+            step_result.status = ScriptletState.FAILED   # Mark as failed
+            step_result.errors.append(f"Legacy scriptlet returned exit code: {exit_code}")
+        
+        # Add legacy execution metadata
+        step_result.metadata.update({
+            "execution_method": "legacy",  # Execution method
+            "legacy_exit_code": exit_code  # Legacy exit code
+        })
+    
+    def _acquire_scriptlet(self, scriptlet_class: type) -> Any:
+        """
+        Get a scriptlet instance, reusing an idle pooled one when enabled.
+        
+        Args:
+            scriptlet_class: Class of the scriptlet to instantiate
+            
+        Returns:
+            Any: Scriptlet instance
+        """
+        if self.pool_scriptlet_instances:
+            with self._pool_lock:
+                idle_instances = self._scriptlet_pool.get(scriptlet_class)
+                if idle_instances:
+                    return idle_instances.pop()  # Reuse idle instance
+        return scriptlet_class()  # Instantiate scriptlet
+    
+    def _release_scriptlet(self, scriptlet: Any) -> None:
+        """
+        Return a scriptlet instance to the pool when pooling is enabled.
+        
+        Args:
+            scriptlet: Instance that finished executing
+        """
+        if self.pool_scriptlet_instances:
+            with self._pool_lock:
+                self._scriptlet_pool.setdefault(type(scriptlet), []).append(scriptlet)
     
     def _finalize_context(self, ctx: Context, execution_result: RecipeExecutionResult) -> None:
         """
@@ -861,6 +2137,123 @@ class EnhancedRecipeRunner:
         self.logger.debug(f"Finalized context for recipe execution: {execution_result.recipe_path}")
 
 
+def _execute_step_in_worker_process(
+    step: Dict[str, Any],
+    step_index: int,
+    context_data: Dict[str, Any],
+    debug: bool,
+    step_timeout: Optional[float],
+    max_retries: int,
+    retry_delay: float
+) -> tuple:
+    """
+    Process pool entry point that executes one step against a context snapshot.
+    
+    Args:
+        step: Step configuration
+        step_index: Index of step in recipe
+        context_data: Context snapshot taken when the step was scheduled
+        debug: Enable debug logging
+        step_timeout: Timeout for step execution
+        max_retries: Maximum retry attempts
+        retry_delay: Delay between retries
+        
+    Returns:
+        tuple: Step result and dictionary of context keys changed by the step
+    """
+    ctx = Context(enable_history=False)  # Worker-local context
+    for key, value in context_data.items():
+        ctx.set(key, value, who="snapshot")  # Restore snapshot state
+    ctx.pop_dirty_keys()  # Only report changes made by the step
+    
+    runner = EnhancedRecipeRunner()  # Worker-local runner
+    step_result = runner._execute_single_step(
+        ctx=ctx,
+        step=step,
+        step_index=step_index,
+        debug=debug,
+        step_timeout=step_timeout,
+        max_retries=max_retries,
+        retry_delay=retry_delay
+    )
+    
+    context_changes = {key: ctx.get(key) for key in ctx.pop_dirty_keys()}
+    return step_result, context_changes
+
+
+def _attach_cancellation_token(scriptlet: Any, token: CancellationToken) -> None:
+    """
+    Give a scriptlet the cancellation token of its current attempt.
+    
+    Args:
+        scriptlet: Scriptlet instance about to run
+        token: Token of the attempt
+    """
+    try:
+        scriptlet.cancellation_token = token
+    except AttributeError:
+        pass  # Legacy scriptlet without writable attributes
+
+
+def _run_bridged(method: Any, ctx: Context, params: Dict[str, Any], done: threading.Event) -> Any:
+    """
+    Run a synchronous scriptlet method on the bridge pool and signal completion.
+    
+    Args:
+        method: Bound execute() or run() method of the scriptlet
+        ctx: Context for step execution
+        params: Step parameters
+        done: Event set when the method returns or raises
+        
+    Returns:
+        Any: Return value of the method
+    """
+    try:
+        return method(ctx, params)
+    finally:
+        done.set()
+
+
+def _attempt_step_in_child_process(
+    connection: Any,
+    step: Dict[str, Any],
+    step_index: int,
+    context_data: Dict[str, Any],
+    debug: bool
+) -> None:
+    """
+    Subprocess entry point for a single supervised step attempt.
+    
+    Args:
+        connection: Pipe end receiving the step result and context changes
+        step: Step configuration
+        step_index: Index of step in recipe
+        context_data: Context snapshot taken when the attempt started
+        debug: Enable debug logging
+    """
+    ctx = Context(enable_history=False)  # Child-local context
+    for key, value in context_data.items():
+        ctx.set(key, value, who="snapshot")  # Restore snapshot state
+    ctx.pop_dirty_keys()  # Only report changes made by the step
+    
+    step_result = StepExecutionResult(
+        step_name=step.get("name", f"step_{step_index}"),
+        step_index=step_index,
+        module_name=step.get("module", ""),
+        class_name=step.get("function", ""),
+        status=ScriptletState.INITIALIZED,
+        exit_code=1,
+        execution_time_seconds=0.0,
+        start_time=time.time(),
+        end_time=0.0
+    )
+    EnhancedRecipeRunner()._attempt_step_execution(ctx, step, step_result, debug, None)
+    
+    context_changes = {key: ctx.get(key) for key in ctx.pop_dirty_keys()}
+    connection.send((step_result, context_changes))
+    connection.close()
+
+
 def run_recipe(
     recipe_path: str,
     *,
@@ -870,7 +2263,10 @@ def run_recipe(
     continue_on_error: bool = False,
     step_timeout: Optional[float] = None,
     max_retries: int = 0,
-    retry_delay: float = 1.0
+    retry_delay: float = 1.0,
+    parallel: bool = False,
+    max_parallel_steps: Optional[int] = None,
+    executor_type: str = "thread"
 ) -> Context:
     """
     Convenience function for recipe execution with enhanced capabilities.
@@ -887,6 +2283,9 @@ def run_recipe(
         step_timeout: Timeout for individual steps in seconds
         max_retries: Maximum number of retry attempts for failed steps
         retry_delay: Delay between retry attempts in seconds
+        parallel: Schedule steps by their 'depends_on' graph instead of list order
+        max_parallel_steps: Worker count for parallel mode
+        executor_type: Pool used for parallel mode ('thread', 'process' or 'asyncio')
         
     Returns:
         Context: Final context state with execution results
@@ -898,7 +2297,11 @@ def run_recipe(
         RuntimeError: If execution fails and continue_on_error is False
     """
     # Create enhanced runner instance
-    runner = EnhancedRecipeRunner(default_timeout=step_timeout)  # Create runner with configuration
+    runner = EnhancedRecipeRunner(
+        default_timeout=step_timeout,          # Step timeout
+        max_parallel_steps=max_parallel_steps,  # Parallel worker count
+        executor_type=executor_type            # Parallel pool type
+    )
     
     # Execute recipe using enhanced runner
     return runner.run_recipe(
@@ -909,7 +2312,8 @@ def run_recipe(
         continue_on_error=continue_on_error,  # Error handling
         step_timeout=step_timeout,         # Step timeout
         max_retries=max_retries,           # Retry configuration
-        retry_delay=retry_delay            # Retry delay
+        retry_delay=retry_delay,           # Retry delay
+        parallel=parallel                  # Scheduling mode
     )
 
 
@@ -932,6 +2336,8 @@ Examples:
   python runner.py --recipe recipe.yaml --only step1,step2 --continue-on-error
   python runner.py --recipe recipe.yaml --skip step3 --max-retries 3 --retry-delay 2.0
   python runner.py --recipe recipe.yaml --step-timeout 30 --json-output
+  python runner.py --recipe recipe.yaml --parallel --max-parallel-steps 8
+  python runner.py --recipe recipe.yaml --plan-cache-dir /tmp/recipe-plans
         """
     )
     
@@ -986,6 +2392,45 @@ Examples:
         help="Delay between retry attempts in seconds"
     )
     
+    # Parallel execution arguments
+    parser.add_argument(
+        "--parallel", 
+        action="store_true", 
+        help="Run steps concurrently following their depends_on graph"
+    )
+    
+    parser.add_argument(
+        "--max-parallel-steps", 
+        type=int, 
+        help="Maximum number of steps executing at once in parallel mode"
+    )
+    
+    parser.add_argument(
+        "--executor", 
+        choices=PARALLEL_EXECUTOR_TYPES, 
+        default="thread", 
+        help="Worker pool type for parallel mode"
+    )
+    
+    parser.add_argument(
+        "--timeout-isolation", 
+        choices=TIMEOUT_ISOLATION_TYPES, 
+        default="thread", 
+        help="Run steps with a timeout on an abandonable thread or a killable subprocess"
+    )
+    
+    # Plan cache arguments
+    parser.add_argument(
+        "--plan-cache-dir", 
+        help="Directory for compiled recipe plans (default: $FRAMEWORK0_RECIPE_CACHE_DIR or ~/.cache/framework0/recipes)"
+    )
+    
+    parser.add_argument(
+        "--no-plan-cache", 
+        action="store_true", 
+        help="Always parse and validate the recipe instead of using a compiled plan"
+    )
+    
     # Output control arguments
     parser.add_argument(
         "--json-output", 
@@ -1007,8 +2452,17 @@ Examples:
         only_list = args.only.split(",") if args.only else None  # Parse include filter
         skip_list = args.skip.split(",") if args.skip else None   # Parse skip filter
         
+        # Compiled plans let warm starts skip parsing and validation
+        plan_cache = None if args.no_plan_cache else RecipePlanCache(args.plan_cache_dir)
+        
         # Create enhanced runner for execution
-        runner = EnhancedRecipeRunner(default_timeout=args.step_timeout)
+        runner = EnhancedRecipeRunner(
+            default_timeout=args.step_timeout,           # Step timeout
+            max_parallel_steps=args.max_parallel_steps,  # Parallel worker count
+            executor_type=args.executor,                 # Parallel pool type
+            plan_cache=plan_cache,                       # Persistent plan cache
+            timeout_isolation=args.timeout_isolation     # Timeout supervision
+        )
         
         # Execute recipe with parsed arguments
         ctx = runner.run_recipe(
@@ -1019,7 +2473,8 @@ Examples:
             continue_on_error=args.continue_on_error,  # Error handling
             step_timeout=args.step_timeout,    # Step timeout
             max_retries=args.max_retries,      # Retry attempts
-            retry_delay=args.retry_delay       # Retry delay
+            retry_delay=args.retry_delay,      # Retry delay
+            parallel=args.parallel             # Scheduling mode
         )
         
         # Generate output based on format selection
@@ -8,8 +8,11 @@ enterprise-grade batch processing for large datasets.
 
 Features:
 - Multi-threaded and multi-process parallel execution
+- Streaming execution with bounded memory and pluggable result sinks
 - Progress tracking with checkpoint recovery mechanisms
+- Exact resume from a ledger of completed partitions
 - Memory management and resource throttling
+- Adaptive (AIMD) concurrency and partition sizing from resource feedback
 - Chunking algorithms for optimal performance
 - Foundation system integration for monitoring
 - Comprehensive error handling and retry logic
@@ -20,6 +23,7 @@ Usage:
     specifically the batch_processing.yaml template.
 """
 
+import os
 import sys
 import json
 import time
@@ -27,9 +31,24 @@ import pickle
 import threading
 import multiprocessing
 import gc
+import csv
+import itertools
+import bisect
+import gzip
+import shutil
+import random
+import sqlite3
+import importlib
+from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List, Callable
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Dict, Any, Optional, List, Callable, Tuple, Iterable, Iterator
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    Future,
+    FIRST_COMPLETED,
+    wait,
+)
 from dataclasses import dataclass, field
 from pathlib import Path
 import hashlib
@@ -169,6 +188,7 @@ class CheckpointManager:
         self.storage_format = config.get("storage_format", "pickle")
         self.compression_enabled = config.get("compression_enabled", True)
         self.encryption_enabled = config.get("encryption_enabled", False)
+        self.durable = config.get("durable", False)  # fsync the partition ledger
 
         # Create checkpoint directory
         self.checkpoint_path.mkdir(parents=True, exist_ok=True)
@@ -205,20 +225,7 @@ class CheckpointManager:
             )
 
             # Serialize checkpoint data
-            if self.storage_format == "pickle":
-                data = pickle.dumps(checkpoint_data)
-            elif self.storage_format == "json":
-                data = json.dumps(checkpoint_data.to_dict(), indent=2).encode()
-            else:
-                raise BatchProcessingError(
-                    f"Unsupported storage format: {self.storage_format}"
-                )
-
-            # Apply compression if enabled
-            if self.compression_enabled:
-                import gzip
-
-                data = gzip.compress(data)
+            data = self._serialize(checkpoint_data, checkpoint_data.to_dict)
 
             # Write checkpoint file
             with open(checkpoint_file, "wb") as f:
@@ -255,22 +262,10 @@ class CheckpointManager:
             with open(checkpoint_file, "rb") as f:
                 data = f.read()
 
-            # Decompress if needed
-            if self.compression_enabled:
-                import gzip
-
-                data = gzip.decompress(data)
-
             # Deserialize checkpoint data
-            if self.storage_format == "pickle":
-                checkpoint_data = pickle.loads(data)
-            elif self.storage_format == "json":
-                checkpoint_dict = json.loads(data.decode())
-                checkpoint_data = CheckpointData.from_dict(checkpoint_dict)
-            else:
-                raise BatchProcessingError(
-                    f"Unsupported storage format: {self.storage_format}"
-                )
+            checkpoint_data = self._deserialize(data)
+            if isinstance(checkpoint_data, dict):
+                checkpoint_data = CheckpointData.from_dict(checkpoint_data)
 
             self.logger.info(f"Checkpoint loaded: {checkpoint_file}")
             return checkpoint_data
@@ -279,6 +274,213 @@ class CheckpointManager:
             self.logger.error(f"Failed to load checkpoint: {e}")
             return None
 
+    def _serialize(self, value: Any, to_json: Optional[Callable] = None) -> bytes:
+        """
+        Serialize a value in the configured storage format.
+
+        Args:
+            value: Value to serialize
+            to_json: Optional conversion to a JSON-compatible value
+
+        Returns:
+            Serialized (and optionally compressed) bytes
+        """
+        if self.storage_format == "pickle":
+            data = pickle.dumps(value)
+        elif self.storage_format == "json":
+            data = json.dumps(to_json() if to_json else value, indent=2).encode()
+        else:
+            raise BatchProcessingError(
+                f"Unsupported storage format: {self.storage_format}"
+            )
+
+        # Apply compression if enabled
+        if self.compression_enabled:
+            data = gzip.compress(data)
+        return data
+
+    def _deserialize(self, data: bytes) -> Any:
+        """Reverse _serialize."""
+        # Decompress if needed
+        if self.compression_enabled:
+            data = gzip.decompress(data)
+
+        if self.storage_format == "pickle":
+            return pickle.loads(data)
+        if self.storage_format == "json":
+            return json.loads(data.decode())
+        raise BatchProcessingError(f"Unsupported storage format: {self.storage_format}")
+
+    def _ledger_file(self, job_id: str) -> Path:
+        """Path of the completed-partition ledger for a job."""
+        return self.checkpoint_path / f"ledger_{job_id}.jsonl"
+
+    def _partition_file(self, job_id: str, partition_id: int) -> Path:
+        """Path of the stored result summary for one partition."""
+        return self.checkpoint_path / f"partitions_{job_id}" / f"partition_{partition_id}.part"
+
+    def start_partition_ledger(self, job_id: str, layout: Dict[str, Any]) -> None:
+        """
+        Start a new ledger for a job, discarding results of earlier runs.
+
+        The first line records the partition layout; resuming checks it so
+        stored partitions are never matched against differently split data.
+
+        Args:
+            job_id: Batch job identifier
+            layout: Description of how the job's data is partitioned
+        """
+        if not self.checkpoint_enabled:
+            return
+
+        self.clear_partition_ledger(job_id)
+        header = {
+            "ledger_header": {
+                "layout": layout,
+                "created": datetime.now(timezone.utc).isoformat(),
+            }
+        }
+        with open(self._ledger_file(job_id), "w") as f:
+            f.write(json.dumps(header) + "\n")
+            f.flush()
+            if self.durable:
+                os.fsync(f.fileno())
+
+    def load_ledger_layout(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the partition layout recorded in a job's ledger header.
+
+        Args:
+            job_id: Batch job identifier
+
+        Returns:
+            Recorded layout, or None if the ledger is missing or has no header
+        """
+        ledger_file = self._ledger_file(job_id)
+        if not self.checkpoint_enabled or not ledger_file.exists():
+            return None
+
+        with open(ledger_file, "r") as f:
+            try:
+                header = json.loads(f.readline())
+            except json.JSONDecodeError:
+                return None
+        if not isinstance(header, dict) or "ledger_header" not in header:
+            return None
+        return header["ledger_header"]["layout"]
+
+    def save_partition_result(
+        self,
+        job_id: str,
+        partition_id: int,
+        result: Dict[str, Any],
+        start_item: Optional[int] = None,
+    ) -> bool:
+        """
+        Persist one completed partition and append it to the job ledger.
+
+        The result summary is written atomically first and the ledger line
+        appended afterwards, so a partition listed in the ledger always has
+        its results on disk. With durable checkpoints both are fsynced, which
+        also survives an operating system crash.
+
+        Args:
+            job_id: Batch job identifier
+            partition_id: Completed partition identifier
+            result: Partition result summary
+            start_item: Position of the partition's first item in a stream
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.checkpoint_enabled:
+            return True
+
+        try:
+            partition_file = self._partition_file(job_id, partition_id)
+            partition_file.parent.mkdir(parents=True, exist_ok=True)
+            temporary_file = partition_file.with_suffix(".tmp")
+            with open(temporary_file, "wb") as f:
+                f.write(self._serialize(result))
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temporary_file, partition_file)
+
+            entry = {
+                "partition_id": partition_id,
+                "processed_items": result.get("processed_items", 0),
+                "failed_items": result.get("failed_items", 0),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+            if start_item is not None:
+                entry["start_item"] = start_item
+            with open(self._ledger_file(job_id), "a") as f:
+                f.write(json.dumps(entry) + "\n")
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to save partition {partition_id}: {e}")
+            return False
+
+    def load_partition_ledger(self, job_id: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Load the completed partitions of a job.
+
+        The header line and a torn final line from a crash mid-append are
+        ignored.
+
+        Args:
+            job_id: Batch job identifier
+
+        Returns:
+            Ledger entries keyed by partition ID
+        """
+        ledger_file = self._ledger_file(job_id)
+        if not self.checkpoint_enabled or not ledger_file.exists():
+            return {}
+
+        completed = {}
+        with open(ledger_file, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    self.logger.warning(f"Ignoring incomplete ledger entry in {ledger_file}")
+                    continue
+                if "ledger_header" in entry:
+                    continue
+                completed[entry["partition_id"]] = entry
+        return completed
+
+    def load_partition_result(
+        self, job_id: str, partition_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load the stored result summary of a completed partition.
+
+        Args:
+            job_id: Batch job identifier
+            partition_id: Partition identifier
+
+        Returns:
+            Partition result summary, or None if missing or unreadable
+        """
+        try:
+            with open(self._partition_file(job_id, partition_id), "rb") as f:
+                return self._deserialize(f.read())
+        except Exception as e:
+            self.logger.error(f"Failed to load partition {partition_id}: {e}")
+            return None
+
+    def clear_partition_ledger(self, job_id: str) -> None:
+        """Remove a job's ledger and stored partition results."""
+        self._ledger_file(job_id).unlink(missing_ok=True)
+        shutil.rmtree(self._partition_file(job_id, 0).parent, ignore_errors=True)
+
     def list_checkpoints(self) -> List[str]:
         """List available checkpoint IDs."""
         try:
@@ -339,6 +541,8 @@ class ResourceMonitor:
             "memory_usage_mb": 0.0,
             "disk_io_read": 0.0,
             "disk_io_write": 0.0,
+            "system_cpu_percent": 0.0,
+            "system_memory_percent": 0.0,
         }
 
         # Process reference
@@ -369,6 +573,10 @@ class ResourceMonitor:
     def update_stats(self) -> Dict[str, float]:
         """Update and return current resource statistics."""
         try:
+            # System-wide usage, which includes process mode workers
+            self.resource_stats["system_cpu_percent"] = psutil.cpu_percent()
+            self.resource_stats["system_memory_percent"] = psutil.virtual_memory().percent
+
             # CPU usage
             cpu_percent = self.process.cpu_percent()
 
@@ -406,8 +614,7 @@ class ResourceMonitor:
         stats = self.update_stats()
 
         # Check memory usage
-        memory_usage_bytes = stats["memory_usage_mb"] * 1024 * 1024
-        if memory_usage_bytes > (self.max_memory_usage * self.throttling_threshold):
+        if self.memory_pressure(stats):
             return True
 
         # Check CPU usage
@@ -416,11 +623,398 @@ class ResourceMonitor:
 
         return False
 
+    def memory_pressure(self, stats: Optional[Dict[str, float]] = None) -> bool:
+        """
+        Check if process or system memory is above the throttling threshold.
+
+        Args:
+            stats: Resource statistics (default: last collected)
+
+        Returns:
+            True if memory usage should be reduced
+        """
+        stats = stats or self.resource_stats
+        memory_usage_bytes = stats["memory_usage_mb"] * 1024 * 1024
+        if memory_usage_bytes > (self.max_memory_usage * self.throttling_threshold):
+            return True
+        return stats.get("system_memory_percent", 0.0) > (
+            100 * self.throttling_threshold
+        )
+
     def get_memory_usage_mb(self) -> float:
         """Get current memory usage in MB."""
         return self.resource_stats.get("memory_usage_mb", 0.0)
 
 
+class AdaptiveConcurrencyController:
+    """
+    Adjusts batch concurrency and partition size from observed behaviour.
+
+    The concurrency limit follows AIMD: it grows additively while throughput
+    keeps up and the system has CPU headroom, steps back when throughput
+    drops, and is cut multiplicatively under memory pressure. The partition
+    size is derived from the smoothed per-item latency so each partition
+    takes about target_partition_seconds.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        initial_concurrency: int,
+        initial_partition_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize adaptive concurrency controller.
+
+        Args:
+            config: Adaptive concurrency configuration
+            initial_concurrency: Starting limit unless configured
+            initial_partition_size: Starting partition size
+            clock: Monotonic time source
+        """
+        self.min_concurrency = max(1, config.get("min_concurrency", 1))
+        self.max_concurrency = config.get(
+            "max_concurrency", max(initial_concurrency, multiprocessing.cpu_count())
+        )
+        self.increase_step = config.get("increase_step", 1)
+        self.decrease_factor = config.get("decrease_factor", 0.5)
+        self.throughput_tolerance = config.get("throughput_tolerance", 0.05)
+        self.cpu_ceiling = config.get("cpu_ceiling", 90.0)
+        self.adjust_interval = config.get("adjust_interval", 1.0)
+
+        self.target_partition_seconds = config.get("target_partition_seconds", 1.0)
+        self.min_partition_size = config.get("min_partition_size", 1)
+        self.max_partition_size = config.get("max_partition_size", 100000)
+
+        self.concurrency = self._clamp_concurrency(
+            config.get("initial_concurrency", initial_concurrency)
+        )
+        self.partition_size = initial_partition_size
+        self.adjustments = 0
+
+        self._clock = clock
+        self._window_start = clock()
+        self._window_items = 0
+        self._last_throughput: Optional[float] = None
+        self._item_latency: Optional[float] = None  # Smoothed seconds per item
+
+    def _clamp_concurrency(self, value: float) -> int:
+        """Keep a concurrency limit within the configured bounds."""
+        return int(max(self.min_concurrency, min(self.max_concurrency, value)))
+
+    def record_partition(self, items: int, seconds: float) -> None:
+        """
+        Record a completed partition and retune the partition size.
+
+        Args:
+            items: Items processed in the partition
+            seconds: Worker time spent on the partition
+        """
+        self._window_items += items
+        if items <= 0 or seconds <= 0:
+            return
+
+        latency = seconds / items
+        if self._item_latency is None:
+            self._item_latency = latency
+        else:
+            self._item_latency = 0.8 * self._item_latency + 0.2 * latency
+
+        size = round(self.target_partition_seconds / self._item_latency)
+        self.partition_size = int(
+            max(self.min_partition_size, min(self.max_partition_size, size))
+        )
+
+    def adjust(self, resource_stats: Dict[str, float], memory_pressure: bool) -> bool:
+        """
+        Update the concurrency limit once per adjust_interval.
+
+        Args:
+            resource_stats: Statistics from ResourceMonitor.update_stats
+            memory_pressure: Result of ResourceMonitor.memory_pressure
+
+        Returns:
+            True if the limit changed
+        """
+        now = self._clock()
+        elapsed = now - self._window_start
+        if elapsed < self.adjust_interval or elapsed <= 0:
+            return False
+
+        throughput = self._window_items / elapsed
+        previous = self._last_throughput
+        self._window_start = now
+        self._window_items = 0
+        self._last_throughput = throughput
+
+        current = self.concurrency
+        if memory_pressure:
+            current = self._clamp_concurrency(current * self.decrease_factor)
+        elif previous is not None and throughput < previous * (
+            1 - self.throughput_tolerance
+        ):
+            current = self._clamp_concurrency(current - self.increase_step)
+        elif resource_stats.get("system_cpu_percent", 0.0) < self.cpu_ceiling:
+            current = self._clamp_concurrency(current + self.increase_step)
+
+        if current == self.concurrency:
+            return False
+        self.concurrency = current
+        self.adjustments += 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the current limits and observations."""
+        return {
+            "concurrency": self.concurrency,
+            "partition_size": self.partition_size,
+            "throughput": self._last_throughput,
+            "item_latency": self._item_latency,
+            "adjustments": self.adjustments,
+        }
+
+
+# Per-process state for process mode, set once by _init_process_worker
+_worker_function: Optional[Callable] = None
+_worker_params: Dict[str, Any] = {}
+_worker_collect_results = True
+
+
+def _init_process_worker(
+    module_name: str,
+    function_name: str,
+    function_params: Dict[str, Any],
+    collect_results: bool = True,
+) -> None:
+    """
+    Initialize a process pool worker by importing the processing function.
+
+    Runs once per worker process so tasks only carry partition data.
+
+    Args:
+        module_name: Module containing the processing function
+        function_name: Function name, dotted for nested attributes
+        function_params: Parameters passed to every function call
+        collect_results: Whether per-item results are returned
+    """
+    global _worker_function, _worker_params, _worker_collect_results
+
+    target: Any = importlib.import_module(module_name)
+    for attribute in function_name.split("."):
+        target = getattr(target, attribute)
+
+    _worker_function = target
+    _worker_params = function_params
+    _worker_collect_results = collect_results
+
+
+def _process_partition_task(worker_id: int, payload: bytes) -> Dict[str, Any]:
+    """
+    Process one pickled partition inside a process pool worker.
+
+    Args:
+        worker_id: Worker (partition) identifier
+        payload: Partition pickled by the parent process
+
+    Returns:
+        Result summary in the same shape as the thread mode worker, with
+        errors reduced to index, message and type
+    """
+    worker_results: Dict[str, Any] = {
+        "worker_id": worker_id,
+        "processed_items": 0,
+        "failed_items": 0,
+        "results": [],
+        "errors": [],
+        "start_time": time.time(),
+        "end_time": None,
+    }
+
+    for item_index, item in enumerate(pickle.loads(payload)):
+        try:
+            result = _worker_function(item, **_worker_params)
+        except Exception as e:
+            worker_results["errors"].append(
+                {
+                    "item_index": item_index,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "timestamp": datetime.now().isoformat(),
+                }
+            )
+            worker_results["failed_items"] += 1
+            continue
+
+        worker_results["processed_items"] += 1
+        if _worker_collect_results:
+            worker_results["results"].append(result)
+
+    worker_results["end_time"] = time.time()
+    return worker_results
+
+
+class ResultSink(ABC):
+    """
+    Destination for per-item results in streaming batch processing.
+
+    Results are written one partition at a time as partitions complete,
+    so the manager never holds more than the in-flight partitions' results.
+    """
+
+    @abstractmethod
+    def write_batch(self, partition_id: int, results: List[Any]) -> None:
+        """
+        Write the results of one completed partition.
+
+        Args:
+            partition_id: Partition identifier (position in the data stream)
+            results: Successful per-item results of the partition
+        """
+        pass
+
+    def close(self) -> None:
+        """Flush and release the sink."""
+
+
+class CallbackResultSink(ResultSink):
+    """Result sink that passes each partition's results to a callback."""
+
+    def __init__(self, callback: Callable[[int, List[Any]], None]) -> None:
+        """
+        Initialize callback sink.
+
+        Args:
+            callback: Called with (partition_id, results)
+        """
+        self.callback = callback
+
+    def write_batch(self, partition_id: int, results: List[Any]) -> None:
+        """Pass results to the callback."""
+        self.callback(partition_id, results)
+
+
+class JSONLinesResultSink(ResultSink):
+    """Result sink that appends one JSON object per result to a file."""
+
+    def __init__(self, path: str, append: bool = False) -> None:
+        """
+        Initialize JSON lines sink.
+
+        Args:
+            path: Output file path
+            append: Keep existing lines (resumed jobs) instead of truncating
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+
+    def write_batch(self, partition_id: int, results: List[Any]) -> None:
+        """Write one line per result."""
+        for result in results:
+            self._file.write(
+                json.dumps({"partition_id": partition_id, "result": result}, default=str)
+            )
+            self._file.write("\n")
+
+    def close(self) -> None:
+        """Close the output file."""
+        self._file.close()
+
+
+class SQLiteResultSink(ResultSink):
+    """Result sink that inserts results as JSON text into a SQLite table."""
+
+    def __init__(self, path: str, table: str = "batch_results") -> None:
+        """
+        Initialize SQLite sink.
+
+        Args:
+            path: Database file path
+            table: Table name, created if missing
+        """
+        if not table.isidentifier():
+            raise BatchProcessingError(f"Invalid result table name: {table}")
+        self.table = table
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(partition_id INTEGER NOT NULL, result TEXT)"
+        )
+
+    def write_batch(self, partition_id: int, results: List[Any]) -> None:
+        """Insert one row per result in a single transaction."""
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT INTO {self.table} (partition_id, result) VALUES (?, ?)",
+                ((partition_id, json.dumps(result, default=str)) for result in results),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+def create_result_sink(sink_config: Dict[str, Any]) -> Optional[ResultSink]:
+    """
+    Create a result sink from configuration.
+
+    Args:
+        sink_config: Dictionary with sink_type ("file", "sqlite", "callback"
+            or "none") and the matching path, table or callback
+
+    Returns:
+        Result sink, or None when results are not stored
+    """
+    sink_type = sink_config.get("sink_type", "none")
+    if sink_type == "file":
+        return JSONLinesResultSink(sink_config["path"], sink_config.get("append", False))
+    if sink_type == "sqlite":
+        return SQLiteResultSink(
+            sink_config["path"], sink_config.get("table", "batch_results")
+        )
+    if sink_type == "callback":
+        return CallbackResultSink(sink_config["callback"])
+    if sink_type == "none":
+        return None
+    raise BatchProcessingError(f"Unsupported result sink type: {sink_type}")
+
+
+class ErrorSampler:
+    """
+    Bounded sample of processing errors with per-type counts.
+
+    Keeps a uniform random sample (reservoir sampling) of at most
+    max_samples errors while counting every error by type.
+    """
+
+    def __init__(self, max_samples: int = 100, seed: Optional[int] = None) -> None:
+        """
+        Initialize error sampler.
+
+        Args:
+            max_samples: Maximum number of errors kept
+            seed: Optional random seed for reproducible samples
+        """
+        self.max_samples = max_samples
+        self.samples: List[Dict[str, Any]] = []
+        self.counts: Dict[str, int] = {}
+        self.total = 0
+        self._random = random.Random(seed)
+
+    def add(self, error: Dict[str, Any]) -> None:
+        """Record one error."""
+        self.total += 1
+        error_type = error.get("error_type", "Error")
+        self.counts[error_type] = self.counts.get(error_type, 0) + 1
+        if len(self.samples) < self.max_samples:
+            self.samples.append(error)
+        else:
+            slot = self._random.randrange(self.total)
+            if slot < self.max_samples:
+                self.samples[slot] = error
+
+
 class BatchProcessingManager:
     """
     Main batch processing manager with parallel execution capabilities.
@@ -463,23 +1057,135 @@ class BatchProcessingManager:
         self.parallel_workers = config.get("parallel_workers", 4)
         self.execution_mode = config.get("execution_mode", "process")
         self.worker_timeout = config.get("worker_timeout", 600)
+        self.start_method = config.get("start_method")  # None = platform default
+        self.collect_results = config.get("collect_results", True)
+
+        # Optional adaptive concurrency limit and partition size
+        adaptive_config = config.get("adaptive_concurrency", {})
+        self.adaptive_controller = (
+            AdaptiveConcurrencyController(
+                adaptive_config, self.parallel_workers, self.chunk_size
+            )
+            if adaptive_config.get("enabled", False)
+            else None
+        )
 
         # Initialize components
-        self.checkpoint_manager = CheckpointManager(config.get("checkpoint_config", {}))
+        checkpoint_config = config.get("checkpoint_config", {})
+        self.checkpoint_manager = CheckpointManager(checkpoint_config)
         self.resource_monitor = ResourceMonitor(config.get("memory_config", {}))
 
         # Processing state
         self.stats = BatchProcessingStats()
         self.processing_function = None
+        self.processing_function_name = None
         self.processing_module = None
         self.data_partitions = []
         self.results = []
         self.errors = []
 
+        # Exact resume: completed partitions are recorded per job in a ledger
+        self.job_id = config.get("job_id") or checkpoint_config.get("job_id")
+        self.completed_partitions: Dict[int, Dict[str, Any]] = {}
+        self._resuming = False  # Next run continues the loaded ledger
+
         # Synchronization
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
 
+    def resume_from_checkpoint(self, job_id: Optional[str] = None) -> int:
+        """
+        Load the completed-partition ledger so finished partitions are skipped.
+
+        Partition IDs are positions in the partitioned data, so the job must
+        be re-run with the same data and partition size; the next run raises
+        BatchProcessingError if its partition layout differs from the one
+        recorded in the ledger. Streaming runs instead match completed
+        partitions by item range, which also covers adaptive partition sizes.
+        Runs that do not resume start a new ledger.
+
+        Args:
+            job_id: Job to resume (default: this manager's job_id)
+
+        Returns:
+            Number of partitions already completed
+        """
+        self.job_id = job_id or self.job_id
+        if not self.job_id:
+            raise BatchProcessingError("A job_id is required to resume from checkpoint")
+
+        self.completed_partitions = self.checkpoint_manager.load_partition_ledger(
+            self.job_id
+        )
+        self._resuming = True
+        self.logger.info(
+            f"Resuming job {self.job_id}: "
+            f"{len(self.completed_partitions)} partitions already completed"
+        )
+        return len(self.completed_partitions)
+
+    def _open_ledger(self, layout: Dict[str, Any]) -> None:
+        """
+        Continue the ledger of a resumed job, or start a new one.
+
+        Args:
+            layout: Partition layout of the run about to start
+
+        Raises:
+            BatchProcessingError: If resumed partitions were recorded with a
+                different layout
+        """
+        if not self.job_id:
+            return
+        resuming, self._resuming = self._resuming, False
+        if resuming and self.completed_partitions:
+            recorded = self.checkpoint_manager.load_ledger_layout(self.job_id)
+            if recorded != layout:
+                raise BatchProcessingError(
+                    f"Cannot resume job {self.job_id}: partition layout {layout} "
+                    f"does not match the recorded layout {recorded}"
+                )
+            return
+        self.completed_partitions = {}
+        self.checkpoint_manager.start_partition_ledger(self.job_id, layout)
+
+    def _record_partition(
+        self, partition_id: int, result: Dict[str, Any], start_item: Optional[int] = None
+    ) -> None:
+        """Record a completed partition, and its item range in a stream, in the job ledger."""
+        if not self.job_id:
+            return
+        if self.checkpoint_manager.save_partition_result(
+            self.job_id, partition_id, result, start_item
+        ):
+            self.completed_partitions[partition_id] = {
+                "partition_id": partition_id,
+                "processed_items": result["processed_items"],
+                "failed_items": result["failed_items"],
+            }
+            if start_item is not None:
+                self.completed_partitions[partition_id]["start_item"] = start_item
+
+    def _restore_partition(self, partition_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Load the stored result of a partition completed before a restart.
+
+        Returns:
+            Partition result summary, or None if it must be processed again
+        """
+        if partition_id not in self.completed_partitions:
+            return None
+        result = self.checkpoint_manager.load_partition_result(self.job_id, partition_id)
+        if result is None:
+            self.completed_partitions.pop(partition_id)  # Results lost, redo it
+            return None
+
+        with self._lock:
+            self.stats.processed_items += result["processed_items"]
+            self.stats.failed_items += result["failed_items"]
+            self.stats.batches_completed += 1
+        return result
+
     def load_processing_function(
         self, function_name: str, module_name: str
     ) -> Callable:
@@ -507,6 +1213,8 @@ class BatchProcessingManager:
                 raise BatchProcessingError(f"'{function_name}' is not callable")
 
             self.processing_function = processing_function
+            self.processing_function_name = function_name
+            self.processing_module = module_name
             self.logger.info(
                 f"Processing function loaded: {module_name}.{function_name}"
             )
@@ -536,32 +1244,7 @@ class BatchProcessingManager:
             # Future use: strategy = partitioning_config.get("strategy_type", "round_robin")
             partition_size = partitioning_config.get("partition_size", self.chunk_size)
 
-            partitions = []
-
-            if isinstance(data_source, (list, tuple)):
-                # Partition list/tuple data
-                total_items = len(data_source)
-                for i in range(0, total_items, partition_size):
-                    partition = data_source[i : i + partition_size]
-                    partitions.append(partition)
-
-            elif hasattr(data_source, "__iter__"):
-                # Partition iterable data
-                current_partition = []
-                for item in data_source:
-                    current_partition.append(item)
-                    if len(current_partition) >= partition_size:
-                        partitions.append(current_partition)
-                        current_partition = []
-
-                # Add remaining items
-                if current_partition:
-                    partitions.append(current_partition)
-
-            else:
-                raise BatchProcessingError(
-                    f"Unsupported data source type: {type(data_source)}"
-                )
+            partitions = list(self.iter_partitions(data_source, partition_size))
 
             self.data_partitions = partitions
             self.logger.info(f"Data partitioned into {len(partitions)} partitions")
@@ -572,8 +1255,141 @@ class BatchProcessingManager:
             self.logger.error(error_msg)
             raise BatchProcessingError(error_msg) from e
 
+    def iter_partitions(
+        self, data_source: Any, partition_size: Optional[int] = None
+    ) -> Iterator[List[Any]]:
+        """
+        Lazily split a data source into partitions.
+
+        Only the partition being built is held in memory, so generators and
+        file readers can be partitioned without materializing them.
+
+        Args:
+            data_source: List, tuple or any iterable of items
+            partition_size: Items per partition (default: chunk_size)
+
+        Yields:
+            Data partitions
+        """
+        partition_size = partition_size or self.chunk_size
+
+        if isinstance(data_source, (list, tuple)):
+            # Partition list/tuple data
+            for i in range(0, len(data_source), partition_size):
+                yield data_source[i : i + partition_size]
+
+        elif hasattr(data_source, "__iter__"):
+            # Partition iterable data
+            current_partition = []
+            for item in data_source:
+                current_partition.append(item)
+                if len(current_partition) >= partition_size:
+                    yield current_partition
+                    current_partition = []
+
+            # Add remaining items
+            if current_partition:
+                yield current_partition
+
+        else:
+            raise BatchProcessingError(
+                f"Unsupported data source type: {type(data_source)}"
+            )
+
+    def _iter_stream_partitions(
+        self, data_source: Iterable[Any], partition_size: Optional[int] = None
+    ) -> Iterator[Tuple[int, int, List[Any]]]:
+        """
+        Lazily split a stream into partitions, reproducing resumed item ranges.
+
+        Without a fixed partition_size and with adaptive concurrency, new
+        partitions take the controller's current partition size. Ranges
+        completed before a restart are matched by their first item, not by
+        partition position, so a resumed job restores them exactly even when
+        partition sizes differ from the earlier run; new partitions are cut
+        short rather than overlap them.
+
+        Args:
+            data_source: Iterable of items
+            partition_size: Items per new partition (default: chunk_size, or
+                adaptive with adaptive concurrency)
+
+        Yields:
+            Tuples of (partition_id, start_item, partition)
+        """
+        resumed = {
+            entry["start_item"]: entry
+            for entry in self.completed_partitions.values()
+            if "start_item" in entry
+        }
+        resumed_starts = sorted(resumed)
+        next_partition_id = max(self.completed_partitions, default=-1) + 1
+        iterator = iter(data_source)
+        start_item = 0
+        while True:
+            entry = resumed.get(start_item)
+            if entry is not None:
+                partition_id = entry["partition_id"]
+                size = entry["processed_items"] + entry["failed_items"]
+            else:
+                partition_id = next_partition_id
+                next_partition_id += 1
+                if partition_size is None and self.adaptive_controller:
+                    size = self.adaptive_controller.partition_size
+                else:
+                    size = partition_size or self.chunk_size
+                following = bisect.bisect_right(resumed_starts, start_item)
+                if following < len(resumed_starts):
+                    size = min(size, resumed_starts[following] - start_item)
+
+            partition = list(itertools.islice(iterator, size))
+            if not partition:
+                return
+            if entry is not None and len(partition) != size:
+                raise BatchProcessingError(
+                    f"Cannot resume job {self.job_id}: the data source ended inside "
+                    f"completed partition {partition_id}"
+                )
+            yield partition_id, start_item, partition
+            start_item += len(partition)
+
+    def _apply_backpressure(self, result: Dict[str, Any]) -> None:
+        """
+        React to resource usage after a partition completes.
+
+        With adaptive concurrency the controller is fed the partition timing
+        and resource statistics; otherwise execution pauses briefly when the
+        resource monitor asks for throttling.
+
+        Args:
+            result: Completed partition result summary
+        """
+        if self.adaptive_controller:
+            self.adaptive_controller.record_partition(
+                result["processed_items"] + result["failed_items"],
+                (result.get("end_time") or 0) - (result.get("start_time") or 0),
+            )
+            stats = self.resource_monitor.update_stats()
+            if self.adaptive_controller.adjust(
+                stats, self.resource_monitor.memory_pressure(stats)
+            ):
+                self.logger.info(
+                    f"Concurrency limit now {self.adaptive_controller.concurrency}, "
+                    f"partition size {self.adaptive_controller.partition_size}"
+                )
+            return
+
+        # Check for resource throttling
+        if self.resource_monitor.should_throttle():
+            self.logger.warning("Resource usage high, throttling execution")
+            time.sleep(1.0)  # Brief pause
+
     def _process_partition_worker(
-        self, partition_data: List[Any], worker_id: int, function_params: Dict[str, Any]
+        self,
+        partition_data: List[Any],
+        worker_id: int,
+        function_params: Dict[str, Any],
+        collect_results: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Worker function for processing a data partition.
@@ -582,10 +1398,14 @@ class BatchProcessingManager:
             partition_data: Data partition to process
             worker_id: Worker identifier
             function_params: Parameters for processing function
+            collect_results: Whether to keep per-item results (default: config)
 
         Returns:
             Processing results
         """
+        if collect_results is None:
+            collect_results = self.collect_results
+
         worker_results = {
             "worker_id": worker_id,
             "processed_items": 0,
@@ -605,7 +1425,8 @@ class BatchProcessingManager:
 
                     # Process item
                     result = self.processing_function(item, **function_params)
-                    worker_results["results"].append(result)
+                    if collect_results:
+                        worker_results["results"].append(result)
                     worker_results["processed_items"] += 1
 
                 except Exception as e:
@@ -613,6 +1434,7 @@ class BatchProcessingManager:
                         "item_index": item_index,
                         "item": item,
                         "error": str(e),
+                        "error_type": type(e).__name__,
                         "timestamp": datetime.now().isoformat(),
                     }
                     worker_results["errors"].append(error_info)
@@ -635,6 +1457,119 @@ class BatchProcessingManager:
             )
             return worker_results
 
+    def _resolve_function_path(self) -> Tuple[str, str]:
+        """
+        Find the import path of the processing function for process workers.
+
+        Returns:
+            Tuple of (module name, function name)
+        """
+        if self.processing_module and self.processing_function_name:
+            return self.processing_module, self.processing_function_name
+
+        module_name = getattr(self.processing_function, "__module__", None)
+        function_name = getattr(self.processing_function, "__qualname__", "")
+        if not module_name or "<" in function_name:
+            raise BatchProcessingError(
+                f"Process mode requires an importable processing function, "
+                f"got {self.processing_function!r}; use execution_mode 'thread' instead"
+            )
+        return module_name, function_name
+
+    def _pool_size(self) -> int:
+        """Number of pool workers; adaptive limits may grow up to the maximum."""
+        if self.adaptive_controller:
+            return self.adaptive_controller.max_concurrency
+        return self.parallel_workers
+
+    def _create_executor(
+        self, function_params: Dict[str, Any], collect_results: Optional[bool] = None
+    ) -> Any:
+        """
+        Create the executor for the configured execution mode.
+
+        Args:
+            function_params: Parameters for processing function
+            collect_results: Whether workers return per-item results (default: config)
+
+        Returns:
+            Thread or process pool executor
+        """
+        if self.execution_mode == "thread":
+            return ThreadPoolExecutor(max_workers=self._pool_size())
+        if self.execution_mode == "process":
+            # Workers import the function once; tasks carry only pickled partitions
+            return self._create_process_executor(function_params, collect_results)
+        raise BatchProcessingError(f"Unsupported execution mode: {self.execution_mode}")
+
+    def _submit_partition(
+        self,
+        executor: Any,
+        partition: List[Any],
+        partition_id: int,
+        function_params: Dict[str, Any],
+        collect_results: Optional[bool] = None,
+    ) -> Future:
+        """
+        Submit one partition to an executor created by _create_executor.
+
+        Args:
+            executor: Thread or process pool executor
+            partition: Data partition to process
+            partition_id: Partition identifier
+            function_params: Parameters for processing function
+            collect_results: Whether to keep per-item results (thread mode)
+
+        Returns:
+            Future resolving to the partition result summary
+        """
+        if self.execution_mode == "process":
+            return executor.submit(
+                _process_partition_task,
+                partition_id,
+                pickle.dumps(partition, protocol=pickle.HIGHEST_PROTOCOL),
+            )
+        return executor.submit(
+            self._process_partition_worker,
+            partition,
+            partition_id,
+            function_params,
+            collect_results,
+        )
+
+    def _create_process_executor(
+        self, function_params: Dict[str, Any], collect_results: Optional[bool] = None
+    ) -> ProcessPoolExecutor:
+        """
+        Create a process pool whose workers load the processing function once.
+
+        Args:
+            function_params: Parameters for processing function
+            collect_results: Whether workers return per-item results (default: config)
+
+        Returns:
+            Process pool executor
+        """
+        if collect_results is None:
+            collect_results = self.collect_results
+        module_name, function_name = self._resolve_function_path()
+        mp_context = (
+            multiprocessing.get_context(self.start_method)
+            if self.start_method
+            else None
+        )
+        return ProcessPoolExecutor(
+            max_workers=self._pool_size(),
+            mp_context=mp_context,
+            initializer=_init_process_worker,
+            initargs=(
+                module_name,
+                function_name,
+                function_params,
+                collect_results,
+            ),
+        )
+
     def execute_parallel_processing(
         self,
         partitions: List[Any],
@@ -658,6 +1593,14 @@ class BatchProcessingManager:
         # Initialize processing statistics
         self.stats.start_time = datetime.now(timezone.utc)
         self.stats.total_items = sum(len(partition) for partition in partitions)
+        self._open_ledger(
+            {
+                "mode": "partitions",
+                "partition_count": len(partitions),
+                "partition_size": max((len(p) for p in partitions), default=0),
+                "total_items": self.stats.total_items,
+            }
+        )
 
         # Start resource monitoring
         self.resource_monitor.start_monitoring()
@@ -668,69 +1611,258 @@ class BatchProcessingManager:
             progress_bar = tqdm(total=len(partitions), desc="Processing batches")
 
         try:
-            # Choose execution strategy
-            if self.execution_mode == "thread":
-                executor_class = ThreadPoolExecutor
-            elif self.execution_mode == "process":
-                executor_class = ProcessPoolExecutor
-            else:
-                raise BatchProcessingError(
-                    f"Unsupported execution mode: {self.execution_mode}"
-                )
-
             # Execute parallel processing
             all_results = []
-            with executor_class(max_workers=self.parallel_workers) as executor:
-                # Submit tasks
+            with self._create_executor(function_params) as executor:
+                # Submit tasks through the concurrency window (all at once unless
+                # adaptive), reusing results of partitions finished before a restart
+                pending = enumerate(partitions)
                 future_to_partition = {}
-                for i, partition in enumerate(partitions):
-                    future = executor.submit(
-                        self._process_partition_worker, partition, i, function_params
+                completed_partitions = 0
+
+                def submit_up_to_limit() -> int:
+                    restored_count = 0
+                    limit = (
+                        self.adaptive_controller.concurrency
+                        if self.adaptive_controller
+                        else len(partitions)
                     )
-                    future_to_partition[future] = i
+                    while len(future_to_partition) < limit:
+                        try:
+                            i, partition = next(pending)
+                        except StopIteration:
+                            break
+                        restored = self._restore_partition(i)
+                        if restored is not None:
+                            all_results.append(restored)
+                            restored_count += 1
+                            continue
+                        future = self._submit_partition(
+                            executor, partition, i, function_params
+                        )
+                        future_to_partition[future] = i
+                    return restored_count
+
+                completed_partitions += submit_up_to_limit()
+                if progress_bar:
+                    progress_bar.update(completed_partitions)
 
                 # Process completed tasks
-                completed_partitions = 0
-                for future in as_completed(
-                    future_to_partition, timeout=self.worker_timeout
-                ):
-                    try:
-                        partition_id = future_to_partition[future]
-                        result = future.result()
-                        all_results.append(result)
+                while future_to_partition:
+                    done, _ = wait(
+                        future_to_partition,
+                        timeout=self.worker_timeout,
+                        return_when=FIRST_COMPLETED,
+                    )
+                    if not done:
+                        raise BatchProcessingError(
+                            f"No partition completed within {self.worker_timeout}s"
+                        )
+
+                    for future in done:
+                        partition_id = future_to_partition.pop(future)
+                        try:
+                            result = future.result()
+                            all_results.append(result)
+                            self._record_partition(partition_id, result)
+
+                            # Update statistics
+                            with self._lock:
+                                self.stats.processed_items += result["processed_items"]
+                                self.stats.failed_items += result["failed_items"]
+                                self.stats.batches_completed += 1
+
+                            completed_partitions += 1
+
+                            # Update progress
+                            if progress_bar:
+                                progress_bar.update(1)
+                            elif progress_callback:
+                                progress_callback(completed_partitions, len(partitions))
+
+                            # Check for checkpoint
+                            if self.checkpoint_manager.should_checkpoint():
+                                self._save_progress_checkpoint(
+                                    completed_partitions, len(partitions)
+                                )
+
+                            # Adapt concurrency or throttle on resource usage
+                            self._apply_backpressure(result)
+
+                        except Exception as e:
+                            self.logger.error(f"Partition {partition_id} failed: {e}")
+                            with self._lock:
+                                self.stats.batches_failed += 1
+
+                    restored_count = submit_up_to_limit()
+                    completed_partitions += restored_count
+                    if progress_bar and restored_count:
+                        progress_bar.update(restored_count)
+
+            # Finalize statistics
+            self.stats.end_time = datetime.now(timezone.utc)
+            self.stats.processing_time = (
+                self.stats.end_time - self.stats.start_time
+            ).total_seconds()
+            self.stats.update_throughput()
+            self.stats.update_error_rate()
+
+            # Update resource statistics
+            final_stats = self.resource_monitor.update_stats()
+            self.stats.memory_usage = final_stats
+
+            return {
+                "processing_results": all_results,
+                "statistics": self.stats,
+                "resource_stats": final_stats,
+                "adaptive_concurrency": (
+                    self.adaptive_controller.get_stats()
+                    if self.adaptive_controller
+                    else None
+                ),
+            }
+
+        finally:
+            # Clean up
+            if progress_bar:
+                progress_bar.close()
+            self.resource_monitor.stop_monitoring()
+
+    def execute_streaming_processing(
+        self,
+        data_source: Iterable[Any],
+        function_params: Dict[str, Any],
+        partition_size: Optional[int] = None,
+        result_sink: Optional[ResultSink] = None,
+        combiner: Optional[Callable[[Any, Any], Any]] = None,
+        initial_value: Any = None,
+        max_in_flight: Optional[int] = None,
+        max_error_samples: int = 100,
+        progress_callback: Optional[Callable] = None,
+    ) -> Dict[str, Any]:
+        """
+        Process a data stream with bounded memory.
+
+        Partitions are read lazily from the source and at most max_in_flight
+        of them are queued or running at once. Per-item results of each
+        completed partition go to the result sink and/or are folded into a
+        running value with the combiner, then dropped. Errors are counted by
+        type and only a bounded sample is kept.
+
+        Args:
+            data_source: Iterable of items, e.g. a generator or file reader
+            function_params: Parameters for processing function
+            partition_size: Items per partition (default: chunk_size, or tuned
+                from per-item latency with adaptive concurrency)
+            result_sink: Optional destination for per-item results
+            combiner: Optional function (accumulated, result) -> accumulated
+            initial_value: Starting value for the combiner
+            max_in_flight: Maximum partitions submitted at once (default: 2 x workers;
+                ignored with adaptive concurrency, which sets its own limit)
+            max_error_samples: Maximum number of errors kept
+            progress_callback: Optional callback(completed_partitions, items_seen)
+
+        Returns:
+            Statistics, combined value and sampled errors
+        """
+        if not self.processing_function:
+            raise BatchProcessingError("Processing function not loaded")
+
+        max_in_flight = max_in_flight or self.parallel_workers * 2
+        self._open_ledger({"mode": "stream"})  # Partitions are matched by item range
+        collect_results = result_sink is not None or combiner is not None
+        combined = initial_value
+        errors = ErrorSampler(max_error_samples)
+
+        self.stats.start_time = datetime.now(timezone.utc)
+        self.stats.total_items = 0
+        self.resource_monitor.start_monitoring()
+
+        completed_partitions = 0
+        try:
+            with self._create_executor(function_params, collect_results) as executor:
+                partitions = self._iter_stream_partitions(data_source, partition_size)
+                in_flight: Dict[Future, Tuple[int, int]] = {}
+                exhausted = False
+
+                while in_flight or not exhausted:
+                    # Top up the window from the source
+                    limit = (
+                        self.adaptive_controller.concurrency
+                        if self.adaptive_controller
+                        else max_in_flight
+                    )
+                    while not exhausted and len(in_flight) < limit:
+                        try:
+                            partition_id, start_item, partition = next(partitions)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        self.stats.total_items += len(partition)
+                        restored = self._restore_partition(partition_id)
+                        if restored is not None:
+                            # Results already reached the sink before the restart
+                            if combiner is not None:
+                                for item_result in restored["results"]:
+                                    combined = combiner(combined, item_result)
+                            completed_partitions += 1
+                            continue
+                        future = self._submit_partition(
+                            executor, partition, partition_id, function_params,
+                            collect_results,
+                        )
+                        in_flight[future] = (partition_id, start_item)
+                        del partition  # Only the executor keeps the partition
+
+                    if not in_flight:
+                        break
+
+                    done, _ = wait(
+                        in_flight, timeout=self.worker_timeout, return_when=FIRST_COMPLETED
+                    )
+                    if not done:
+                        raise BatchProcessingError(
+                            f"No partition completed within {self.worker_timeout}s"
+                        )
+
+                    for future in done:
+                        partition_id, start_item = in_flight.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            self.logger.error(f"Partition {partition_id} failed: {e}")
+                            with self._lock:
+                                self.stats.batches_failed += 1
+                            continue
+
+                        if result_sink is not None:
+                            result_sink.write_batch(partition_id, result["results"])
+                        self._record_partition(partition_id, result, start_item)
+                        if combiner is not None:
+                            for item_result in result["results"]:
+                                combined = combiner(combined, item_result)
+                        for error in result["errors"]:
+                            error.pop("item", None)  # Items can be large; keep the index
+                            error["partition_id"] = partition_id
+                            errors.add(error)
 
-                        # Update statistics
                         with self._lock:
                             self.stats.processed_items += result["processed_items"]
                             self.stats.failed_items += result["failed_items"]
                             self.stats.batches_completed += 1
-
                         completed_partitions += 1
 
-                        # Update progress
-                        if progress_bar:
-                            progress_bar.update(1)
-                        elif progress_callback:
-                            progress_callback(completed_partitions, len(partitions))
+                        if progress_callback:
+                            progress_callback(completed_partitions, self.stats.total_items)
 
                         # Check for checkpoint
                         if self.checkpoint_manager.should_checkpoint():
                             self._save_progress_checkpoint(
-                                completed_partitions, len(partitions)
+                                completed_partitions, completed_partitions + len(in_flight)
                             )
 
-                        # Check for resource throttling
-                        if self.resource_monitor.should_throttle():
-                            self.logger.warning(
-                                "Resource usage high, throttling execution"
-                            )
-                            time.sleep(1.0)  # Brief pause
-
-                    except Exception as e:
-                        partition_id = future_to_partition[future]
-                        self.logger.error(f"Partition {partition_id} failed: {e}")
-                        with self._lock:
-                            self.stats.batches_failed += 1
+                        # Adapt concurrency or throttle on resource usage
+                        self._apply_backpressure(result)
 
             # Finalize statistics
             self.stats.end_time = datetime.now(timezone.utc)
@@ -740,20 +1872,26 @@ class BatchProcessingManager:
             self.stats.update_throughput()
             self.stats.update_error_rate()
 
-            # Update resource statistics
             final_stats = self.resource_monitor.update_stats()
             self.stats.memory_usage = final_stats
 
             return {
-                "processing_results": all_results,
                 "statistics": self.stats,
+                "combined_result": combined,
+                "error_samples": errors.samples,
+                "error_counts": errors.counts,
+                "partitions_completed": completed_partitions,
                 "resource_stats": final_stats,
+                "adaptive_concurrency": (
+                    self.adaptive_controller.get_stats()
+                    if self.adaptive_controller
+                    else None
+                ),
             }
 
         finally:
-            # Clean up
-            if progress_bar:
-                progress_bar.close()
+            if result_sink is not None:
+                result_sink.close()
             self.resource_monitor.stop_monitoring()
 
     def _save_progress_checkpoint(
@@ -770,6 +1908,8 @@ class BatchProcessingManager:
                 current_batch=completed_batches,
                 total_batches=total_batches,
                 processing_state={
+                    "job_id": self.job_id,
+                    "completed_partitions": sorted(self.completed_partitions),
                     "execution_mode": self.execution_mode,
                     "parallel_workers": self.parallel_workers,
                     "batch_size": self.batch_size,
@@ -903,6 +2043,8 @@ class BatchProcessingManager:
                 "cleanup_checkpoints_after_success", False
             ):
                 self.checkpoint_manager.cleanup_checkpoints(keep_latest=1)
+                if self.job_id:
+                    self.checkpoint_manager.clear_partition_ledger(self.job_id)
 
             self.logger.info("Resources cleaned up successfully")
 
@@ -957,6 +2099,23 @@ def initialize_batch_processing(
 
         # Create batch processing manager
         batch_manager = BatchProcessingManager(config, context)
+        config_hash = hashlib.md5(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+        # Completed partitions are only recorded for jobs that can be resumed
+        resume_from_checkpoint = params.get("resume_from_checkpoint", False)
+        if not batch_manager.job_id and (
+            checkpoint_config.get("exact_resume", False) or resume_from_checkpoint
+        ):
+            batch_manager.job_id = config_hash  # Same configuration resumes the same job
+
+        # Skip partitions completed by a previous run of this job
+        resumed_partitions = 0
+        if resume_from_checkpoint:
+            resumed_partitions = batch_manager.resume_from_checkpoint(
+                resume_from_checkpoint
+                if isinstance(resume_from_checkpoint, str)
+                else None
+            )
 
         # Load processing function
         batch_manager.load_processing_function(
@@ -979,9 +2138,12 @@ def initialize_batch_processing(
         initialization_status = {
             "initialized": True,
             "initialization_time": datetime.now().isoformat(),
-            "config_hash": hashlib.md5(
-                json.dumps(config, sort_keys=True).encode()
-            ).hexdigest(),
+            "config_hash": config_hash,
+            "job_id": batch_manager.job_id,
+            "resume": {
+                "resumed": bool(resume_from_checkpoint),
+                "completed_partitions": resumed_partitions,
+            },
             "components": {
                 "batch_manager": True,
                 "checkpoint_manager": (
@@ -1365,6 +2527,142 @@ def execute_batch_processing(
         raise BatchProcessingError(error_msg) from e
 
 
+def iter_data_source(data_source_config: Dict[str, Any]) -> Iterator[Any]:
+    """
+    Lazily read items from a data source configuration.
+
+    Supports the same source types as load_and_partition_data. Files are
+    read line by line: CSV rows become dictionaries of strings, .jsonl lines
+    are decoded as JSON, other files yield stripped non-empty lines. Plain
+    .json files are a single document and are still loaded whole.
+
+    Args:
+        data_source_config: Data source configuration
+
+    Yields:
+        Data items
+    """
+    source_type = data_source_config.get("source_type", "memory")
+
+    if source_type == "file":
+        source_path = data_source_config.get("source_path")
+        if source_path.endswith(".json"):
+            with open(source_path, "r") as f:
+                yield from json.load(f)
+            return
+        with open(source_path, "r", newline="") as f:
+            if source_path.endswith(".csv"):
+                yield from csv.DictReader(f)
+            elif source_path.endswith(".jsonl"):
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                for line in f:
+                    if line.strip():
+                        yield line.strip()
+
+    elif source_type == "memory":
+        yield from data_source_config.get("data", [])
+
+    elif source_type == "generator":
+        generator_func = data_source_config.get("generator_function")
+        if not generator_func:
+            raise BatchProcessingError("Generator function not provided")
+        yield from generator_func()
+
+    else:
+        raise BatchProcessingError(f"Unsupported data source type: {source_type}")
+
+
+def execute_streaming_batch_processing(
+    context: Optional[Context] = None, **params
+) -> Dict[str, Any]:
+    """
+    Execute batch processing over a lazily read data source with bounded memory.
+
+    Replaces load_and_partition_data, execute_batch_processing and
+    aggregate_processing_results for inputs too large to hold in memory.
+
+    Args:
+        context: Framework0 context
+        **params: Streaming execution parameters
+
+    Returns:
+        Dictionary with execution statistics, combined result and error summary
+    """
+    start_time = time.time()
+    logger = get_logger(__name__)
+
+    try:
+        batch_manager = params.get("batch_processing_manager")
+        data_source_config = params.get("data_source_config", {})
+        processing_function = params.get("processing_function", {})
+        streaming_config = params.get("streaming_config", {})
+
+        if not batch_manager:
+            raise BatchProcessingError("Batch processing manager is required")
+
+        # A resumed job keeps the results written before the restart
+        sink_config = streaming_config.get("result_sink", {})
+        if batch_manager.completed_partitions:
+            sink_config = {"append": True, **sink_config}
+        result_sink = create_result_sink(sink_config)
+
+        processing_results = batch_manager.execute_streaming_processing(
+            iter_data_source(data_source_config),
+            processing_function.get("function_parameters", {}),
+            partition_size=streaming_config.get("partition_size"),
+            result_sink=result_sink,
+            combiner=streaming_config.get("combiner"),
+            initial_value=streaming_config.get("initial_value"),
+            max_in_flight=streaming_config.get("max_in_flight"),
+            max_error_samples=streaming_config.get("max_error_samples", 100),
+        )
+
+        statistics = processing_results["statistics"]
+        execution_statistics = {
+            "total_execution_time": statistics.processing_time,
+            "items_per_second": statistics.throughput,
+            "batches_completed": statistics.batches_completed,
+            "batches_failed": statistics.batches_failed,
+            "total_items_processed": statistics.processed_items,
+            "total_items_failed": statistics.failed_items,
+            "success_rate": (
+                ((statistics.processed_items / statistics.total_items) * 100)
+                if statistics.total_items > 0
+                else 0
+            ),
+        }
+
+        error_summary = {
+            "total_errors": statistics.failed_items,
+            "error_rate_percent": statistics.error_rate,
+            "error_categories": processing_results["error_counts"],
+            "error_samples": processing_results["error_samples"],
+            "failed_batches": statistics.batches_failed,
+        }
+
+        duration = time.time() - start_time
+        logger.info(
+            f"Streaming batch processing executed in {duration:.3f}s: "
+            f"{statistics.processed_items} items processed"
+        )
+
+        return {
+            "combined_result": processing_results["combined_result"],
+            "execution_statistics": execution_statistics,
+            "resource_stats": processing_results["resource_stats"],
+            "error_summary": error_summary,
+            "execution_duration": duration,
+        }
+
+    except Exception as e:
+        error_msg = f"Streaming batch processing execution failed: {str(e)}"
+        logger.error(error_msg)
+        raise BatchProcessingError(error_msg) from e
+
+
 def aggregate_processing_results(
     context: Optional[Context] = None, **params
 ) -> Dict[str, Any]:
@@ -10,6 +10,7 @@ Features:
 - Safe file operations with backup and rollback
 - Multiple format support (text, JSON, CSV, XML, YAML, binary)
 - Content validation and transformation
+- Streaming record processing with constant memory for large files
 - Performance monitoring and health checks
 - Integration with Foundation systems (5A-5D)
 - Robust error handling and recovery
@@ -19,19 +20,23 @@ Usage:
     specifically the file_processing.yaml template.
 """
 
+import io
 import os
 import shutil
 import hashlib
+import tempfile
 import chardet
 import json
 import csv
 import xml.etree.ElementTree as ET
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Iterable, Iterator, Callable
 from datetime import datetime, timezone
 import time
 
+from src.core.file_modes import match_file_mode
+
 # Framework0 imports with fallback
 try:
     from orchestrator.context import Context
@@ -59,6 +64,10 @@ except ImportError:
     get_performance_monitor = None
 
 
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # Bytes per read/write in streaming mode
+STREAMING_FORMATS = ('csv', 'jsonl', 'text', 'binary')
+
+
 class FileProcessingError(Exception):
     """Custom exception for file processing errors."""
     pass
@@ -179,6 +188,7 @@ class FileProcessor:
         format_map = {
             '.json': 'json',
             '.csv': 'csv', 
+            '.jsonl': 'jsonl',
             '.xml': 'xml',
             '.yaml': 'yaml',
             '.yml': 'yaml',
@@ -254,6 +264,321 @@ class FileProcessor:
         if isinstance(content, str):
             content = content.encode('utf-8')
         return hashlib.md5(content).hexdigest()
+    
+    def _calculate_file_checksum(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+        """Calculate MD5 checksum of a file's bytes without loading it whole."""
+        checksum = hashlib.md5()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                checksum.update(chunk)
+        return checksum.hexdigest()
+
+
+class _ChecksumIO(io.RawIOBase):
+    """Raw binary stream that hashes every byte passing through it."""
+    
+    def __init__(self, raw: io.RawIOBase) -> None:
+        self._raw = raw
+        self.checksum = hashlib.md5()
+        self.byte_count = 0
+    
+    def readable(self) -> bool:
+        return self._raw.readable()
+    
+    def writable(self) -> bool:
+        return self._raw.writable()
+    
+    def readinto(self, buffer) -> int:
+        count = self._raw.readinto(buffer)
+        if count:
+            self.checksum.update(memoryview(buffer)[:count])
+            self.byte_count += count
+        return count
+    
+    def write(self, data) -> int:
+        count = self._raw.write(data)
+        if count:
+            self.checksum.update(memoryview(data)[:count])
+            self.byte_count += count
+        return count
+    
+    def fileno(self) -> int:
+        return self._raw.fileno()
+    
+    def close(self) -> None:
+        if not self.closed:
+            self._raw.close()
+        super().close()
+
+
+class StreamingFileReader:
+    """
+    Iterate over the records of a file without loading it into memory.
+    
+    Records are CSV rows (dicts), JSON lines, text lines (without line
+    endings) or binary chunks. The MD5 checksum of the raw file bytes is
+    computed while reading and is complete once iteration finishes.
+    
+    Usage:
+        with StreamingFileReader('data.csv', 'csv') as reader:
+            for row in reader:
+                ...
+        reader.checksum
+    """
+    
+    def __init__(self, file_path: str, file_format: str = 'text',
+                 encoding: str = 'utf-8', chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Initialize streaming reader.
+        
+        Args:
+            file_path: File to read
+            file_format: 'csv', 'jsonl', 'text' or 'binary'
+            encoding: Text encoding
+            chunk_size: Bytes per read (and per binary record)
+        """
+        if file_format not in STREAMING_FORMATS:
+            raise FileProcessingError(
+                f"Streaming is not supported for format '{file_format}'; use one of {STREAMING_FORMATS}"
+            )
+        self.file_path = file_path
+        self.file_format = file_format
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self.records_read = 0
+        self._raw = _ChecksumIO(io.FileIO(file_path, 'r'))
+        self._buffer = io.BufferedReader(self._raw, buffer_size=chunk_size)
+    
+    @property
+    def checksum(self) -> str:
+        """MD5 checksum of the bytes read so far."""
+        return self._raw.checksum.hexdigest()
+    
+    @property
+    def bytes_read(self) -> int:
+        """Number of bytes read so far."""
+        return self._raw.byte_count
+    
+    def __iter__(self) -> Iterator[Any]:
+        for record in self._records():
+            self.records_read += 1
+            yield record
+    
+    def _records(self) -> Iterator[Any]:
+        if self.file_format == 'binary':
+            yield from iter(lambda: self._buffer.read(self.chunk_size), b'')
+            return
+        
+        # newline='' keeps CSV quoting intact; text lines are stripped below
+        text = io.TextIOWrapper(self._buffer, encoding=self.encoding, newline='')
+        if self.file_format == 'csv':
+            yield from csv.DictReader(text)
+        elif self.file_format == 'jsonl':
+            for line_number, line in enumerate(text, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise FileProcessingError(f"Invalid JSON on line {line_number}: {e}")
+        else:
+            for line in text:
+                yield line.rstrip('\r\n')
+    
+    def iter_batches(self, batch_size: int) -> Iterator[List[Any]]:
+        """
+        Iterate over lists of at most batch_size records.
+        
+        Args:
+            batch_size: Maximum records per batch
+        """
+        batch = []
+        for record in self:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._buffer.close()
+    
+    def __enter__(self) -> 'StreamingFileReader':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class StreamingFileWriter:
+    """
+    Write records to a temporary file and atomically rename it into place.
+    
+    The target only ever contains complete output: commit() flushes, syncs
+    and renames the temporary file over the target, abort() removes it.
+    Used as a context manager it commits on success and aborts on error.
+    The MD5 checksum of the written bytes is computed incrementally.
+    """
+    
+    def __init__(self, target_file: str, file_format: str = 'text',
+                 encoding: str = 'utf-8', fieldnames: Optional[List[str]] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Initialize streaming writer.
+        
+        Args:
+            target_file: Final output path
+            file_format: 'csv', 'jsonl', 'text' or 'binary'
+            encoding: Text encoding
+            fieldnames: CSV columns (default: keys of the first record)
+            chunk_size: Write buffer size in bytes
+        """
+        if file_format not in STREAMING_FORMATS:
+            raise FileProcessingError(
+                f"Streaming is not supported for format '{file_format}'; use one of {STREAMING_FORMATS}"
+            )
+        self.target_file = target_file
+        self.file_format = file_format
+        self.fieldnames = fieldnames
+        self.records_written = 0
+        
+        target_path = Path(target_file)
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self.temp_file = tempfile.mkstemp(
+            dir=target_path.parent, prefix=f'.{target_path.name}.', suffix='.tmp'
+        )
+        try:
+            match_file_mode(self.temp_file, target_path)  # Survives os.replace
+        except OSError:
+            os.close(fd)
+            Path(self.temp_file).unlink(missing_ok=True)
+            raise
+        self._raw = _ChecksumIO(io.FileIO(fd, 'w'))
+        self._buffer = io.BufferedWriter(self._raw, buffer_size=chunk_size)
+        self._text = None
+        self._csv_writer = None
+        if file_format != 'binary':
+            self._text = io.TextIOWrapper(self._buffer, encoding=encoding, newline='')
+    
+    @property
+    def checksum(self) -> str:
+        """MD5 checksum of the bytes written so far (complete after commit)."""
+        return self._raw.checksum.hexdigest()
+    
+    @property
+    def bytes_written(self) -> int:
+        """Number of bytes flushed to disk so far."""
+        return self._raw.byte_count
+    
+    def write_record(self, record: Any) -> None:
+        """
+        Write one record in the writer's format.
+        
+        Args:
+            record: Dict for CSV, JSON value for JSONL, line for text, bytes for binary
+        """
+        if self.file_format == 'binary':
+            self._buffer.write(record)
+        elif self.file_format == 'csv':
+            if self._csv_writer is None:
+                self._csv_writer = csv.DictWriter(
+                    self._text, fieldnames=self.fieldnames or list(record.keys())
+                )
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow(record)
+        elif self.file_format == 'jsonl':
+            self._text.write(json.dumps(record, ensure_ascii=False))
+            self._text.write('\n')
+        else:
+            self._text.write(str(record))
+            self._text.write('\n')
+        self.records_written += 1
+    
+    def write_records(self, records: Iterable[Any]) -> int:
+        """Write every record of an iterable; returns the number written."""
+        for record in records:
+            self.write_record(record)
+        return self.records_written
+    
+    def commit(self) -> None:
+        """Flush, sync and atomically replace the target file."""
+        stream = self._text or self._buffer
+        try:
+            stream.flush()
+            os.fsync(self._raw.fileno())
+            stream.close()
+            os.replace(self.temp_file, self.target_file)
+        except Exception:
+            self.abort()
+            raise
+    
+    def abort(self) -> None:
+        """Discard the temporary file, leaving the target untouched."""
+        try:
+            (self._text or self._buffer).close()
+        finally:
+            Path(self.temp_file).unlink(missing_ok=True)
+    
+    def __enter__(self) -> 'StreamingFileWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
+def transform_records(records: Iterable[Any], transformation_rules: Dict[str, Any],
+                      counts: Optional[Dict[str, int]] = None) -> Iterator[Any]:
+    """
+    Apply transformation rules to each record of a stream.
+    
+    Supports the per-record rules of apply_transformations: string_replace
+    on text lines and json_transform (add_fields / remove_fields) on dict
+    records such as CSV rows and JSON lines. A record_function rule may
+    provide any callable(record) -> record; returning None drops the record.
+    Replacements cannot match across line boundaries.
+    
+    Args:
+        records: Input records
+        transformation_rules: Transformation rules
+        counts: Optional dictionary receiving per-rule application counts
+        
+    Yields:
+        Transformed records
+    """
+    counts = counts if counts is not None else {}
+    replacements = [
+        (r.get('old'), r.get('new'))
+        for r in transformation_rules.get('string_replace', {}).get('replacements', [])
+        if r.get('old') is not None and r.get('new') is not None
+    ]
+    json_rules = transformation_rules.get('json_transform', {})
+    add_fields = json_rules.get('add_fields', {})
+    remove_fields = json_rules.get('remove_fields', [])
+    record_function: Optional[Callable] = transformation_rules.get('record_function')
+    
+    for record in records:
+        if isinstance(record, str):
+            for old_value, new_value in replacements:
+                if old_value in record:
+                    counts['string_replace'] = counts.get('string_replace', 0) + record.count(old_value)
+                    record = record.replace(old_value, new_value)
+        elif isinstance(record, dict) and (add_fields or remove_fields):
+            record.update(add_fields)
+            for field in remove_fields:
+                record.pop(field, None)
+            counts['json_transform'] = counts.get('json_transform', 0) + 1
+        
+        if record_function is not None:
+            record = record_function(record)
+            if record is None:
+                counts['dropped'] = counts.get('dropped', 0) + 1
+                continue
+        yield record
 
 
 def initialize_processing(context: Optional[Context] = None, **params) -> Dict[str, Any]:
@@ -855,6 +1180,26 @@ def write_file_content(context: Optional[Context] = None, **params) -> Dict[str,
         if not target_file:
             raise FileProcessingError("target_file parameter is required")
         
+        # Iterators of records are streamed to a temporary file and renamed into place
+        if not isinstance(content, (str, bytes, dict, list)) and hasattr(content, '__iter__'):
+            with StreamingFileWriter(target_file, file_format, encoding) as writer:
+                writer.write_records(content)
+            
+            result = {
+                'target_file': target_file,
+                'bytes_written': writer.bytes_written,
+                'records_written': writer.records_written,
+                'checksum': writer.checksum,
+                'encoding': encoding,
+                'file_format': file_format,
+                'write_time': datetime.now().isoformat(),
+                'write_successful': True
+            }
+            duration = time.time() - start_time
+            processor._track_performance('write_content', duration, bytes_written=writer.bytes_written)
+            processor.logger.info(f"Content streamed successfully: {writer.bytes_written} bytes to {target_file}")
+            return result
+        
         # Prepare content for writing based on format
         write_content = content
         
@@ -932,10 +1277,8 @@ def verify_file_integrity(context: Optional[Context] = None, **params) -> Dict[s
         stat = path_obj.stat()
         actual_size = stat.st_size
         
-        # Calculate checksum
-        with open(file_path, 'rb') as f:
-            content = f.read()
-            actual_checksum = processor._calculate_checksum(content)
+        # Calculate checksum in chunks
+        actual_checksum = processor._calculate_file_checksum(file_path)
         
         verification_results = []
         verification_passed = True
@@ -986,6 +1329,95 @@ def verify_file_integrity(context: Optional[Context] = None, **params) -> Dict[s
         raise FileProcessingError(error_msg) from e
 
 
+def stream_process_file(context: Optional[Context] = None, **params) -> Dict[str, Any]:
+    """
+    Read, transform and write a file record by record with constant memory.
+    
+    Streaming counterpart of read_file_content, apply_transformations and
+    write_file_content for large CSV, JSONL, text and binary files. Checksums
+    of source and target bytes are computed while streaming, and the target
+    is replaced atomically only after all records were written.
+    
+    Args:
+        context: Framework0 context
+        **params: Streaming parameters
+        
+    Returns:
+        Dictionary with record counts, checksums and byte sizes
+    """
+    start_time = time.time()
+    processor = FileProcessor(context)
+    
+    try:
+        source_file = params.get('source_file')
+        target_file = params.get('target_file')
+        file_format = params.get('file_format', 'auto')
+        target_format = params.get('target_format')
+        encoding = params.get('encoding', 'utf-8')
+        target_encoding = params.get('target_encoding', encoding)
+        transformation_rules = params.get('transformation_rules', {})
+        chunk_size = params.get('chunk_size', DEFAULT_CHUNK_SIZE)
+        
+        if not source_file:
+            raise FileProcessingError("source_file parameter is required")
+        
+        if not target_file:
+            raise FileProcessingError("target_file parameter is required")
+        
+        if file_format == 'auto':
+            file_format = processor._detect_format(source_file)
+        target_format = target_format or file_format
+        
+        transformation_counts: Dict[str, int] = {}
+        with StreamingFileReader(source_file, file_format, encoding, chunk_size) as reader:
+            with StreamingFileWriter(target_file, target_format, target_encoding,
+                                     fieldnames=params.get('fieldnames'),
+                                     chunk_size=chunk_size) as writer:
+                writer.write_records(
+                    transform_records(reader, transformation_rules, transformation_counts)
+                )
+        
+        result = {
+            'source_file': source_file,
+            'target_file': target_file,
+            'file_format': file_format,
+            'target_format': target_format,
+            'records_read': reader.records_read,
+            'records_written': writer.records_written,
+            'bytes_read': reader.bytes_read,
+            'bytes_written': writer.bytes_written,
+            'source_checksum': reader.checksum,
+            'target_checksum': writer.checksum,
+            'transformations_applied': transformation_counts,
+            'write_time': datetime.now().isoformat(),
+            'write_successful': True
+        }
+        
+        # Track performance
+        duration = time.time() - start_time
+        processor._track_performance(
+            'stream_process',
+            duration,
+            bytes_read=reader.bytes_read,
+            records_read=reader.records_read
+        )
+        
+        processor.logger.info(
+            f"File streamed successfully: {reader.records_read} records, "
+            f"{writer.bytes_written} bytes to {target_file}"
+        )
+        return result
+        
+    except Exception as e:
+        error_msg = f"Streaming file processing failed: {str(e)}"
+        processor.logger.error(error_msg)
+        
+        if processor.foundation_logger:
+            processor.foundation_logger.error(error_msg, extra={'source_file': source_file, 'error': str(e)})
+        
+        raise FileProcessingError(error_msg) from e
+
+
 def finalize_processing(context: Optional[Context] = None, **params) -> Dict[str, Any]:
     """
     Finalize file processing and generate comprehensive report.
@@ -24,6 +24,7 @@ import functools  # Imported for decorator creation and function wrapping
 import inspect  # Imported for function signature inspection and validation
 import importlib  # Imported for dynamic module loading in registry
 import ast  # Imported for code analysis and paradigm compliance checking
+import asyncio  # Imported for asynchronous scriptlet execution
 import psutil  # Imported for resource monitoring and performance tracking
 from typing import (
     Any,
@@ -522,6 +523,70 @@ def retry_on_failure(
     return decorator  # Return decorator
 
 
+class StepCancelledError(Exception):
+    """Exception raised inside a scriptlet whose step has been cancelled."""
+
+    pass
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation signal shared between a runner and a scriptlet.
+
+    The runner cancels the token when a step times out or the recipe is
+    cancelled. Long-running scriptlets should check it between units of
+    work, or sleep with ``wait`` so cancellation interrupts the sleep.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an uncancelled token."""
+        self._event = threading.Event()  # Set once cancellation is requested
+        self.reason: Optional[str] = None  # Why the step was cancelled
+
+    @property
+    def is_cancelled(self) -> bool:
+        """
+        Check whether cancellation has been requested.
+
+        Returns:
+            True if the token has been cancelled
+        """
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """
+        Request cancellation; the first reason given is kept.
+
+        Args:
+            reason: Human-readable cancellation reason
+        """
+        if not self._event.is_set():
+            self.reason = reason  # Record reason before waking waiters
+            self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raise StepCancelledError if cancellation has been requested.
+
+        Raises:
+            StepCancelledError: If the token has been cancelled
+        """
+        if self._event.is_set():
+            raise StepCancelledError(self.reason)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Sleep until cancelled or the timeout elapses.
+
+        Args:
+            timeout: Maximum time to wait in seconds (forever if None)
+
+        Returns:
+            True if the token was cancelled
+        """
+        return self._event.wait(timeout)
+
+
 class BaseScriptlet(ABC):
     """
     Unified base class for all scriptlets in the IAF0 framework.
@@ -566,6 +631,9 @@ class BaseScriptlet(ABC):
         # Thread safety
         self._lock = threading.RLock()  # Reentrant lock for thread-safe operations
 
+        # Cooperative cancellation, replaced by the runner for each step attempt
+        self.cancellation_token = CancellationToken()
+
         # Validation configuration errors
         validation_errors = (
             self.config.validate_configuration()
@@ -676,52 +744,16 @@ class BaseScriptlet(ABC):
         """
         with self._lock:  # Ensure thread-safe execution
             try:
-                # Initialize execution state
-                self.state = ScriptletState.VALIDATING  # Update state
-                self.start_time = time.time()  # Record start time
-                self.execution_count += 1  # Increment execution counter
-
-                logger.info(f"Starting execution of {self.__class__.__name__}")
-
-                # Execute pre-execution hooks
-                self._execute_hooks(self.config.pre_execution_hooks, context, params)
-
-                # Perform validation
-                if not self.validate(context, params):
-                    validation_result = ScriptletResult(
-                        success=False,  # Mark as failed
-                        exit_code=1,  # Validation failure code
-                        message="Validation failed",  # Error message
-                        validation_errors=[
-                            "Parameter validation failed"
-                        ],  # Validation error details
-                    )
-                    self._handle_completion(validation_result)  # Handle completion
+                # Initialize state and validate before running
+                validation_result = self._begin_execution(context, params)
+                if validation_result is not None:
                     return validation_result  # Return validation failure
 
-                # Update state for execution
-                self.state = ScriptletState.EXECUTING  # Update to executing state
-
                 # Execute the main scriptlet logic
                 exit_code = self.run(context, params)  # Call abstract run method
 
-                # Create successful result
-                result = ScriptletResult(
-                    success=(exit_code == 0),  # Success if exit code is 0
-                    exit_code=exit_code,  # Store exit code
-                    message=(
-                        "Execution completed successfully"
-                        if exit_code == 0
-                        else f"Execution failed with code {exit_code}"
-                    ),
-                    data=self._extract_result_data(
-                        context, params
-                    ),  # Extract result data
-                )
-
                 # Handle completion and return result
-                self._handle_completion(result)  # Process completion
-                return result  # Return execution result
+                return self._finish_execution(exit_code, context, params)
 
             except Exception as e:
                 # Handle execution errors
@@ -729,6 +761,75 @@ class BaseScriptlet(ABC):
                 self._handle_completion(error_result)  # Handle completion
                 return error_result  # Return error result
 
+    def _begin_execution(
+        self, context: Context, params: Dict[str, Any]
+    ) -> Optional[ScriptletResult]:
+        """
+        Start an execution: update state, run pre-execution hooks and validate.
+
+        Args:
+            context: Context instance for state management
+            params: Parameters for scriptlet execution
+
+        Returns:
+            Validation failure result, or None if execution may proceed
+        """
+        # Initialize execution state
+        self.state = ScriptletState.VALIDATING  # Update state
+        self.start_time = time.time()  # Record start time
+        self.execution_count += 1  # Increment execution counter
+
+        logger.info(f"Starting execution of {self.__class__.__name__}")
+
+        # Execute pre-execution hooks
+        self._execute_hooks(self.config.pre_execution_hooks, context, params)
+
+        # Perform validation
+        if not self.validate(context, params):
+            validation_result = ScriptletResult(
+                success=False,  # Mark as failed
+                exit_code=1,  # Validation failure code
+                message="Validation failed",  # Error message
+                validation_errors=[
+                    "Parameter validation failed"
+                ],  # Validation error details
+            )
+            self._handle_completion(validation_result)  # Handle completion
+            return validation_result  # Return validation failure
+
+        # Update state for execution
+        self.state = ScriptletState.EXECUTING  # Update to executing state
+        return None  # Validation passed
+
+    def _finish_execution(
+        self, exit_code: int, context: Context, params: Dict[str, Any]
+    ) -> ScriptletResult:
+        """
+        Build and complete the result for a finished run.
+
+        Args:
+            exit_code: Exit code returned by run
+            context: Context instance with execution state
+            params: Parameters used during execution
+
+        Returns:
+            Execution result
+        """
+        # Create result from exit code
+        result = ScriptletResult(
+            success=(exit_code == 0),  # Success if exit code is 0
+            exit_code=exit_code,  # Store exit code
+            message=(
+                "Execution completed successfully"
+                if exit_code == 0
+                else f"Execution failed with code {exit_code}"
+            ),
+            data=self._extract_result_data(context, params),  # Extract result data
+        )
+
+        self._handle_completion(result)  # Process completion
+        return result  # Return execution result
+
     def _execute_hooks(self, hooks: List[Callable], *args, **kwargs) -> None:
         """
         Execute lifecycle hooks safely with error handling.
@@ -1077,6 +1178,84 @@ class IOScriptlet(BaseScriptlet):
         return super().validate_custom(context, params)  # Call parent validation
 
 
+class AsyncBaseScriptlet(BaseScriptlet):
+    """
+    Base class for I/O-bound scriptlets implemented with asyncio.
+
+    Subclasses implement ``async def run``. The runner's asyncio mode awaits
+    ``execute_async`` on a shared event loop, so many steps can wait on
+    network or database I/O concurrently without occupying a thread each.
+    The synchronous ``execute`` remains available and drives the coroutine
+    on a private event loop.
+
+    An instance must not be awaited by more than one step at a time.
+    """
+
+    async def execute_async(
+        self, context: Context, params: Dict[str, Any]
+    ) -> ScriptletResult:
+        """
+        Execute the scriptlet on the running event loop.
+
+        Args:
+            context: Context instance for state management
+            params: Parameters for scriptlet execution
+
+        Returns:
+            Comprehensive result object with execution details
+
+        Raises:
+            asyncio.CancelledError: If the awaiting task is cancelled
+        """
+        try:
+            # Initialize state and validate before running
+            validation_result = self._begin_execution(context, params)
+            if validation_result is not None:
+                return validation_result  # Return validation failure
+
+            # Await the main scriptlet logic
+            exit_code = await self.run(context, params)  # Call abstract run coroutine
+
+            # Handle completion and return result
+            return self._finish_execution(exit_code, context, params)
+
+        except Exception as e:
+            # Handle execution errors
+            error_result = self._handle_error(e, context, params)  # Process error
+            self._handle_completion(error_result)  # Handle completion
+            return error_result  # Return error result
+
+    def execute(self, context: Context, params: Dict[str, Any]) -> ScriptletResult:
+        """
+        Execute the scriptlet synchronously on a private event loop.
+
+        Args:
+            context: Context instance for state management
+            params: Parameters for scriptlet execution
+
+        Returns:
+            Comprehensive result object with execution details
+
+        Raises:
+            RuntimeError: If called from a thread with a running event loop
+        """
+        return asyncio.run(self.execute_async(context, params))
+
+    @abstractmethod
+    async def run(self, context: Context, params: Dict[str, Any]) -> int:
+        """
+        Execute the main scriptlet logic asynchronously.
+
+        Args:
+            context: Context instance for state management
+            params: Parameters for execution
+
+        Returns:
+            Exit code (0 for success, non-zero for failure)
+        """
+        raise NotImplementedError("Subclasses must implement the run coroutine")
+
+
 # Factory functions for creating scriptlets with enhanced configuration
 def create_compute_scriptlet(
     scriptlet_class: Type[ComputeScriptlet], **config_kwargs
@@ -1329,12 +1508,15 @@ BaseTask = BaseScriptlet  # Alias for legacy BaseTask compatibility
 # Module exports for clean API
 __all__ = [
     "BaseScriptlet",
+    "AsyncBaseScriptlet",
     "ComputeScriptlet",
     "IOScriptlet",
     "ScriptletResult",
     "ScriptletConfig",
     "ScriptletState",
     "ScriptletCategory",
+    "CancellationToken",
+    "StepCancelledError",
     "ExecutionContext",
     "register_scriptlet",
     "get_scriptlet_class",
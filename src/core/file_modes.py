@@ -0,0 +1,41 @@
+"""
+Permission helpers for files written through a temporary file and os.replace.
+
+tempfile.mkstemp creates files readable only by their owner, and os.replace
+keeps the temporary file's mode, so atomic writers use these helpers to give
+the replacement the permissions the target should end up with.
+"""
+
+import os  # Operating system interface for stat and chmod
+from pathlib import Path  # Cross-platform path handling
+from typing import Union  # Type hints for function signatures
+
+
+def _read_umask() -> int:
+    """Return the process umask; os.umask can only report it by replacing it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import so no thread ever sees the temporary zero umask while
+# creating files; later umask changes by the process are not picked up.
+PROCESS_UMASK: int = _read_umask()
+
+
+def replacement_mode(target_path: Union[str, Path]) -> int:
+    """
+    Permission bits for a file that will replace target_path.
+
+    Existing targets keep their mode; new ones get the default 0666
+    filtered by the umask the process started with.
+    """
+    try:
+        return os.stat(target_path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~PROCESS_UMASK
+
+
+def match_file_mode(temp_path: Union[str, Path], target_path: Union[str, Path]) -> None:
+    """Give temp_path the permissions its replacement of target_path should have."""
+    os.chmod(temp_path, replacement_mode(target_path))
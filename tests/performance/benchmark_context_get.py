@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for Context.get throughput.
+
+Compares the lock-free fast path (no get callbacks registered) with the
+dispatching path taken once a before_get callback is registered, which
+performs the same per-read work as the original implementation: lock
+acquisition, callback dispatch and metrics bookkeeping.
+
+Usage:
+    python tests/performance/benchmark_context_get.py [--reads N] [--keys N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+# Allow running the benchmark directly from a source checkout
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from orchestrator.context.context import Context  # noqa: E402
+
+
+def measure_reads(context: Context, keys: int, reads: int) -> float:
+    """Return get() calls per second for a populated context."""
+    key_names = [f"bench.key_{index}" for index in range(keys)]
+    get = context.get  # Bind once so the loop measures get() itself
+
+    start = time.perf_counter()
+    for index in range(reads):
+        get(key_names[index % keys])
+    elapsed = time.perf_counter() - start
+    return reads / elapsed
+
+
+def run_benchmark(reads: int, keys: int) -> Dict[str, Any]:
+    """Run both read paths and return throughput figures."""
+    fast_context = Context()
+    dispatch_context = Context()
+    for index in range(keys):
+        fast_context.set(f"bench.key_{index}", index, who="benchmark")
+        dispatch_context.set(f"bench.key_{index}", index, who="benchmark")
+    dispatch_context.register_callback("before_get", lambda **kwargs: None)
+
+    fast_rate = measure_reads(fast_context, keys, reads)
+    dispatch_rate = measure_reads(dispatch_context, keys, reads)
+
+    return {
+        "reads": reads,
+        "keys": keys,
+        "fast_path_gets_per_second": fast_rate,
+        "dispatch_path_gets_per_second": dispatch_rate,
+        "speedup": fast_rate / dispatch_rate,
+    }
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark Context.get throughput")
+    parser.add_argument("--reads", type=int, default=1_000_000, help="Number of get() calls")
+    parser.add_argument("--keys", type=int, default=1_000, help="Number of keys in the context")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.reads, args.keys)
+    print(f"Context.get over {results['keys']} keys, {results['reads']} reads")
+    print(f"  fast path:     {results['fast_path_gets_per_second']:>12,.0f} gets/s")
+    print(f"  dispatch path: {results['dispatch_path_gets_per_second']:>12,.0f} gets/s")
+    print(f"  speedup:       {results['speedup']:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark for SnapshotManager with the content-addressed chunk store.
+
+Creates a series of snapshots of a large dictionary where only a small
+fraction of keys change between snapshots, and reports time and disk growth
+per snapshot. With chunked storage only changed values, their manifest pages
+and a new root are written; a full copy is shown for comparison.
+
+Usage:
+    python tests/performance/benchmark_snapshot_store.py [--keys N] [--snapshots N] [--changed N]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running the benchmark directly from a source checkout
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from orchestrator.persistence.snapshot import SnapshotManager  # noqa: E402
+
+
+def directory_size(path: str) -> int:
+    """Return the total size of the files under a directory."""
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path) for name in names
+    )
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark chunked snapshot storage")
+    parser.add_argument("--keys", type=int, default=50_000, help="Keys in the snapshotted dictionary")
+    parser.add_argument("--snapshots", type=int, default=10, help="Snapshots to create")
+    parser.add_argument("--changed", type=int, default=100, help="Keys changed between snapshots")
+    args = parser.parse_args()
+
+    base_path = tempfile.mkdtemp(prefix="snapshot_benchmark_")
+    try:
+        manager = SnapshotManager(base_path)
+        data = {f"key_{index}": {"index": index, "payload": "x" * 200} for index in range(args.keys)}
+
+        # Reference point: one full JSON copy of the data
+        start = time.perf_counter()
+        with open(os.path.join(base_path, "full_copy.json"), "w") as f:
+            json.dump(data, f)
+        full_seconds = time.perf_counter() - start
+        full_bytes = os.path.getsize(os.path.join(base_path, "full_copy.json"))
+        os.unlink(os.path.join(base_path, "full_copy.json"))
+
+        print(f"{args.keys:,} keys, {args.changed:,} changed per snapshot")
+        print(f"  full JSON copy: {full_seconds * 1000:,.0f} ms, {full_bytes:,} bytes")
+        print(f"  {'snapshot':>8} {'ms':>10} {'bytes added':>14}")
+
+        previous_size = directory_size(base_path)
+        for snapshot in range(args.snapshots):
+            for offset in range(args.changed):
+                key = f"key_{(snapshot * args.changed + offset) % args.keys}"
+                data[key] = {"index": -snapshot, "payload": "y" * 200}
+
+            start = time.perf_counter()
+            manager.create_snapshot(data)
+            elapsed = time.perf_counter() - start
+
+            size = directory_size(base_path)
+            print(f"  {snapshot:>8} {elapsed * 1000:>10,.0f} {size - previous_size:>14,}")
+            previous_size = size
+
+        manager.cleanup()
+    finally:
+        shutil.rmtree(base_path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the ASGI context server and sharded context backends.
+
+This test suite validates:
+- ShardStore commits and stable key placement
+- SocketShardBackend routing and change notifications over Unix sockets
+- ShardCluster shard processes
+- The ASGI REST API matching EnhancedContextServer responses
+"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("socketio")
+
+# Import test targets
+from orchestrator.asgi_context_server import AsyncContextServer
+from orchestrator.context_shards import (
+    LocalShardBackend, ShardCluster, ShardStore, SocketShardBackend, serve_shard, shard_for
+)
+
+
+async def call(app, method, path, body=None, query=""):
+    """Send one HTTP request to an ASGI app and return (status, JSON body)."""
+    scope = {"type": "http", "method": method, "path": path,
+             "query_string": query.encode(), "headers": []}
+    payload = json.dumps(body).encode() if body is not None else b""
+    messages = [{"type": "http.request", "body": payload, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+class TestShardStore:
+    """Test cases for ShardStore and key placement."""
+
+    def test_set_many_and_history(self) -> None:
+        """Test that only changes are recorded and history is bounded."""
+        store = ShardStore(max_history=2)
+        assert store.set_many({"a": 1, "b": 2}, who="x") == ["a", "b"]
+        assert store.set_many({"a": 1, "c": 3}, who="y") == ["c"]
+
+        assert store.get_many(["a", "z"]) == {"a": 1, "z": None}
+        assert [entry["key"] for entry in store.get_history()] == ["b", "c"]
+        assert store.get_history(who="y")[0]["key"] == "c"
+
+    def test_shard_for_is_stable(self) -> None:
+        """Test that key placement does not depend on the process hash seed."""
+        assert shard_for("app.status", 4) == shard_for("app.status", 4)
+        assert {shard_for(f"key{i}", 4) for i in range(100)} == {0, 1, 2, 3}
+
+
+class TestSocketShardBackend:
+    """Test cases for shards served over Unix sockets."""
+
+    def test_routing_and_watch_events(self, tmp_path) -> None:
+        """Test that keys spread over shards and every change is reported."""
+        async def scenario():
+            paths = [str(tmp_path / f"s{i}.sock") for i in range(3)]
+            stores = [ShardStore() for _ in paths]
+            servers = [await serve_shard(path, store) for path, store in zip(paths, stores)]
+
+            backend = SocketShardBackend(paths)
+            events = []
+            backend.add_watcher(lambda updates, who, origin: events.append((updates, who, origin)))
+            await backend.start()
+
+            values = {f"key{i}": i for i in range(30)}
+            changed = await backend.set_many(values, who="test", origin="sid1")
+            assert sorted(changed) == sorted(values)
+            assert await backend.get_many(["key3", "missing"]) == {"key3": 3, "missing": None}
+            assert await backend.to_dict() == values
+            assert len(await backend.get_history()) == 30
+            assert len(await backend.get_history(key="key7")) == 1
+            assert await backend.history_count() == 30
+
+            # Every shard holds only the keys it owns
+            for index, store in enumerate(stores):
+                assert all(shard_for(key, 3) == index for key in store.to_dict())
+                assert store.to_dict()
+
+            await asyncio.sleep(0.05)  # Let change events arrive
+            received = {}
+            for updates, who, origin in events:
+                assert (who, origin) == ("test", "sid1")
+                received.update(updates)
+            assert received == values
+
+            await backend.close()
+            for server in servers:
+                server.close()
+
+        asyncio.run(scenario())
+
+    def test_cluster_processes(self) -> None:
+        """Test that ShardCluster shards are reachable from a backend."""
+        async def scenario(paths):
+            backend = SocketShardBackend(paths)
+            await backend.start()
+            await backend.set_many({"a": 1, "b": 2})
+            state = await backend.to_dict()
+            await backend.close()
+            return state
+
+        with ShardCluster(shard_count=2) as cluster:
+            assert asyncio.run(scenario(cluster.socket_paths)) == {"a": 1, "b": 2}
+
+
+class TestAsyncContextServer:
+    """Test cases for the ASGI REST API."""
+
+    @pytest.fixture
+    def server(self, tmp_path):
+        """Create an in-process server with dumps in a temporary directory."""
+        return AsyncContextServer(backend=LocalShardBackend(), dump_directory=str(tmp_path / "dumps"))
+
+    def test_rest_api(self, server) -> None:
+        """Test get, set, batch, all and history endpoints."""
+        async def scenario():
+            published = []
+            server.broadcaster.publish = lambda updates, who, skip_sid=None: published.append(updates)
+            app = server.app
+
+            status, data = await call(app, "POST", "/ctx", {"key": "app.status", "value": "up", "who": "t"})
+            assert status == 200 and data["status"] == "success"
+
+            status, data = await call(app, "GET", "/ctx", query="key=app.status")
+            assert data["value"] == "up"
+
+            status, data = await call(app, "POST", "/ctx/batch",
+                                      {"set": {"a": 1, "app.status": "up"}, "get": ["a"], "who": "t"})
+            assert data["values"] == {"a": 1}
+            assert data["updated"] == ["a"]
+
+            status, data = await call(app, "GET", "/ctx/all")
+            assert data["context"] == {"app.status": "up", "a": 1}
+            assert data["history_count"] == 2
+
+            status, data = await call(app, "GET", "/ctx/history", query="key=a")
+            assert data["filtered_entries"] == 1 and data["total_entries"] == 2
+
+            assert published == [{"app.status": "up"}, {"a": 1}]
+            await server.close()
+
+        asyncio.run(scenario())
+
+    def test_errors(self, server) -> None:
+        """Test validation errors and unknown routes."""
+        async def scenario():
+            app = server.app
+            assert (await call(app, "GET", "/ctx"))[0] == 400
+            assert (await call(app, "POST", "/ctx", {"key": "a"}))[0] == 400
+            assert (await call(app, "POST", "/ctx/batch", {"set": {"a": None}}))[0] == 400
+            status, data = await call(app, "GET", "/nothing")
+            assert status == 404 and data["status"] == "error"
+            await server.close()
+
+        asyncio.run(scenario())
+
+    def test_dump_and_list(self, server) -> None:
+        """Test dumping context to a file and listing dumps."""
+        async def scenario():
+            app = server.app
+            await call(app, "POST", "/ctx", {"key": "a", "value": 1})
+            status, data = await call(app, "POST", "/ctx/dump",
+                                      {"format": "csv", "filename": "../escape", "include_history": True})
+            assert status == 200
+            assert data["filename"] == "escape.csv"
+            assert (server.dump_directory / "escape.csv").exists()
+
+            status, data = await call(app, "GET", "/ctx/dump/list")
+            assert data["dump_count"] == 1
+            await server.close()
+
+        asyncio.run(scenario())
@@ -8,7 +8,9 @@ resource monitoring, and performance validation.
 """
 
 import pytest
+import json
 import os
+import sqlite3
 import time
 from datetime import datetime
 from unittest.mock import Mock, patch
@@ -24,6 +26,9 @@ try:
         BatchProcessingError,
         BatchProcessingStats,
         CheckpointData,
+        AdaptiveConcurrencyController,
+        SQLiteResultSink,
+        execute_streaming_batch_processing,
     )
 except ImportError:
     # Fallback for test environments
@@ -38,9 +43,19 @@ except ImportError:
         BatchProcessingError,
         BatchProcessingStats,
         CheckpointData,
+        AdaptiveConcurrencyController,
+        SQLiteResultSink,
+        execute_streaming_batch_processing,
     )
 
 
+def square_or_fail(item, offset=0):
+    """Module-level processing function importable by process workers."""
+    if item < 0:
+        raise ValueError(f"Negative item: {item}")
+    return item * item + offset
+
+
 class TestBatchProcessing:
     """Test suite for Batch Processing functionality."""
 
@@ -569,6 +584,370 @@ class TestBatchProcessingIntegration:
         checkpoint_manager.cleanup_checkpoints(keep_latest=0)
 
 
+class TestProcessExecutionMode:
+    """Test cases for the process pool worker protocol."""
+
+    def _manager(self, tmp_path, **config):
+        return BatchProcessingManager(
+            {
+                "parallel_workers": 2,
+                "execution_mode": "process",
+                "checkpoint_config": {"checkpoint_storage_path": str(tmp_path)},
+                "memory_config": {"throttling_enabled": False},
+                **config,
+            }
+        )
+
+    def test_process_mode_results(self, tmp_path):
+        """Test that process workers import the function and return summaries."""
+        manager = self._manager(tmp_path)
+        manager.processing_function = square_or_fail
+
+        partitions = manager.partition_data([1, 2, -3, 4, 5], {"partition_size": 2})
+        result = manager.execute_parallel_processing(partitions, {"offset": 1})
+
+        summaries = sorted(result["processing_results"], key=lambda r: r["worker_id"])
+        assert [r["results"] for r in summaries] == [[2, 5], [17], [26]]
+        assert summaries[1]["errors"][0]["error_type"] == "ValueError"
+        assert "item" not in summaries[1]["errors"][0]
+        assert result["statistics"].processed_items == 4
+        assert result["statistics"].failed_items == 1
+
+    def test_process_mode_without_results(self, tmp_path):
+        """Test that collect_results disabled returns counts only."""
+        manager = self._manager(tmp_path, collect_results=False)
+        manager.load_processing_function("square_or_fail", square_or_fail.__module__)
+
+        result = manager.execute_parallel_processing([[1, 2], [3]], {})
+        assert all(r["results"] == [] for r in result["processing_results"])
+        assert result["statistics"].processed_items == 3
+
+    def test_process_mode_rejects_local_function(self, tmp_path):
+        """Test that functions workers cannot import are rejected up front."""
+        manager = self._manager(tmp_path)
+        manager.processing_function = lambda item: item
+
+        with pytest.raises(BatchProcessingError):
+            manager.execute_parallel_processing([[1]], {})
+
+
+class TestStreamingProcessing:
+    """Test cases for bounded-memory streaming execution."""
+
+    def _manager(self, tmp_path, mode="thread"):
+        manager = BatchProcessingManager(
+            {
+                "parallel_workers": 2,
+                "execution_mode": mode,
+                "chunk_size": 10,
+                "checkpoint_config": {"checkpoint_storage_path": str(tmp_path)},
+                "memory_config": {"throttling_enabled": False},
+            }
+        )
+        manager.processing_function = square_or_fail
+        return manager
+
+    def test_window_bounds_items_read_ahead(self, tmp_path):
+        """Test that the source is consumed only as partitions complete."""
+        manager = self._manager(tmp_path)
+        pulled = []
+        completed = []
+        max_ahead = []
+
+        def source():
+            for i in range(1000):
+                pulled.append(i)
+                max_ahead.append(len(pulled) - sum(completed))
+                yield i
+
+        result = manager.execute_streaming_processing(
+            source(),
+            {},
+            max_in_flight=3,
+            combiner=lambda total, value: total + value,
+            initial_value=0,
+            progress_callback=lambda done, seen: completed.append(10),
+        )
+
+        assert result["combined_result"] == sum(i * i for i in range(1000))
+        assert result["partitions_completed"] == 100
+        assert max(max_ahead) <= 4 * 10  # Window plus the partition being read
+
+    def test_errors_are_sampled(self, tmp_path):
+        """Test that errors are counted in full but only a sample is kept."""
+        manager = self._manager(tmp_path, mode="process")
+        result = manager.execute_streaming_processing(
+            (-i for i in range(1, 101)), {}, max_error_samples=5
+        )
+
+        assert result["statistics"].failed_items == 100
+        assert result["error_counts"] == {"ValueError": 100}
+        assert len(result["error_samples"]) == 5
+        assert "item" not in result["error_samples"][0]
+
+    def test_recipe_step_with_sqlite_sink(self, tmp_path):
+        """Test the recipe step reading a file into a SQLite sink."""
+        source = tmp_path / "items.jsonl"
+        source.write_text("\n".join(str(i) for i in range(25)) + "\n")
+        database = tmp_path / "results.db"
+
+        result = execute_streaming_batch_processing(
+            batch_processing_manager=self._manager(tmp_path),
+            data_source_config={"source_type": "file", "source_path": str(source)},
+            processing_function={"function_parameters": {"offset": 1}},
+            streaming_config={
+                "result_sink": {"sink_type": "sqlite", "path": str(database)}
+            },
+        )
+
+        assert result["execution_statistics"]["total_items_processed"] == 25
+        with sqlite3.connect(database) as connection:
+            rows = connection.execute("SELECT result FROM batch_results").fetchall()
+        assert sorted(int(row[0]) for row in rows) == [i * i + 1 for i in range(25)]
+
+    def test_invalid_sqlite_table_rejected(self, tmp_path):
+        """Test that table names are validated before use in SQL."""
+        with pytest.raises(BatchProcessingError):
+            SQLiteResultSink(str(tmp_path / "db.sqlite"), table="x; DROP")
+
+
+class TestExactResume:
+    """Test cases for the completed-partition ledger and resume."""
+
+    def _manager(self, tmp_path, **checkpoint_config):
+        manager = BatchProcessingManager(
+            {
+                "parallel_workers": 2,
+                "execution_mode": "thread",
+                "job_id": "job1",
+                "checkpoint_config": {
+                    "checkpoint_storage_path": str(tmp_path),
+                    **checkpoint_config,
+                },
+                "memory_config": {"throttling_enabled": False},
+            }
+        )
+        manager.calls = []
+
+        def tracked(item):
+            manager.calls.append(item)
+            return square_or_fail(item)
+
+        manager.processing_function = tracked
+        return manager
+
+    def _crash_after(self, tmp_path, completed):
+        """Truncate job1's ledger to its header and the given completed partitions."""
+        ledger = tmp_path / "ledger_job1.jsonl"
+        lines = ledger.read_text().splitlines(keepends=True)
+        header, entries = lines[0], sorted(lines[1:], key=lambda line: json.loads(line)["partition_id"])
+        if isinstance(completed, int):
+            completed = range(completed)
+        ledger.write_text(header + "".join(entries[i] for i in completed))
+
+    @pytest.mark.parametrize("storage_format", ["pickle", "json"])
+    def test_resume_skips_completed_partitions(self, tmp_path, storage_format):
+        """Test that a resumed job processes only unfinished partitions."""
+        partitions = [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]
+        first = self._manager(tmp_path, storage_format=storage_format)
+        first.execute_parallel_processing(partitions, {})
+        self._crash_after(tmp_path, 3)
+
+        resumed = self._manager(tmp_path, storage_format=storage_format)
+        assert resumed.resume_from_checkpoint() == 3
+        result = resumed.execute_parallel_processing(partitions, {})
+
+        assert sorted(resumed.calls) == [6, 7, 8, 9]
+        merged = sorted(r for worker in result["processing_results"] for r in worker["results"])
+        assert merged == [i * i for i in range(10)]
+        assert result["statistics"].processed_items == 10
+
+    def test_streaming_resume_restores_combined_value(self, tmp_path):
+        """Test that streaming resume folds stored results into the combiner."""
+        first = self._manager(tmp_path)
+        first.execute_streaming_processing(
+            range(20), {}, partition_size=5, combiner=lambda a, b: a + b, initial_value=0
+        )
+
+        resumed = self._manager(tmp_path)
+        resumed.resume_from_checkpoint()
+        result = resumed.execute_streaming_processing(
+            range(30), {}, partition_size=5, combiner=lambda a, b: a + b, initial_value=0
+        )
+
+        assert sorted(resumed.calls) == list(range(20, 30))
+        assert result["combined_result"] == sum(i * i for i in range(30))
+
+    def test_streaming_resume_with_adaptive_partition_size(self, tmp_path):
+        """Test that resumed item ranges are restored when partition sizes change."""
+        first = self._manager(tmp_path)
+        first.execute_streaming_processing(
+            range(30), {}, partition_size=5, combiner=lambda a, b: a + b, initial_value=0
+        )
+        self._crash_after(tmp_path, [0, 1, 3])  # Items 0-9 and 15-19 completed
+
+        resumed = self._manager(tmp_path)
+        resumed.adaptive_controller = AdaptiveConcurrencyController({}, 2, 7)
+        resumed.resume_from_checkpoint()
+        result = resumed.execute_streaming_processing(
+            range(30), {}, combiner=lambda a, b: a + b, initial_value=0
+        )
+
+        assert sorted(resumed.calls) == list(range(10, 15)) + list(range(20, 30))
+        assert result["combined_result"] == sum(i * i for i in range(30))
+
+    def test_streaming_resume_refuses_shorter_source(self, tmp_path):
+        """Test that a source ending inside a completed range is rejected."""
+        self._manager(tmp_path).execute_streaming_processing(range(10), {}, partition_size=5)
+
+        resumed = self._manager(tmp_path)
+        resumed.resume_from_checkpoint()
+        with pytest.raises(BatchProcessingError, match="ended inside"):
+            resumed.execute_streaming_processing(range(7), {}, partition_size=5)
+
+    def test_fresh_run_discards_previous_ledger(self, tmp_path):
+        """Test that a run without resume does not leave stale results behind."""
+        self._manager(tmp_path).execute_parallel_processing([[1], [2], [3]], {})
+        self._manager(tmp_path).execute_parallel_processing([[4], [5]], {})
+
+        resumed = self._manager(tmp_path)
+        assert resumed.resume_from_checkpoint() == 2
+        result = resumed.execute_parallel_processing([[4], [5]], {})
+        assert resumed.calls == []
+        assert sorted(r for worker in result["processing_results"] for r in worker["results"]) == [16, 25]
+
+    def test_resume_refuses_changed_layout(self, tmp_path):
+        """Test that resuming with differently partitioned data is rejected."""
+        self._manager(tmp_path).execute_parallel_processing([[0, 1], [2, 3]], {})
+
+        resumed = self._manager(tmp_path)
+        resumed.resume_from_checkpoint()
+        with pytest.raises(BatchProcessingError, match="partition layout"):
+            resumed.execute_parallel_processing([[0], [1], [2], [3]], {})
+
+    def test_ledger_not_synced_unless_durable(self, tmp_path, monkeypatch):
+        """Test that partition results are only fsynced for durable checkpoints."""
+        synced = []
+        monkeypatch.setattr(os, "fsync", synced.append)
+        self._manager(tmp_path).execute_parallel_processing([[1], [2]], {})
+        assert synced == []
+
+        self._manager(tmp_path, durable=True).execute_parallel_processing([[1], [2]], {})
+        assert len(synced) == 5  # Header, then result file and ledger line per partition
+
+    def test_torn_ledger_line_ignored(self, tmp_path):
+        """Test that a partially written ledger entry does not break resume."""
+        manager = self._manager(tmp_path)
+        manager.execute_parallel_processing([[1], [2]], {})
+        with open(tmp_path / "ledger_job1.jsonl", "a") as f:
+            f.write('{"partition_id": 2, "proc')
+
+        assert self._manager(tmp_path).resume_from_checkpoint() == 2
+
+    def test_initialize_with_resume(self, tmp_path):
+        """Test that initialize_batch_processing resumes the job of the same configuration."""
+        params = {
+            "batch_processing_config": {"recipe_name": "resume_test"},
+            "processing_config": {
+                "processing_function": "square_or_fail",
+                "processing_module": square_or_fail.__module__,
+            },
+            "execution_config": {"parallel_workers": 1, "execution_mode": "thread"},
+            "memory_config": {"throttling_enabled": False},
+            "checkpoint_config": {"checkpoint_storage_path": str(tmp_path), "exact_resume": True},
+        }
+        manager = initialize_batch_processing(**params)["batch_processing_manager"]
+        manager.execute_parallel_processing([[1, 2]], {})
+
+        result = initialize_batch_processing(resume_from_checkpoint=True, **params)
+        assert result["batch_processing_manager"].job_id == manager.job_id
+        assert result["initialization_status"]["resume"]["completed_partitions"] == 1
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAdaptiveConcurrency:
+    """Test cases for the AIMD concurrency controller."""
+
+    def _controller(self, **config):
+        clock = FakeClock()
+        controller = AdaptiveConcurrencyController(
+            {"max_concurrency": 16, "adjust_interval": 1.0, **config}, 4, 100, clock=clock
+        )
+        return controller, clock
+
+    def _window(self, controller, clock, items, cpu=50.0, memory_pressure=False):
+        controller.record_partition(items, 0.0)
+        clock.now += 1.0
+        return controller.adjust({"system_cpu_percent": cpu}, memory_pressure)
+
+    def test_additive_increase_until_cpu_ceiling(self):
+        """Test that the limit grows while throughput holds and CPU has headroom."""
+        controller, clock = self._controller()
+        for items in (100, 150, 200):
+            assert self._window(controller, clock, items)
+        assert controller.concurrency == 7
+
+        assert not self._window(controller, clock, 200, cpu=95.0)
+        assert controller.concurrency == 7
+
+    def test_throughput_drop_steps_back(self):
+        """Test that a throughput drop removes the last increase."""
+        controller, clock = self._controller()
+        self._window(controller, clock, 200)
+        self._window(controller, clock, 100)
+        assert controller.concurrency == 4
+
+    def test_memory_pressure_cuts_multiplicatively(self):
+        """Test that memory pressure halves the limit within bounds."""
+        controller, clock = self._controller(min_concurrency=3)
+        self._window(controller, clock, 100, memory_pressure=True)
+        assert controller.concurrency == 3
+
+    def test_adjusts_once_per_interval(self):
+        """Test that adjustments wait for a full measurement interval."""
+        controller, clock = self._controller()
+        controller.record_partition(100, 0.0)
+        clock.now += 0.5
+        assert not controller.adjust({"system_cpu_percent": 0.0}, False)
+
+    def test_partition_size_from_latency(self):
+        """Test that partitions are sized to the target duration."""
+        controller, _ = self._controller(target_partition_seconds=0.5)
+        controller.record_partition(100, 1.0)  # 10ms per item
+        assert controller.partition_size == 50
+
+    def test_manager_runs_adaptive_modes(self, tmp_path):
+        """Test list and streaming execution with the controller enabled."""
+        manager = BatchProcessingManager(
+            {
+                "parallel_workers": 1,
+                "execution_mode": "thread",
+                "chunk_size": 4,
+                "adaptive_concurrency": {"enabled": True, "max_concurrency": 3},
+                "checkpoint_config": {"checkpoint_storage_path": str(tmp_path)},
+            }
+        )
+        manager.processing_function = square_or_fail
+
+        result = manager.execute_parallel_processing([[i] for i in range(10)], {})
+        assert result["statistics"].processed_items == 10
+        assert result["adaptive_concurrency"]["concurrency"] >= 1
+
+        result = manager.execute_streaming_processing(
+            range(50), {}, combiner=lambda a, b: a + b, initial_value=0
+        )
+        assert result["combined_result"] == sum(i * i for i in range(50))
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v"])
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the consolidated Context system.
+
+This test suite validates the Context functionality including:
+- Basic get/set behaviour and JSON validation
+- Copy-on-write storage with frozen, structurally shared values
+- Bounded history with per-key retention and spill-to-disk
+- Lock-free get path with lazily folded metrics
+- Incremental memory accounting
+"""
+
+import copy
+import json
+import pickle
+import shutil
+import tempfile
+import unittest
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+
+# Import test target
+from orchestrator.context.context import (
+    Context, ContextHistoryBuffer, FrozenDict, FrozenList, freeze_value, thaw_value
+)
+
+
+class TestContextStorage(unittest.TestCase):
+    """Test cases for default (deep copy) Context storage."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.context = Context()  # Create test Context
+
+    def test_set_isolates_caller_value(self) -> None:
+        """Test that later mutation of the caller's object is not visible."""
+        value = {"items": [1, 2, 3]}
+        self.context.set("data", value, who="test")
+        value["items"].append(4)
+
+        self.assertEqual(self.context.get("data"), {"items": [1, 2, 3]})
+        history = self.context.get_history()
+        self.assertEqual(history[-1]["after"], {"items": [1, 2, 3]})
+
+    def test_rejects_non_serializable_values(self) -> None:
+        """Test that non-JSON values are rejected."""
+        with self.assertRaises(ValueError):
+            self.context.set("bad", {"value": object()})
+
+    def test_unchanged_value_is_noop(self) -> None:
+        """Test that setting an equal value records no history."""
+        self.context.set("count", 1)
+        self.context.set("count", 1)
+
+        self.assertEqual(len(self.context.get_history()), 1)
+
+
+class TestCopyOnWriteContext(unittest.TestCase):
+    """Test cases for copy-on-write Context storage."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.context = Context(copy_on_write=True)  # Create test Context
+
+    def test_values_are_frozen(self) -> None:
+        """Test that stored containers are immutable."""
+        self.context.set("data", {"items": [1, 2]}, who="test")
+        stored = self.context.get("data")
+
+        self.assertIsInstance(stored, FrozenDict)
+        self.assertIsInstance(stored["items"], FrozenList)
+        with self.assertRaises(TypeError):
+            stored["new"] = 1
+        with self.assertRaises(TypeError):
+            stored["items"].append(3)
+
+    def test_history_shares_stored_value(self) -> None:
+        """Test that history keeps references instead of copies."""
+        self.context.set("data", [1, 2, 3])
+        self.context.set("data", [4, 5, 6])
+        history = self.context.get_history()
+
+        self.assertIs(history[-1]["after"], self.context.get("data"))
+        self.assertIs(history[-1]["before"], history[0]["after"])
+
+    def test_structural_sharing(self) -> None:
+        """Test that frozen sub-values are reused when rebuilding a container."""
+        self.context.set("data", {"large": list(range(1000)), "small": 1})
+        original = self.context.get("data")
+
+        updated = dict(original)
+        updated["small"] = 2
+        self.context.set("data", updated)
+
+        self.assertIs(self.context.get("data")["large"], original["large"])
+        self.assertEqual(self.context.get("data")["small"], 2)
+
+    def test_to_dict_returns_mutable_copy(self) -> None:
+        """Test that to_dict returns plain, mutable containers."""
+        self.context.set("data", {"items": [1]})
+        exported = self.context.to_dict()
+        exported["data"]["items"].append(2)
+
+        self.assertEqual(self.context.get("data"), {"items": [1]})
+        self.assertEqual(json.loads(self.context.to_json()), {"data": {"items": [1]}})
+
+    def test_rejects_non_serializable_values(self) -> None:
+        """Test that freezing validates JSON compatibility."""
+        with self.assertRaises(ValueError):
+            self.context.set("bad", [object()])
+        with self.assertRaises(ValueError):
+            self.context.set("bad", {(1, 2): "tuple key"})
+
+    def test_merge_from_copy_on_write_context(self) -> None:
+        """Test merging shares frozen values between contexts."""
+        source = Context(copy_on_write=True)
+        source.set("data", {"items": [1, 2]})
+        self.context.merge_from(source)
+
+        self.assertIs(self.context.get("data"), source.get("data"))
+
+    def test_merge_into_plain_context_thaws_values(self) -> None:
+        """Test that a non copy-on-write context never stores frozen values."""
+        source = Context(copy_on_write=True)
+        source.set("data", {"items": [1, 2]})
+        target = Context()
+        target.merge_from(source)
+        target.set("copy", source.get("data"))
+
+        for key in ("data", "copy"):
+            value = target.get(key)
+            self.assertIs(type(value), dict)
+            self.assertIs(type(value["items"]), list)
+            value["items"].append(3)  # Mutable, and not shared with the source
+        self.assertEqual(source.get("data"), {"items": [1, 2]})
+        self.assertIs(type(target.to_dict()["data"]), dict)
+
+    def test_plain_context_keeps_container_subclasses(self) -> None:
+        """Test that copies of dict subclasses keep their type and state."""
+        context = Context()
+        counts = defaultdict(int, {"a": 1})
+        context.set("data", {"ordered": OrderedDict([("b", 2), ("a", 1)]), "counts": counts})
+
+        value = context.get("data")
+        self.assertIs(type(value["ordered"]), OrderedDict)
+        self.assertEqual(list(value["ordered"]), ["b", "a"])
+        value["counts"]["new"] += 1  # Factory survives the copy
+        self.assertEqual(counts, {"a": 1})
+
+    def test_from_json_freezes_values(self) -> None:
+        """Test that deserialized contexts use frozen storage."""
+        context = Context.from_json('{"data": {"items": [1]}}', copy_on_write=True)
+
+        self.assertIsInstance(context.get("data"), FrozenDict)
+
+
+class TestFrozenValues(unittest.TestCase):
+    """Test cases for frozen value helpers."""
+
+    def test_copy_and_pickle(self) -> None:
+        """Test that frozen values survive copy and pickle round-trips."""
+        frozen = freeze_value({"items": [1, {"nested": True}]})
+
+        self.assertIs(copy.deepcopy(frozen), frozen)
+        restored = pickle.loads(pickle.dumps(frozen))
+        self.assertEqual(restored, frozen)
+        self.assertIsInstance(restored["items"], FrozenList)
+
+    def test_thaw_value(self) -> None:
+        """Test that thawed values are plain and mutable."""
+        thawed = thaw_value(freeze_value({"items": [1]}))
+        thawed["items"].append(2)
+
+        self.assertIs(type(thawed), dict)
+        self.assertIs(type(thawed["items"]), list)
+
+
+class TestBoundedHistory(unittest.TestCase):
+    """Test cases for bounded, spilling Context history."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())  # Directory for spill logs
+
+    def tearDown(self) -> None:
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_history_limit_bounds_memory(self) -> None:
+        """Test that only the newest entries stay in memory."""
+        context = Context(history_limit=3)
+        for value in range(10):
+            context.set("counter", value)
+
+        history = context.get_history()
+        self.assertEqual([entry["after"] for entry in history], [7, 8, 9])
+        self.assertEqual(context.get_metrics()["history_entries"], 3)
+
+    def test_spilled_history_is_pageable(self) -> None:
+        """Test that evicted entries are spilled and readable in order."""
+        spill_path = self.temp_dir / "history.jsonl"
+        context = Context(history_limit=4, history_spill_path=spill_path)
+        for value in range(10):
+            context.set("counter", value, who="test")
+
+        self.assertEqual(len(context._history), 4)
+
+        full = context.get_history()
+        self.assertEqual([entry["after"] for entry in full], list(range(10)))
+        self.assertEqual(len(spill_path.read_text().splitlines()), 6)
+
+        page = context.get_history(offset=5, limit=3)
+        self.assertEqual([entry["after"] for entry in page], [5, 6, 7])
+
+    def test_per_key_retention(self) -> None:
+        """Test that retention rules keep only the newest entries per key."""
+        context = Context(history_retention={"metrics.": 2})
+        for value in range(5):
+            context.set("metrics.cpu", value)
+        context.set("result", "done")
+
+        history = context.get_history()
+        self.assertEqual(
+            [(entry["key"], entry["after"]) for entry in history],
+            [("metrics.cpu", 3), ("metrics.cpu", 4), ("result", "done")],
+        )
+
+    def test_retention_without_limit_releases_slots(self) -> None:
+        """Test that discarded entries do not accumulate in an unbounded buffer."""
+        context = Context(history_retention={"metrics.": 2})
+        context.set("result", "start")
+        for value in range(100):
+            context.set("metrics.cpu", value)
+
+        self.assertEqual(len(context._history), 3)
+        self.assertEqual(len(context._history._slots), 3)
+        self.assertEqual(
+            [entry["after"] for entry in context.get_history()], ["start", 98, 99]
+        )
+
+    def test_close_releases_spill_handle(self) -> None:
+        """Test that closing the context closes the spill log handle."""
+        spill_path = self.temp_dir / "history.jsonl"
+        with Context(history_limit=2, history_spill_path=spill_path) as context:
+            for value in range(5):
+                context.set("counter", value)
+            self.assertIsNotNone(context._history._spill_file)
+
+        self.assertIsNone(context._history._spill_file)
+        context.set("counter", 5)  # Reopens the log on the next eviction
+        self.assertEqual(
+            [entry["after"] for entry in context.get_history()], list(range(6))
+        )
+        context.close()
+
+    def test_clear_history_truncates_spill(self) -> None:
+        """Test that clearing history removes spilled entries too."""
+        spill_path = self.temp_dir / "history.jsonl"
+        context = Context(history_limit=2, history_spill_path=spill_path)
+        for value in range(5):
+            context.set("counter", value)
+
+        self.assertEqual(context.clear_history(), 5)
+        self.assertEqual(context.get_history(), [])
+        self.assertFalse(spill_path.exists())
+
+    def test_invalid_capacity(self) -> None:
+        """Test that non-positive capacities are rejected."""
+        with self.assertRaises(ValueError):
+            ContextHistoryBuffer(capacity=0)
+
+
+class TestContextReadPath(unittest.TestCase):
+    """Test cases for the Context.get fast path."""
+
+    def test_get_metrics_fold_fast_path_reads(self) -> None:
+        """Test that lock-free reads are reflected in metrics."""
+        context = Context()
+        context.set("key", "value")
+        for _ in range(5):
+            context.get("key")
+
+        metrics = context.get_metrics()
+        self.assertEqual(metrics["get_operations"], 5)
+        self.assertEqual(metrics["total_operations"], 6)
+        self.assertEqual(context.get_metrics()["get_operations"], 5)
+
+    def test_callbacks_still_dispatched(self) -> None:
+        """Test that registering a get callback enables dispatch."""
+        context = Context()
+        context.set("key", "value")
+        seen = []
+        context.register_callback("after_get", lambda **kwargs: seen.append(kwargs["value"]))
+
+        self.assertEqual(context.get("key"), "value")
+        self.assertEqual(context.get("missing", "fallback"), "fallback")
+        self.assertEqual(seen, ["value", "fallback"])
+        self.assertEqual(context.get_metrics()["get_operations"], 2)
+
+
+class TestMemoryAccounting(unittest.TestCase):
+    """Test cases for incremental memory usage estimates."""
+
+    def data_bytes(self, context: Context) -> int:
+        """Return the memory estimate without history and dirty-key overhead."""
+        context.clear_history()
+        context.pop_dirty_keys()
+        return context.get_metrics()["memory_usage_bytes"]
+
+    def test_matches_full_serialization(self) -> None:
+        """Test that the running estimate equals the serialized size."""
+        context = Context()
+        context.set("numbers", list(range(100)))
+        context.set("nested", {"name": "value", "flags": [True, None]})
+        context.set("numbers", list(range(10)))
+
+        expected = len(json.dumps(context.to_dict()).encode("utf-8"))
+        self.assertEqual(self.data_bytes(context), expected)
+
+    def test_from_json_and_merge_are_accounted(self) -> None:
+        """Test that deserialized and merged keys are measured."""
+        context = Context.from_json('{"alpha": [1, 2, 3]}')
+        other = Context()
+        other.set("beta", "text")
+        context.merge_from(other)
+
+        expected = len(json.dumps(context.to_dict()).encode("utf-8"))
+        self.assertEqual(self.data_bytes(context), expected)
+
+    def test_accurate_mode(self) -> None:
+        """Test that the sampled getsizeof estimate scales with content."""
+        context = Context(enable_history=False)
+        context.set("small", list(range(10)))
+        small_estimate = context.get_metrics(accurate=True)["memory_usage_bytes"]
+        context.set("large", [str(index) for index in range(10000)])
+        large_estimate = context.get_metrics(accurate=True)["memory_usage_bytes"]
+
+        self.assertGreater(large_estimate, small_estimate + 10000 * 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test Suite for batched context server operations.
+
+This test suite validates the /ctx/batch endpoint and the batching
+client API:
+- Sets applied as one history commit with one coalesced publish
+- Gets observing writes from the same batch
+- ContextClient.get_many/set_many and pipeline ordering
+"""
+
+import pytest
+from unittest import mock
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_socketio")
+pytest.importorskip("requests")
+
+# Import test targets
+from orchestrator.enhanced_context_server import EnhancedContextServer, Context
+from orchestrator.context_client import ContextClient, ContextPipeline
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """Create a server whose dump directory lives in a temporary path."""
+    monkeypatch.chdir(tmp_path)
+    return EnhancedContextServer(host="127.0.0.1", port=0)
+
+
+class TestContextSetMany:
+    """Test cases for Context.set_many."""
+
+    def test_records_changes_with_shared_timestamp(self) -> None:
+        """Test that only changed keys are recorded, in one commit."""
+        context = Context()
+        context.set("a", 1)
+
+        updated = context.set_many({"a": 1, "b": 2, "c": 3}, who="batch")
+
+        assert updated == ["b", "c"]
+        history = context.get_history()[1:]
+        assert [entry["key"] for entry in history] == ["b", "c"]
+        assert len({entry["timestamp"] for entry in history}) == 1
+        assert sorted(context.pop_dirty_keys()) == ["a", "b", "c"]
+
+
+class TestBatchEndpoint:
+    """Test cases for POST /ctx/batch."""
+
+    def test_sets_then_gets_with_one_broadcast(self, server) -> None:
+        """Test that a batch publishes a single update and reads its own writes."""
+        with mock.patch.object(server.broadcaster, "publish") as publish:
+            with server.app.test_client() as client:
+                response = client.post('/ctx/batch', json={
+                    "set": {"a": 1, "b": {"nested": True}},
+                    "get": ["a", "missing"],
+                    "who": "worker"
+                })
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["values"] == {"a": 1, "missing": None}
+        assert sorted(data["updated"]) == ["a", "b"]
+        assert server.context.get("b") == {"nested": True}
+
+        publish.assert_called_once_with({"a": 1, "b": {"nested": True}}, who="worker")
+
+    def test_unchanged_batch_does_not_broadcast(self, server) -> None:
+        """Test that a batch of no-op writes publishes nothing."""
+        server.context.set("a", 1)
+        with mock.patch.object(server.broadcaster, "publish") as publish:
+            with server.app.test_client() as client:
+                response = client.post('/ctx/batch', json={"set": {"a": 1}})
+
+        assert response.status_code == 200
+        publish.assert_not_called()
+
+    def test_rejects_invalid_batches(self, server) -> None:
+        """Test validation of batch shape, null values and size."""
+        server.max_batch_size = 2
+        with server.app.test_client() as client:
+            assert client.post('/ctx/batch', json={"set": ["a"]}).status_code == 400
+            assert client.post('/ctx/batch', json={"set": {"a": None}}).status_code == 400
+            assert client.post('/ctx/batch', json={"get": ["a", "b", "c"]}).status_code == 400
+
+
+class TestBatchClient:
+    """Test cases for ContextClient batch operations and pipelines."""
+
+    @pytest.fixture
+    def client(self, server):
+        """Create a client whose requests are served by the Flask test client."""
+        client = ContextClient(host="127.0.0.1", port=0)
+        test_client = server.app.test_client()
+
+        def make_request(method, endpoint, data=None):
+            return test_client.open(endpoint, method=method, json=data).get_json()
+
+        client._make_request = mock.Mock(side_effect=make_request)
+        return client
+
+    def test_get_many_and_set_many(self, client) -> None:
+        """Test that many keys take one request each way."""
+        assert client.set_many({f"key{i}": i for i in range(200)}) is True
+        values = client.get_many([f"key{i}" for i in range(200)])
+
+        assert values == {f"key{i}": i for i in range(200)}
+        assert client._make_request.call_count == 2
+
+    def test_pipeline_preserves_order(self, client) -> None:
+        """Test that results follow queue order across automatic flushes."""
+        client.set("a", "old")
+        client._make_request.reset_mock()
+
+        with client.pipeline(max_batch_size=3) as pipe:
+            pipe.get("a").set("a", "new").get("a").set("b", 2).get("b")
+            results = pipe.execute()
+
+        assert results == ["old", True, "new", True, 2]
+        assert client._make_request.call_count == 3
+
+    def test_pipeline_rejects_empty_batches(self, client) -> None:
+        """Test that a batch size below one is rejected."""
+        with pytest.raises(ValueError):
+            ContextPipeline(client, max_batch_size=0)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the coalescing context update broadcaster.
+
+This test suite validates BroadcastAggregator delivery:
+- Last-write-wins coalescing within a flush window
+- Per-client prefix subscriptions and sender exclusion
+- Acknowledgement backpressure and slow client policies
+"""
+
+import pytest
+
+# Import test target
+from orchestrator.context_broadcast import BroadcastAggregator
+
+
+class RecordingEmitter:
+    """Collect emitted events and their acknowledgement callbacks."""
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event, payload, to=None, callback=None):
+        self.events.append((event, payload, to, callback))
+
+    def for_client(self, sid):
+        return [(event, payload) for event, payload, to, _ in self.events if to == sid]
+
+
+@pytest.fixture
+def emitter():
+    """Create an emitter that records events."""
+    return RecordingEmitter()
+
+
+class TestCoalescing:
+    """Test cases for coalescing and subscriptions."""
+
+    def test_last_write_wins_within_window(self, emitter) -> None:
+        """Test that repeated writes to a key produce one event with the last value."""
+        broadcaster = BroadcastAggregator(emitter, window=1.0)
+        broadcaster.add_client("c1")
+        for i in range(100):
+            broadcaster.publish({"counter": i, f"k{i % 3}": i}, who="writer")
+
+        assert emitter.events == []
+        assert broadcaster.flush() == 1
+
+        event, payload = emitter.for_client("c1")[0]
+        assert event == "context_updated"
+        assert payload["updates"] == {"k0": 99, "counter": 99, "k2": 98, "k1": 97}
+        assert broadcaster.get_stats()["coalesced"] == 196
+
+    def test_single_key_payload_keeps_key_fields(self, emitter) -> None:
+        """Test that one-key events carry key, value and who."""
+        broadcaster = BroadcastAggregator(emitter, window=0)
+        broadcaster.add_client("c1")
+        broadcaster.publish({"app.status": "running"}, who="shell")
+
+        _, payload = emitter.for_client("c1")[0]
+        assert payload["key"] == "app.status"
+        assert payload["value"] == "running"
+        assert payload["who"] == "shell"
+
+    def test_prefix_filters_and_sender_skip(self, emitter) -> None:
+        """Test that clients receive only subscribed keys and not their own writes."""
+        broadcaster = BroadcastAggregator(emitter, window=1.0)
+        for sid in ("all", "metrics", "writer"):
+            broadcaster.add_client(sid)
+        broadcaster.subscribe("metrics", ["metrics."], keys_only=True)
+
+        broadcaster.publish({"metrics.cpu": 50, "app.name": "x"}, skip_sid="writer")
+        broadcaster.flush()
+
+        assert emitter.for_client("all")[0][1]["updates"] == {"metrics.cpu": 50, "app.name": "x"}
+        metrics_payload = emitter.for_client("metrics")[0][1]
+        assert metrics_payload["keys"] == ["metrics.cpu"]
+        assert "updates" not in metrics_payload and "value" not in metrics_payload
+        assert emitter.for_client("writer") == []
+
+
+class TestBackpressure:
+    """Test cases for acknowledgements and slow clients."""
+
+    def test_unacknowledged_client_keeps_coalescing(self, emitter) -> None:
+        """Test that delivery waits for the previous batch to be acknowledged."""
+        broadcaster = BroadcastAggregator(emitter, window=1.0)
+        broadcaster.subscribe("slow", ack=True)
+
+        broadcaster.publish({"a": 1})
+        broadcaster.flush()
+        broadcaster.publish({"a": 2, "b": 1})
+        broadcaster.flush()
+        broadcaster.publish({"a": 3})
+        assert broadcaster.flush() == 0
+        assert len(emitter.events) == 1
+
+        # Acknowledging releases the coalesced backlog
+        emitter.events[0][3]()
+        broadcaster.flush()
+        assert emitter.events[1][1]["updates"] == {"b": 1, "a": 3}
+
+    def test_resync_policy_replaces_backlog(self, emitter) -> None:
+        """Test that an overflowing backlog is dropped in favour of a resync event."""
+        broadcaster = BroadcastAggregator(emitter, window=1.0, max_pending=3)
+        broadcaster.subscribe("slow", ack=True)
+        broadcaster.publish({"first": 0})
+        broadcaster.flush()
+
+        broadcaster.publish({f"k{i}": i for i in range(5)})
+        broadcaster.flush()
+        emitter.events[0][3]()
+        broadcaster.flush()
+
+        event, payload = emitter.events[1][:2]
+        assert event == "context_resync"
+        assert payload["dropped"] == 5
+        assert broadcaster.get_stats()["backlog_keys"] == 0
+
+    def test_drop_oldest_policy(self, emitter) -> None:
+        """Test that drop_oldest keeps only the newest pending keys."""
+        broadcaster = BroadcastAggregator(emitter, window=1.0, max_pending=2,
+                                          slow_client_policy="drop_oldest")
+        broadcaster.add_client("c1")
+        broadcaster.publish({"a": 1, "b": 2, "c": 3})
+        broadcaster.flush()
+
+        assert emitter.for_client("c1")[0][1]["updates"] == {"b": 2, "c": 3}
+        assert broadcaster.get_stats()["dropped"] == 1
+
+    def test_unknown_policy_rejected(self, emitter) -> None:
+        """Test that an unknown slow client policy is rejected."""
+        with pytest.raises(ValueError):
+            BroadcastAggregator(emitter, slow_client_policy="block")
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Test Suite for context Persistence.
+
+This test suite validates the write-ahead log based persistence:
+- Diff flushes append only dirty keys to the WAL
+- Compaction into a single base snapshot
+- Recovery from base snapshot plus WAL, including torn records
+- DBAdapter upserts over a shared WAL-mode connection
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Import test target
+from orchestrator.context.context import Context
+from orchestrator.context.db_adapter import DBAdapter
+from orchestrator.context.persistence import (
+    BASE_SNAPSHOT_NAME, WAL_FILE_NAME, Persistence
+)
+
+
+class TestContextPersistence(unittest.TestCase):
+    """Test cases for WAL-based context persistence."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()  # Flush directory
+        self.context = Context()  # Context being persisted
+
+    def tearDown(self) -> None:
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_persistence(self, **kwargs) -> Persistence:
+        """Create a Persistence instance over the test directory."""
+        return Persistence(self.context, flush_dir=self.temp_dir, fsync=False, **kwargs)
+
+    def read_wal(self):
+        """Return the parsed WAL records."""
+        with open(os.path.join(self.temp_dir, WAL_FILE_NAME)) as wal_file:
+            return [json.loads(line) for line in wal_file]
+
+    def test_diff_flush_writes_only_dirty_keys(self) -> None:
+        """Test that each diff flush appends just the changed keys."""
+        persistence = self.make_persistence()
+        self.context.set("a", 1)
+        self.context.set("b", 2)
+        persistence.flush(mode="diff")
+        self.context.set("b", 3)
+        persistence.flush(mode="diff")
+        persistence.flush(mode="diff")  # Nothing dirty, nothing written
+
+        records = self.read_wal()
+        self.assertEqual([record["changes"] for record in records], [{"a": 1, "b": 2}, {"b": 3}])
+        self.assertEqual([record["seq"] for record in records], [1, 2])
+        self.assertEqual(os.listdir(self.temp_dir), [WAL_FILE_NAME])
+
+    def test_compaction_folds_wal_into_base(self) -> None:
+        """Test that the threshold triggers a base snapshot and truncates the WAL."""
+        persistence = self.make_persistence(wal_compaction_threshold=3)
+        for value in range(3):
+            self.context.set("counter", value)
+            persistence.flush(mode="diff", compress=False)
+
+        self.assertEqual(self.read_wal(), [])
+        self.assertEqual(
+            sorted(os.listdir(self.temp_dir)), sorted([BASE_SNAPSHOT_NAME, WAL_FILE_NAME])
+        )
+
+    def test_full_flush_replaces_single_snapshot(self) -> None:
+        """Test that repeated full flushes keep one base snapshot."""
+        persistence = self.make_persistence()
+        self.context.set("a", 1)
+        persistence.flush(mode="full")
+        self.context.set("a", 2)
+        persistence.flush(mode="full")
+
+        self.assertEqual(
+            sorted(os.listdir(self.temp_dir)), sorted([BASE_SNAPSHOT_NAME + ".gz", WAL_FILE_NAME])
+        )
+        restored = Context()
+        Persistence(restored, flush_dir=self.temp_dir).load_from_disk(BASE_SNAPSHOT_NAME + ".gz")
+        self.assertEqual(restored.to_dict(), {"a": 2})
+
+    def test_recover_replays_base_and_wal(self) -> None:
+        """Test that recovery applies WAL records on top of the base snapshot."""
+        persistence = self.make_persistence()
+        self.context.set("a", 1)
+        self.context.set("b", {"nested": [1, 2]})
+        persistence.flush(mode="full")
+        self.context.set("a", 10)
+        persistence.flush(mode="diff")
+        self.context.set("c", "new")
+        persistence.flush(mode="diff")
+
+        restored = Context()
+        recovered = Persistence(restored, flush_dir=self.temp_dir).recover()
+
+        self.assertEqual(recovered, 3)
+        self.assertEqual(restored.to_dict(), self.context.to_dict())
+        self.assertEqual(restored.pop_dirty_keys(), [])
+
+    def test_recover_skips_torn_record_and_continues_sequence(self) -> None:
+        """Test that a partial final WAL line is ignored and numbering resumes."""
+        persistence = self.make_persistence()
+        self.context.set("a", 1)
+        persistence.flush(mode="diff")
+        with open(os.path.join(self.temp_dir, WAL_FILE_NAME), "a") as wal_file:
+            wal_file.write('{"seq": 2, "changes": {"a"')
+
+        restored = Context()
+        reopened = Persistence(restored, flush_dir=self.temp_dir, fsync=False)
+        reopened.recover()
+        self.assertEqual(restored.to_dict(), {"a": 1})
+
+        restored.set("b", 2)
+        reopened.flush(mode="diff")
+        final = Context()
+        Persistence(final, flush_dir=self.temp_dir).recover()
+        self.assertEqual(final.to_dict(), {"a": 1, "b": 2})
+
+    def test_failed_write_keeps_keys_dirty(self) -> None:
+        """Test that keys whose WAL or snapshot write failed are flushed later."""
+        persistence = self.make_persistence()
+        self.context.set("a", 1)
+        wal_path = persistence.wal_path
+        persistence.wal_path = self.temp_dir  # Appending to a directory fails
+        with self.assertRaises(OSError):
+            persistence.flush(mode="diff")
+        persistence.wal_path = wal_path
+
+        def failing_snapshot(data, compress):
+            raise OSError("disk full")
+
+        persistence._flush_to_disk = failing_snapshot
+        with self.assertRaises(OSError):
+            persistence.flush(mode="full")
+        self.assertEqual(self.context.pop_dirty_keys(), ["a"])
+
+        self.context.mark_dirty(["a"])
+        del persistence._flush_to_disk
+        persistence.flush(mode="diff")
+        self.assertEqual([record["changes"] for record in self.read_wal()], [{"a": 1}])
+
+    def test_every_flush_commits_a_version(self) -> None:
+        """Test that diff flushes are versioned like full flushes."""
+        persistence = self.make_persistence()
+        with mock.patch.object(persistence.version_control, "commit") as commit:
+            self.context.set("a", 1)
+            persistence.flush(mode="diff")
+            self.context.set("a", 2)
+            persistence.flush(mode="full")
+        self.assertEqual(commit.call_count, 2)
+
+    def test_invalid_threshold(self) -> None:
+        """Test that a non-positive compaction threshold is rejected."""
+        with self.assertRaises(ValueError):
+            self.make_persistence(wal_compaction_threshold=0)
+
+
+class TestDBAdapter(unittest.TestCase):
+    """Test cases for the SQLite DBAdapter."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()  # Database directory
+        self.adapter = DBAdapter(os.path.join(self.temp_dir, "context.db"))
+
+    def tearDown(self) -> None:
+        """Clean up test fixtures."""
+        self.adapter.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_save_context_upserts(self) -> None:
+        """Test that saving updates existing keys and tags them with the mode."""
+        self.adapter.save_context({"a": 1, "b": [1, 2]})
+        self.adapter.save_context({"a": 2}, mode="diff")
+
+        self.assertEqual(self.adapter.load_context(), {"a": 2, "b": [1, 2]})
+        self.assertEqual(self.adapter.load_context("diff"), {"a": 2})
+
+    def test_persistence_flushes_changes_to_db(self) -> None:
+        """Test that diff flushes send only changed keys to the database."""
+        context = Context()
+        persistence = Persistence(
+            context, db_adapter=self.adapter, flush_dir=self.temp_dir, fsync=False
+        )
+        context.set("a", 1)
+        persistence.flush(mode="full")
+        context.set("b", 2)
+        persistence.flush(mode="diff")
+
+        self.assertEqual(self.adapter.load_context("diff"), {"b": 2})
+        self.assertEqual(self.adapter.load_context(), {"a": 1, "b": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,7 +27,9 @@ from orchestrator.persistence.delta import (
     DeltaCompressor,
     DeltaChain,
     DeltaCompressionError,
-    extract_keys_from_delta
+    DeltaInfo,
+    extract_keys_from_delta,
+    parse_json_pointer
 )
 from orchestrator.persistence.core import DeltaStrategy
 
@@ -453,6 +455,213 @@ class TestUtilityFunctions:
         assert "key4" in keys
 
 
+class TestStructuralDelta:
+    """Test cases for recursive JSON-Pointer deltas."""
+    
+    @pytest.fixture
+    def compressor(self):
+        """Create a compressor using the structural strategy."""
+        return DeltaCompressor(strategy=DeltaStrategy.STRUCTURAL)
+        
+    @pytest.fixture
+    def nested_state(self):
+        """Create a nested state with a large list."""
+        return {
+            "items": [{"id": index, "value": index} for index in range(2000)],
+            "config": {"name": "test", "limits": {"max": 10}},
+            "tags": ["a", "b", "c"]
+        }
+        
+    def test_nested_change_is_proportional(self, compressor, nested_state):
+        """Test that one nested change yields one operation, not the whole list."""
+        new_state = json.loads(json.dumps(nested_state))
+        new_state["items"][1500]["value"] = -1
+        
+        delta_info = compressor.calculate_delta(nested_state, new_state)
+        
+        assert delta_info["operations"] == [
+            {"op": "replace", "path": "/items/1500/value", "value": -1}
+        ]
+        assert compressor.apply_delta(nested_state, delta_info) == new_state
+        
+    def test_list_insert_and_delete_become_splices(self, compressor, nested_state):
+        """Test that insertions and deletions do not rewrite following elements."""
+        new_state = json.loads(json.dumps(nested_state))
+        new_state["items"].insert(100, {"id": "new"})
+        del new_state["items"][1000]
+        new_state["tags"].remove("b")
+        
+        delta_info = compressor.calculate_delta(nested_state, new_state)
+        
+        assert len(delta_info["operations"]) == 3
+        assert all(operation["op"] == "splice" for operation in delta_info["operations"])
+        assert compressor.apply_delta(nested_state, delta_info) == new_state
+        
+    def test_keys_added_removed_and_escaped(self, compressor):
+        """Test dictionary additions, removals and JSON Pointer escaping."""
+        old_state = {"keep": 1, "drop": 2, "nested": {"a/b": 1, "x~y": 2}}
+        new_state = {"keep": 1, "add": 3, "nested": {"a/b": 5}}
+        
+        delta_info = compressor.calculate_delta(old_state, new_state)
+        paths = {operation["path"] for operation in delta_info["operations"]}
+        
+        assert paths == {"/add", "/drop", "/nested/a~1b", "/nested/x~0y"}
+        assert parse_json_pointer("/nested/a~1b") == ["nested", "a/b"]
+        assert compressor.apply_delta(old_state, delta_info) == new_state
+        
+    def test_apply_copies_only_changed_paths(self, compressor, nested_state):
+        """Test that the base state is untouched and unchanged branches are shared."""
+        new_state = json.loads(json.dumps(nested_state))
+        new_state["config"]["limits"]["max"] = 20
+        original = json.loads(json.dumps(nested_state))
+        
+        delta_info = compressor.calculate_delta(nested_state, new_state)
+        result = compressor.apply_delta(nested_state, delta_info)
+        
+        assert nested_state == original
+        assert result["items"] is nested_state["items"]
+        assert result["config"] is not nested_state["config"]
+        
+    def test_apply_in_place(self, compressor):
+        """Test that in-place application patches the given state."""
+        state = {"a": {"b": [1, 2, 3]}}
+        delta_info = compressor.calculate_delta(state, {"a": {"b": [1, 3]}})
+        
+        result = compressor.apply_delta(state, delta_info, in_place=True)
+        
+        assert result is state
+        assert state == {"a": {"b": [1, 3]}}
+        
+    def test_sizes_measured_lazily(self, compressor):
+        """Test that delta sizes are computed only when read."""
+        delta_info = compressor.calculate_delta({"a": 1}, {"a": 2})
+        
+        assert isinstance(delta_info, DeltaInfo)
+        assert compressor.get_compression_stats()["total_original_size"] == 0
+        assert delta_info["original_size"] > 0
+        assert compressor.get_compression_stats()["total_original_size"] == delta_info["original_size"]
+        
+    def test_chain_and_merge_with_operations(self):
+        """Test that delta chains store and merge structural operations."""
+        chain = DeltaChain(delta_strategy=DeltaStrategy.STRUCTURAL, max_chain_length=10)
+        states = [
+            {"doc": {"rows": [1, 2, 3]}},
+            {"doc": {"rows": [1, 2, 3, 4]}},
+            {"doc": {"rows": [2, 3, 4]}, "extra": True}
+        ]
+        for state in states:
+            chain.add_state(state)
+            
+        assert chain.get_current_state() == states[-1]
+        merged = chain.delta_compressor.merge_deltas(chain._deltas[1:])
+        assert chain.delta_compressor.apply_delta(states[0], merged.to_patch()) == states[-1]
+        assert extract_keys_from_delta(merged) == {"doc", "extra"}
+
+
+class TestDeltaChainCheckpoints:
+    """Test cases for DeltaChain keyframes and the state cache."""
+    
+    @pytest.fixture
+    def states(self):
+        """Create a sequence of states that each change a few keys."""
+        states = []
+        state = {f"key{i}": i for i in range(50)}
+        for step in range(40):
+            state = dict(state)
+            state[f"key{step % 50}"] = {"step": step}
+            if step % 7 == 0:
+                state.pop(f"key{(step + 25) % 50}", None)
+            states.append(state)
+        return states
+        
+    def test_every_index_reconstructs(self, states):
+        """Test that every index matches the state that was added."""
+        chain = DeltaChain(max_chain_length=0, checkpoint_interval=8, state_cache_size=4)
+        for state in states:
+            chain.add_state(state)
+            
+        # Index 0 is the base and index 1 its empty delta
+        for index in [5, 1, 39, 0, 17, 16, 24, 40, 3]:
+            expected = states[max(index - 1, 0)]
+            assert chain.get_state_at_index(index) == expected
+            
+    def test_keyframes_bound_replay(self, states):
+        """Test that keyframes are inserted every checkpoint_interval deltas."""
+        chain = DeltaChain(max_chain_length=0, checkpoint_interval=8)
+        for state in states:
+            chain.add_state(state)
+            
+        assert chain._keyframe_indices == [0, 8, 16, 24, 32, 40]
+        assert chain.get_chain_metrics()["checkpoint_count"] == 5
+        
+        # Reconstruction never applies more than checkpoint_interval deltas
+        with mock.patch.object(chain.delta_compressor, "apply_delta",
+                               wraps=chain.delta_compressor.apply_delta) as apply_delta:
+            chain.get_state_at_index(31)
+        assert apply_delta.call_count == 7
+        
+    def test_checkpoint_by_delta_size(self, states):
+        """Test that cumulative delta size triggers a keyframe."""
+        chain = DeltaChain(max_chain_length=0, checkpoint_interval=1000, checkpoint_bytes=1)
+        for state in states[:5]:
+            chain.add_state(state)
+            
+        assert chain._keyframe_indices == [0, 2, 3, 4, 5]
+        
+    def test_state_cache(self, states):
+        """Test that reconstructed states are cached and evicted LRU first."""
+        chain = DeltaChain(max_chain_length=0, checkpoint_interval=8, state_cache_size=2)
+        for state in states:
+            chain.add_state(state)
+            
+        result = chain.get_state_at_index(5)
+        result["mutated"] = True
+        assert chain.get_state_at_index(5) == states[4]
+        chain.get_state_at_index(6)
+        chain.get_state_at_index(7)
+        
+        metrics = chain.get_chain_metrics()
+        assert metrics["cache_hits"] == 1
+        assert metrics["cache_misses"] == 3
+        assert list(chain._state_cache) == [6, 7]
+        
+    def test_merge_keeps_keyframes_consistent(self, states):
+        """Test that merging old deltas shifts keyframes with their indices."""
+        chain = DeltaChain(max_chain_length=20, enable_rebase=False, checkpoint_interval=4)
+        for state in states:
+            chain.add_state(state)
+            
+        length = len(chain._deltas)
+        assert chain.get_chain_metrics()["optimization_count"] > 0
+        assert chain.get_current_state() == states[-1]
+        for offset in range(1, length - 1):
+            assert chain.get_state_at_index(length - offset) == states[-1 - offset]
+            
+    def test_rebase_keeps_history_after_keyframe(self, states):
+        """Test that rebasing onto a keyframe keeps the recent history."""
+        chain = DeltaChain()
+        for state in states:
+            chain.add_state(state)
+            
+        length = len(chain._deltas)
+        assert 13 <= length <= 20
+        assert chain.get_chain_metrics()["rebaseline_count"] > 0
+        assert chain._keyframe_indices[0] == 0 and len(chain._keyframe_indices) > 1
+        for offset in range(length):
+            assert chain.get_state_at_index(length - offset) == states[-1 - offset]
+            
+    def test_states_are_not_shared(self):
+        """Test that changing a returned state does not affect the chain."""
+        chain = DeltaChain(delta_strategy=DeltaStrategy.STRUCTURAL, checkpoint_interval=2)
+        chain.add_state({"doc": {"rows": [1, 2]}})
+        chain.add_state({"doc": {"rows": [1, 2, 3]}})
+        chain.add_state({"doc": {"rows": [1, 2, 3]}, "other": 1})
+        
+        chain.get_current_state()["other"] = 2
+        assert chain.get_state_at_index(2) == {"doc": {"rows": [1, 2, 3]}}
+        assert chain.get_current_state() == {"doc": {"rows": [1, 2, 3]}, "other": 1}
+
+
 def test_delta_compression_error():
     """Test that DeltaCompressionError can be properly raised and caught."""
     try:
@@ -7,6 +7,7 @@ messaging system, reliability features, and Context integration.
 
 import os
 import json
+import stat
 import tempfile
 import threading
 import time
@@ -23,12 +24,14 @@ from orchestrator.enhanced_memory_bus import (
     MemoryBusMetrics,
     MessageEvent,
     JSONPersistenceBackend,
+    LazyJSONMapping,
     SQLitePersistenceBackend,
     create_json_memory_bus,
     create_sqlite_memory_bus,
     create_memory_only_bus
 )
 from orchestrator.context.context import Context
+from src.core import file_modes
 
 
 class TestMemoryBusMetrics:
@@ -238,6 +241,114 @@ class TestJSONPersistenceBackend:
             # Clean up
             os.unlink(tmp_file.name)
             os.unlink(backup_path)
+    
+    def test_json_save_is_atomic(self):
+        """Test that a failed save leaves the previous file and no temp files."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "bus.json")
+            backend = JSONPersistenceBackend(file_path)
+            backend.save({"key": "old"})
+            
+            assert not backend.save({"key": object()})  # Not serializable mid-stream
+            assert backend.load() == {"key": "old"}
+            assert sorted(os.listdir(tmp_dir)) == ["bus.json"]
+            
+            backend.save({"key": "new"})
+            assert sorted(os.listdir(tmp_dir)) == ["bus.bak", "bus.json"]
+            assert JSONPersistenceBackend(os.path.join(tmp_dir, "bus.bak")).load() == {"key": "old"}
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_json_save_keeps_file_mode(self):
+        """Test that atomic saves and restores do not tighten file permissions."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "bus.json")
+            backend = JSONPersistenceBackend(file_path, lazy_load=True)
+            backend.save({"key": "first"})
+            default_mode = 0o666 & ~file_modes.PROCESS_UMASK
+            assert stat.S_IMODE(os.stat(file_path).st_mode) == default_mode
+            assert stat.S_IMODE(os.stat(backend.index_path).st_mode) == default_mode
+
+            os.chmod(file_path, 0o640)
+            backend.save({"key": "second"})
+            assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o640
+
+            backup_path = os.path.join(tmp_dir, "copy.json")
+            assert backend.backup(backup_path)
+            os.chmod(backup_path, 0o600)
+            assert backend.restore(backup_path)
+            assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o640
+
+    def test_json_gzip_round_trip(self):
+        """Test gzip-compressed files are detected on load."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "bus.json")
+            test_data = {"key": list(range(100))}
+            JSONPersistenceBackend(file_path, compression="gzip", durable=False).save(test_data)
+            
+            with open(file_path, "rb") as data_file:
+                assert data_file.read(2) == b"\x1f\x8b"
+            assert JSONPersistenceBackend(file_path).load() == test_data
+    
+    def test_json_invalid_options(self):
+        """Test unsupported option combinations are rejected."""
+        with pytest.raises(ValueError):
+            JSONPersistenceBackend("bus.json", compression="lz4")
+        with pytest.raises(ValueError):
+            JSONPersistenceBackend("bus.json", compression="gzip", lazy_load=True)
+    
+    def test_json_lazy_load(self):
+        """Test lazy loads decode values on access and save untouched bytes verbatim."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "bus.json")
+            backend = JSONPersistenceBackend(file_path, lazy_load=True, durable=False)
+            test_data = {f"key{index}": {"value": index, "text": "é"} for index in range(50)}
+            backend.save(test_data)
+            with open(file_path, "r", encoding="utf-8") as data_file:
+                assert json.load(data_file) == test_data
+            
+            loaded = backend.load()
+            assert isinstance(loaded, LazyJSONMapping)
+            assert len(loaded) == 50 and loaded.decoded_count == 0
+            assert loaded["key7"] == {"value": 7, "text": "é"}
+            assert loaded.decoded_count == 1
+            
+            loaded["key8"] = "changed"
+            del loaded["key9"]
+            backend.save(loaded)
+            reloaded = backend.load()
+            assert reloaded["key8"] == "changed"
+            assert "key9" not in reloaded
+            assert dict(reloaded) == {**{k: v for k, v in test_data.items() if k != "key9"}, "key8": "changed"}
+    
+    def test_json_lazy_load_ignores_stale_index(self):
+        """Test a file replaced outside the backend is parsed in full."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "bus.json")
+            backend = JSONPersistenceBackend(file_path, lazy_load=True, durable=False)
+            backend.save({"key": "indexed"})
+            with open(file_path, "w", encoding="utf-8") as data_file:
+                json.dump({"key": "replaced", "other": 1}, data_file)
+            
+            loaded = backend.load()
+            assert not isinstance(loaded, LazyJSONMapping)
+            assert loaded == {"key": "replaced", "other": 1}
+    
+    def test_lazy_memory_bus_startup(self):
+        """Test a memory bus over a lazy backend serves values without a full parse."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "bus.json")
+            JSONPersistenceBackend(file_path, lazy_load=True).save({"a": 1, "b": [2]})
+            
+            memory_bus = EnhancedMemoryBus(
+                persistence_backend=JSONPersistenceBackend(file_path, lazy_load=True),
+                enable_messaging=False
+            )
+            assert memory_bus._memory_cache.decoded_count == 0
+            assert memory_bus.get("b") == [2]
+            memory_bus.set("c", 3)
+            memory_bus.shutdown()
+            
+            assert JSONPersistenceBackend(file_path).load() == {"a": 1, "b": [2], "c": 3}
 
 
 class TestSQLitePersistenceBackend:
@@ -313,6 +424,88 @@ class TestSQLitePersistenceBackend:
             # Clean up
             os.unlink(tmp_file.name)
             os.unlink(backup_path)
+    
+    def test_sqlite_save_changes_upserts_and_deletes(self):
+        """Test incremental saves keep untouched rows and their creation time."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            backend = SQLitePersistenceBackend(os.path.join(tmp_dir, "bus.db"), synchronous="full")
+            backend.save({"keep": 1, "update": 2, "drop": 3})
+            created_before = backend._connection().execute(
+                "SELECT created_at FROM memory_bus WHERE key = 'update'"
+            ).fetchone()
+            
+            assert backend.save_changes({"update": 20, "new": 4}, ["drop"])
+            assert backend.load() == {"keep": 1, "update": 20, "new": 4}
+            created_after = backend._connection().execute(
+                "SELECT created_at FROM memory_bus WHERE key = 'update'"
+            ).fetchone()
+            assert created_after == created_before
+            
+            journal_mode = backend._connection().execute("PRAGMA journal_mode").fetchone()[0]
+            assert journal_mode == "wal"
+            backend.close()
+    
+    def test_sqlite_invalid_synchronous_level(self):
+        """Test SQLite backend rejects unknown synchronous levels."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with pytest.raises(ValueError):
+                SQLitePersistenceBackend(os.path.join(tmp_dir, "bus.db"), synchronous="fast")
+
+
+class TestIncrementalPersistence:
+    """Test suite for dirty-key persistence through incremental backends."""
+    
+    def test_persist_sends_only_changed_keys(self):
+        """Test that persist passes only keys changed since the last persist."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            memory_bus = create_sqlite_memory_bus(
+                os.path.join(tmp_dir, "bus.db"), enable_messaging=False
+            )
+            for index in range(5):
+                memory_bus.set(f"key{index}", index)
+            assert memory_bus.persist()
+            
+            backend = memory_bus.persistence_backend
+            with patch.object(backend, "save_changes", wraps=backend.save_changes) as save_changes:
+                memory_bus.set("key1", 10)
+                memory_bus.delete("key2")
+                assert memory_bus.persist()
+                assert memory_bus.persist()  # Nothing pending
+            
+            save_changes.assert_called_once_with({"key1": 10}, ["key2"])
+            assert backend.load() == {"key0": 0, "key1": 10, "key3": 3, "key4": 4}
+            assert memory_bus.health_check()["persistence"]["pending_changes"] == 0
+            memory_bus.shutdown()
+    
+    def test_clear_and_reload(self):
+        """Test that clear deletes persisted keys and changes survive a restart."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "bus.db")
+            memory_bus = create_sqlite_memory_bus(db_path, enable_messaging=False)
+            memory_bus.set("old", 1)
+            memory_bus.persist()
+            memory_bus.clear()
+            memory_bus.set("new", 2)
+            memory_bus.shutdown()
+            
+            reopened = create_sqlite_memory_bus(db_path, enable_messaging=False)
+            assert reopened.keys() == ["new"]
+            reopened.shutdown()
+    
+    def test_failed_persist_is_retried(self):
+        """Test that changes from a failed persist stay pending."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            memory_bus = create_sqlite_memory_bus(
+                os.path.join(tmp_dir, "bus.db"), enable_messaging=False
+            )
+            memory_bus.set("key", "value")
+            backend = memory_bus.persistence_backend
+            with patch.object(backend, "save_changes", return_value=False):
+                assert not memory_bus.persist()
+            
+            assert memory_bus.persist()
+            assert backend.load() == {"key": "value"}
+            memory_bus.shutdown()
 
 
 class TestEnhancedMemoryBus:
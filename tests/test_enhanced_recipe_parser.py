@@ -28,6 +28,7 @@ from orchestrator.enhanced_recipe_parser import (
     parse_recipe_file, validate_recipe_data
 )
 from orchestrator.context.context import Context
+from orchestrator.recipe_cache import RecipePlanCache
 
 
 class TestRecipeValidator(unittest.TestCase):
@@ -431,6 +432,25 @@ class TestEnhancedRecipeParser(unittest.TestCase):
         self.assertEqual(parsed1.file_hash, parsed2.file_hash)
         self.assertEqual(id(parsed1), id(parsed2))  # Same object reference
     
+    def test_parse_recipe_persistent_cache(self) -> None:
+        """Test that parsed recipes are reused across parser instances."""
+        recipe_content = {
+            "metadata": {"name": "persisted_test"},
+            "steps": [{"name": "step1", "module": "builtins", "function": "len"}]
+        }
+        recipe_file = self._create_temp_file(json.dumps(recipe_content), "persisted.json")
+        plan_cache = RecipePlanCache(os.path.join(self.temp_dir, "plans"))
+        
+        parsed1 = EnhancedRecipeParser(self.context, plan_cache=plan_cache).parse_recipe(recipe_file)
+        warm_parser = EnhancedRecipeParser(self.context, plan_cache=plan_cache)
+        with patch.object(warm_parser, "load_file", side_effect=AssertionError("file was re-parsed")):
+            parsed2 = warm_parser.parse_recipe(recipe_file)
+        
+        # Should be equal content loaded without parsing
+        self.assertEqual(parsed2.file_hash, parsed1.file_hash)
+        self.assertEqual(parsed2.steps, parsed1.steps)
+        self.assertEqual(plan_cache.get_stats()["hits"], 1)
+    
     def test_context_integration(self) -> None:
         """Test Context system integration."""
         recipe_content = {
@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Enhanced Recipe Runner.
+
+This test suite validates the EnhancedRecipeRunner functionality including:
+- Sequential recipe execution
+- Dependency-aware parallel step scheduling
+- Resource class concurrency limits
+- Failure handling in parallel mode
+- Recipe plan caching and scriptlet instance pooling
+- Persistent compiled recipe plans
+- Asyncio execution mode for AsyncBaseScriptlet steps
+- Enforced step timeouts and cooperative cancellation
+"""
+
+import asyncio
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+# Import test target
+from orchestrator.context.context import Context
+from orchestrator import runner as runner_module
+from orchestrator.recipe_cache import RecipePlanCache
+from orchestrator.runner import EnhancedRecipeRunner
+from scriptlets.framework import AsyncBaseScriptlet, BaseScriptlet
+
+
+class SleepScriptlet(BaseScriptlet):
+    """Test scriptlet that sleeps and records its completion in the context."""
+
+    active_lock = threading.Lock()  # Protects concurrency tracking
+    active_steps = 0  # Currently running instances
+    peak_active_steps = 0  # Highest observed concurrency
+
+    def run(self, context: Context, params: Dict[str, Any]) -> int:
+        with SleepScriptlet.active_lock:
+            SleepScriptlet.active_steps += 1
+            SleepScriptlet.peak_active_steps = max(
+                SleepScriptlet.peak_active_steps, SleepScriptlet.active_steps
+            )
+        try:
+            for dependency in params.get("requires", []):
+                if context.get(f"done.{dependency}") is not True:
+                    return 1  # Dependency output missing
+            time.sleep(params.get("seconds", 0.0))
+            context.set(f"done.{params['name']}", True, who=params["name"])
+            return 0
+        finally:
+            with SleepScriptlet.active_lock:
+                SleepScriptlet.active_steps -= 1
+
+
+class CountingScriptlet(BaseScriptlet):
+    """Test scriptlet that counts instantiations and mutates its params."""
+
+    instances = 0  # Number of constructed instances
+
+    def __init__(self) -> None:
+        super().__init__()
+        CountingScriptlet.instances += 1
+
+    def run(self, context: Context, params: Dict[str, Any]) -> int:
+        params.setdefault("seen", []).append(True)  # Mutation must not leak into the plan
+        context.set(f"seen.{params['name']}", len(params["seen"]), who=params["name"])
+        return 0
+
+
+class AsyncSleepScriptlet(AsyncBaseScriptlet):
+    """Test scriptlet that awaits a sleep and records the running thread."""
+
+    async def run(self, context: Context, params: Dict[str, Any]) -> int:
+        await asyncio.sleep(params.get("seconds", 0.0))
+        context.set(f"done.{params['name']}", True, who=params["name"])
+        context.set(f"thread.{params['name']}", threading.current_thread().name, who=params["name"])
+        return 0
+
+
+class HangingScriptlet(BaseScriptlet):
+    """Test scriptlet that blocks, optionally honouring its cancellation token."""
+
+    def run(self, context: Context, params: Dict[str, Any]) -> int:
+        context.set(f"started.{params['name']}", True, who=params["name"])
+        if params.get("cooperative"):
+            if self.cancellation_token.wait(params.get("seconds", 30.0)):
+                context.set(f"cancelled.{params['name']}", self.cancellation_token.reason, who=params["name"])
+                return 1
+        else:
+            time.sleep(params.get("seconds", 30.0))
+        context.set(f"done.{params['name']}", True, who=params["name"])
+        return 0
+
+
+class FailingScriptlet(BaseScriptlet):
+    """Test scriptlet that always fails."""
+
+    def run(self, context: Context, params: Dict[str, Any]) -> int:
+        return 1
+
+
+def sleep_step(name: str, seconds: float = 0.0, depends_on: List[str] = None, **extra: Any) -> Dict[str, Any]:
+    """Build a recipe step running SleepScriptlet."""
+    step = {
+        "name": name,
+        "module": __name__,
+        "function": "SleepScriptlet",
+        "args": {"name": name, "seconds": seconds, "requires": depends_on or []},
+    }
+    if depends_on:
+        step["depends_on"] = depends_on
+    step.update(extra)
+    return step
+
+
+class TestParallelExecution(unittest.TestCase):
+    """Test cases for dependency-aware parallel step scheduling."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())  # Directory for recipe files
+        SleepScriptlet.active_steps = 0
+        SleepScriptlet.peak_active_steps = 0
+
+    def tearDown(self) -> None:
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_recipe(self, steps: List[Dict[str, Any]]) -> str:
+        """Write a recipe file and return its path."""
+        recipe_path = self.temp_dir / "recipe.yaml"
+        recipe_path.write_text(yaml.safe_dump({"steps": steps}))
+        return str(recipe_path)
+
+    def test_fan_out_runs_concurrently(self) -> None:
+        """Test that independent steps overlap and dependencies are honoured."""
+        recipe = self.write_recipe([
+            sleep_step("source"),
+            sleep_step("branch_a", 0.3, ["source"]),
+            sleep_step("branch_b", 0.3, ["source"]),
+            sleep_step("branch_c", 0.3, ["source"]),
+            sleep_step("join", 0.0, ["branch_a", "branch_b", "branch_c"]),
+        ])
+
+        start = time.time()
+        ctx = EnhancedRecipeRunner().run_recipe(recipe, parallel=True, max_parallel_steps=4)
+        elapsed = time.time() - start
+
+        self.assertTrue(ctx.get("recipe.success"))
+        self.assertEqual(ctx.get("recipe.completed_steps"), 5)
+        self.assertTrue(ctx.get("done.join"))
+        self.assertLess(elapsed, 0.8)  # Sequential execution would take 0.9s
+        self.assertEqual(SleepScriptlet.peak_active_steps, 3)
+
+    def test_resource_class_limit(self) -> None:
+        """Test that resource class limits bound concurrency."""
+        recipe = self.write_recipe([
+            sleep_step(f"io_{index}", 0.1, resource_class="io") for index in range(4)
+        ])
+
+        runner = EnhancedRecipeRunner(resource_limits={"io": 2})
+        ctx = runner.run_recipe(recipe, parallel=True, max_parallel_steps=4)
+
+        self.assertTrue(ctx.get("recipe.success"))
+        self.assertEqual(SleepScriptlet.peak_active_steps, 2)
+
+    def test_failure_stops_dependents(self) -> None:
+        """Test that dependents of a failed step are skipped."""
+        steps = [
+            {"name": "broken", "module": __name__, "function": "FailingScriptlet"},
+            sleep_step("after", 0.0, ["broken"]),
+            sleep_step("independent"),
+        ]
+        recipe = self.write_recipe(steps)
+
+        ctx = EnhancedRecipeRunner().run_recipe(recipe, parallel=True, continue_on_error=True)
+
+        self.assertFalse(ctx.get("recipe.success"))
+        self.assertEqual(ctx.get("recipe.failed_steps"), 1)
+        self.assertEqual(ctx.get("recipe.skipped_steps"), 1)
+        self.assertTrue(ctx.get("done.independent"))
+        self.assertIsNone(ctx.get("done.after"))
+
+    def test_circular_dependencies_rejected(self) -> None:
+        """Test that cyclic dependency graphs are rejected."""
+        recipe = self.write_recipe([
+            sleep_step("first", depends_on=["second"]),
+            sleep_step("second", depends_on=["first"]),
+        ])
+
+        with self.assertRaises(ValueError):
+            EnhancedRecipeRunner().run_recipe(recipe, parallel=True)
+
+    def test_process_executor_merges_context(self) -> None:
+        """Test that process workers see dependency outputs and merge changes back."""
+        recipe = self.write_recipe([
+            sleep_step("source"),
+            sleep_step("consumer", 0.0, ["source"]),
+        ])
+
+        runner = EnhancedRecipeRunner(executor_type="process")
+        ctx = runner.run_recipe(recipe, parallel=True, max_parallel_steps=2)
+
+        self.assertTrue(ctx.get("recipe.success"))
+        self.assertTrue(ctx.get("done.consumer"))
+
+    def test_invalid_executor_type(self) -> None:
+        """Test that unknown executor types are rejected."""
+        with self.assertRaises(ValueError):
+            EnhancedRecipeRunner(executor_type="gpu")
+
+
+class TestRecipePlanCache(unittest.TestCase):
+    """Test cases for recipe plan caching and scriptlet pooling."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())  # Directory for recipe files
+        EnhancedRecipeRunner.clear_plan_cache()
+        CountingScriptlet.instances = 0
+
+    def tearDown(self) -> None:
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        EnhancedRecipeRunner.clear_plan_cache()
+
+    def write_recipe(self, names: List[str]) -> str:
+        """Write a recipe of CountingScriptlet steps and return its path."""
+        recipe_path = self.temp_dir / "recipe.yaml"
+        steps = [
+            {"name": name, "module": __name__, "function": "CountingScriptlet", "args": {"name": name}}
+            for name in names
+        ]
+        recipe_path.write_text(yaml.safe_dump({"steps": steps}))
+        return str(recipe_path)
+
+    def test_plan_reused_for_unchanged_recipe(self) -> None:
+        """Test that an unchanged recipe is parsed once and args stay pristine."""
+        recipe = self.write_recipe(["first", "second"])
+        runner = EnhancedRecipeRunner()
+
+        first_plan = runner._get_recipe_plan(recipe)
+        ctx = runner.run_recipe(recipe)
+        ctx_again = runner.run_recipe(recipe)
+
+        self.assertIs(runner._get_recipe_plan(recipe), first_plan)
+        self.assertEqual(ctx.get("seen.first"), 1)
+        self.assertEqual(ctx_again.get("seen.first"), 1)
+        self.assertEqual(first_plan.steps[0]["args"], {"name": "first"})
+        self.assertIn((__name__, "CountingScriptlet"), runner_module._scriptlet_class_cache)
+
+    def test_plan_rebuilt_when_recipe_changes(self) -> None:
+        """Test that editing the recipe invalidates the cached plan."""
+        recipe = self.write_recipe(["first"])
+        runner = EnhancedRecipeRunner()
+        first_plan = runner._get_recipe_plan(recipe)
+
+        self.write_recipe(["first", "second"])
+        second_plan = runner._get_recipe_plan(recipe)
+
+        self.assertIsNot(second_plan, first_plan)
+        self.assertEqual(len(second_plan.steps), 2)
+
+    def test_unresolvable_step_fails_at_execution(self) -> None:
+        """Test that classes failing to resolve are reported when run."""
+        recipe_path = self.temp_dir / "recipe.yaml"
+        recipe_path.write_text(yaml.safe_dump({"steps": [
+            {"name": "missing", "module": __name__, "function": "MissingScriptlet"},
+        ]}))
+        runner = EnhancedRecipeRunner()
+
+        self.assertEqual(runner._get_recipe_plan(str(recipe_path)).unresolved_steps, ["missing"])
+        with self.assertLogs(runner.logger.logger, level="WARNING") as logs:
+            ctx = runner.run_recipe(str(recipe_path))
+        self.assertIn("steps: missing", logs.output[0])
+        self.assertFalse(ctx.get("recipe.success"))
+
+    def test_filtered_steps_are_not_imported(self) -> None:
+        """Test that steps excluded by only or skip are resolved only when selected."""
+        recipe_path = self.temp_dir / "recipe.yaml"
+        recipe_path.write_text(yaml.safe_dump({"steps": [
+            {"name": "first", "module": __name__, "function": "CountingScriptlet", "args": {"name": "first"}},
+            {"name": "missing", "module": "no_such_scriptlet_module", "function": "Missing"},
+        ]}))
+        runner = EnhancedRecipeRunner()
+
+        ctx = runner.run_recipe(str(recipe_path), skip=["missing"])
+        plan = runner._get_recipe_plan(str(recipe_path), only=["first"])
+        self.assertTrue(ctx.get("recipe.success"))
+        self.assertEqual(plan.import_results, {f"{__name__}.CountingScriptlet": True})
+
+        plan = runner._get_recipe_plan(str(recipe_path))
+        self.assertEqual(plan.unresolved_steps, ["missing"])
+
+    def test_scriptlet_instance_pooling(self) -> None:
+        """Test that pooled runners reuse scriptlet instances."""
+        recipe = self.write_recipe(["first", "second", "third"])
+
+        EnhancedRecipeRunner().run_recipe(recipe)
+        self.assertEqual(CountingScriptlet.instances, 3)
+
+        CountingScriptlet.instances = 0
+        pooled_runner = EnhancedRecipeRunner(pool_scriptlet_instances=True)
+        ctx = pooled_runner.run_recipe(recipe)
+
+        self.assertTrue(ctx.get("recipe.success"))
+        self.assertEqual(CountingScriptlet.instances, 1)
+
+
+class TestPersistentPlanCache(unittest.TestCase):
+    """Test cases for on-disk compiled recipe plans."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())  # Directory for recipes and plans
+        self.plan_cache = RecipePlanCache(self.temp_dir / "plans")
+        self.recipe_path = self.temp_dir / "recipe.yaml"
+        EnhancedRecipeRunner.clear_plan_cache()
+
+    def tearDown(self) -> None:
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        EnhancedRecipeRunner.clear_plan_cache()
+
+    def write_recipe(self, steps: List[Dict[str, Any]]) -> str:
+        """Write a recipe file and return its path."""
+        self.recipe_path.write_text(yaml.safe_dump({"steps": steps}))
+        return str(self.recipe_path)
+
+    def cold_runner(self) -> EnhancedRecipeRunner:
+        """Return a runner as a new process would see it."""
+        EnhancedRecipeRunner.clear_plan_cache()
+        return EnhancedRecipeRunner(plan_cache=self.plan_cache)
+
+    def test_warm_start_skips_parsing(self) -> None:
+        """Test that a persisted plan is used without loading the YAML."""
+        recipe = self.write_recipe([
+            sleep_step("join", depends_on=["source"]),
+            sleep_step("source"),
+        ])
+        built_plan = self.cold_runner()._get_recipe_plan(recipe)
+
+        runner = self.cold_runner()
+        runner._load_recipe = lambda *args, **kwargs: self.fail("recipe was re-parsed")
+        loaded_plan = runner._get_recipe_plan(recipe)
+        ctx = runner.run_recipe(recipe, parallel=True)
+
+        self.assertEqual(loaded_plan.steps, built_plan.steps)
+        self.assertEqual(loaded_plan.execution_order, ["source", "join"])
+        self.assertEqual(loaded_plan.import_results, {f"{__name__}.SleepScriptlet": True})
+        self.assertTrue(ctx.get("recipe.success"))
+        self.assertGreaterEqual(self.plan_cache.get_stats()["hits"], 2)
+
+    def test_changed_recipe_is_rebuilt(self) -> None:
+        """Test that content changes invalidate the persisted plan."""
+        recipe = self.write_recipe([sleep_step("first")])
+        self.cold_runner()._get_recipe_plan(recipe)
+
+        self.write_recipe([sleep_step("first"), sleep_step("second")])
+        plan = self.cold_runner()._get_recipe_plan(recipe)
+
+        self.assertEqual([step["name"] for step in plan.steps], ["first", "second"])
+
+    def test_touched_recipe_reuses_plan(self) -> None:
+        """Test that a new modification time with identical content is a hit."""
+        recipe = self.write_recipe([sleep_step("first")])
+        self.cold_runner()._get_recipe_plan(recipe)
+        os.utime(recipe, ns=(0, 0))
+
+        runner = self.cold_runner()
+        runner._load_recipe = lambda *args, **kwargs: self.fail("recipe was re-parsed")
+        plan = runner._get_recipe_plan(recipe)
+
+        self.assertEqual(plan.steps[0]["name"], "first")
+
+    def test_cyclic_plan_rejected_in_parallel_mode(self) -> None:
+        """Test that a persisted invalid dependency graph still fails parallel runs."""
+        recipe = self.write_recipe([
+            sleep_step("first", depends_on=["second"]),
+            sleep_step("second", depends_on=["first"]),
+        ])
+        self.cold_runner()._get_recipe_plan(recipe)
+
+        with self.assertRaises(ValueError):
+            self.cold_runner().run_recipe(recipe, parallel=True)
+
+    def test_edited_module_is_resolved_again(self) -> None:
+        """Test that persisted import results are dropped when the module source changes."""
+        module_path = self.temp_dir / "edited_scriptlets.py"
+        module_path.write_text("")
+        sys.path.insert(0, str(self.temp_dir))
+        self.addCleanup(sys.path.remove, str(self.temp_dir))
+        self.addCleanup(sys.modules.pop, "edited_scriptlets", None)
+        recipe = self.write_recipe([
+            {"name": "edited", "module": "edited_scriptlets", "function": "EditedScriptlet"},
+        ])
+        self.assertEqual(self.cold_runner()._get_recipe_plan(recipe).unresolved_steps, ["edited"])
+
+        module_path.write_text(f"from {__name__} import SleepScriptlet as EditedScriptlet\n")
+        sys.modules.pop("edited_scriptlets", None)  # As a new process would see it
+        importlib.invalidate_caches()
+        plan = self.cold_runner()._get_recipe_plan(recipe)
+
+        self.assertEqual(plan.unresolved_steps, [])
+        self.assertEqual(plan.import_results, {"edited_scriptlets.EditedScriptlet": True})
+
+    def test_corrupt_entry_is_ignored(self) -> None:
+        """Test that unreadable entries are treated as misses."""
+        recipe = self.write_recipe([sleep_step("first")])
+        self.cold_runner()._get_recipe_plan(recipe)
+        for entry_path in (self.temp_dir / "plans").glob("*.pkl"):
+            entry_path.write_bytes(b"not a pickle")
+
+        plan = self.cold_runner()._get_recipe_plan(recipe)
+
+        self.assertEqual(plan.steps[0]["name"], "first")
+
+
+def async_step(name: str, seconds: float = 0.0, depends_on: List[str] = None) -> Dict[str, Any]:
+    """Build a recipe step running AsyncSleepScriptlet."""
+    step = sleep_step(name, seconds, depends_on)
+    step["function"] = "AsyncSleepScriptlet"
+    return step
+
+
+class TestAsyncioExecution(unittest.TestCase):
+    """Test cases for the asyncio step executor."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())  # Directory for recipe files
+        SleepScriptlet.active_steps = 0
+        SleepScriptlet.peak_active_steps = 0
+
+    def tearDown(self) -> None:
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_recipe(self, steps: List[Dict[str, Any]]) -> str:
+        """Write a recipe file and return its path."""
+        recipe_path = self.temp_dir / "recipe.yaml"
+        recipe_path.write_text(yaml.safe_dump({"steps": steps}))
+        return str(recipe_path)
+
+    def test_async_steps_share_one_event_loop(self) -> None:
+        """Test that many awaiting steps overlap without a thread each."""
+        steps = [async_step("source")]
+        steps += [async_step(f"fetch_{index}", 0.2, ["source"]) for index in range(100)]
+        recipe = self.write_recipe(steps)
+
+        runner = EnhancedRecipeRunner(executor_type="asyncio", async_bridge_workers=2)
+        start = time.time()
+        ctx = runner.run_recipe(recipe, parallel=True)
+        elapsed = time.time() - start
+
+        self.assertTrue(ctx.get("recipe.success"))
+        self.assertEqual(ctx.get("recipe.completed_steps"), 101)
+        self.assertLess(elapsed, 2.0)  # Sequential execution would take 20s
+        thread_names = {ctx.get(f"thread.fetch_{index}") for index in range(100)}
+        self.assertEqual(thread_names, {"recipe-event-loop"})
+
+    def test_sync_steps_use_bounded_bridge(self) -> None:
+        """Test that synchronous scriptlets run on the bounded bridge pool."""
+        recipe = self.write_recipe([sleep_step(f"sync_{index}", 0.05) for index in range(6)])
+
+        runner = EnhancedRecipeRunner(executor_type="asyncio", async_bridge_workers=2)
+        ctx = runner.run_recipe(recipe, parallel=True)
+
+        self.assertTrue(ctx.get("recipe.success"))
+        self.assertEqual(SleepScriptlet.peak_active_steps, 2)
+
+    def test_step_timeout(self) -> None:
+        """Test that slow async steps are cancelled by their timeout."""
+        recipe = self.write_recipe([async_step("slow", 5.0), async_step("fast")])
+
+        runner = EnhancedRecipeRunner(executor_type="asyncio")
+        start = time.time()
+        ctx = runner.run_recipe(recipe, parallel=True, step_timeout=0.2, continue_on_error=True)
+
+        self.assertLess(time.time() - start, 2.0)
+        self.assertEqual(ctx.get("recipe.failed_steps"), 1)
+        self.assertTrue(ctx.get("done.fast"))
+        self.assertIsNone(ctx.get("done.slow"))
+
+    def test_cancelled_step_releases_pooled_instance(self) -> None:
+        """Test that a timed-out async step returns its instance to the pool."""
+        recipe = self.write_recipe([async_step("slow", 5.0)])
+
+        runner = EnhancedRecipeRunner(executor_type="asyncio", pool_scriptlet_instances=True)
+        ctx = runner.run_recipe(recipe, parallel=True, step_timeout=0.2, continue_on_error=True)
+
+        self.assertEqual(ctx.get("recipe.failed_steps"), 1)
+        self.assertEqual(len(runner._scriptlet_pool[AsyncSleepScriptlet]), 1)
+
+    def test_async_scriptlet_in_sequential_mode(self) -> None:
+        """Test that async scriptlets also run under the synchronous runner."""
+        recipe = self.write_recipe([async_step("only")])
+
+        ctx = EnhancedRecipeRunner().run_recipe(recipe)
+
+        self.assertTrue(ctx.get("recipe.success"))
+        self.assertTrue(ctx.get("done.only"))
+
+
+def hanging_step(name: str, seconds: float = 30.0, cooperative: bool = False) -> Dict[str, Any]:
+    """Build a recipe step running HangingScriptlet."""
+    return {
+        "name": name,
+        "module": __name__,
+        "function": "HangingScriptlet",
+        "args": {"name": name, "seconds": seconds, "cooperative": cooperative},
+    }
+
+
+class TestStepTimeouts(unittest.TestCase):
+    """Test cases for supervised step timeouts and cancellation."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())  # Directory for recipe files
+
+    def tearDown(self) -> None:
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_recipe(self, steps: List[Dict[str, Any]]) -> str:
+        """Write a recipe file and return its path."""
+        recipe_path = self.temp_dir / "recipe.yaml"
+        recipe_path.write_text(yaml.safe_dump({"steps": steps}))
+        return str(recipe_path)
+
+    def test_cooperative_step_stops_on_timeout(self) -> None:
+        """Test that a timed-out step sees its token cancelled."""
+        recipe = self.write_recipe([hanging_step("wait", cooperative=True)])
+        runner = EnhancedRecipeRunner(cancel_grace_period=2.0)
+
+        start = time.time()
+        ctx = runner.run_recipe(recipe, step_timeout=0.2)
+
+        self.assertLess(time.time() - start, 1.5)
+        self.assertFalse(ctx.get("recipe.success"))
+        self.assertEqual(ctx.get("cancelled.wait"), "timed out after 0.2s")
+        self.assertEqual(runner.get_execution_statistics()["abandoned_steps"], 0)
+
+    def test_unresponsive_thread_is_abandoned(self) -> None:
+        """Test that a step ignoring its token is abandoned after the grace period."""
+        recipe = self.write_recipe([hanging_step("stuck", seconds=3.0), sleep_step("next")])
+        runner = EnhancedRecipeRunner(cancel_grace_period=0.1)
+
+        start = time.time()
+        ctx = runner.run_recipe(recipe, step_timeout=0.2, continue_on_error=True)
+
+        self.assertLess(time.time() - start, 1.5)
+        self.assertEqual(ctx.get("recipe.failed_steps"), 1)
+        self.assertTrue(ctx.get("done.next"))
+        self.assertEqual(runner.get_execution_statistics()["abandoned_steps"], 1)
+
+    def test_process_isolation_kills_hung_step(self) -> None:
+        """Test that subprocess-isolated steps are terminated on timeout."""
+        recipe = self.write_recipe([hanging_step("stuck"), sleep_step("after")])
+        runner = EnhancedRecipeRunner(timeout_isolation="process", cancel_grace_period=0.5)
+
+        start = time.time()
+        ctx = runner.run_recipe(recipe, step_timeout=0.5, continue_on_error=True)
+
+        self.assertLess(time.time() - start, 10.0)
+        self.assertEqual(ctx.get("recipe.failed_steps"), 1)
+        self.assertIsNone(ctx.get("done.stuck"))
+        self.assertTrue(ctx.get("done.after"))  # Completed subprocess merges its changes
+
+    def test_cancel_execution_reaches_running_step(self) -> None:
+        """Test that cancelling the recipe cancels the running step's token."""
+        recipe = self.write_recipe([hanging_step("wait", cooperative=True), sleep_step("never")])
+        runner = EnhancedRecipeRunner()
+        timer = threading.Timer(0.2, runner.cancel_execution)
+        timer.start()
+
+        start = time.time()
+        ctx = runner.run_recipe(recipe, continue_on_error=True)
+        timer.join()
+
+        self.assertLess(time.time() - start, 5.0)
+        self.assertEqual(ctx.get("cancelled.wait"), "recipe execution cancelled")
+        self.assertIsNone(ctx.get("done.never"))
+
+    def test_invalid_timeout_isolation(self) -> None:
+        """Test that unknown isolation modes are rejected."""
+        with self.assertRaises(ValueError):
+            EnhancedRecipeRunner(timeout_isolation="container")
+
+
+if __name__ == "__main__":
+    unittest.main()
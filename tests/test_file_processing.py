@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Test Suite for streaming file processing.
+
+This test suite validates:
+- Record iteration for CSV, JSONL, text and binary files
+- Incremental checksums matching whole-file checksums
+- Atomic streaming writes that keep file permissions
+- Per-record transformations
+- Constant memory use for large files
+"""
+
+import hashlib
+import os
+import stat
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("chardet")
+pytest.importorskip("yaml")
+
+# Import test targets
+from scriptlets.core.file_processing import (
+    FileProcessingError, StreamingFileReader, StreamingFileWriter,
+    stream_process_file, transform_records, verify_file_integrity, write_file_content
+)
+from src.core import file_modes
+
+
+def md5_of(path):
+    """Checksum of a whole file for comparison."""
+    return hashlib.md5(path.read_bytes()).hexdigest()
+
+
+class TestStreamingFileReader:
+    """Test cases for StreamingFileReader."""
+
+    def test_csv_rows_and_checksum(self, tmp_path) -> None:
+        """Test that quoted CSV rows are parsed and the checksum covers all bytes."""
+        source = tmp_path / "data.csv"
+        source.write_text('id,text\r\n1,"a, b"\r\n2,"multi\nline"\r\n', newline="")
+
+        with StreamingFileReader(str(source), "csv") as reader:
+            rows = list(reader)
+
+        assert rows == [{"id": "1", "text": "a, b"}, {"id": "2", "text": "multi\nline"}]
+        assert reader.records_read == 2
+        assert reader.checksum == md5_of(source)
+        assert reader.bytes_read == source.stat().st_size
+
+    def test_jsonl_batches(self, tmp_path) -> None:
+        """Test JSON lines with blank lines, read in batches."""
+        source = tmp_path / "data.jsonl"
+        source.write_text('{"a": 1}\n\n{"a": 2}\n{"a": 3}\n')
+
+        with StreamingFileReader(str(source), "jsonl") as reader:
+            assert list(reader.iter_batches(2)) == [[{"a": 1}, {"a": 2}], [{"a": 3}]]
+
+    def test_invalid_jsonl_line(self, tmp_path) -> None:
+        """Test that a malformed line reports its line number."""
+        source = tmp_path / "bad.jsonl"
+        source.write_text('{"a": 1}\n{oops\n')
+
+        with StreamingFileReader(str(source), "jsonl") as reader:
+            with pytest.raises(FileProcessingError, match="line 2"):
+                list(reader)
+
+    def test_binary_chunks(self, tmp_path) -> None:
+        """Test that binary files are read in chunk_size pieces."""
+        source = tmp_path / "blob.bin"
+        source.write_bytes(bytes(range(256)) * 10)
+
+        with StreamingFileReader(str(source), "binary", chunk_size=1000) as reader:
+            chunks = list(reader)
+        assert [len(c) for c in chunks] == [1000, 1000, 560]
+        assert reader.checksum == md5_of(source)
+
+    def test_unsupported_format(self, tmp_path) -> None:
+        """Test that whole-document formats are rejected for streaming."""
+        with pytest.raises(FileProcessingError):
+            StreamingFileReader(str(tmp_path / "x.xml"), "xml")
+
+
+class TestStreamingFileWriter:
+    """Test cases for StreamingFileWriter."""
+
+    def test_atomic_commit(self, tmp_path) -> None:
+        """Test that the target appears complete only on commit."""
+        target = tmp_path / "out.jsonl"
+        target.write_text("old\n")
+
+        with StreamingFileWriter(str(target), "jsonl") as writer:
+            writer.write_records([{"a": 1}, {"a": 2}])
+            assert target.read_text() == "old\n"
+
+        assert target.read_text() == '{"a": 1}\n{"a": 2}\n'
+        assert writer.checksum == md5_of(target)
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_abort_on_error_keeps_target(self, tmp_path) -> None:
+        """Test that an error leaves the previous target and no temporary file."""
+        target = tmp_path / "out.txt"
+        target.write_text("old\n")
+
+        with pytest.raises(RuntimeError):
+            with StreamingFileWriter(str(target), "text") as writer:
+                writer.write_record("new")
+                raise RuntimeError("boom")
+
+        assert target.read_text() == "old\n"
+        assert list(tmp_path.iterdir()) == [target]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_commit_keeps_file_mode(self, tmp_path) -> None:
+        """Test that commits keep the target's mode or use the umask default."""
+        target = tmp_path / "out.txt"
+        target.write_text("old\n")
+        target.chmod(0o640)
+        with StreamingFileWriter(str(target), "text") as writer:
+            writer.write_record("new")
+        assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+        fresh = tmp_path / "fresh.txt"
+        with StreamingFileWriter(str(fresh), "text") as writer:
+            writer.write_record("new")
+        assert stat.S_IMODE(fresh.stat().st_mode) == 0o666 & ~file_modes.PROCESS_UMASK
+
+    def test_write_file_content_streams_iterators(self, tmp_path) -> None:
+        """Test that write_file_content accepts a generator of records."""
+        target = tmp_path / "rows.csv"
+        result = write_file_content(
+            content=({"n": i} for i in range(3)), target_file=str(target), file_format="csv"
+        )
+
+        assert result["records_written"] == 3
+        assert target.read_bytes() == b"n\r\n0\r\n1\r\n2\r\n"
+        assert verify_file_integrity(file_path=str(target),
+                                     expected_checksum=result["checksum"])["verification_passed"]
+
+
+class TestStreamPipeline:
+    """Test cases for per-record transformations and stream_process_file."""
+
+    def test_transform_records(self) -> None:
+        """Test replacement, field rules and a record function that drops records."""
+        counts = {}
+        lines = list(transform_records(
+            ["a-a", "b"], {"string_replace": {"replacements": [{"old": "a", "new": "x"}]}}, counts
+        ))
+        assert lines == ["x-x", "b"] and counts == {"string_replace": 2}
+
+        rows = list(transform_records(
+            [{"id": 1, "secret": 1}, {"id": 2, "secret": 2}],
+            {"json_transform": {"add_fields": {"v": 1}, "remove_fields": ["secret"]},
+             "record_function": lambda row: row if row["id"] > 1 else None}
+        ))
+        assert rows == [{"id": 2, "v": 1}]
+
+    def test_csv_to_jsonl(self, tmp_path) -> None:
+        """Test converting and transforming a CSV file to JSON lines."""
+        source = tmp_path / "in.csv"
+        source.write_text("id,name\n1,a\n2,b\n")
+        target = tmp_path / "out.jsonl"
+
+        result = stream_process_file(
+            source_file=str(source), target_file=str(target), target_format="jsonl",
+            transformation_rules={"json_transform": {"remove_fields": ["name"]}}
+        )
+
+        assert result["file_format"] == "csv"
+        assert result["records_read"] == result["records_written"] == 2
+        assert target.read_text() == '{"id": "1"}\n{"id": "2"}\n'
+        assert result["source_checksum"] == md5_of(source)
+        assert result["target_checksum"] == md5_of(target)
+
+    def test_memory_independent_of_file_size(self, tmp_path) -> None:
+        """Test that peak memory stays far below the file size."""
+        source = tmp_path / "big.csv"
+        with open(source, "w") as f:
+            f.write("id,payload\n")
+            for i in range(200000):
+                f.write(f"{i},{'x' * 40}\n")
+        size = source.stat().st_size
+
+        tracemalloc.start()
+        result = stream_process_file(source_file=str(source), target_file=str(tmp_path / "copy.csv"),
+                                     chunk_size=64 * 1024)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert result["records_written"] == 200000
+        assert size > 8 * 1024 * 1024
+        assert peak < size / 8
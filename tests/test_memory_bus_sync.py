@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the versioned MemoryBus sync protocol.
+
+This test suite validates:
+- Server revisions and the bounded change log
+- Full snapshot fallback after log truncation
+- Client sync fetching only changes and pushing only local edits
+- Local edits kept dirty when the server is unreachable or rejects a patch
+"""
+
+import json
+
+import pytest
+
+# Import test targets
+from orchestrator import memory_bus
+from orchestrator.context import Context
+from orchestrator.memory_bus import MemoryBusClient, MemoryBusServer
+
+
+class FakeRequest:
+    """Minimal request object for the server handler stubs."""
+
+    def __init__(self, params=None, body=None):
+        self.args = {k: str(v) for k, v in (params or {}).items()}
+        self._body = body
+
+    def get_json(self):
+        return self._body
+
+
+class FakeResponse:
+    """Minimal response object returned to MemoryBusClient."""
+
+    def __init__(self, body, status_code):
+        self.status_code = status_code
+        self._body = json.loads(body)
+
+    def json(self):
+        return self._body
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Create a server and route client HTTP calls to its handlers."""
+    server = MemoryBusServer(max_changes=5)
+    routes = {"/snapshot": server.handle_snapshot_request,
+              "/changes": server.handle_changes_request,
+              "/patch": server.handle_patch_request}
+    server.requests = []
+
+    def dispatch(url, params=None, json=None, **kwargs):
+        path = url[len("http://bus"):]
+        server.requests.append((path, params))
+        return FakeResponse(*routes[path](FakeRequest(params, json)))
+
+    monkeypatch.setattr(memory_bus.requests, "get", dispatch)
+    monkeypatch.setattr(memory_bus.requests, "post", dispatch)
+    return server
+
+
+class TestMemoryBusServer:
+    """Test cases for revisions and the change log."""
+
+    def test_changes_since_revision(self) -> None:
+        """Test that changes are collapsed per key and no-op patches keep the revision."""
+        server = MemoryBusServer()
+        assert server.apply_patch({"a": 1, "b": 2}) == 1
+        assert server.apply_patch({"a": 3}) == 2
+        assert server.apply_patch({"a": 3}) == 2
+
+        assert server.get_changes_since(0) == {"revision": 2, "changes": {"a": 3, "b": 2}}
+        assert server.get_changes_since(1) == {"revision": 2, "changes": {"a": 3}}
+        assert server.get_changes_since(2) == {"revision": 2, "changes": {}}
+
+    def test_origin_excluded(self) -> None:
+        """Test that a client's own latest changes are not sent back to it."""
+        server = MemoryBusServer()
+        server.apply_patch({"a": 1, "b": 1}, origin="c1")
+        server.apply_patch({"b": 2}, origin="c2")
+        assert server.get_changes_since(0, origin="c1")["changes"] == {"b": 2}
+
+    def test_truncated_log_falls_back_to_snapshot(self) -> None:
+        """Test that revisions older than the change log get a full snapshot."""
+        server = MemoryBusServer(max_changes=2)
+        server.apply_patch({"a": 1})
+        server.apply_patch({"b": 1})
+        server.apply_patch({"c": 1})
+
+        response = server.get_changes_since(0)
+        assert response["full"] is True
+        assert response["snapshot"] == {"a": 1, "b": 1, "c": 1}
+        assert server.get_changes_since(1)["changes"] == {"b": 1, "c": 1}
+        assert server.get_changes_since(9)["full"] is True
+
+
+class TestMemoryBusClientSync:
+    """Test cases for client sync over the versioned protocol."""
+
+    def test_sync_transfers_only_changes(self, server) -> None:
+        """Test first sync, incremental sync and pushing local edits."""
+        server.apply_patch({"shared.x": 1, "shared.y": 2})
+        client = MemoryBusClient("http://bus")
+        local = Context()
+
+        client.sync(local)
+        assert local.get("shared.y") == 2
+        assert client.revision == 1
+
+        local.set("local.z", 9)
+        server.apply_patch({"shared.x": 5})
+        client.sync(local)
+        assert local.get("shared.x") == 5
+        assert server.get_snapshot()["local.z"] == 9
+        # Remote values merged during sync are not pushed back
+        assert server.requests[-1] == ("/patch", {"origin": client.client_id})
+        assert server.get_changes_since(1, origin=client.client_id)["changes"] == {"shared.x": 5}
+
+        # Nothing changed: the next sync receives an empty change set
+        client.sync(local)
+        assert server.requests[-1][0] == "/changes"
+        assert server.get_changes_since(client.revision) == {"revision": client.revision, "changes": {}}
+
+    def test_remote_wins_on_conflict(self, server) -> None:
+        """Test that a key changed on both sides takes the server value."""
+        client = MemoryBusClient("http://bus")
+        local = Context()
+        client.sync(local)
+
+        local.set("k", "local")
+        server.apply_patch({"k": "remote"})
+        client.sync(local)
+        assert local.get("k") == "remote"
+        assert server.get_snapshot()["k"] == "remote"
+
+    def test_unreachable_server_keeps_local_edits(self, server, monkeypatch) -> None:
+        """Test that edits made while the server is down are pushed later."""
+        client = MemoryBusClient("http://bus")
+        local = Context()
+        client.sync(local)
+        local.set("local.z", 9)
+
+        def unreachable(url, **kwargs):
+            raise memory_bus.requests.ConnectionError("server down")
+
+        with monkeypatch.context() as offline:
+            offline.setattr(memory_bus.requests, "get", unreachable)
+            with pytest.raises(memory_bus.requests.ConnectionError):
+                client.sync(local)
+        assert "local.z" not in server.get_snapshot()
+
+        client.sync(local)
+        assert server.get_snapshot()["local.z"] == 9
+
+    def test_rejected_patch_is_retried(self, server, monkeypatch) -> None:
+        """Test that a patch the server rejects stays dirty."""
+        client = MemoryBusClient("http://bus")
+        local = Context()
+        local.set("local.z", 9)
+
+        with monkeypatch.context() as failing:
+            failing.setattr(memory_bus.requests, "post",
+                            lambda url, **kwargs: FakeResponse("{}", 503))
+            client.sync(local)
+        assert local.pop_dirty_keys() == ["local.z"]
+
+        local.mark_dirty(["local.z"])
+        client.sync(local)
+        assert server.get_snapshot()["local.z"] == 9
+
+    def test_concurrent_set_during_sync_stays_dirty(self, server, monkeypatch) -> None:
+        """Test that a key set while changes are fetched is pushed by the next sync."""
+        server.apply_patch({"shared.x": 1})
+        client = MemoryBusClient("http://bus")
+        local = Context()
+        fetch_changes = client.fetch_changes
+
+        def fetch_with_concurrent_set(since):
+            local.set("local.z", 9)  # Another thread writes mid-sync
+            return fetch_changes(since)
+
+        with monkeypatch.context() as racing:
+            racing.setattr(client, "fetch_changes", fetch_with_concurrent_set)
+            client.sync(local)
+        assert local.get("shared.x") == 1
+        assert local.pop_dirty_keys() == ["local.z"]
+
+        local.mark_dirty(["local.z"])
+        client.sync(local)
+        assert server.get_snapshot()["local.z"] == 9
+
+    def test_bad_since_rejected(self, server) -> None:
+        """Test that a non-integer revision is a client error."""
+        _, status = server.handle_changes_request(FakeRequest({"since": "x"}))
+        assert status == 400
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the persistence Cache eviction policies.
+
+This test suite validates that each eviction policy selects the expected
+victim using its index:
+- LRU recency order and FIFO insertion order
+- LFU access-count buckets with insertion-order tie breaking
+- TTL expiration heap with LRU fallback
+- Expired entry cleanup and memory-based eviction
+"""
+
+import time
+import unittest
+
+# Import test target
+from orchestrator.persistence.cache import Cache, EvictionPolicy
+
+
+class TestCacheEviction(unittest.TestCase):
+    """Test cases for policy-driven eviction."""
+
+    def fill(self, cache: Cache, keys) -> None:
+        """Insert each key with its own name as the value."""
+        for key in keys:
+            cache.set(key, key)
+
+    def test_lru_evicts_least_recently_used(self) -> None:
+        """Test that reads refresh recency under LRU."""
+        cache = Cache(max_size=3, eviction_policy=EvictionPolicy.LRU)
+        self.fill(cache, ["a", "b", "c"])
+        cache.get("a")
+        cache.set("d", "d")
+
+        self.assertFalse(cache.contains("b"))
+        self.assertTrue(cache.contains("a"))
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_fifo_ignores_reads(self) -> None:
+        """Test that FIFO evicts in insertion order regardless of reads."""
+        cache = Cache(max_size=3, eviction_policy=EvictionPolicy.FIFO)
+        self.fill(cache, ["a", "b", "c"])
+        cache.get("a")
+        cache.set("d", "d")
+
+        self.assertFalse(cache.contains("a"))
+        self.assertTrue(cache.contains("b"))
+
+    def test_lfu_evicts_least_frequently_used(self) -> None:
+        """Test that LFU evicts the oldest key in the lowest count bucket."""
+        cache = Cache(max_size=3, eviction_policy=EvictionPolicy.LFU)
+        self.fill(cache, ["a", "b", "c"])
+        for key in ["a", "a", "b", "c"]:
+            cache.get(key)
+        cache.set("d", "d")  # b and c have one read; b is older
+
+        self.assertFalse(cache.contains("b"))
+        cache.set("e", "e")  # d has no reads
+
+        self.assertFalse(cache.contains("d"))
+        self.assertEqual(sorted(cache.get_keys()), ["a", "c", "e"])
+
+    def test_lfu_replaced_key_resets_count(self) -> None:
+        """Test that overwriting a key starts a fresh access count."""
+        cache = Cache(max_size=2, eviction_policy=EvictionPolicy.LFU)
+        self.fill(cache, ["a", "b"])
+        cache.get("a")
+        cache.get("b")
+        cache.set("a", "new")
+        cache.set("c", "c")
+
+        self.assertFalse(cache.contains("a"))
+        self.assertTrue(cache.contains("b"))
+
+    def test_ttl_evicts_soonest_expiring(self) -> None:
+        """Test that TTL evicts by expiration time, then by recency."""
+        cache = Cache(max_size=3, eviction_policy=EvictionPolicy.TTL)
+        cache.set("long", 1, ttl=300)
+        cache.set("short", 2, ttl=60)
+        cache.set("forever", 3)
+        cache.set("next", 4)
+
+        self.assertFalse(cache.contains("short"))
+        cache.delete("long")
+        cache.set("last", 5)  # No TTLs left; LRU fallback
+        cache.set("extra", 6)
+
+        self.assertFalse(cache.contains("forever"))
+
+    def test_expired_entries_are_cleaned(self) -> None:
+        """Test that expired entries are purged without being read."""
+        cache = Cache(max_size=10)
+        cache.set("brief", 1, ttl=0.01)
+        cache.set("kept", 2)
+        time.sleep(0.02)
+
+        self.assertEqual(cache.get("kept"), 2)
+        self.assertEqual(len(cache.get_keys()), 1)
+        self.assertEqual(cache.get_stats()["expirations"], 1)
+
+    def test_memory_limit_evicts_until_fit(self) -> None:
+        """Test that memory pressure evicts entries in policy order."""
+        cache = Cache(max_size=0, max_memory_mb=0.001, eviction_policy=EvictionPolicy.LRU)
+        for index in range(20):
+            cache.set(f"key_{index}", "x" * 100)
+
+        stats = cache.get_stats()
+        self.assertLessEqual(stats["memory_bytes"], cache.max_memory_bytes)
+        self.assertTrue(cache.contains("key_19"))
+        self.assertFalse(cache.contains("key_0"))
+
+    def test_clear_resets_indexes(self) -> None:
+        """Test that eviction works normally after clear."""
+        cache = Cache(max_size=2, eviction_policy=EvictionPolicy.LFU)
+        self.fill(cache, ["a", "b"])
+        cache.clear()
+        self.fill(cache, ["c", "d", "e"])
+
+        self.assertEqual(sorted(cache.get_keys()), ["d", "e"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Test Suite for content-addressed snapshot storage.
+
+This test suite validates the chunk store behind SnapshotManager:
+- Unchanged values are stored once across snapshots
+- Round trips for dictionaries, lists and other data types
+- Reference counting and removal of unreferenced chunks on delete
+- SQLite registry persistence, tagging and legacy registry migration
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+# Import test target
+from orchestrator.persistence.chunk_store import ChunkStore
+from orchestrator.persistence.snapshot import (
+    LEGACY_REGISTRY_NAME, SnapshotManager, SnapshotNotFoundError
+)
+
+
+class TestSnapshotStore(unittest.TestCase):
+    """Test cases for chunked snapshots."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()  # Snapshot directory
+        self.manager = SnapshotManager(self.temp_dir)
+
+    def tearDown(self) -> None:
+        """Clean up test fixtures."""
+        self.manager.cleanup()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def chunk_count(self) -> int:
+        """Return the number of chunk files on disk."""
+        return sum(1 for _ in self.manager.chunk_store.iter_digests())
+
+    def make_data(self, count: int = 500):
+        """Return a dictionary whose values are large enough to get their own chunk."""
+        return {f"key_{index}": {"index": index, "payload": "x" * 400} for index in range(count)}
+
+    def test_unchanged_values_are_stored_once(self) -> None:
+        """Test that a second snapshot only adds chunks for what changed."""
+        data = self.make_data()
+        self.manager.create_snapshot(data)
+        first_count = self.chunk_count()
+
+        data["key_7"] = {"index": -1, "payload": "y" * 400}
+        self.manager.create_snapshot(data)
+        added = self.chunk_count() - first_count
+
+        self.assertGreater(first_count, 500)
+        self.assertLessEqual(added, 3)  # Value, its page and the root manifest
+
+    def test_identical_snapshot_adds_no_chunks(self) -> None:
+        """Test that snapshotting the same data twice reuses every chunk."""
+        data = self.make_data(50)
+        first = self.manager.create_snapshot(data)
+        count = self.chunk_count()
+        second = self.manager.create_snapshot(data)
+
+        self.assertEqual(self.chunk_count(), count)
+        self.assertEqual(self.manager.get_snapshot(first)[0], self.manager.get_snapshot(second)[0])
+
+    def test_round_trip_types(self) -> None:
+        """Test that data of different shapes is restored unchanged."""
+        samples = [
+            self.make_data(20),
+            {"small": 1, "nested": {"list": [1, 2, 3]}, "set": {1, 2}},
+            [{"item": index, "text": "z" * 300} for index in range(20)] + [None, 1.5],
+            "plain string",
+            b"\x00\x01 raw bytes",
+            (1, "tuple"),
+            {1: "integer keys"},
+            [],
+        ]
+        for sample in samples:
+            version = self.manager.create_snapshot(sample)
+            self.assertEqual(self.manager.get_snapshot(version)[0], sample)
+
+    def test_delete_removes_only_unshared_chunks(self) -> None:
+        """Test that deleting a snapshot keeps chunks used by others."""
+        data = self.make_data(100)
+        first = self.manager.create_snapshot(data)
+        data["key_3"] = {"index": 3, "payload": "changed" * 100}
+        second = self.manager.create_snapshot(data)
+
+        self.manager.delete_snapshot(first)
+
+        self.assertEqual(self.manager.get_snapshot(second)[0], data)
+        self.manager.delete_snapshot(second)
+        self.assertEqual(self.chunk_count(), 0)
+
+    def test_registry_persists_across_instances(self) -> None:
+        """Test that snapshots, tags and data survive reopening the manager."""
+        version = self.manager.create_snapshot({"a": 1}, tags=["release"], description="first")
+        self.manager.tag_snapshot(version, ["stable"])
+        self.manager.untag_snapshot(version, ["release"])
+        self.manager.cleanup()
+
+        reopened = SnapshotManager(self.temp_dir)
+        data, metadata = reopened.get_snapshot_by_tag("stable")
+
+        self.assertEqual(data, {"a": 1})
+        self.assertEqual(metadata.description, "first")
+        self.assertEqual(reopened.list_tags(), {"stable": 1})
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, LEGACY_REGISTRY_NAME)))
+        reopened.cleanup()
+
+    def test_delta_snapshot_alongside_chunks(self) -> None:
+        """Test that delta snapshots resolve against chunked bases."""
+        base = self.manager.create_snapshot({"a": 1, "b": 2})
+        delta = self.manager.create_delta_snapshot({"a": 1, "b": 3}, base_version=base)
+
+        self.assertEqual(self.manager.get_snapshot(delta)[0], {"a": 1, "b": 3})
+        self.assertEqual(self.manager.get_delta_snapshot(base)[0], {"a": 1, "b": 2})
+
+    def test_snapshot_limit_releases_chunks(self) -> None:
+        """Test that snapshots evicted by the limit free their chunks."""
+        manager = SnapshotManager(os.path.join(self.temp_dir, "limited"), max_snapshots=2)
+        for index in range(5):
+            manager.create_snapshot({"value": "v" * 400 + str(index)})
+
+        self.assertEqual(len(manager.list_versions()), 2)
+        self.assertEqual(sum(1 for _ in manager.chunk_store.iter_digests()), 2 * 3)
+        manager.cleanup()
+
+    def test_legacy_registry_is_migrated(self) -> None:
+        """Test that snapshots listed in registry.json stay readable."""
+        legacy_dir = os.path.join(self.temp_dir, "legacy")
+        os.makedirs(os.path.join(legacy_dir, "data"))
+        with open(os.path.join(legacy_dir, "data", "v1.data"), "w") as f:
+            json.dump({"old": True}, f)
+        with open(os.path.join(legacy_dir, LEGACY_REGISTRY_NAME), "w") as f:
+            json.dump({"snapshots": {"v1": {"version": "v1", "tags": ["old"]}}}, f)
+
+        manager = SnapshotManager(legacy_dir)
+
+        self.assertEqual(manager.get_snapshot_by_tag("old")[0], {"old": True})
+        manager.delete_snapshot("v1")
+        with self.assertRaises(SnapshotNotFoundError):
+            manager.get_snapshot("v1")
+        manager.cleanup()
+
+    def test_garbage_collection_removes_orphans(self) -> None:
+        """Test that chunks written without a registered snapshot are collected."""
+        self.manager.create_snapshot({"kept": "k" * 400})
+        count = self.chunk_count()
+        self.manager.chunk_store.store({"orphan": "o" * 400})
+
+        self.assertEqual(self.manager.collect_garbage(), 3)
+        self.assertEqual(self.chunk_count(), count)
+
+
+class TestChunkStore(unittest.TestCase):
+    """Test cases for the raw chunk store."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()  # Chunk directory
+        self.store = ChunkStore(self.temp_dir)
+
+    def tearDown(self) -> None:
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_put_is_idempotent(self) -> None:
+        """Test that equal payloads map to one chunk file."""
+        first = self.store.put(b"payload" * 100)
+        second = self.store.put(b"payload" * 100)
+
+        self.assertEqual(first, second)
+        self.assertEqual(list(self.store.iter_digests()), [first])
+        self.assertEqual(self.store.get(first), b"payload" * 100)
+
+    def test_page_boundaries_survive_insertions(self) -> None:
+        """Test that inserting a key early leaves most later pages unchanged."""
+        data = {f"key_{index}": "v" * 300 for index in range(5000)}
+        _, before = self.store.store(data)
+        data = {"inserted": "new", **data}
+        _, after = self.store.store(data)
+
+        self.assertLessEqual(len(after - before), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Context Server Load Test for Framework0
+
+This tool measures context server throughput in requests per second. It
+either drives an already running server (--url) or, for each worker count
+given with --workers, starts the ASGI server in that configuration, runs the
+same load against it and stops it again, so scaling with core count can be
+compared directly.
+
+Load is generated by client processes, each running several threads with
+their own HTTP sessions, issuing a configurable mix of GET /ctx and
+POST /ctx requests over a shared key space.
+
+Usage:
+    python tools/context_load_test.py --workers 1,2,4 --duration 10
+    python tools/context_load_test.py --url http://127.0.0.1:8080 --clients 8
+"""
+
+import argparse  # For command-line argument parsing
+import multiprocessing  # For client processes that are not limited by one interpreter
+import os  # For CPU count and environment handling
+import random  # For choosing keys and operations
+import socket  # For finding a free port
+import subprocess  # For starting server processes
+import sys  # For the Python executable path
+import threading  # For concurrent requests inside each client process
+import time  # For timing the load window
+from pathlib import Path  # For locating the repository root
+from typing import Dict, List  # For complete type safety
+
+import requests  # For HTTP requests to the context server
+
+REPO_ROOT = Path(__file__).resolve().parent.parent  # Server is started from the repository root
+
+
+def _client_process(url: str, duration: float, threads: int, keys: int,
+                    write_ratio: float, results: "multiprocessing.Queue") -> None:
+    """
+    Issue requests from several threads until the duration elapses.
+
+    Args:
+        url: Server base URL
+        duration: Seconds to generate load
+        threads: Threads in this process
+        keys: Size of the key space
+        write_ratio: Fraction of requests that are writes
+        results: Queue receiving (completed, errors) for this process
+    """
+    deadline = time.time() + duration
+    counts = [[0, 0] for _ in range(threads)]  # Per-thread completed and error counts
+
+    def worker(index: int) -> None:
+        session = requests.Session()  # Keep-alive connection per thread
+        rng = random.Random(index)
+        while time.time() < deadline:
+            key = f"load.key{rng.randrange(keys)}"
+            try:
+                if rng.random() < write_ratio:
+                    response = session.post(f"{url}/ctx", json={"key": key, "value": rng.random(), "who": "load"})
+                else:
+                    response = session.get(f"{url}/ctx", params={"key": key})
+                response.raise_for_status()
+                counts[index][0] += 1
+            except requests.RequestException:
+                counts[index][1] += 1
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    results.put((sum(c[0] for c in counts), sum(c[1] for c in counts)))
+
+
+def run_load(url: str, duration: float, clients: int, threads: int,
+             keys: int, write_ratio: float) -> Dict[str, float]:
+    """
+    Run load against a server and measure throughput.
+
+    Args:
+        url: Server base URL
+        duration: Seconds to generate load
+        clients: Client processes
+        threads: Threads per client process
+        keys: Size of the key space
+        write_ratio: Fraction of requests that are writes
+
+    Returns:
+        Dictionary with completed requests, errors and requests per second
+    """
+    results: "multiprocessing.Queue" = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=_client_process,
+                                args=(url, duration, threads, keys, write_ratio, results))
+        for _ in range(clients)
+    ]
+    start = time.time()
+    for process in processes:
+        process.start()
+    totals = [results.get() for _ in processes]  # Drain before join to avoid queue deadlock
+    for process in processes:
+        process.join()
+    elapsed = time.time() - start
+
+    completed = sum(t[0] for t in totals)
+    errors = sum(t[1] for t in totals)
+    return {"completed": completed, "errors": errors, "seconds": elapsed,
+            "requests_per_second": completed / elapsed if elapsed else 0.0}
+
+
+def _free_port() -> int:
+    """Find a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_ready(url: str, timeout: float = 30.0) -> None:
+    """Poll the server until it answers or the timeout expires."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(f"{url}/ctx/all", timeout=1).ok:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not become ready")
+
+
+def run_scaling(worker_counts: List[int], **load_options) -> List[Dict[str, float]]:
+    """
+    Start the ASGI server with each worker count and measure throughput.
+
+    Args:
+        worker_counts: ASGI worker counts to compare
+        **load_options: Options passed to run_load
+
+    Returns:
+        One result dictionary per worker count
+    """
+    rows = []
+    for workers in worker_counts:
+        port = _free_port()
+        url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "orchestrator.enhanced_context_server", "--asgi",
+             "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers)],
+            cwd=REPO_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        try:
+            _wait_until_ready(url)
+            result = run_load(url, **load_options)
+            result["workers"] = workers
+            rows.append(result)
+            print(f"workers={workers:<3} requests/sec={result['requests_per_second']:>10.1f} "
+                  f"completed={result['completed']} errors={result['errors']}")
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+    return rows
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Context server load test")
+    parser.add_argument("--url", help="Load an already running server instead of starting ASGI servers")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated ASGI worker counts (default: 1,2,4)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load per run (default: 10)")
+    parser.add_argument("--clients", type=int, default=os.cpu_count() or 2,
+                        help="Client processes (default: CPU count)")
+    parser.add_argument("--threads", type=int, default=8, help="Threads per client process (default: 8)")
+    parser.add_argument("--keys", type=int, default=1000, help="Size of the key space (default: 1000)")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="Fraction of writes (default: 0.2)")
+    args = parser.parse_args()
+
+    load_options = {"duration": args.duration, "clients": args.clients, "threads": args.threads,
+                    "keys": args.keys, "write_ratio": args.write_ratio}
+
+    if args.url:
+        result = run_load(args.url.rstrip("/"), **load_options)
+        print(f"requests/sec={result['requests_per_second']:.1f} "
+              f"completed={result['completed']} errors={result['errors']}")
+        return
+
+    rows = run_scaling([int(w) for w in args.workers.split(",")], **load_options)
+    if rows and rows[0]["requests_per_second"]:
+        base = rows[0]["requests_per_second"]
+        for row in rows:
+            print(f"workers={row['workers']:<3} speedup={row['requests_per_second'] / base:.2f}x")
+
+
+if __name__ == "__main__":
+    main()